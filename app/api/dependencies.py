@@ -2,23 +2,80 @@
 API dependencies for dependency injection.
 """
 
-from fastapi import HTTPException, status, Depends
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterator, Optional, Tuple, Union
+
+from fastapi import HTTPException, Request, Response, status, Depends
+from fastapi.encoders import jsonable_encoder
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
+from app.core.exceptions import IdempotencyInProgressException, IdempotencyKeyMismatchException
 from app.core.security import verify_token
+from app.models.idempotency import IdempotencyRecord
 from app.models.user import User
+from app.parsers.parse_cache import configure_parse_cache
 from app.services.jira_service import JiraService
 from app.services.ai_service import AIService
 from app.services.task_orchestrator import TaskOrchestrator
-from app.clients.jira_client import JiraClient
-from app.services.reel_workflow_service import ReelWorkflowService
+from app.clients.jira_client import JiraClient, JiraClientConfig
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.cache_backend import cache_namespace, configure_cache, create_cache_backend, get_cache_backend
+from app.clients.client_registry import ClientRegistry, credential_fingerprint, schedule_aclose
+from app.clients.deadline import deadline
+from app.clients.instrumentation import operation
+from app.services.outbox_service import OutboxWorker
+from app.services.health_monitor import HealthMonitor
+from app.services.idempotency_service import REPLAY, IdempotencyStore, request_fingerprint
+from app.services.user_directory import UserDirectory
+from app.services.project_cache import ProjectListCache
+from app.services.principal_cache import (
+    Principal,
+    PrincipalCache,
+    expiration_timestamp,
+    invalidate_on_user_update,
+)
 
 # Security scheme for JWT
 security = HTTPBearer()
 
+# Request handlers get a Principal; background jobs load the User row
+AuthenticatedUser = Union[User, Principal]
+
+# Shared cache tier (Redis) so every worker reuses lookups made by the others.
+# Configured before any Jira client exists: per-site caches bind to it on creation.
+if settings.CACHE_ENABLED:
+    configure_cache(
+        create_cache_backend(
+            settings.REDIS_URL,
+            key_prefix=settings.CACHE_KEY_PREFIX,
+            socket_timeout=settings.CACHE_SOCKET_TIMEOUT
+        ),
+        default_ttl=settings.CACHE_TTL
+    )
+
+# Parse results shared by every get_parser()/create_parser() caller
+configure_parse_cache(
+    settings.PARSE_CACHE_MAX_BYTES,
+    shared=cache_namespace("parser", settings.PARSE_CACHE_SHARED_TTL)
+)
+
+# Long-lived per-user Jira clients, reused across requests
+jira_client_registry = ClientRegistry(
+    max_size=settings.JIRA_CLIENT_CACHE_SIZE,
+    idle_ttl=settings.JIRA_CLIENT_IDLE_TTL
+)
+async_jira_client_registry = ClientRegistry(
+    max_size=settings.JIRA_CLIENT_CACHE_SIZE,
+    idle_ttl=settings.JIRA_CLIENT_IDLE_TTL,
+    close=schedule_aclose
+)
+
 
 def get_jira_service() -> JiraService:
     """
@@ -57,6 +114,44 @@ def get_task_orchestrator() -> TaskOrchestrator:
     )
 
 
+def get_jira_client_config() -> JiraClientConfig:
+    """
+    Get Jira transport configuration from application settings.
+
+    Returns:
+        JiraClientConfig: Pool, keep-alive, timeout, retry, rate limit, coalescing, circuit breaker
+            and user cache settings
+    """
+    return JiraClientConfig(
+        pool_connections=settings.JIRA_POOL_CONNECTIONS,
+        pool_maxsize=settings.JIRA_POOL_MAXSIZE,
+        pool_block=settings.JIRA_POOL_BLOCK,
+        keep_alive=settings.JIRA_KEEP_ALIVE,
+        timeout=settings.JIRA_TIMEOUT,
+        connect_timeout=settings.JIRA_CONNECT_TIMEOUT,
+        json_codec=settings.JIRA_JSON_CODEC,
+        compress_requests=settings.JIRA_COMPRESS_REQUESTS,
+        compress_min_bytes=settings.JIRA_COMPRESS_MIN_BYTES,
+        cassette_mode=settings.JIRA_CASSETTE_MODE,
+        cassette_path=settings.JIRA_CASSETTE,
+        cassette_speed=settings.JIRA_CASSETTE_SPEED,
+        user_cache_ttl=settings.JIRA_USER_CACHE_TTL,
+        user_cache_negative_ttl=settings.JIRA_USER_CACHE_NEGATIVE_TTL,
+        user_cache_size=settings.JIRA_USER_CACHE_SIZE,
+        create_meta_ttl=settings.JIRA_CREATE_META_TTL,
+        max_retries=settings.MAX_RETRIES,
+        retry_backoff_factor=settings.RETRY_BACKOFF_FACTOR,
+        retry_base_delay=settings.RETRY_BASE_DELAY,
+        retry_max_delay=settings.RETRY_MAX_DELAY,
+        rate_limit_per_minute=settings.RATE_LIMIT_PER_MINUTE,
+        rate_limit_burst=settings.JIRA_RATE_LIMIT_BURST or None,
+        coalesce_gets=settings.JIRA_COALESCE_GETS,
+        circuit_failure_threshold=settings.JIRA_CIRCUIT_FAILURE_THRESHOLD,
+        circuit_recovery_timeout=settings.JIRA_CIRCUIT_RECOVERY_TIMEOUT,
+        circuit_half_open_max_calls=settings.JIRA_CIRCUIT_HALF_OPEN_MAX_CALLS
+    )
+
+
 def get_jira_client() -> JiraClient:
     """
     Get JiraClient instance with configuration from environment variables.
@@ -68,7 +163,7 @@ def get_jira_client() -> JiraClient:
         HTTPException: If configuration is invalid or missing
     """
     try:
-        return JiraClient()
+        return JiraClient(config=get_jira_client_config())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -76,39 +171,71 @@ def get_jira_client() -> JiraClient:
         )
 
 
-def get_reel_workflow_service() -> ReelWorkflowService:
+async def request_deadline() -> AsyncIterator[None]:
     """
-    Get ReelWorkflowService instance with JiraClient dependency.
+    Apply REQUEST_DEADLINE_SECONDS as the time budget of the current request.
 
-    Returns:
-        ReelWorkflowService: Configured workflow service instance
+    Every Jira call made while handling the request draws its connect and
+    read timeouts from what is left of this budget.
 
-    Raises:
-        HTTPException: If JiraClient initialization fails
+    Example:
+        @router.post("/content", dependencies=[Depends(request_deadline)])
+        async def create_content(...):
+            ...
     """
-    jira_client = get_jira_client()
-    return ReelWorkflowService(jira_client)
+    with deadline(settings.REQUEST_DEADLINE_SECONDS):
+        yield
+
+
+async def instrument_request(request: Request) -> AsyncIterator[None]:
+    """
+    Label every Jira call made while handling the request with its route.
+
+    The built-in collectors in app.clients.instrumentation group latency,
+    errors and retries by this label (e.g. "POST /api/v1/tasks/batch").
+
+    Example:
+        @router.post("/batch", dependencies=[Depends(instrument_request)])
+        async def create_batch(...):
+            ...
+    """
+    route = request.scope.get("route")
+    with operation(f"{request.method} {getattr(route, 'path', request.url.path)}"):
+        yield
 
 
 # ============================================================================
 # Authentication Dependencies
 # ============================================================================
 
+# Verified token → immutable user snapshot, so hot endpoints skip the users table
+principal_cache: Optional[PrincipalCache] = PrincipalCache(
+    ttl=settings.AUTH_PRINCIPAL_CACHE_TTL,
+    max_size=settings.AUTH_PRINCIPAL_CACHE_SIZE
+) if settings.AUTH_PRINCIPAL_CACHE_TTL > 0 else None
+if principal_cache is not None:
+    invalidate_on_user_update(principal_cache)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
+) -> Principal:
     """
     Get the current authenticated user from JWT token.
 
     This dependency should be used in endpoints that require authentication.
+    The result is an immutable snapshot of the user; a token seen in the last
+    AUTH_PRINCIPAL_CACHE_TTL seconds is served from ``principal_cache``
+    without decoding the JWT or querying the database. Endpoints that modify
+    the user row must use ``get_current_db_user`` instead.
 
     Args:
         credentials: HTTP Bearer token from Authorization header
         db: Database session
 
     Returns:
-        User: The authenticated user object
+        Principal: Snapshot of the authenticated user
 
     Raises:
         HTTPException 401: If token is invalid or expired
@@ -116,10 +243,15 @@ async def get_current_user(
 
     Example:
         @app.get("/protected")
-        def protected_route(current_user: User = Depends(get_current_user)):
+        def protected_route(current_user: Principal = Depends(get_current_user)):
             return {"user": current_user.username}
     """
     token = credentials.credentials
+    if principal_cache is not None:
+        principal = principal_cache.get(token)
+        if principal is not None:
+            return principal
+
     payload = verify_token(token)
 
     if payload is None:
@@ -160,12 +292,56 @@ async def get_current_user(
             detail="Usuario inactivo",
         )
 
+    principal = Principal.from_user(user)
+    if principal_cache is not None:
+        principal_cache.put(token, principal, expiration_timestamp(payload))
+    return principal
+
+
+def get_current_db_user(
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Load the authenticated user's row for endpoints that read or modify it.
+
+    Args:
+        current_user: Snapshot of the authenticated user
+        db: Database session
+
+    Returns:
+        User: The user row, attached to ``db``
+
+    Raises:
+        HTTPException 401: If the user no longer exists
+    """
+    user = db.query(User).filter(User.id == current_user.id).first()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Usuario no encontrado",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
+def invalidate_user_session_cache(user_id: int) -> None:
+    """
+    Drop the cached snapshots of a user.
+
+    Call this after committing a change to the user's credentials, status or
+    permissions (ORM updates already trigger it).
+
+    Args:
+        user_id: Id of the user
+    """
+    if principal_cache is not None:
+        principal_cache.invalidate_user(user_id)
+
+
 async def get_current_active_superuser(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """
     Get current user and verify they are a superuser.
 
@@ -173,7 +349,7 @@ async def get_current_active_superuser(
         current_user: The authenticated user
 
     Returns:
-        User: The authenticated superuser
+        Principal: The authenticated superuser
 
     Raises:
         HTTPException 403: If user is not a superuser
@@ -186,30 +362,16 @@ async def get_current_active_superuser(
     return current_user
 
 
-def get_user_jira_client(current_user: User = Depends(get_current_user)) -> JiraClient:
+def _require_jira_credentials(current_user: AuthenticatedUser) -> None:
     """
-    Get JiraClient instance with the current user's Jira credentials.
-
-    This dependency should be used in endpoints that need to interact with Jira
-    on behalf of the authenticated user.
+    Validate that the user has configured Jira credentials.
 
     Args:
-        current_user: The authenticated user (injected by dependency)
-
-    Returns:
-        JiraClient: Configured with user's Jira credentials
+        current_user: The authenticated user
 
     Raises:
         HTTPException 400: If user hasn't configured Jira credentials
-        HTTPException 500: If JiraClient initialization fails
-
-    Example:
-        @app.get("/projects")
-        def list_projects(jira_client: JiraClient = Depends(get_user_jira_client)):
-            return jira_client.get_projects()
     """
-    from app.core.encryption import decrypt_token
-
     # Validate user has Jira credentials configured
     if not current_user.jira_base_url:
         raise HTTPException(
@@ -229,18 +391,492 @@ def get_user_jira_client(current_user: User = Depends(get_current_user)) -> Jira
             detail="Usuario no tiene configurado el token de Jira. Por favor, actualiza tu perfil."
         )
 
+
+def _get_user_jira_credentials(current_user: AuthenticatedUser) -> Tuple[str, str, str]:
+    """
+    Validate and decrypt the Jira credentials stored for a user.
+
+    Args:
+        current_user: The authenticated user
+
+    Returns:
+        Tuple (base_url, email, decrypted_api_token)
+
+    Raises:
+        HTTPException 400: If user hasn't configured Jira credentials
+        HTTPException 500: If the stored token cannot be decrypted
+    """
+    from app.core.encryption import decrypt_token
+
+    _require_jira_credentials(current_user)
+
     try:
         # Decrypt Jira API token
         decrypted_token = decrypt_token(current_user.jira_api_token)
-
-        # Create JiraClient with user's credentials
-        return JiraClient(
-            base_url=current_user.jira_base_url,
-            email=current_user.jira_email,
-            api_token=decrypted_token
-        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error al inicializar cliente de Jira: {str(e)}"
         )
+
+    return current_user.jira_base_url, current_user.jira_email, decrypted_token
+
+
+def _user_client_key(current_user: AuthenticatedUser) -> Tuple[int, str]:
+    """
+    Registry key for a user's Jira client.
+
+    The fingerprint covers the stored (encrypted) credentials, so a cache hit
+    needs no decryption and any credential change maps to a new client.
+
+    Args:
+        current_user: The authenticated user
+
+    Returns:
+        Tuple (user_id, credential_fingerprint)
+
+    Raises:
+        HTTPException 400: If user hasn't configured Jira credentials
+    """
+    _require_jira_credentials(current_user)
+    if isinstance(current_user, Principal):
+        # Computed once when the snapshot was taken
+        return current_user.id, current_user.jira_fingerprint
+    return current_user.id, credential_fingerprint(
+        current_user.jira_base_url,
+        current_user.jira_email,
+        current_user.jira_api_token
+    )
+
+
+def jira_tenant_key(current_user: AuthenticatedUser) -> Tuple[int, str]:
+    """
+    Key for data fetched with the user's Jira credentials (e.g. projects).
+
+    Same key as the client registry: the app user plus the fingerprint of
+    their stored credentials, token included. Keying by site and email alone
+    would let another user who sets the same URL and email, with any token,
+    read this user's cached data without Jira ever checking that token.
+
+    Args:
+        current_user: The authenticated user
+
+    Returns:
+        Tuple (user_id, credential_fingerprint)
+
+    Raises:
+        HTTPException 400: If user hasn't configured Jira credentials
+    """
+    return _user_client_key(current_user)
+
+
+def invalidate_user_jira_clients(user_id: int) -> None:
+    """
+    Drop the cached Jira clients of a user.
+
+    Call this whenever the user's Jira credentials change.
+
+    Args:
+        user_id: Id of the user
+    """
+    jira_client_registry.invalidate(user_id)
+    async_jira_client_registry.invalidate(user_id)
+
+
+def get_user_jira_client(current_user: Principal = Depends(get_current_user)) -> Iterator[JiraClient]:
+    """
+    Get JiraClient instance with the current user's Jira credentials.
+
+    This dependency should be used in endpoints that need to interact with Jira
+    on behalf of the authenticated user. The client comes from a process-wide
+    registry, so its connection pool stays warm across requests.
+
+    Args:
+        current_user: The authenticated user (injected by dependency)
+
+    Yields:
+        JiraClient: Configured with user's Jira credentials
+
+    Raises:
+        HTTPException 400: If user hasn't configured Jira credentials
+        HTTPException 500: If JiraClient initialization fails
+
+    Example:
+        @app.get("/projects")
+        def list_projects(jira_client: JiraClient = Depends(get_user_jira_client)):
+            return jira_client.get_projects()
+    """
+    def create_client() -> JiraClient:
+        base_url, email, api_token = _get_user_jira_credentials(current_user)
+        try:
+            # Create JiraClient with user's credentials
+            return JiraClient(
+                base_url=base_url,
+                email=email,
+                api_token=api_token,
+                config=get_jira_client_config()
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error al inicializar cliente de Jira: {str(e)}"
+            )
+
+    key = _user_client_key(current_user)
+    jira_client = jira_client_registry.acquire(key, create_client)
+    try:
+        yield jira_client
+    finally:
+        jira_client_registry.release(key, jira_client)
+
+
+@asynccontextmanager
+async def lease_user_async_jira_client(user: AuthenticatedUser) -> AsyncIterator[AsyncJiraClient]:
+    """
+    Borrow the user's AsyncJiraClient from the registry for the block.
+
+    Shared by the request dependency and by background jobs (the outbox
+    worker), so both reuse the same pooled client per user.
+
+    Args:
+        user: User whose Jira credentials are used
+
+    Yields:
+        AsyncJiraClient: Configured with the user's Jira credentials
+
+    Raises:
+        HTTPException 400: If user hasn't configured Jira credentials
+        HTTPException 500: If AsyncJiraClient initialization fails
+    """
+    def create_client() -> AsyncJiraClient:
+        base_url, email, api_token = _get_user_jira_credentials(user)
+        try:
+            return AsyncJiraClient(
+                base_url=base_url,
+                email=email,
+                api_token=api_token,
+                config=get_jira_client_config()
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error al inicializar cliente de Jira: {str(e)}"
+            )
+
+    key = _user_client_key(user)
+    jira_client = async_jira_client_registry.acquire(key, create_client)
+    try:
+        yield jira_client
+    finally:
+        async_jira_client_registry.release(key, jira_client)
+
+
+async def get_user_async_jira_client(
+    current_user: Principal = Depends(get_current_user)
+) -> AsyncIterator[AsyncJiraClient]:
+    """
+    Get AsyncJiraClient instance with the current user's Jira credentials.
+
+    Use this dependency from ``async def`` endpoints so Jira calls are awaited
+    instead of blocking the event loop. The client comes from a process-wide
+    registry and is returned to it when the request finishes; idle clients
+    are closed by the registry.
+
+    Args:
+        current_user: The authenticated user (injected by dependency)
+
+    Yields:
+        AsyncJiraClient: Configured with user's Jira credentials
+
+    Raises:
+        HTTPException 400: If user hasn't configured Jira credentials
+        HTTPException 500: If AsyncJiraClient initialization fails
+
+    Example:
+        @app.get("/projects")
+        async def list_projects(
+            jira_client: AsyncJiraClient = Depends(get_user_async_jira_client)
+        ):
+            return await jira_client._make_request("GET", "/project")
+    """
+    async with lease_user_async_jira_client(current_user) as jira_client:
+        yield jira_client
+
+
+# Per-project assignable users, for resolving assignee names without Jira
+user_directory: Optional[UserDirectory] = UserDirectory(
+    refresh_interval=settings.USER_DIRECTORY_REFRESH_SECONDS,
+    max_distance=settings.USER_DIRECTORY_MAX_DISTANCE
+) if settings.USER_DIRECTORY_ENABLED else None
+
+# Project lists per Jira account, served stale while they refresh
+project_cache = ProjectListCache(
+    soft_ttl=settings.PROJECT_CACHE_SOFT_TTL,
+    hard_ttl=settings.PROJECT_CACHE_HARD_TTL,
+    refresh_timeout=settings.PROJECT_CACHE_REFRESH_TIMEOUT
+)
+
+# Background sender for writes accepted with "Prefer: respond-async"
+outbox_worker = OutboxWorker(
+    session_factory=SessionLocal,
+    client_provider=lease_user_async_jira_client,
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_POLL_INTERVAL,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    retry_base_delay=settings.OUTBOX_RETRY_BASE_DELAY,
+    retry_max_delay=settings.OUTBOX_RETRY_MAX_DELAY,
+    lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+    workflow_deadline=settings.WORKFLOW_DEADLINE_SECONDS,
+    user_directory=user_directory
+)
+
+
+def _ping_database() -> None:
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+    finally:
+        db.close()
+
+
+async def check_database() -> None:
+    """Run ``SELECT 1`` in a worker thread so a slow database never blocks the loop."""
+    await asyncio.to_thread(_ping_database)
+
+
+async def check_shared_cache() -> str:
+    """
+    Ping the shared cache backend.
+
+    Returns:
+        Backend name
+
+    Raises:
+        RuntimeError: If the backend does not answer
+    """
+    backend = get_cache_backend()
+    if not await asyncio.to_thread(backend.ping):
+        raise RuntimeError(f"El backend {backend.name} no responde")
+    return backend.name
+
+
+async def check_jira() -> dict:
+    """
+    Call /myself with the global Jira credentials.
+
+    The client is kept in the client registry under its own key, so
+    successive checks reuse one warm connection pool.
+
+    Returns:
+        Display name of the Jira account
+    """
+    key = ("health", credential_fingerprint(settings.JIRA_BASE_URL, settings.JIRA_EMAIL, settings.JIRA_API_TOKEN))
+    jira_client = async_jira_client_registry.acquire(
+        key, lambda: AsyncJiraClient(config=get_jira_client_config())
+    )
+    try:
+        with deadline(settings.HEALTH_DEADLINE_SECONDS):
+            user = await jira_client.get_current_user()
+    finally:
+        async_jira_client_registry.release(key, jira_client)
+    return {"user": user.get("displayName", "unknown")}
+
+
+async def check_outbox() -> dict:
+    """
+    Outbox backlog by status, queried in a worker thread.
+
+    Returns:
+        outbox_worker.snapshot()
+    """
+    return await asyncio.to_thread(outbox_worker.snapshot)
+
+
+def jira_configured() -> bool:
+    """Whether global Jira credentials are set (otherwise only per-user credentials exist)."""
+    return bool(settings.JIRA_BASE_URL and settings.JIRA_EMAIL and settings.JIRA_API_TOKEN)
+
+
+# Dependency checks refreshed in the background; probes only read the results.
+# Only the database gates readiness: Jira and the cache degrade the service.
+health_monitor = HealthMonitor(
+    interval=settings.HEALTH_CHECK_INTERVAL,
+    timeout=settings.HEALTH_DEADLINE_SECONDS,
+    stale_after=settings.HEALTH_STALE_AFTER or None
+)
+health_monitor.register("database", check_database)
+if get_cache_backend() is not None:
+    health_monitor.register("shared_cache", check_shared_cache, critical=False)
+if jira_configured():
+    health_monitor.register("jira", check_jira, critical=False)
+if settings.OUTBOX_ENABLED:
+    health_monitor.register("outbox", check_outbox, critical=False)
+
+
+def prefers_async(request: Request) -> bool:
+    """
+    Whether the client asked for asynchronous processing (RFC 7240).
+
+    Only honoured when the outbox is enabled; otherwise the request is
+    processed synchronously as usual.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        True if the ``Prefer`` header contains ``respond-async``
+    """
+    if not settings.OUTBOX_ENABLED:
+        return False
+    preferences = ",".join(request.headers.getlist("prefer"))
+    return any(
+        token.split(";")[0].strip().lower() == "respond-async"
+        for token in preferences.split(",")
+    )
+
+
+# Stored outcomes of requests sent with an Idempotency-Key header
+idempotency_store = IdempotencyStore(
+    session_factory=SessionLocal,
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+    lock_timeout=settings.IDEMPOTENCY_LOCK_SECONDS,
+    wait_timeout=settings.IDEMPOTENCY_WAIT_SECONDS,
+    purge_interval=settings.IDEMPOTENCY_PURGE_INTERVAL
+)
+
+# Response headers replayed along with the stored body
+_IDEMPOTENT_HEADERS = ("location", "preference-applied")
+
+
+class IdempotencyContext:
+    """
+    Idempotency state of the current request.
+
+    ``replay`` holds the stored response when the key was already used;
+    the endpoint returns it as is. Otherwise the endpoint runs normally and
+    passes its result through ``save()`` so retries can replay it.
+    """
+
+    def __init__(
+        self,
+        store: Optional[IdempotencyStore] = None,
+        record: Optional[IdempotencyRecord] = None,
+        replay: Optional[Response] = None
+    ):
+        self.store = store
+        self.record = record
+        self.replay = replay
+        self.saved = False
+
+    async def save(self, result: Any, status_code: int = status.HTTP_200_OK) -> Any:
+        """
+        Store the endpoint's successful result for the idempotency key.
+
+        Args:
+            result: Response model or Response returned by the endpoint
+            status_code: Status code for a response model result
+
+        Returns:
+            The same result, so endpoints can ``return await ...save(result)``
+        """
+        if self.record is None:
+            return result
+
+        headers = {}
+        if isinstance(result, Response):
+            body = result.body.decode("utf-8")
+            status_code = result.status_code
+            headers = {
+                name: result.headers[name] for name in _IDEMPOTENT_HEADERS if name in result.headers
+            }
+        else:
+            body = json.dumps(jsonable_encoder(result), ensure_ascii=False, separators=(",", ":"))
+
+        await self.store.complete(self.record, status_code, body, headers)
+        self.saved = True
+        return result
+
+
+def _replay_response(record: IdempotencyRecord) -> Response:
+    """Rebuild the stored response of an idempotency record."""
+    headers = dict(record.headers_data)
+    headers["Idempotent-Replayed"] = "true"
+    return Response(
+        content=record.response_body,
+        status_code=record.response_status,
+        media_type="application/json",
+        headers=headers
+    )
+
+
+async def idempotency_guard(
+    request: Request,
+    current_user: Principal = Depends(get_current_user)
+) -> AsyncIterator[IdempotencyContext]:
+    """
+    Honour the ``Idempotency-Key`` header on create endpoints.
+
+    The first request with a key runs and its successful response is
+    stored; retries with the same key get that response back without
+    calling Jira again, and concurrent duplicates wait for the first one
+    to finish. If the endpoint fails the key is released so the client
+    can retry.
+
+    Args:
+        request: Incoming request
+        current_user: The authenticated user (keys are scoped per user)
+
+    Yields:
+        IdempotencyContext: Replay response or the claimed key
+
+    Raises:
+        HTTPException 400: If the key is empty or too long
+        HTTPException 409: If the original request is still running
+        HTTPException 422: If the key was used with a different request
+
+    Example:
+        @router.post("/batch")
+        async def create_batch(
+            request: CreateBatchTasksRequest,
+            idempotency: IdempotencyContext = Depends(idempotency_guard)
+        ):
+            if idempotency.replay is not None:
+                return idempotency.replay
+            ...
+            return await idempotency.save(response)
+    """
+    key = request.headers.get("idempotency-key")
+    if key is None or not settings.IDEMPOTENCY_ENABLED:
+        yield IdempotencyContext()
+        return
+
+    body = await request.body()
+    path = request.url.path
+    try:
+        state, record = await idempotency_store.begin(
+            current_user.id,
+            key.strip(),
+            f"{request.method} {path}",
+            request_fingerprint(request.method, path, body)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IdempotencyKeyMismatchException as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message)
+    except IdempotencyInProgressException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=e.message,
+            headers={"Retry-After": "1"}
+        )
+
+    if state == REPLAY:
+        yield IdempotencyContext(replay=_replay_response(record))
+        return
+
+    context = IdempotencyContext(idempotency_store, record)
+    try:
+        yield context
+    finally:
+        if not context.saved:
+            await idempotency_store.release(record)
@@ -11,11 +11,18 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.security import HTTPAuthorizationCredentials, OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_current_user
+from app.api.dependencies import (
+    get_current_db_user,
+    get_current_user,
+    invalidate_user_jira_clients,
+    invalidate_user_session_cache,
+    principal_cache,
+    security,
+)
 from app.core.database import get_db
 from app.core.security import (
     verify_password,
@@ -25,6 +32,7 @@ from app.core.security import (
 )
 from app.core.encryption import encrypt_token, decrypt_token
 from app.models.user import User
+from app.services.principal_cache import Principal
 
 router = APIRouter()
 
@@ -234,7 +242,7 @@ async def login(
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: User = Depends(get_current_db_user)):
     """
     Get information about the currently authenticated user.
 
@@ -250,19 +258,28 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: Principal = Depends(get_current_user)
+):
     """
     Logout endpoint.
 
     Since JWT is stateless, logout is handled client-side by deleting the token.
+    The server drops its cached snapshot for the token, so the next request
+    with it is verified against the database again.
     This endpoint exists for consistency and can be extended for token blacklisting.
 
     Args:
+        credentials: Bearer token being logged out (injected by dependency)
         current_user: Current authenticated user (injected by dependency)
 
     Returns:
         dict: Success message
     """
+    if principal_cache is not None:
+        principal_cache.invalidate_token(credentials.credentials)
+
     return {
         "message": "Logout exitoso",
         "detail": "Por favor, elimina el token del cliente"
@@ -272,7 +289,7 @@ async def logout(current_user: User = Depends(get_current_user)):
 @router.put("/jira-credentials", response_model=UserResponse)
 async def update_jira_credentials(
     credentials: UpdateJiraCredentials,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -307,6 +324,10 @@ async def update_jira_credentials(
     db.commit()
     db.refresh(current_user)
 
+    # Clients and session snapshots built with the old credentials must not be reused
+    invalidate_user_jira_clients(current_user.id)
+    invalidate_user_session_cache(current_user.id)
+
     return UserResponse(
         id=current_user.id,
         email=current_user.email,
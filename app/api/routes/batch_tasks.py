@@ -6,12 +6,25 @@ from pydantic import BaseModel, Field
 from typing import List, Optional
 
 from app.parsers.task_parser import create_parser
-from app.clients.jira_client import JiraClient, JiraAPIError
+from app.clients.jira_client import JiraAPIError
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.deadline import deadline, expired
+from app.core.config import settings
 from app.services.reel_workflow_service import ReelWorkflowService
-from app.api.dependencies import get_user_jira_client
+from app.services.principal_cache import Principal
+from app.services.user_directory import resolve_assignee
+from app.api.dependencies import (
+    get_current_user,
+    get_user_async_jira_client,
+    lease_user_async_jira_client,
+    instrument_request,
+    idempotency_guard,
+    IdempotencyContext,
+    user_directory,
+)
 
 
-router = APIRouter(tags=["Batch Tasks"])
+router = APIRouter(tags=["Batch Tasks"], dependencies=[Depends(instrument_request)])
 
 
 # ============================================================================
@@ -81,6 +94,14 @@ class SubtaskInfo(BaseModel):
     url: str = Field(..., description="URL de la subtarea en Jira")
 
 
+class FailedSubtaskInfo(BaseModel):
+    """Subtarea que Jira rechazó al crear el workflow."""
+
+    phase: str = Field(..., description="Fase de producción", example="Edición")
+    emoji: str = Field(..., description="Emoji identificador", example="✂️")
+    error: str = Field(..., description="Mensaje de error de Jira")
+
+
 class TaskResult(BaseModel):
     """Resultado de crear un workflow de Instagram."""
 
@@ -89,6 +110,7 @@ class TaskResult(BaseModel):
     main_task_url: Optional[str] = Field(None, description="URL de la tarea principal en Jira")
     content_type: Optional[str] = Field(None, description="Tipo de contenido (Reel/Historia/Carrusel)", example="Reel", examples=["Reel", "Historia", "Carrusel"])
     subtasks: Optional[List[SubtaskInfo]] = Field(None, description="Lista de subtareas creadas")
+    failed_subtasks: Optional[List[FailedSubtaskInfo]] = Field(None, description="Subtareas que fallaron")
     total_tasks: Optional[int] = Field(None, description="Total de tareas creadas (1 principal + subtareas)")
     error: Optional[str] = Field(None, description="Mensaje de error si falló")
     original_text: str = Field(..., description="Texto original de la tarea")
@@ -112,7 +134,9 @@ class CreateBatchTasksResponse(BaseModel):
 @router.post("/batch", response_model=CreateBatchTasksResponse)
 async def create_batch_tasks(
     request: CreateBatchTasksRequest,
-    jira_client: JiraClient = Depends(get_user_jira_client)
+    jira_client: AsyncJiraClient = Depends(get_user_async_jira_client),
+    idempotency: IdempotencyContext = Depends(idempotency_guard),
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Crea múltiples workflows de Instagram (Reels/Historias/Carruseles) a partir de un array de textos.
@@ -130,9 +154,15 @@ async def create_batch_tasks(
     3. Crea workflow completo con subtareas usando las credenciales del usuario
     4. Retorna un resumen con éxitos y fallos
 
+    Con el header ``Idempotency-Key`` un reintento recibe el resumen del
+    primer request (incluidos sus fallos parciales) sin volver a crear los
+    workflows.
+
     Args:
         request: Objeto con array de 'tasks' y 'project_key'
         jira_client: Cliente de Jira con credenciales del usuario (inyectado)
+        idempotency: Estado del Idempotency-Key del request (inyectado)
+        current_user: Usuario autenticado (inyectado)
 
     Returns:
         CreateBatchTasksResponse con resultados de cada workflow
@@ -140,13 +170,20 @@ async def create_batch_tasks(
     Raises:
         HTTPException 400: Error de validación
         HTTPException 401: Error de autenticación con Jira
+        HTTPException 409: Request con el mismo Idempotency-Key aún en curso
+        HTTPException 422: Idempotency-Key reusado con otro body
         HTTPException 500: Error interno del servidor
 
     Notes:
         - Se procesarán todos los workflows aunque algunos fallen
+        - Si se agota BATCH_DEADLINE_SECONDS, los workflows pendientes fallan
+          sin llamar a Jira
         - El endpoint retorna 200 incluso si algunos workflows fallan
         - Máximo 50 workflows por request (cada uno crea 7 tareas)
     """
+    if idempotency.replay is not None:
+        return idempotency.replay
+
     try:
         # Crear servicio de workflow con el JiraClient del usuario
         service = ReelWorkflowService(jira_client)
@@ -157,92 +194,120 @@ async def create_batch_tasks(
         total_failed = 0
         total_jira_tasks = 0
 
-        for task_item in request.tasks:
-            try:
-                # 1. Parsear texto
-                parsed_task = parser.parse(task_item.text)
-
-                # 2. Detectar tipo de contenido (Reel, Historia o Carrusel)
-                content_type = "Reel"  # Default
-                text_lower = task_item.text.lower()
-
-                if "carrusel" in text_lower or "carousel" in text_lower:
-                    content_type = "Carrusel"
-                elif "historia" in text_lower or "story" in text_lower or "stories" in text_lower:
-                    content_type = "Historia"
-
-                # 3. Determinar assignee (prioridad: task_item.assignee > parsed_task.assignee)
-                assignee_account_id = None
-                if task_item.assignee:
-                    # Si viene del frontend (ya es un account_id), usarlo directamente
-                    assignee_account_id = task_item.assignee
-                elif parsed_task.assignee:
-                    # Si viene del texto parseado (es un nombre), buscar el account_id
-                    try:
-                        assignee_account_id = jira_client.get_user_account_id(
-                            parsed_task.assignee,
-                            request.project_key
+        # Presupuesto total del batch, compartido por todos los workflows
+        with deadline(settings.BATCH_DEADLINE_SECONDS):
+            for task_item in request.tasks:
+                if expired():
+                    # Sin presupuesto no se llama a Jira: los que faltan fallan ya
+                    results.append(TaskResult(
+                        success=False,
+                        error=f"Sin tiempo: el batch superó {settings.BATCH_DEADLINE_SECONDS}s",
+                        original_text=task_item.text
+                    ))
+                    total_failed += 1
+                    continue
+
+                try:
+                    # 1. Parsear texto
+                    parsed_task = await parser.aparse(task_item.text)
+
+                    # 2. Detectar tipo de contenido (Reel, Historia o Carrusel)
+                    content_type = "Reel"  # Default
+                    text_lower = task_item.text.lower()
+
+                    if "carrusel" in text_lower or "carousel" in text_lower:
+                        content_type = "Carrusel"
+                    elif "historia" in text_lower or "story" in text_lower or "stories" in text_lower:
+                        content_type = "Historia"
+
+                    # 3. Determinar assignee (prioridad: task_item.assignee > parsed_task.assignee)
+                    assignee_account_id = None
+                    if task_item.assignee:
+                        # Si viene del frontend (ya es un account_id), usarlo directamente
+                        assignee_account_id = task_item.assignee
+                    elif parsed_task.assignee:
+                        # Si viene del texto parseado (es un nombre), buscar el account_id
+                        try:
+                            assignee_account_id = await resolve_assignee(
+                                jira_client,
+                                parsed_task.assignee,
+                                request.project_key,
+                                user_directory,
+                                lease=lambda: lease_user_async_jira_client(current_user)
+                            )
+                        except Exception as e:
+                            # Si falla buscar el usuario, continuar sin assignee
+                            print(f"Warning: No se pudo encontrar usuario '{parsed_task.assignee}': {e}")
+
+                    # 4. Crear workflow completo
+                    # Usar la descripción del task_item si existe, sino usar la del parsed_task
+                    final_description = task_item.description if task_item.description else parsed_task.description
+
+                    # Cada workflow tiene su propio presupuesto de tiempo, recortado
+                    # a lo que quede del batch: uno lento no consume el de los demás
+                    with deadline(settings.WORKFLOW_DEADLINE_SECONDS):
+                        workflow_result = await service.create_reel_workflow(
+                            project_key=request.project_key,
+                            title=parsed_task.summary,
+                            content_type=content_type,
+                            priority=parsed_task.priority,
+                            labels=parsed_task.labels,
+                            assignee=assignee_account_id,
+                            description=final_description,
+                            subtask_ids=task_item.subtasks
                         )
-                    except Exception as e:
-                        # Si falla buscar el usuario, continuar sin assignee
-                        print(f"Warning: No se pudo encontrar usuario '{parsed_task.assignee}': {e}")
-
-                # 4. Crear workflow completo
-                # Usar la descripción del task_item si existe, sino usar la del parsed_task
-                final_description = task_item.description if task_item.description else parsed_task.description
-
-                workflow_result = service.create_reel_workflow(
-                    project_key=request.project_key,
-                    title=parsed_task.summary,
-                    content_type=content_type,
-                    priority=parsed_task.priority,
-                    labels=parsed_task.labels,
-                    assignee=assignee_account_id,
-                    description=final_description,
-                    subtask_ids=task_item.subtasks
-                )
-
-                # 5. Formatear subtareas
-                subtasks_info = [
-                    SubtaskInfo(
-                        key=subtask["key"],
-                        phase=subtask["phase"],
-                        emoji=subtask["emoji"],
-                        url=subtask["url"]
-                    )
-                    for subtask in workflow_result["subtasks"]
-                ]
-
-                # Éxito
-                results.append(TaskResult(
-                    success=True,
-                    main_task_key=workflow_result["main_task"]["key"],
-                    main_task_url=workflow_result["main_task"]["url"],
-                    content_type=content_type,
-                    subtasks=subtasks_info,
-                    total_tasks=workflow_result["total_tasks"],
-                    original_text=task_item.text
-                ))
-                total_created += 1
-                total_jira_tasks += workflow_result["total_tasks"]
-
-            except Exception as e:
-                # Fallo en este workflow específico
-                results.append(TaskResult(
-                    success=False,
-                    error=str(e),
-                    original_text=task_item.text
-                ))
-                total_failed += 1
-
-        return CreateBatchTasksResponse(
-            success=total_failed == 0,
+
+                    # 5. Formatear subtareas
+                    subtasks_info = [
+                        SubtaskInfo(
+                            key=subtask["key"],
+                            phase=subtask["phase"],
+                            emoji=subtask["emoji"],
+                            url=subtask["url"]
+                        )
+                        for subtask in workflow_result["subtasks"]
+                    ]
+                    failed_info = [
+                        FailedSubtaskInfo(
+                            phase=failed["phase"],
+                            emoji=failed["emoji"],
+                            error=failed["error"]
+                        )
+                        for failed in workflow_result["failed_subtasks"]
+                    ]
+
+                    # La tarea principal existe aunque fallen algunas subtareas
+                    results.append(TaskResult(
+                        success=workflow_result["success"],
+                        main_task_key=workflow_result["main_task"]["key"],
+                        main_task_url=workflow_result["main_task"]["url"],
+                        content_type=content_type,
+                        subtasks=subtasks_info,
+                        failed_subtasks=failed_info or None,
+                        error=f"{len(failed_info)} subtareas no se pudieron crear" if failed_info else None,
+                        total_tasks=workflow_result["total_tasks"],
+                        original_text=task_item.text
+                    ))
+                    total_created += 1
+                    total_jira_tasks += workflow_result["total_tasks"]
+
+                except Exception as e:
+                    # Fallo en este workflow específico
+                    results.append(TaskResult(
+                        success=False,
+                        error=str(e),
+                        original_text=task_item.text
+                    ))
+                    total_failed += 1
+
+        return await idempotency.save(CreateBatchTasksResponse(
+            success=all(result.success for result in results),
             total_requested=len(request.tasks),
             total_created=total_created,
             total_failed=total_failed,
             total_tasks_created=total_jira_tasks,
             results=results
-        )
+        ))
 
     except JiraAPIError as e:
         if e.status_code == 401:
@@ -3,15 +3,37 @@ Instagram content creation endpoints.
 """
 from fastapi import APIRouter, HTTPException, Depends, status
 from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.parsers.task_parser import create_parser
-from app.clients.jira_client import JiraClient, JiraAPIError
+from app.clients.jira_client import JiraAPIError
+from app.clients.async_jira_client import AsyncJiraClient
+from app.core.database import get_db
+from app.models.outbox import OUTBOX_WORKFLOW
+from app.services.principal_cache import Principal
 from app.services.reel_workflow_service import ReelWorkflowService
-from app.api.dependencies import get_user_jira_client
-
-
-router = APIRouter(tags=["Instagram Content"])
+from app.services.outbox_service import enqueue_jira_write
+from app.services.user_directory import resolve_assignee
+from app.api.dependencies import (
+    get_current_user,
+    get_user_async_jira_client,
+    lease_user_async_jira_client,
+    request_deadline,
+    instrument_request,
+    outbox_worker,
+    prefers_async,
+    idempotency_guard,
+    IdempotencyContext,
+    user_directory,
+)
+from app.api.routes.outbox import OutboxAcceptedResponse, accepted_response
+
+
+router = APIRouter(
+    tags=["Instagram Content"],
+    dependencies=[Depends(request_deadline), Depends(instrument_request)]
+)
 
 
 # ============================================================================
@@ -55,14 +77,23 @@ class SubtaskInfo(BaseModel):
     url: str = Field(..., description="URL de la subtarea en Jira")
 
 
+class FailedSubtaskInfo(BaseModel):
+    """Subtarea que Jira rechazó al crear el workflow."""
+
+    phase: str = Field(..., description="Fase de producción", example="Edición")
+    emoji: str = Field(..., description="Emoji identificador", example="✂️")
+    error: str = Field(..., description="Mensaje de error de Jira")
+
+
 class CreateInstagramContentResponse(BaseModel):
     """Response al crear contenido de Instagram."""
 
-    success: bool = Field(default=True)
+    success: bool = Field(default=True, description="False si alguna subtarea no se pudo crear")
     main_task_key: str = Field(..., description="Clave de la tarea principal", example="KAN-123")
     main_task_url: str = Field(..., description="URL de la tarea principal en Jira")
     content_type: str = Field(..., description="Tipo de contenido detectado", example="Reel", examples=["Reel", "Historia", "Carrusel"])
     subtasks: List[SubtaskInfo] = Field(..., description="Lista de subtareas creadas")
+    failed_subtasks: List[FailedSubtaskInfo] = Field(default_factory=list, description="Subtareas que fallaron")
     total_tasks: int = Field(..., description="Total de tareas creadas (1 principal + subtareas)")
 
 
@@ -70,10 +101,18 @@ class CreateInstagramContentResponse(BaseModel):
 # Endpoints
 # ============================================================================
 
-@router.post("/instagram", response_model=CreateInstagramContentResponse)
+@router.post(
+    "/instagram",
+    response_model=CreateInstagramContentResponse,
+    responses={202: {"model": OutboxAcceptedResponse}}
+)
 async def create_instagram_content(
     request: CreateInstagramContentRequest,
-    jira_client: JiraClient = Depends(get_user_jira_client)
+    jira_client: AsyncJiraClient = Depends(get_user_async_jira_client),
+    respond_async: bool = Depends(prefers_async),
+    idempotency: IdempotencyContext = Depends(idempotency_guard),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
     Crea contenido de Instagram (Reel, Historia o Carrusel) con workflow completo.
@@ -86,25 +125,43 @@ async def create_instagram_content(
     3. Crea tarea principal + 6 subtareas de producción usando credenciales del usuario
     4. Retorna el key de la tarea principal y subtareas
 
+    Con el header ``Prefer: respond-async`` el workflow se guarda en el
+    outbox tras el parseo y se responde 202 con la URL de su estado; el
+    worker lo crea en Jira en segundo plano.
+
+    Con el header ``Idempotency-Key`` un reintento (o un doble envío del
+    formulario) recibe la respuesta del primer request en lugar de crear
+    otro workflow completo.
+
     Args:
         request: Objeto con 'text' (descripción natural) y 'project_key' (opcional)
         jira_client: Cliente de Jira con credenciales del usuario (inyectado)
+        respond_async: Si el cliente pidió procesamiento asíncrono (inyectado)
+        idempotency: Estado del Idempotency-Key del request (inyectado)
+        current_user: Usuario autenticado (inyectado)
+        db: Sesión de base de datos (inyectada)
 
     Returns:
-        CreateInstagramContentResponse con main_task_key y lista de subtasks
+        CreateInstagramContentResponse con main_task_key y lista de subtasks,
+        u OutboxAcceptedResponse (202) si se procesa en segundo plano
 
     Raises:
         HTTPException 400: Error de validación o parsing
         HTTPException 401: Token inválido o expirado
+        HTTPException 409: Request con el mismo Idempotency-Key aún en curso
+        HTTPException 422: Idempotency-Key reusado con otro body
         HTTPException 500: Error interno del servidor
     """
+    if idempotency.replay is not None:
+        return idempotency.replay
+
     try:
         # Crear servicio de workflow con el JiraClient del usuario
         service = ReelWorkflowService(jira_client)
 
         # 1. Parsear texto
         parser = create_parser(use_llm=False)
-        parsed_task = parser.parse(request.text)
+        parsed_task = await parser.aparse(request.text)
 
         # 2. Detectar tipo de contenido (Reel, Historia o Carrusel)
         content_type = "Reel"  # Default
@@ -115,19 +172,35 @@ async def create_instagram_content(
         elif "historia" in text_lower or "story" in text_lower or "stories" in text_lower:
             content_type = "Historia"
 
+        # Usar la descripción del request si existe, sino usar la del parsed_task
+        final_description = request.description if request.description else parsed_task.description
+
+        if respond_async:
+            # El worker resuelve el assignee y crea el workflow más tarde
+            entry = enqueue_jira_write(db, current_user.id, OUTBOX_WORKFLOW, {
+                "project_key": request.project_key,
+                "title": parsed_task.summary,
+                "content_type": content_type,
+                "priority": parsed_task.priority,
+                "labels": parsed_task.labels,
+                "assignee_name": parsed_task.assignee,
+                "description": final_description,
+            })
+            outbox_worker.wake()
+            return await idempotency.save(accepted_response(entry))
+
         # 3. Buscar Account ID si hay assignee
         assignee_account_id = None
         if parsed_task.assignee:
-            assignee_account_id = jira_client.get_user_account_id(
+            assignee_account_id = await resolve_assignee(
+                jira_client,
                 parsed_task.assignee,
-                request.project_key
+                request.project_key,
+                user_directory,
+                lease=lambda: lease_user_async_jira_client(current_user)
             )
 
-        # 4. Crear workflow completo
-        # Usar la descripción del request si existe, sino usar la del parsed_task
-        final_description = request.description if request.description else parsed_task.description
-
-        result = service.create_reel_workflow(
+        result = await service.create_reel_workflow(
             project_key=request.project_key,
             title=parsed_task.summary,
             content_type=content_type,
@@ -137,7 +210,7 @@ async def create_instagram_content(
             description=final_description
         )
 
-        # 5. Formatear respuesta
+        # 4. Formatear respuesta
         subtasks_info = [
             SubtaskInfo(
                 key=subtask["key"],
@@ -147,15 +220,24 @@ async def create_instagram_content(
             )
             for subtask in result["subtasks"]
         ]
+        failed_info = [
+            FailedSubtaskInfo(
+                phase=failed["phase"],
+                emoji=failed["emoji"],
+                error=failed["error"]
+            )
+            for failed in result["failed_subtasks"]
+        ]
 
-        return CreateInstagramContentResponse(
-            success=True,
+        return await idempotency.save(CreateInstagramContentResponse(
+            success=result["success"],
             main_task_key=result["main_task"]["key"],
             main_task_url=result["main_task"]["url"],
             content_type=content_type,
             subtasks=subtasks_info,
+            failed_subtasks=failed_info,
             total_tasks=result["total_tasks"]
-        )
+        ))
 
     except ValueError as e:
         raise HTTPException(
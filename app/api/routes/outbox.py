@@ -0,0 +1,111 @@
+"""
+Outbox endpoints: estado de las escrituras a Jira aceptadas de forma asíncrona.
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.outbox import OutboxEntry
+from app.services.principal_cache import Principal
+from app.services.outbox_service import get_outbox_entry
+from app.api.dependencies import get_current_user
+
+
+router = APIRouter(tags=["Outbox"])
+
+
+# ============================================================================
+# Pydantic Models
+# ============================================================================
+
+class OutboxAcceptedResponse(BaseModel):
+    """Respuesta 202 al aceptar una escritura para enviarla en segundo plano."""
+
+    success: bool = Field(default=True)
+    outbox_id: int = Field(..., description="ID de la entrada en el outbox", example=42)
+    status: str = Field(..., description="Estado de la entrada", example="pending")
+    status_url: str = Field(..., description="URL para consultar el resultado", example="/api/v1/outbox/42")
+
+
+class OutboxEntryResponse(BaseModel):
+    """Estado de una escritura en el outbox."""
+
+    outbox_id: int = Field(..., description="ID de la entrada en el outbox")
+    kind: str = Field(..., description="Tipo de escritura: issue o workflow")
+    status: str = Field(..., description="pending, processing, done o failed")
+    attempts: int = Field(..., description="Intentos de envío a Jira")
+    last_error: Optional[str] = Field(None, description="Último error de Jira, si hubo")
+    result: Optional[Dict[str, Any]] = Field(None, description="Issues creados, una vez enviada")
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+
+
+def accepted_response(entry: OutboxEntry) -> JSONResponse:
+    """
+    Construye la respuesta 202 para una entrada recién encolada.
+
+    Args:
+        entry: Entrada creada en el outbox
+
+    Returns:
+        JSONResponse 202 con Location hacia el estado de la entrada
+    """
+    status_url = f"/api/v1/outbox/{entry.id}"
+    body = OutboxAcceptedResponse(outbox_id=entry.id, status=entry.status, status_url=status_url)
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=body.model_dump(),
+        headers={"Location": status_url, "Preference-Applied": "respond-async"}
+    )
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+@router.get("/outbox/{outbox_id}", response_model=OutboxEntryResponse)
+def get_outbox_status(
+    outbox_id: int,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Consulta el estado de una escritura aceptada con "Prefer: respond-async".
+
+    Requiere autenticación con JWT token. Solo el dueño de la entrada puede
+    consultarla.
+
+    Args:
+        outbox_id: ID retornado en la respuesta 202
+        current_user: Usuario autenticado (inyectado)
+        db: Sesión de base de datos (inyectada)
+
+    Returns:
+        OutboxEntryResponse con el estado y, si ya se envió, los issues creados
+
+    Raises:
+        HTTPException 401: Token inválido o expirado
+        HTTPException 404: La entrada no existe o es de otro usuario
+    """
+    entry = get_outbox_entry(db, outbox_id, current_user.id)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Entrada de outbox {outbox_id} no encontrada"
+        )
+
+    return OutboxEntryResponse(
+        outbox_id=entry.id,
+        kind=entry.kind,
+        status=entry.status,
+        attempts=entry.attempts,
+        last_error=entry.last_error,
+        result=entry.result_data,
+        created_at=entry.created_at,
+        completed_at=entry.completed_at
+    )
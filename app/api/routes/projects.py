@@ -5,11 +5,20 @@ from fastapi import APIRouter, HTTPException, Depends, status
 from pydantic import BaseModel, Field
 from typing import List, Optional
 
-from app.clients.jira_client import JiraClient, JiraAPIError
-from app.api.dependencies import get_user_jira_client
+from app.clients.jira_client import JiraAPIError
+from app.clients.async_jira_client import AsyncJiraClient
+from app.api.dependencies import (
+    get_user_async_jira_client,
+    request_deadline,
+    instrument_request,
+    user_directory,
+)
 
 
-router = APIRouter(tags=["Projects"])
+router = APIRouter(
+    tags=["Projects"],
+    dependencies=[Depends(request_deadline), Depends(instrument_request)]
+)
 
 
 # ============================================================================
@@ -42,7 +51,7 @@ class GetProjectUsersResponse(BaseModel):
 @router.get("/projects/{project_key}/users", response_model=GetProjectUsersResponse)
 async def get_project_users(
     project_key: str,
-    jira_client: JiraClient = Depends(get_user_jira_client)
+    jira_client: AsyncJiraClient = Depends(get_user_async_jira_client)
 ):
     """
     Obtiene todos los usuarios asignables a un proyecto específico.
@@ -85,19 +94,15 @@ async def get_project_users(
     """
     try:
         # Buscar usuarios asignables al proyecto usando la API de Jira
-        # Endpoint: /rest/api/3/user/assignable/search
-        response = jira_client._make_request(
-            method="GET",
-            endpoint="/user/assignable/search",
-            params={
-                "project": project_key,
-                "maxResults": 1000  # Máximo permitido por Jira
-            }
-        )
-
-        # Parsear usuarios
+        # Endpoint: /rest/api/3/user/assignable/search (paginado por startAt)
         users = []
-        for user_data in response:
+        raw_users = []
+        async for user_data in jira_client.paginate(
+            "/user/assignable/search",
+            params={"project": project_key},
+            page_size=1000  # Máximo permitido por Jira
+        ):
+            raw_users.append(user_data)
             # Verificar que el usuario esté activo
             if user_data.get("active", True):
                 users.append(JiraUser(
@@ -108,6 +113,10 @@ async def get_project_users(
                     avatar_url=user_data.get("avatarUrls", {}).get("48x48")
                 ))
 
+        # La lista completa ya está aquí: refrescar el directorio de assignees
+        if user_directory is not None:
+            user_directory.load(jira_client.base_url, project_key, raw_users)
+
         # Ordenar por nombre para mejor UX
         users.sort(key=lambda u: u.display_name.lower())
 
@@ -7,7 +7,7 @@ from typing import List
 from pydantic import BaseModel, Field
 
 from app.core.database import get_db
-from app.models.user import User
+from app.services.principal_cache import Principal
 from app.models.subtask import SubtaskTemplate
 from app.api.dependencies import get_current_user
 
@@ -136,7 +136,7 @@ def initialize_default_subtasks(user_id: int, db: Session) -> List[SubtaskTempla
 
 @router.get("", response_model=List[SubtaskResponse])
 async def get_subtasks(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -158,7 +158,7 @@ async def get_subtasks(
 @router.post("", response_model=SubtaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_subtask(
     subtask_data: SubtaskCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a new subtask template for the current user."""
@@ -187,7 +187,7 @@ async def create_subtask(
 async def update_subtask(
     subtask_id: int,
     subtask_data: SubtaskUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update a subtask template."""
@@ -221,7 +221,7 @@ async def update_subtask(
 @router.delete("/{subtask_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_subtask(
     subtask_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete a subtask template."""
@@ -254,7 +254,7 @@ async def delete_subtask(
 @router.post("/reorder", response_model=List[SubtaskResponse])
 async def reorder_subtasks(
     reorder_data: SubtaskReorder,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Reorder subtasks by providing ordered list of IDs."""
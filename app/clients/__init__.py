@@ -1,5 +1,6 @@
 """Clients package for external API integrations."""
 
-from app.clients.jira_client import JiraClient, JiraAPIError
+from app.clients.jira_client import JiraClient, JiraClientConfig, JiraAPIError
+from app.clients.async_jira_client import AsyncJiraClient
 
-__all__ = ["JiraClient", "JiraAPIError"]
+__all__ = ["JiraClient", "AsyncJiraClient", "JiraClientConfig", "JiraAPIError"]
@@ -0,0 +1,574 @@
+"""
+Async Jira REST API Client.
+
+Versión asyncio del cliente de Jira basada en httpx.AsyncClient, para usar
+desde los endpoints async de FastAPI sin bloquear el event loop mientras
+Jira responde.
+"""
+
+import asyncio
+from dataclasses import replace
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+import httpx
+
+from app.clients.jira_client import (
+    BULK_CREATE_LIMIT,
+    JiraClientBase,
+    JiraClientConfig,
+    JiraAPIError,
+)
+from app.clients import cassette
+from app.clients.create_meta import FieldMeta, IssueTypeMeta
+from app.clients.instrumentation import RequestTrace
+from app.clients.pagination import OFFSET, Pager
+from app.clients.single_flight import AsyncSingleFlight
+from app.clients.user_cache import MISS
+
+# GETs idénticos en vuelo, compartidos por todos los clientes asíncronos
+_single_flight = AsyncSingleFlight()
+
+
+class AsyncJiraClient(JiraClientBase):
+    """
+    Cliente asíncrono para Jira Cloud REST API v3.
+
+    Expone la misma interfaz que JiraClient, pero cada método es una
+    corrutina. Las conexiones se reutilizan a través del pool de
+    httpx.AsyncClient según JiraClientConfig.
+
+    Example:
+        >>> async with AsyncJiraClient() as client:
+        ...     user = await client.get_current_user()
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        email: Optional[str] = None,
+        api_token: Optional[str] = None,
+        config: Optional[JiraClientConfig] = None
+    ):
+        """
+        Inicializa el cliente asíncrono de Jira.
+
+        Args:
+            base_url: URL base de Jira (ej: https://company.atlassian.net)
+            email: Email del usuario de Jira
+            api_token: API token de Jira
+            config: Configuración de transporte (default: JiraClientConfig.from_env())
+        """
+        super().__init__(base_url, email, api_token, config)
+
+        # Cliente HTTP persistente con pool de conexiones
+        self.http = self._create_http_client()
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """
+        Crea el httpx.AsyncClient compartido por todas las peticiones.
+
+        Returns:
+            AsyncClient con límites de pool configurados según self.config
+        """
+        limits = httpx.Limits(
+            # Con pool_block se respeta el máximo por host; sin él se permiten
+            # conexiones extra que no vuelven al pool
+            max_connections=self.config.pool_maxsize if self.config.pool_block else None,
+            max_keepalive_connections=self.config.pool_maxsize if self.config.keep_alive else 0
+        )
+
+        # Con un transporte propio, los límites del pool van en el transporte
+        transport = None
+        if self.cassette_mode == cassette.REPLAY:
+            transport = cassette.ReplayTransport(self.cassette, self.config.cassette_speed)
+        elif self.cassette_mode == cassette.RECORD:
+            transport = cassette.RecordingTransport(self.cassette, httpx.AsyncHTTPTransport(limits=limits))
+
+        return httpx.AsyncClient(
+            headers=self.headers,
+            limits=limits,
+            transport=transport,
+            timeout=httpx.Timeout(self.config.timeout, connect=self.config.connect_timeout)
+        )
+
+    async def aclose(self) -> None:
+        """Cierra el cliente HTTP y libera las conexiones del pool."""
+        await self.http.aclose()
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        idempotent: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Realiza una petición HTTP a la API de Jira.
+
+        Los fallos transitorios se reintentan con la misma política que
+        JiraClient._make_request, esperando con asyncio.sleep, y los GETs
+        idénticos concurrentes comparten una sola petición.
+
+        Args:
+            method: Método HTTP (GET, POST, PUT, DELETE)
+            endpoint: Endpoint de la API (ej: /issue)
+            data: Datos JSON para el body (opcional)
+            params: Parámetros query string (opcional)
+            timeout: Timeout de lectura en segundos (default: self.config.timeout),
+                recortado al deadline de la petición en curso
+            idempotent: Marca la llamada como segura de repetir aunque el
+                método no lo sea. None = según el método
+
+        Returns:
+            Response JSON como diccionario
+
+        Raises:
+            JiraAPIError: Si la petición falla
+        """
+        key = self._coalesce_key(method, data, endpoint, params)
+        if key is not None:
+            return await _single_flight.do(
+                key,
+                lambda: self._send_request(method, endpoint, data, params, timeout, idempotent),
+                timeout_error=lambda: self._deadline_error(f"{self.api_url}{endpoint}")
+            )
+        return await self._send_request(method, endpoint, data, params, timeout, idempotent)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        idempotent: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Envía la petición con reintentos (ver _make_request()) y entrega el
+        resultado a los hooks de instrumentación.
+
+        Returns:
+            Response JSON como diccionario
+
+        Raises:
+            JiraAPIError: Si la petición falla
+        """
+        trace = RequestTrace(method, endpoint)
+        try:
+            result = await self._send_attempts(trace, method, endpoint, data, params, timeout, idempotent)
+        except BaseException as e:
+            self._observe_request(trace, e)
+            raise
+        self._observe_request(trace)
+        return result
+
+    async def _send_attempts(
+        self,
+        trace: RequestTrace,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        idempotent: Optional[bool]
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta los intentos de una petición anotándolos en `trace`.
+
+        Returns:
+            Response JSON como diccionario
+
+        Raises:
+            JiraAPIError: Si la petición falla
+        """
+        url = f"{self.api_url}{endpoint}"
+        body = self._encode_body(data)
+        wire_body, extra_headers = self._compress_body(body)
+        self.retry_stats.record_request()
+
+        attempt = 0
+        delay = None
+        while True:
+            # Sin presupuesto no se intenta; si el sitio está caído, fallar rápido
+            connect_timeout, read_timeout = self._call_timeouts(url, timeout)
+            self._check_circuit()
+
+            # Esperar turno en el rate limiter del sitio; si el intento se
+            # abandona sin enviarse, el permiso del breaker se devuelve
+            try:
+                wait = self._rate_limit_wait()
+                if wait > 0:
+                    if not self._fits_deadline(wait):
+                        raise self._deadline_error(url)
+                    await asyncio.sleep(wait)
+                    connect_timeout, read_timeout = self._call_timeouts(url, timeout)
+            except BaseException:
+                self._release_circuit()
+                raise
+
+            trace.sent(body, wire_body)
+            try:
+                response = await self.http.request(
+                    method=method,
+                    url=url,
+                    content=wire_body,
+                    headers=extra_headers,
+                    params=params,
+                    timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+                )
+            except httpx.TimeoutException as e:
+                sent = not isinstance(e, httpx.ConnectTimeout)
+                error = JiraAPIError(
+                    f"Timeout al conectar con Jira: {url}",
+                    status_code=None,
+                    request_sent=sent
+                )
+                self._record_circuit()
+                delay = self._next_retry_delay(
+                    method, url, attempt, delay,
+                    error=e,
+                    request_sent=sent,
+                    idempotent=idempotent
+                )
+            except httpx.HTTPError as e:
+                sent = not isinstance(e, httpx.ConnectError)
+                error = JiraAPIError(f"Error de conexión con Jira: {str(e)}", request_sent=sent)
+                self._record_circuit()
+                delay = self._next_retry_delay(
+                    method, url, attempt, delay,
+                    error=e,
+                    request_sent=sent,
+                    idempotent=idempotent
+                )
+            except BaseException:
+                # Cancelado a mitad del envío: no hay resultado que registrar
+                self._release_circuit()
+                raise
+            else:
+                trace.received(response.status_code, response.content, response.num_bytes_downloaded)
+                self._observe_rate_limit(response.status_code, response.headers)
+                self._record_circuit(response.status_code)
+                if not response.is_error:
+                    # Retornar JSON si hay contenido
+                    return self._parse_response(response)
+
+                error = self._error_from_response(response)
+                delay = self._next_retry_delay(
+                    method, url, attempt, delay,
+                    status_code=response.status_code,
+                    headers=response.headers,
+                    idempotent=idempotent
+                )
+
+            if delay is None:
+                raise error
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def create_issue(
+        self,
+        project_key: str,
+        summary: str,
+        description: Optional[str] = None,
+        issue_type: str = "Task",
+        priority: str = "Medium",
+        labels: Optional[List[str]] = None,
+        assignee: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Crea un nuevo issue en Jira.
+
+        Args:
+            Ver JiraClient.create_issue()
+
+        Returns:
+            Diccionario con id, key y self del issue creado
+
+        Raises:
+            JiraAPIError: Si falla la creación del issue
+            ValueError: Si los parámetros son inválidos
+        """
+        payload = await self._prepare_issue_payload(self._build_issue_payload(
+            project_key=project_key,
+            summary=summary,
+            description=description,
+            issue_type=issue_type,
+            priority=priority,
+            labels=labels,
+            assignee=assignee
+        ))
+
+        return await self._make_request(
+            method="POST",
+            endpoint="/issue",
+            data=payload
+        )
+
+    async def create_issues_bulk(
+        self,
+        payloads: List[Dict[str, Any]],
+        chunk_size: int = BULK_CREATE_LIMIT
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Crea varios issues con POST /issue/bulk.
+
+        Args:
+            Ver JiraClient.create_issues_bulk()
+
+        Returns:
+            Diccionario con "issues" creados y "errors", ambos con el índice
+            del payload original
+        """
+        result: Dict[str, List[Dict[str, Any]]] = {"issues": [], "errors": []}
+
+        sendable, positions = [], []
+        for index, payload in enumerate(payloads):
+            try:
+                sendable.append(await self._prepare_issue_payload(payload))
+                positions.append(index)
+            except JiraAPIError as e:
+                result["errors"].append(self._bulk_item_error(index, e))
+
+        sent: Dict[str, List[Dict[str, Any]]] = {"issues": [], "errors": []}
+        offset = 0
+        for chunk in self._bulk_chunks(sendable, chunk_size):
+            try:
+                response = await self._make_request(
+                    method="POST",
+                    endpoint="/issue/bulk",
+                    data={"issueUpdates": chunk}
+                )
+                self._merge_bulk_response(sent, offset, len(chunk), response)
+            except JiraAPIError as e:
+                self._merge_bulk_error(sent, offset, len(chunk), e)
+            offset += len(chunk)
+
+        return self._remap_bulk_result(result, sent, positions)
+
+    async def get_create_meta(self, project_key: str, issue_type: str) -> Optional[IssueTypeMeta]:
+        """
+        Metadatos de creación de un tipo de issue, desde la caché o createmeta.
+
+        Args:
+            Ver JiraClient.get_create_meta()
+
+        Returns:
+            Tipo con sus campos, o None si no hay metadatos
+
+        Raises:
+            JiraAPIError: (400 local) Si el proyecto no tiene ese tipo de issue
+        """
+        cache = self.create_meta_cache
+        if cache is None:
+            return None
+
+        issue_types = cache.get_issue_types(project_key)
+        if issue_types is MISS:
+            try:
+                issue_types = [
+                    IssueTypeMeta.from_api(item)
+                    async for item in self.paginate(
+                        f"/issue/createmeta/{project_key}/issuetypes", items_key="issueTypes"
+                    )
+                ]
+            except JiraAPIError as e:
+                self._create_meta_unavailable(project_key, e)
+                return None
+            cache.put_issue_types(project_key, issue_types)
+
+        match = self._match_issue_type(project_key, issue_types, issue_type)
+        if match is None:
+            return None
+
+        fields = cache.get_fields(project_key, match.id)
+        if fields is MISS:
+            try:
+                fields = {}
+                async for item in self.paginate(
+                    f"/issue/createmeta/{project_key}/issuetypes/{match.id}", items_key="fields"
+                ):
+                    meta = FieldMeta.from_api(item)
+                    fields[meta.field_id] = meta
+            except JiraAPIError as e:
+                self._create_meta_unavailable(project_key, e)
+                return None
+            cache.put_fields(project_key, match.id, fields)
+
+        return replace(match, fields=fields)
+
+    async def _prepare_issue_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Valida y normaliza un payload con createmeta antes de enviarlo.
+
+        Raises:
+            JiraAPIError: (400 local) Si el payload es inválido
+        """
+        project_key, issue_type = self._create_meta_target(payload)
+        if project_key is None or issue_type is None:
+            return payload
+        return self._apply_create_meta(payload, await self.get_create_meta(project_key, issue_type))
+
+    async def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        style: str = OFFSET,
+        page_size: int = 50,
+        items_key: str = "values"
+    ) -> AsyncIterator[Any]:
+        """
+        Recorre un endpoint paginado, resultado por resultado.
+
+        La página siguiente se pide en una tarea de fondo mientras el
+        llamador procesa la actual.
+
+        Args:
+            Ver JiraClient.paginate()
+
+        Yields:
+            Cada resultado de cada página, en orden
+
+        Example:
+            >>> async for project in client.paginate("/project/search"):
+            ...     print(project["key"])
+        """
+        pager = Pager(params, style=style, page_size=page_size, items_key=items_key)
+        page_params = pager.first_params()
+
+        task = asyncio.ensure_future(self._make_request("GET", endpoint, params=page_params))
+        try:
+            while task is not None:
+                response = await task
+
+                next_params = pager.next_params(page_params, response)
+                task = None
+                if next_params is not None:
+                    # Pedir la página siguiente antes de entregar la actual
+                    page_params = next_params
+                    task = asyncio.ensure_future(
+                        self._make_request("GET", endpoint, params=page_params)
+                    )
+
+                for item in pager.items(response):
+                    yield item
+        finally:
+            # Si el llamador deja de iterar, cancelar la página pendiente
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def get_issue(self, issue_key: str) -> Dict[str, Any]:
+        """
+        Obtiene información de un issue por su key.
+
+        Args:
+            issue_key: Key del issue (ej: "PROJ-123")
+
+        Returns:
+            Diccionario con información completa del issue
+        """
+        return await self._make_request(
+            method="GET",
+            endpoint=f"/issue/{issue_key}"
+        )
+
+    async def get_project(self, project_key: str) -> Dict[str, Any]:
+        """
+        Obtiene información de un proyecto.
+
+        Args:
+            project_key: Clave del proyecto (ej: "PROJ")
+
+        Returns:
+            Diccionario con información del proyecto
+        """
+        return await self._make_request(
+            method="GET",
+            endpoint=f"/project/{project_key}"
+        )
+
+    async def search_user(self, query: str, project_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Busca usuarios en Jira por nombre o email.
+
+        Args:
+            query: Nombre o email del usuario a buscar
+            project_key: Clave del proyecto para filtrar usuarios (opcional)
+
+        Returns:
+            Lista de usuarios que coinciden con la búsqueda
+        """
+        params = {"query": query}
+        if project_key:
+            params["project"] = project_key
+
+        return await self._make_request(
+            method="GET",
+            endpoint="/user/search",
+            params=params
+        )
+
+    async def get_user_account_id(self, name: str, project_key: Optional[str] = None) -> Optional[str]:
+        """
+        Obtiene el Account ID de un usuario por su nombre.
+
+        El resultado (también "no encontrado") se guarda en la caché de
+        accountIds del sitio, así las tareas siguientes con el mismo
+        assignee no vuelven a llamar a /user/search.
+
+        Args:
+            name: Nombre del usuario (ej: "Juan", "María")
+            project_key: Clave del proyecto para filtrar búsqueda (opcional)
+
+        Returns:
+            Account ID del usuario o None si no se encuentra
+        """
+        if self.account_id_cache is not None:
+            cached = await self.account_id_cache.aget(name, project_key)
+            if cached is not MISS:
+                return cached
+
+        try:
+            users = await self.search_user(name, project_key)
+        except JiraAPIError:
+            # Si hay error en la búsqueda, retornar None (sin cachear)
+            return None
+
+        # Account ID del primer match
+        account_id = users[0].get("accountId") if users else None
+        if self.account_id_cache is not None:
+            await self.account_id_cache.aput(name, project_key, account_id)
+        return account_id
+
+    async def get_current_user(self) -> Dict[str, Any]:
+        """
+        Obtiene información del usuario autenticado.
+
+        Returns:
+            Diccionario con información del usuario
+        """
+        return await self._make_request(
+            method="GET",
+            endpoint="/myself"
+        )
+
+    async def test_connection(self) -> bool:
+        """
+        Verifica si la conexión con Jira es exitosa.
+
+        Returns:
+            True si la conexión es exitosa, False en caso contrario
+        """
+        try:
+            await self.get_current_user()
+            return True
+        except JiraAPIError:
+            return False
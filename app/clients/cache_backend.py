@@ -0,0 +1,503 @@
+"""
+Backends de caché compartidos entre procesos.
+
+Las cachés del proceso (accountIds, createmeta, proyectos...) viven en la
+memoria de cada worker de uvicorn: con varios workers, cada uno arranca
+frío y repite las mismas consultas a Jira. Un CacheBackend es un almacén
+clave → bytes con TTL que pueden compartir todos los workers:
+
+- MemoryCacheBackend: LRU en memoria del proceso (tests, un solo worker).
+- RedisCacheBackend: Redis (``redis://``, ``rediss://`` o ``unix://``).
+
+Encima de un backend, un CacheNamespace guarda valores JSON (con el codec
+de json_codec, orjson si está instalado) bajo un prefijo propio, así el
+cliente de Jira, el parser y la autenticación comparten el mismo Redis sin
+pisarse las claves.
+
+La caché compartida nunca debe tumbar un request: un error de Redis cuenta
+como fallo de caché, y tras un error el backend deja de consultar Redis
+durante ``retry_interval`` segundos para no sumar el timeout del socket a
+cada llamada.
+
+Los comandos de Redis son bloqueantes: desde código async se usan los
+métodos ``aget``/``aset``/``adelete`` de CacheNamespace, que los corren en
+un hilo para no frenar el event loop.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.clients.json_codec import JsonCodec, get_codec
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - depende del entorno
+    redis = None
+
+# Marca de "no está en caché" (None es un valor válido)
+MISS = object()
+
+MEMORY_SCHEMES = ("memory",)
+REDIS_SCHEMES = ("redis", "rediss", "unix")
+
+# Errores de Redis que se tratan como fallo de caché
+_REDIS_ERRORS: Tuple[type, ...] = (OSError,) if redis is None else (redis.RedisError, OSError)
+
+
+class CacheBackend:
+    """Interfaz de un almacén clave → bytes con TTL."""
+
+    name = "base"
+    # True si las operaciones hacen I/O bloqueante (se corren en un hilo desde async)
+    blocking = False
+
+    def __init__(self, key_prefix: str = ""):
+        """
+        Inicializa los contadores comunes.
+
+        Args:
+            key_prefix: Prefijo de todas las claves (ej: "jira_agent:")
+        """
+        self.key_prefix = key_prefix
+        self._stats_lock = threading.Lock()
+
+        # Métricas
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.errors = 0
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Lee una clave.
+
+        Returns:
+            Valor guardado, o None si no existe, expiró o el backend falló
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Guarda una clave.
+
+        Args:
+            key: Clave completa (con prefijo)
+            value: Valor serializado
+            ttl: Segundos que vale la clave (0 = sin vencimiento)
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Descarta una clave (no falla si no existe)."""
+        raise NotImplementedError
+
+    def clear(self, prefix: str = "") -> int:
+        """
+        Descarta las claves que empiezan por un prefijo.
+
+        Args:
+            prefix: Prefijo completo (vacío = todas las de ``key_prefix``)
+
+        Returns:
+            Cantidad de claves descartadas
+        """
+        raise NotImplementedError
+
+    def ping(self) -> bool:
+        """True si el backend responde."""
+        return True
+
+    def close(self) -> None:
+        """Libera las conexiones del backend."""
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna el tipo de backend y sus contadores.
+
+        Returns:
+            Diccionario con backend, hits, misses, sets, errors y hit_ratio
+        """
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.name,
+                "hits": self.hits,
+                "misses": self.misses,
+                "sets": self.sets,
+                "errors": self.errors,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Backend LRU/TTL en memoria del proceso (no se comparte entre workers)."""
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        key_prefix: str = "",
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa el backend.
+
+        Args:
+            max_entries: Máximo de claves retenidas
+            key_prefix: Prefijo de todas las claves
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries debe ser mayor que 0")
+
+        super().__init__(key_prefix)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._count("misses")
+                return None
+            self._entries.move_to_end(key)
+        self._count("hits")
+        return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        expires_at = self._clock() + ttl if ttl > 0 else float("inf")
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._count("sets")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self, prefix: str = "") -> int:
+        prefix = prefix or self.key_prefix
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def snapshot(self) -> Dict[str, Any]:
+        snapshot = super().snapshot()
+        snapshot["size"] = len(self)
+        return snapshot
+
+
+def _glob_escape(prefix: str) -> str:
+    """Escapa los comodines de SCAN MATCH en un prefijo literal."""
+    return "".join("\\" + char if char in "*?[]\\" else char for char in prefix)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend sobre Redis, compartido por todos los workers."""
+
+    name = "redis"
+    blocking = True
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        key_prefix: str = "",
+        socket_timeout: float = 0.25,
+        retry_interval: float = 5,
+        client: Any = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa el backend. La conexión se abre con el primer comando.
+
+        Args:
+            url: URL de Redis (ej: redis://localhost:6379/0)
+            key_prefix: Prefijo de todas las claves
+            socket_timeout: Timeout de conexión y de cada comando (segundos)
+            retry_interval: Segundos sin consultar Redis después de un error
+            client: Cliente Redis ya construido (tests o configuración propia)
+            clock: Reloj monotónico (inyectable en tests)
+
+        Raises:
+            ValueError: Si no se indica url ni client, o redis no está instalado
+        """
+        super().__init__(key_prefix)
+        if client is None:
+            if redis is None:
+                raise ValueError("redis no está instalado (pip install redis)")
+            if not url:
+                raise ValueError("Se requiere la URL de Redis")
+            client = redis.Redis.from_url(
+                url,
+                socket_timeout=socket_timeout,
+                socket_connect_timeout=socket_timeout
+            )
+
+        self.client = client
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._down_until = 0.0
+        self.last_error: Optional[str] = None
+
+    def _available(self) -> bool:
+        return self._clock() >= self._down_until
+
+    def _failed(self, error: Exception) -> None:
+        self._down_until = self._clock() + self.retry_interval
+        self.last_error = str(error)
+        self._count("errors")
+
+    def get(self, key: str) -> Optional[bytes]:
+        if not self._available():
+            self._count("misses")
+            return None
+        try:
+            value = self.client.get(key)
+        except _REDIS_ERRORS as e:
+            self._failed(e)
+            self._count("misses")
+            return None
+        self._count("hits" if value is not None else "misses")
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if not self._available():
+            return
+        try:
+            if ttl > 0:
+                self.client.set(key, value, px=max(1, int(ttl * 1000)))
+            else:
+                self.client.set(key, value)
+        except _REDIS_ERRORS as e:
+            self._failed(e)
+            return
+        self._count("sets")
+
+    def delete(self, key: str) -> None:
+        # Una invalidación sí se intenta aunque Redis haya fallado hace poco
+        try:
+            self.client.delete(key)
+        except _REDIS_ERRORS as e:
+            self._failed(e)
+
+    def clear(self, prefix: str = "") -> int:
+        pattern = _glob_escape(prefix or self.key_prefix) + "*"
+        removed = 0
+        try:
+            batch = []
+            for key in self.client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    removed += self.client.delete(*batch)
+                    batch = []
+            if batch:
+                removed += self.client.delete(*batch)
+        except _REDIS_ERRORS as e:
+            self._failed(e)
+        return removed
+
+    def ping(self) -> bool:
+        try:
+            self.client.ping()
+        except _REDIS_ERRORS as e:
+            self._failed(e)
+            return False
+        self._down_until = 0.0
+        return True
+
+    def close(self) -> None:
+        try:
+            self.client.close()
+        except _REDIS_ERRORS:
+            pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        snapshot = super().snapshot()
+        snapshot["available"] = self._available()
+        snapshot["last_error"] = self.last_error
+        return snapshot
+
+
+def create_cache_backend(
+    url: Optional[str],
+    key_prefix: str = "",
+    socket_timeout: float = 0.25,
+    max_entries: int = 10000
+) -> CacheBackend:
+    """
+    Crea un backend a partir de una URL.
+
+    Args:
+        url: "memory://" (o vacío) para memoria del proceso; "redis://",
+            "rediss://" o "unix://" para Redis
+        key_prefix: Prefijo de todas las claves
+        socket_timeout: Timeout por comando de Redis (segundos)
+        max_entries: Máximo de claves del backend en memoria
+
+    Returns:
+        Backend configurado
+
+    Raises:
+        ValueError: Si el esquema no es válido o redis no está instalado
+    """
+    scheme = (url or "memory://").split("://", 1)[0].lower()
+    if scheme in MEMORY_SCHEMES:
+        return MemoryCacheBackend(max_entries, key_prefix=key_prefix)
+    if scheme in REDIS_SCHEMES:
+        return RedisCacheBackend(url, key_prefix=key_prefix, socket_timeout=socket_timeout)
+    raise ValueError(f"Backend de caché inválido: {url}")
+
+
+class CacheNamespace:
+    """Valores JSON con TTL bajo un prefijo propio de un backend."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        ttl: float = 3600,
+        codec: Optional[JsonCodec] = None
+    ):
+        """
+        Inicializa el namespace.
+
+        Args:
+            backend: Backend donde se guardan los valores
+            namespace: Prefijo propio (ej: "jira:account_id:https://x.atlassian.net")
+            ttl: TTL por defecto de los valores (segundos)
+            codec: Codec JSON (por defecto orjson si está instalado)
+        """
+        self.backend = backend
+        self.prefix = f"{backend.key_prefix}{namespace}:"
+        self.ttl = ttl
+        self.codec = codec or get_codec("auto")
+
+    def get(self, key: str) -> Any:
+        """
+        Lee un valor.
+
+        Returns:
+            Valor deserializado (None incluido), o MISS
+        """
+        data = self.backend.get(self.prefix + key)
+        if data is None:
+            return MISS
+        try:
+            return self.codec.loads(data)
+        except ValueError:
+            # Un valor corrupto o de otro formato se descarta
+            self.backend.delete(self.prefix + key)
+            return MISS
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Guarda un valor serializable a JSON.
+
+        Args:
+            key: Clave dentro del namespace
+            value: Valor a guardar
+            ttl: Segundos que vale (None = TTL del namespace)
+        """
+        self.backend.set(self.prefix + key, self.codec.dumps(value), self.ttl if ttl is None else ttl)
+
+    def delete(self, key: str) -> None:
+        """Descarta un valor."""
+        self.backend.delete(self.prefix + key)
+
+    def clear(self) -> int:
+        """Descarta todos los valores del namespace."""
+        return self.backend.clear(self.prefix)
+
+    async def _offload(self, fn: Callable[..., Any], *args: Any) -> Any:
+        # Un backend bloqueante (Redis) no debe frenar el event loop
+        if self.backend.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    async def aget(self, key: str) -> Any:
+        """Versión async de get (ver get)."""
+        return await self._offload(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Versión async de set (ver set)."""
+        await self._offload(self.set, key, value, ttl)
+
+    async def adelete(self, key: str) -> None:
+        """Versión async de delete."""
+        await self._offload(self.delete, key)
+
+
+# Backend compartido del proceso (None = sin caché compartida)
+_backend: Optional[CacheBackend] = None
+_default_ttl: float = 3600
+_backend_lock = threading.Lock()
+
+
+def configure_cache(backend: Optional[CacheBackend], default_ttl: float = 3600) -> None:
+    """
+    Define el backend compartido que usan las cachés del proceso.
+
+    Args:
+        backend: Backend a usar, o None para desactivar la caché compartida
+        default_ttl: TTL de los namespaces que no indican uno propio
+    """
+    global _backend, _default_ttl
+    with _backend_lock:
+        previous, _backend, _default_ttl = _backend, backend, default_ttl
+    if previous is not None and previous is not backend:
+        previous.close()
+
+
+def get_cache_backend() -> Optional[CacheBackend]:
+    """Backend compartido del proceso, o None si no se configuró."""
+    return _backend
+
+
+def cache_namespace(namespace: str, ttl: Optional[float] = None) -> Optional[CacheNamespace]:
+    """
+    Crea un namespace sobre el backend compartido del proceso.
+
+    Args:
+        namespace: Prefijo propio de quien lo usa (ej: "parser")
+        ttl: TTL por defecto (None = el configurado en configure_cache)
+
+    Returns:
+        CacheNamespace, o None si no hay caché compartida
+    """
+    with _backend_lock:
+        backend, default_ttl = _backend, _default_ttl
+    if backend is None:
+        return None
+    return CacheNamespace(backend, namespace, default_ttl if ttl is None else ttl)
+
+
+def cache_snapshot() -> Dict[str, Any]:
+    """
+    Estado del backend compartido.
+
+    Returns:
+        Snapshot del backend, o {"backend": None} si no hay caché compartida
+    """
+    backend = get_cache_backend()
+    return backend.snapshot() if backend is not None else {"backend": None}
@@ -0,0 +1,378 @@
+"""
+Grabación y reproducción del tráfico HTTP con Jira (cassettes).
+
+Para que una regresión de rendimiento sea reproducible, los clientes pueden
+grabar sus peticiones reales a un archivo (``JIRA_CASSETTE_MODE=record``) y
+después reproducirlas sin tocar Jira (``JIRA_CASSETTE_MODE=replay``). La
+grabación se hace a nivel de transporte: un adaptador de requests para
+JiraClient y un transporte de httpx para AsyncJiraClient, así que
+reintentos, rate limiting y paginación se ejercitan igual que en vivo.
+
+El cassette es un archivo JSONL con una interacción por línea (método, path,
+body enviado, status, headers y body de la respuesta, y duración). Antes de
+escribir se eliminan las credenciales: el header Authorization, el email y
+el API token dondequiera que aparezcan, y el dominio del sitio.
+
+Al reproducir, cada petición recibe la siguiente respuesta grabada con el
+mismo método y path, en orden, y espera la duración original multiplicada
+por ``speed`` (1 = tiempo real, 0 = sin esperas).
+"""
+
+import asyncio
+import base64
+import binascii
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+MODES = (OFF, RECORD, REPLAY)
+
+SCRUBBED = "<scrubbed>"
+# Dominio que reemplaza al del sitio real en lo grabado
+PLACEHOLDER_HOST = "jira.example.invalid"
+# Un token más corto no es real (tests, simulador) y reemplazarlo
+# corrompería cualquier texto que lo contenga
+MIN_TOKEN_LENGTH = 8
+
+# Headers de petición con credenciales
+_SECRET_HEADERS = frozenset({"authorization", "cookie", "proxy-authorization"})
+# Headers de respuesta que no se graban: dependen de la conexión o del
+# body comprimido original, o llevan sesiones
+_DROPPED_RESPONSE_HEADERS = frozenset({
+    "content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie",
+})
+
+
+class CassetteMiss(LookupError):
+    """No hay respuesta grabada para una petición durante la reproducción."""
+
+
+def _request_key(method: str, url: str) -> Tuple[str, str]:
+    """(método, path con query ordenada) con que se empareja una petición."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return method.upper(), f"{parts.path}?{query}" if query else parts.path
+
+
+class _Scrubber:
+    """Elimina credenciales y el dominio del sitio de los textos grabados."""
+
+    def __init__(self, url: str, authorization: Optional[str]):
+        self.host = urlsplit(url).netloc
+        self.secrets: List[str] = []
+        if authorization:
+            self.secrets.append(authorization)
+            scheme, _, value = authorization.partition(" ")
+            if scheme.lower() == "basic" and value:
+                self.secrets.append(value)
+                try:
+                    email, _, token = base64.b64decode(value).decode().partition(":")
+                except (binascii.Error, UnicodeDecodeError):
+                    email, token = "", ""
+                if len(token) >= MIN_TOKEN_LENGTH:
+                    self.secrets.append(token)
+                if email:
+                    self.secrets.append(email)
+            elif value:
+                self.secrets.append(value)
+
+    def __call__(self, text: str) -> str:
+        for secret in self.secrets:
+            text = text.replace(secret, SCRUBBED)
+        return text.replace(self.host, PLACEHOLDER_HOST) if self.host else text
+
+
+def _decode_body(body: Optional[bytes], headers: Any) -> str:
+    """Body de una petición como texto (descomprimido si iba con gzip)."""
+    if not body:
+        return ""
+    if isinstance(body, str):
+        return body
+    if str(headers.get("Content-Encoding", "")).lower() == "gzip":
+        body = gzip.decompress(body)
+    return body.decode("utf-8", errors="replace")
+
+
+def build_interaction(
+    method: str,
+    url: str,
+    request_headers: Any,
+    request_body: Optional[bytes],
+    status_code: int,
+    response_headers: Any,
+    response_text: str,
+    duration: float
+) -> Dict[str, Any]:
+    """
+    Construye una interacción sin credenciales lista para grabar.
+
+    Args:
+        method: Método HTTP
+        url: URL completa de la petición
+        request_headers: Headers enviados
+        request_body: Body enviado (puede ir comprimido)
+        status_code: Status de la respuesta
+        response_headers: Headers de la respuesta
+        response_text: Body de la respuesta ya descomprimido
+        duration: Segundos desde el envío hasta tener la respuesta completa
+
+    Returns:
+        Diccionario serializable a JSON
+    """
+    scrub = _Scrubber(url, request_headers.get("Authorization"))
+    method, path = _request_key(method, url)
+    return {
+        "method": method,
+        "path": scrub(path),
+        "request": {
+            "headers": {
+                name: SCRUBBED if name.lower() in _SECRET_HEADERS else scrub(str(value))
+                for name, value in request_headers.items()
+            },
+            "body": scrub(_decode_body(request_body, request_headers)),
+        },
+        "response": {
+            "status": status_code,
+            "headers": {
+                name: scrub(str(value))
+                for name, value in response_headers.items()
+                if name.lower() not in _DROPPED_RESPONSE_HEADERS
+            },
+            "body": scrub(response_text),
+        },
+        "duration": round(duration, 6),
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+class Cassette:
+    """Archivo de interacciones grabadas, compartido por los clientes del proceso."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Ruta del archivo JSONL
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._queues: Optional[Dict[Tuple[str, str], Deque[Dict[str, Any]]]] = None
+        self.recorded = 0
+        self.played = 0
+
+    def record(self, interaction: Dict[str, Any]) -> None:
+        """Agrega una interacción al final del archivo."""
+        line = json.dumps(interaction, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.recorded += 1
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Lee todas las interacciones del archivo.
+
+        Raises:
+            ValueError: Si una línea no es JSON válido
+        """
+        interactions = []
+        with open(self.path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    interactions.append(json.loads(line))
+                except ValueError as e:
+                    raise ValueError(f"Cassette {self.path} inválido en la línea {number}: {e}") from e
+        return interactions
+
+    def play(self, method: str, url: str) -> Dict[str, Any]:
+        """
+        Retorna la siguiente interacción grabada para una petición.
+
+        Args:
+            method: Método HTTP
+            url: URL de la petición (solo se usa el path y la query)
+
+        Returns:
+            Interacción grabada
+
+        Raises:
+            CassetteMiss: Si no quedan interacciones para ese método y path
+        """
+        key = _request_key(method, url)
+        with self._lock:
+            if self._queues is None:
+                self._queues = {}
+                for interaction in self.load():
+                    queue_key = (interaction["method"], interaction["path"])
+                    self._queues.setdefault(queue_key, deque()).append(interaction)
+
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteMiss(f"No hay respuesta grabada para {key[0]} {key[1]} en {self.path}")
+            self.played += 1
+            return queue.popleft()
+
+    def rewind(self) -> None:
+        """Vuelve a reproducir el cassette desde el principio."""
+        with self._lock:
+            self._queues = None
+            self.played = 0
+
+
+# Un cassette por archivo, compartido por todos los clientes del proceso
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str) -> Cassette:
+    """Obtiene (o crea) el Cassette de un archivo."""
+    with _cassettes_lock:
+        cassette = _cassettes.get(path)
+        if cassette is None:
+            cassette = Cassette(path)
+            _cassettes[path] = cassette
+        return cassette
+
+
+def check_mode(mode: str, path: Optional[str]) -> str:
+    """
+    Valida la combinación de modo y archivo.
+
+    Returns:
+        Modo normalizado
+
+    Raises:
+        ValueError: Si el modo es inválido o falta el archivo
+    """
+    mode = (mode or OFF).lower()
+    if mode not in MODES:
+        raise ValueError(f"Modo de cassette inválido: {mode}")
+    if mode != OFF and not path:
+        raise ValueError("JIRA_CASSETTE es requerido para grabar o reproducir")
+    return mode
+
+
+# ----------------------------------------------------------------------
+# requests (JiraClient)
+# ----------------------------------------------------------------------
+
+class RecordingAdapter(HTTPAdapter):
+    """HTTPAdapter que además graba cada intercambio en un cassette."""
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        self.cassette = cassette
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        text = response.content.decode(response.encoding or "utf-8", errors="replace")
+        self.cassette.record(build_interaction(
+            request.method, request.url, request.headers, request.body,
+            response.status_code, response.headers, text,
+            time.perf_counter() - started
+        ))
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Adaptador que responde desde un cassette sin abrir conexiones."""
+
+    def __init__(self, cassette: Cassette, speed: float = 1.0):
+        super().__init__()
+        self.cassette = cassette
+        self.speed = speed
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        interaction = self.cassette.play(request.method, request.url)
+        if self.speed > 0:
+            time.sleep(interaction["duration"] * self.speed)
+
+        recorded = interaction["response"]
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response._content = recorded["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.reason = "Replayed"
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+# ----------------------------------------------------------------------
+# httpx (AsyncJiraClient)
+# ----------------------------------------------------------------------
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Transporte de httpx que delega en otro y graba cada intercambio."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.AsyncBaseTransport):
+        self.cassette = cassette
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        duration = time.perf_counter() - started
+
+        # Se devuelve el body tal como llegó (comprimido o no) y se graba decodificado
+        replayed = httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=raw,
+            request=request,
+            extensions=response.extensions
+        )
+        decoded = httpx.Response(response.status_code, headers=response.headers, content=raw)
+        await decoded.aread()
+        self.cassette.record(build_interaction(
+            request.method, str(request.url), request.headers, request.content,
+            response.status_code, response.headers, decoded.text, duration
+        ))
+        return replayed
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Transporte de httpx que responde desde un cassette."""
+
+    def __init__(self, cassette: Cassette, speed: float = 1.0):
+        self.cassette = cassette
+        self.speed = speed
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self.cassette.play(request.method, str(request.url))
+        if self.speed > 0:
+            await asyncio.sleep(interaction["duration"] * self.speed)
+
+        recorded = interaction["response"]
+        return httpx.Response(
+            recorded["status"],
+            headers=recorded["headers"],
+            content=recorded["body"].encode("utf-8"),
+            request=request
+        )
@@ -0,0 +1,211 @@
+"""
+Circuit breaker por sitio de Jira.
+
+Si el sitio de un cliente está caído, cada petición esperaría el timeout
+completo (y sus reintentos) antes de fallar. El breaker cuenta los fallos
+consecutivos del sitio (errores de red, timeouts y 5xx) y, al superar el
+umbral, se abre: las peticiones fallan de inmediato durante
+``recovery_timeout`` segundos. Pasado ese tiempo entra en half-open y deja
+pasar unas pocas peticiones de prueba; si responden, se cierra, y si
+fallan, vuelve a abrirse.
+
+Como el rate limiter, hay un breaker por base_url compartido por todos los
+clientes del proceso.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.clients.client_registry import site_id
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker thread-safe de tres estados."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa el breaker.
+
+        Args:
+            name: Nombre para logs y métricas (el base_url del sitio)
+            failure_threshold: Fallos consecutivos que abren el circuito
+            recovery_timeout: Segundos abierto antes de probar de nuevo
+            half_open_max_calls: Peticiones de prueba simultáneas en half-open
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold debe ser mayor que 0")
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0
+
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # Métricas
+        self.rejected = 0
+        self.transitions: Dict[str, int] = {}
+
+    def allow(self) -> Optional[float]:
+        """
+        Pide permiso para enviar una petición.
+
+        Cada llamada permitida debe cerrarse con record(), o con release()
+        si al final no se envió.
+
+        Returns:
+            None si la petición puede enviarse, o los segundos que faltan
+            para volver a probar el sitio si el circuito está abierto
+        """
+        with self._lock:
+            now = self._clock()
+
+            if self.state == OPEN:
+                remaining = self.opened_at + self.recovery_timeout - now
+                if remaining > 0:
+                    self.rejected += 1
+                    return remaining
+                self._transition(HALF_OPEN)
+
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    if now - self._probe_started < self.recovery_timeout:
+                        self.rejected += 1
+                        return 0.0
+                    # Pruebas que nunca registraron resultado (ej: canceladas)
+                    self._probes = 0
+                self._probes += 1
+                self._probe_started = now
+
+            return None
+
+    def record(self, failure: bool) -> None:
+        """
+        Registra el resultado de una petición permitida.
+
+        Args:
+            failure: True si el sitio falló (red, timeout o 5xx)
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+
+            if not failure:
+                self.consecutive_failures = 0
+                if self.state != CLOSED:
+                    self._transition(CLOSED)
+                return
+
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self._transition(OPEN)
+                self.opened_at = self._clock()
+
+    def release(self) -> None:
+        """
+        Devuelve el permiso de una petición permitida que no llegó a enviarse.
+
+        Sin esto, una prueba de half-open que se abandona antes de enviarse
+        (deadline agotado esperando al rate limiter, cancelación) bloquearía
+        el sitio hasta recovery_timeout.
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+
+    def _transition(self, state: str) -> None:
+        """Cambia de estado y lo registra (con el lock tomado)."""
+        label = f"{self.state}->{state}"
+        self.transitions[label] = self.transitions.get(label, 0) + 1
+        self.state = state
+        self._probes = 0
+        log = logger.warning if state == OPEN else logger.info
+        log("Circuit breaker de Jira %s: %s", self.name, label)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna el estado y las métricas del breaker.
+
+        Returns:
+            Diccionario con estado, fallos consecutivos, rechazos y
+            transiciones de estado
+        """
+        with self._lock:
+            retry_in = 0.0
+            if self.state == OPEN:
+                retry_in = max(0.0, self.opened_at + self.recovery_timeout - self._clock())
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "retry_in_seconds": round(retry_in, 3),
+                "rejected": self.rejected,
+                "transitions": dict(self.transitions),
+            }
+
+
+# Un breaker por sitio de Jira, compartido por todo el proceso
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    base_url: str,
+    failure_threshold: int,
+    recovery_timeout: float,
+    half_open_max_calls: int = 1
+) -> CircuitBreaker:
+    """
+    Obtiene (o crea) el circuit breaker de un sitio de Jira.
+
+    Args:
+        base_url: URL base del sitio (clave del breaker)
+        failure_threshold: Umbral si el breaker no existe
+        recovery_timeout: Tiempo abierto si el breaker no existe
+        half_open_max_calls: Pruebas simultáneas si el breaker no existe
+
+    Returns:
+        CircuitBreaker compartido para ese base_url
+    """
+    key = base_url.rstrip("/").lower()
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, failure_threshold, recovery_timeout, half_open_max_calls)
+            _breakers[key] = breaker
+        return breaker
+
+
+def circuit_breaker_snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Estado de todos los breakers del proceso, por sitio.
+
+    Returns:
+        Diccionario {site_id: snapshot} (id opaco, ver site_id)
+    """
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {site_id(key): breaker.snapshot() for key, breaker in breakers.items()}
@@ -0,0 +1,294 @@
+"""
+Registro de clientes de Jira por tenant.
+
+Crear un cliente por petición obliga a descifrar el token y a abrir
+conexiones TLS nuevas cada vez. El registro conserva un cliente por
+(usuario, huella de credenciales) para reutilizar su pool de conexiones
+caliente entre peticiones, con un tamaño máximo (LRU) y expiración por
+inactividad (TTL).
+
+Los clientes se prestan con acquire()/release(): un cliente desalojado
+mientras otra petición lo usa no se cierra hasta que se devuelve.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def credential_fingerprint(*parts: Optional[str]) -> str:
+    """
+    Huella estable de un conjunto de credenciales.
+
+    Se calcula sobre los valores tal como están guardados (el token
+    cifrado), así un acierto no necesita descifrar nada y cualquier cambio
+    de credenciales produce una clave distinta.
+
+    Args:
+        parts: Valores que identifican las credenciales (URL, email, token)
+
+    Returns:
+        Hash hexadecimal corto
+    """
+    digest = hashlib.sha256("\0".join(part or "" for part in parts).encode())
+    return digest.hexdigest()[:32]
+
+
+def site_id(base_url: str) -> str:
+    """
+    Identificador opaco de un sitio de Jira para métricas.
+
+    Los snapshots por sitio (rate limits, circuitos, cachés) se publican con
+    esta clave en lugar de la URL, así no exponen qué sitios de Jira usan
+    los clientes. Quien conoce la URL puede calcular su id.
+
+    Args:
+        base_url: URL base del sitio
+
+    Returns:
+        "site-" seguido de un hash corto de la URL normalizada
+    """
+    return "site-" + credential_fingerprint(base_url.rstrip("/").lower())[:12]
+
+
+@dataclass
+class _Entry:
+    client: Any
+    refs: int = 0
+    last_used: float = 0.0
+
+
+class ClientRegistry:
+    """
+    Caché LRU/TTL thread-safe de clientes con préstamo por referencia.
+
+    Las claves son tuplas cuyo primer elemento es el id del usuario, para
+    poder invalidar todas las entradas de un usuario.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 100,
+        idle_ttl: float = 900,
+        close: Optional[Callable[[Any], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa el registro.
+
+        Args:
+            max_size: Máximo de clientes retenidos (los prestados pueden excederlo)
+            idle_ttl: Segundos sin uso tras los que se descarta un cliente
+            close: Función que cierra un cliente descartado
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor que 0")
+
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self._close = close or (lambda client: client.close())
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        # Clientes desalojados que siguen prestados, por id()
+        self._retired: Dict[int, _Entry] = {}
+        self._lock = threading.Lock()
+
+        # Métricas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Presta el cliente de una clave, creándolo si no existe.
+
+        Args:
+            key: Clave (user_id, huella)
+            factory: Crea el cliente cuando no está en el registro
+
+        Returns:
+            Cliente; devolverlo con release() al terminar la petición
+        """
+        with self._lock:
+            to_close = self._expire(self._clock())
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                entry.refs += 1
+                entry.last_used = self._clock()
+                client = entry.client
+            else:
+                client = None
+
+        self._close_all(to_close)
+        if client is not None:
+            return client
+
+        # Crear fuera del lock: el factory puede descifrar tokens o fallar
+        client = factory()
+
+        with self._lock:
+            self.misses += 1
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Otra petición lo creó mientras tanto: usar el suyo
+                existing.refs += 1
+                existing.last_used = self._clock()
+                self._entries.move_to_end(key)
+                duplicate, client = client, existing.client
+                to_close = [duplicate]
+            else:
+                self._entries[key] = _Entry(client, refs=1, last_used=self._clock())
+                to_close = self._evict_overflow()
+
+        self._close_all(to_close)
+        return client
+
+    def release(self, key: Hashable, client: Any) -> None:
+        """
+        Devuelve un cliente prestado con acquire().
+
+        Args:
+            key: Clave usada en acquire()
+            client: Cliente prestado
+        """
+        to_close = []
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.client is client:
+                entry.refs = max(0, entry.refs - 1)
+                entry.last_used = self._clock()
+            else:
+                retired = self._retired.get(id(client))
+                if retired is not None:
+                    retired.refs -= 1
+                    if retired.refs <= 0:
+                        del self._retired[id(client)]
+                        to_close.append(client)
+
+        self._close_all(to_close)
+
+    def invalidate(self, user_id: Any) -> int:
+        """
+        Descarta todos los clientes de un usuario (ej: al cambiar credenciales).
+
+        Args:
+            user_id: Id del usuario (primer elemento de la clave)
+
+        Returns:
+            Número de clientes descartados
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == user_id]
+            to_close = [self._discard(key) for key in keys]
+
+        self._close_all([client for client in to_close if client is not None])
+        return len(keys)
+
+    def clear(self, close: bool = True) -> List[Any]:
+        """
+        Descarta todos los clientes del registro.
+
+        Args:
+            close: Cerrar los clientes no prestados. Con False se retornan
+                para que el llamador los cierre (ej: await aclose() al apagar)
+
+        Returns:
+            Clientes descartados que no estaban prestados
+        """
+        with self._lock:
+            discarded = [self._discard(key) for key in list(self._entries)]
+
+        discarded = [client for client in discarded if client is not None]
+        if close:
+            self._close_all(discarded)
+        return discarded
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna el estado y las métricas del registro.
+
+        Returns:
+            Diccionario con tamaño, clientes prestados y contadores
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "in_use": sum(1 for entry in self._entries.values() if entry.refs),
+                "retired_in_use": len(self._retired),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _discard(self, key: Hashable) -> Optional[Any]:
+        """Quita una entrada; retorna el cliente si se puede cerrar ya."""
+        entry = self._entries.pop(key)
+        self.evictions += 1
+        if entry.refs > 0:
+            self._retired[id(entry.client)] = entry
+            return None
+        return entry.client
+
+    def _expire(self, now: float) -> List[Any]:
+        """Descarta los clientes inactivos por más de idle_ttl."""
+        expired = [
+            key for key, entry in self._entries.items()
+            if entry.refs == 0 and now - entry.last_used > self.idle_ttl
+        ]
+        return [self._discard(key) for key in expired]
+
+    def _evict_overflow(self) -> List[Any]:
+        """Descarta los menos usados recientemente por encima de max_size."""
+        to_close = []
+        for key in list(self._entries):
+            if len(self._entries) <= self.max_size:
+                break
+            client = self._discard(key)
+            if client is not None:
+                to_close.append(client)
+        return to_close
+
+    def _close_all(self, clients: List[Any]) -> None:
+        for client in clients:
+            if client is None:
+                continue
+            try:
+                self._close(client)
+            except Exception as e:
+                logger.warning("Error al cerrar cliente de Jira descartado: %s", e)
+
+
+# Referencias a las tareas de cierre pendientes para que no se recolecten
+_closing_tasks = set()
+
+
+def schedule_aclose(client: Any) -> None:
+    """
+    Cierra un cliente asíncrono desde código síncrono.
+
+    Programa ``client.aclose()`` en el event loop en curso. Sin loop activo
+    (ej: al apagar el proceso) se ejecuta en un loop propio.
+
+    Args:
+        client: Cliente con método aclose()
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(client.aclose())
+        return
+
+    task = loop.create_task(client.aclose())
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
@@ -0,0 +1,377 @@
+"""
+Metadatos de creación de issues (createmeta) y validación local de payloads.
+
+Un tipo de issue que no existe, una prioridad fuera del esquema o un campo
+que no está en la pantalla de creación solo se descubrían con un 400 de
+Jira. Los clientes consultan una vez por proyecto los tipos de issue
+(/issue/createmeta/{proyecto}/issuetypes) y los campos de cada tipo
+(/issue/createmeta/{proyecto}/issuetypes/{id}), los guardan en un
+CreateMetaCache por sitio y credenciales (createmeta depende de los permisos
+de quien consulta) y con ellos revisan cada payload antes de enviarlo:
+
+- El tipo se busca sin distinguir mayúsculas, y "Subtask", "Sub-task" o
+  "Subtarea" se traducen al tipo de subtarea que tenga el proyecto.
+- Los campos que no están en la pantalla del tipo (ej: priority en las
+  subtareas de muchos proyectos) se quitan del payload; los clientes lo
+  registran en el log y en el contador ``dropped`` de la caché.
+- Una prioridad u otro valor fuera de los permitidos, o un campo requerido
+  sin valor, es un error local con el mismo formato que el 400 de Jira.
+
+Si los metadatos no se pueden obtener, el payload se envía sin validar y
+Jira sigue siendo quien decide.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from app.clients.client_registry import credential_fingerprint, site_id
+from app.clients.user_cache import MISS
+
+# Campos que arman el propio payload; no se quitan ni se exigen
+STRUCTURAL_FIELDS = ("project", "issuetype")
+
+# Nombres con los que el código y los usuarios se refieren a las subtareas
+SUBTASK_ALIASES = ("subtask", "subtarea")
+
+
+def type_token(name: str) -> str:
+    """
+    Normaliza un nombre de tipo de issue para compararlo.
+
+    Args:
+        name: Nombre del tipo (ej: "Sub-task")
+
+    Returns:
+        Nombre en minúsculas sin espacios, guiones ni guiones bajos
+        (ej: "subtask")
+    """
+    return "".join(char for char in name.casefold() if char not in " -_")
+
+
+@dataclass
+class FieldMeta:
+    """Un campo de la pantalla de creación de un tipo de issue."""
+
+    field_id: str
+    name: str
+    required: bool = False
+    has_default: bool = False
+    # Valor normalizado → nombre exacto en Jira (None = cualquier valor)
+    allowed: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "FieldMeta":
+        """Construye el campo desde un elemento de "fields" de createmeta."""
+        allowed = None
+        if data.get("allowedValues"):
+            allowed = {}
+            for value in data["allowedValues"]:
+                name = value.get("name") or value.get("value")
+                if name:
+                    allowed[name.casefold()] = name
+        field_id = data.get("fieldId") or data.get("key") or ""
+        return cls(
+            field_id=field_id,
+            name=data.get("name") or field_id,
+            required=bool(data.get("required")),
+            has_default=bool(data.get("hasDefaultValue")),
+            allowed=allowed
+        )
+
+
+@dataclass
+class IssueTypeMeta:
+    """Un tipo de issue creable en un proyecto."""
+
+    id: str
+    name: str
+    subtask: bool = False
+    fields: Dict[str, FieldMeta] = field(default_factory=dict)
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "IssueTypeMeta":
+        """Construye el tipo desde un elemento de "issueTypes" de createmeta."""
+        return cls(id=str(data.get("id", "")), name=data.get("name", ""), subtask=bool(data.get("subtask")))
+
+
+def match_issue_type(issue_types: List[IssueTypeMeta], name: str) -> Optional[IssueTypeMeta]:
+    """
+    Busca un tipo de issue por nombre.
+
+    Args:
+        issue_types: Tipos creables del proyecto
+        name: Nombre pedido (ej: "task", "Subtask", "Sub-task")
+
+    Returns:
+        Tipo del proyecto, o None si no hay ninguno con ese nombre
+    """
+    token = type_token(name)
+    for issue_type in issue_types:
+        if type_token(issue_type.name) == token:
+            return issue_type
+    if token in SUBTASK_ALIASES:
+        return next((issue_type for issue_type in issue_types if issue_type.subtask), None)
+    return None
+
+
+def _value_name(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        return value.get("name") or value.get("value")
+    return None
+
+
+def apply_create_meta(
+    fields: Dict[str, Any],
+    issue_type: IssueTypeMeta
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Normaliza los campos de un issue nuevo contra los metadatos de su tipo.
+
+    Args:
+        fields: Campos del payload ({"project": ..., "summary": ..., ...})
+        issue_type: Tipo con sus campos ya cargados
+
+    Returns:
+        Tupla (campos normalizados, errores por campo). Los campos son una
+        copia: el payload original no se modifica. Los campos que no están
+        en la pantalla de creación no aparecen en ninguno de los dos (ver
+        dropped_fields()).
+    """
+    normalized: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+
+    for name, value in fields.items():
+        if name == "issuetype":
+            normalized[name] = {"name": issue_type.name}
+            continue
+        if name in STRUCTURAL_FIELDS:
+            normalized[name] = value
+            continue
+
+        meta = issue_type.fields.get(name)
+        if meta is None:
+            # No está en la pantalla de creación: Jira rechazaría el issue entero
+            continue
+
+        value_name = _value_name(value)
+        if meta.allowed is not None and value_name is not None:
+            canonical = meta.allowed.get(value_name.casefold())
+            if canonical is None:
+                errors[name] = (
+                    f"'{value_name}' no es un valor válido para {meta.name}. "
+                    f"Permitidos: {', '.join(meta.allowed.values())}"
+                )
+                continue
+            value = {**value, "name": canonical} if "name" in value else {**value, "value": canonical}
+        normalized[name] = value
+
+    for meta in issue_type.fields.values():
+        if (
+            meta.required
+            and not meta.has_default
+            and meta.field_id not in STRUCTURAL_FIELDS
+            and normalized.get(meta.field_id) in (None, "", [], {})
+            and meta.field_id not in errors
+        ):
+            errors[meta.field_id] = f"El campo {meta.name} es obligatorio para {issue_type.name}"
+
+    return normalized, errors
+
+
+def dropped_fields(
+    fields: Dict[str, Any],
+    normalized: Dict[str, Any],
+    errors: Dict[str, str]
+) -> List[str]:
+    """
+    Campos que apply_create_meta() quitó por no estar en la pantalla de creación.
+
+    Args:
+        fields: Campos originales del payload
+        normalized: Campos normalizados
+        errors: Errores por campo
+
+    Returns:
+        Nombres de los campos quitados, ordenados
+    """
+    return sorted(name for name in fields if name not in normalized and name not in errors)
+
+
+class CreateMetaCache:
+    """Caché TTL thread-safe de tipos de issue y campos de creación por proyecto."""
+
+    def __init__(
+        self,
+        ttl: float = 3600,
+        max_size: int = 500,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            ttl: Segundos que valen los metadatos de un proyecto
+            max_size: Máximo de entradas (listas de tipos y campos de un tipo)
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor que 0")
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Métricas
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.dropped: Dict[str, int] = {}
+
+    def _get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_issue_types(self, project_key: str) -> Any:
+        """Tipos de issue del proyecto, o MISS."""
+        return self._get(("types", project_key.upper()))
+
+    def put_issue_types(self, project_key: str, issue_types: List[IssueTypeMeta]) -> None:
+        """Guarda los tipos de issue del proyecto."""
+        self._put(("types", project_key.upper()), issue_types)
+
+    def get_fields(self, project_key: str, issue_type_id: str) -> Any:
+        """Campos de creación de un tipo, o MISS."""
+        return self._get(("fields", project_key.upper(), issue_type_id))
+
+    def put_fields(self, project_key: str, issue_type_id: str, fields: Dict[str, FieldMeta]) -> None:
+        """Guarda los campos de creación de un tipo."""
+        self._put(("fields", project_key.upper(), issue_type_id), fields)
+
+    def record_rejection(self) -> None:
+        """Cuenta un payload rechazado localmente (sin llamar a Jira)."""
+        with self._lock:
+            self.rejected += 1
+
+    def record_dropped(self, fields: List[str]) -> None:
+        """Cuenta los campos quitados de un payload por no estar en la pantalla."""
+        with self._lock:
+            for name in fields:
+                self.dropped[name] = self.dropped.get(name, 0) + 1
+
+    def invalidate(self, project_key: Optional[str] = None) -> None:
+        """
+        Descarta los metadatos de un proyecto, o todos si no se indica.
+
+        Args:
+            project_key: Proyecto a descartar (None = todos)
+        """
+        with self._lock:
+            if project_key is None:
+                self._entries.clear()
+                return
+            project = project_key.upper()
+            for key in [key for key in self._entries if key[1] == project]:
+                del self._entries[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna el tamaño y los contadores de la caché.
+
+        Returns:
+            Diccionario con size, hits, misses, rejected (payloads
+            inválidos que no llegaron a Jira) y dropped (veces que se quitó
+            cada campo)
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "rejected": self.rejected,
+                "dropped": dict(self.dropped),
+            }
+
+
+# Una caché por sitio y credenciales, compartida por todo el proceso. Los
+# tipos y campos creables dependen de los permisos de quien consulta.
+MAX_CACHES = 256
+_caches: "OrderedDict[Tuple[str, str], CreateMetaCache]" = OrderedDict()
+_caches_lock = threading.Lock()
+
+
+def get_create_meta_cache(
+    base_url: str,
+    email: Optional[str] = None,
+    api_token: Optional[str] = None,
+    ttl: float = 3600
+) -> CreateMetaCache:
+    """
+    Obtiene (o crea) la caché de createmeta de unas credenciales de Jira.
+
+    Args:
+        base_url: URL base del sitio
+        email: Email de la cuenta de Jira
+        api_token: API token de la cuenta
+        ttl: TTL si la caché no existe
+
+    Returns:
+        CreateMetaCache compartida por los clientes con esas credenciales
+        (se retienen las MAX_CACHES usadas más recientemente)
+    """
+    site = base_url.rstrip("/").lower()
+    key = (site, credential_fingerprint(site, email, api_token))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = CreateMetaCache(ttl)
+            _caches[key] = cache
+            while len(_caches) > MAX_CACHES:
+                _caches.popitem(last=False)
+        else:
+            _caches.move_to_end(key)
+        return cache
+
+
+def create_meta_cache_snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Estado de las cachés del proceso, sumado por sitio.
+
+    Returns:
+        Diccionario {site_id: snapshot} (id opaco, ver site_id) con los
+        contadores de todas las credenciales del sitio y cuántas son
+    """
+    with _caches_lock:
+        caches = list(_caches.items())
+
+    summary: Dict[str, Dict[str, Any]] = {}
+    for (site, _), cache in caches:
+        snapshot = cache.snapshot()
+        total = summary.setdefault(site_id(site), {
+            "credentials": 0, "size": 0, "hits": 0, "misses": 0, "rejected": 0, "dropped": {}
+        })
+        total["credentials"] += 1
+        for name in ("size", "hits", "misses", "rejected"):
+            total[name] += snapshot[name]
+        for name, count in snapshot["dropped"].items():
+            total["dropped"][name] = total["dropped"].get(name, 0) + count
+    return summary
@@ -0,0 +1,132 @@
+"""
+Deadline por petición para las llamadas a Jira.
+
+Las rutas fijan cuánto tiempo total tiene una petición HTTP entrante con
+``deadline(segundos)``; el límite viaja en un ContextVar, así que lo ven
+los clientes de Jira y los servicios sin pasarlo como argumento. Cada
+llamada a Jira toma sus timeouts de conexión y lectura de lo que queda, y
+deja de reintentar (o ni empieza) cuando ya no hay presupuesto.
+
+Los deadlines anidados nunca extienden al externo: rige el más cercano.
+El trabajo compartido entre peticiones (ej: un GET coalescido) corre con un
+SharedDeadline, que se extiende al más lejano de quienes lo esperan.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Union
+
+
+class SharedDeadline:
+    """
+    Deadline de una llamada compartida por varios llamadores.
+
+    Empieza en el deadline del primero y se extiende al más lejano de los
+    que se unen; un llamador sin deadline lo quita. Así la llamada no queda
+    atada al presupuesto de quien la inició ni sigue más allá del de todos.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._at: Optional[float] = None
+        self._joined = 0
+
+    def join(self, at: Optional[float]) -> None:
+        """
+        Agrega el deadline de un llamador.
+
+        Args:
+            at: Instante (time.monotonic) en que vence, o None si no tiene
+        """
+        with self._lock:
+            if self._joined == 0 or (self._at is not None and (at is None or at > self._at)):
+                self._at = at
+            self._joined += 1
+
+    def at(self) -> Optional[float]:
+        """Instante en que vence, o None si algún llamador no tiene deadline."""
+        with self._lock:
+            return self._at
+
+
+# Instante (time.monotonic) en que vence la petición en curso
+_deadline: ContextVar[Union[float, SharedDeadline, None]] = ContextVar("jira_deadline", default=None)
+
+
+def current() -> Optional[float]:
+    """
+    Instante (time.monotonic) en que vence el deadline en curso.
+
+    Returns:
+        Instante de vencimiento, o None si no hay deadline
+    """
+    value = _deadline.get()
+    if isinstance(value, SharedDeadline):
+        return value.at()
+    return value
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Fija el deadline del bloque.
+
+    Args:
+        seconds: Presupuesto total en segundos (None o <= 0 = sin deadline
+            propio; se mantiene el externo si existe)
+
+    Example:
+        >>> with deadline(20):
+        ...     await service.create_reel_workflow(...)
+    """
+    outer = current()
+    new = outer
+    if seconds is not None and seconds > 0:
+        new = time.monotonic() + seconds
+        if outer is not None:
+            new = min(outer, new)
+
+    token = _deadline.set(new)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def shared_deadline(shared: SharedDeadline) -> Iterator[None]:
+    """
+    Reemplaza el deadline en curso por uno compartido dentro del bloque.
+
+    Para trabajo compartido entre peticiones (ej: un GET coalescido), que no
+    debe heredar solo el presupuesto de la petición que lo inició.
+
+    Args:
+        shared: Deadline al que se unen los llamadores
+    """
+    token = _deadline.set(shared)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Segundos que quedan del deadline en curso.
+
+    Returns:
+        Segundos restantes (0 si ya venció), o None si no hay deadline
+    """
+    at = current()
+    if at is None:
+        return None
+    return max(0.0, at - time.monotonic())
+
+
+def expired() -> bool:
+    """True si hay un deadline y ya venció."""
+    left = remaining()
+    return left is not None and left <= 0
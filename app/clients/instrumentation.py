@@ -0,0 +1,340 @@
+"""
+Instrumentación de las llamadas a Jira.
+
+Cada llamada lógica de un cliente (con todos sus reintentos) produce un
+RequestEvent con el método, la plantilla del endpoint (``/issue/{key}``),
+el status final, los bytes enviados y recibidos, la duración total y el
+número de reintentos. Los eventos se entregan a los hooks registrados para
+todo el proceso (``register_hook``) y a los del propio cliente
+(``client.add_hook``): cualquier objeto con un método ``observe(event)``.
+
+El módulo incluye tres colectores registrados por defecto: un histograma de
+latencias, contadores por endpoint y por operación, y los bytes transferidos
+con y sin compresión (``transfer_stats``). La operación es la ruta de la API que originó la llamada
+(ej: ``POST /api/v1/tasks/batch``); se fija con ``operation(nombre)`` y
+viaja en un ContextVar, igual que el deadline.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from app.clients.transfer_stats import endpoint_template, transfer_stats
+
+logger = logging.getLogger(__name__)
+
+# Operación (ruta de la API) que está haciendo las llamadas a Jira
+_operation: ContextVar[Optional[str]] = ContextVar("jira_operation", default=None)
+
+# Límites superiores de los buckets del histograma, en milisegundos
+DEFAULT_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+@contextmanager
+def operation(name: Optional[str]) -> Iterator[None]:
+    """
+    Etiqueta con `name` las llamadas a Jira hechas dentro del bloque.
+
+    Example:
+        >>> with operation("POST /api/v1/tasks/batch"):
+        ...     await service.create_reel_workflow(...)
+    """
+    token = _operation.set(name)
+    try:
+        yield
+    finally:
+        _operation.reset(token)
+
+
+def current_operation() -> Optional[str]:
+    """Operación en curso, o None si la llamada no viene de una ruta etiquetada."""
+    return _operation.get()
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """Resultado de una llamada a Jira, incluidos sus reintentos."""
+
+    method: str
+    endpoint: str
+    status_code: Optional[int]
+    request_bytes: int
+    response_bytes: int
+    duration: float
+    retries: int
+    operation: Optional[str] = None
+    error: Optional[str] = None
+    request_wire_bytes: Optional[int] = None
+    response_wire_bytes: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        """Identificador del endpoint (ej: "GET /issue/{key}")."""
+        return f"{self.method} {self.endpoint}"
+
+    @property
+    def failed(self) -> bool:
+        """True si la llamada terminó sin respuesta o con un status de error."""
+        return self.status_code is None or self.status_code >= 400
+
+    @property
+    def compressed(self) -> bool:
+        """True si el body de la petición viajó comprimido."""
+        return self.request_wire_bytes is not None and self.request_wire_bytes < self.request_bytes
+
+
+class RequestTrace:
+    """Acumula los datos de una llamada mientras se reintenta."""
+
+    def __init__(self, method: str, endpoint: str):
+        self.method = method.upper()
+        self.endpoint = endpoint_template(endpoint)
+        self.operation = current_operation()
+        self.attempts = 0
+        self.status_code: Optional[int] = None
+        self.request_bytes = 0
+        self.request_wire_bytes = 0
+        self.response_bytes = 0
+        self.response_wire_bytes = 0
+        self._started = time.perf_counter()
+
+    def sent(self, body: Optional[bytes], wire_body: Optional[bytes]) -> None:
+        """
+        Registra un intento de envío.
+
+        Args:
+            body: Body serializado, sin comprimir
+            wire_body: Body tal como va por la red
+        """
+        self.attempts += 1
+        self.request_bytes += len(body or b"")
+        self.request_wire_bytes += len(wire_body or b"")
+
+    def received(self, status_code: int, content: bytes, wire_bytes: int) -> None:
+        """
+        Registra la respuesta de un intento.
+
+        Args:
+            status_code: Status HTTP
+            content: Body recibido, ya descomprimido
+            wire_bytes: Tamaño del body recibido por la red
+        """
+        self.status_code = status_code
+        self.response_bytes += len(content)
+        self.response_wire_bytes += wire_bytes
+
+    def finish(self, error: Optional[BaseException] = None) -> RequestEvent:
+        """
+        Cierra la traza.
+
+        Args:
+            error: Excepción con la que terminó la llamada, si falló
+
+        Returns:
+            Evento de la llamada
+        """
+        status_code = self.status_code
+        if error is not None:
+            status_code = getattr(error, "status_code", None)
+        return RequestEvent(
+            method=self.method,
+            endpoint=self.endpoint,
+            status_code=status_code,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            duration=time.perf_counter() - self._started,
+            retries=max(0, self.attempts - 1),
+            operation=self.operation,
+            error=type(error).__name__ if error is not None else None,
+            request_wire_bytes=self.request_wire_bytes,
+            response_wire_bytes=self.response_wire_bytes,
+        )
+
+
+def emit(hooks: Sequence[Any], event: RequestEvent) -> None:
+    """
+    Entrega un evento a los hooks; un hook que falla no afecta la llamada.
+
+    Args:
+        hooks: Objetos con método observe(event)
+        event: Evento a entregar
+    """
+    for hook in hooks:
+        try:
+            hook.observe(event)
+        except Exception:
+            logger.exception("Hook de instrumentación %r falló", hook)
+
+
+class LatencyHistogram:
+    """Histograma thread-safe de latencias por endpoint."""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        """
+        Args:
+            buckets_ms: Límites superiores de los buckets en ms, ascendentes
+        """
+        if list(buckets_ms) != sorted(buckets_ms) or not buckets_ms:
+            raise ValueError("buckets_ms debe ser una lista ascendente no vacía")
+        self.buckets_ms = tuple(buckets_ms)
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, event: RequestEvent) -> None:
+        ms = event.duration * 1000
+        with self._lock:
+            stats = self._endpoints.get(event.key)
+            if stats is None:
+                # Un bucket extra para lo que supera el último límite
+                stats = {"counts": [0] * (len(self.buckets_ms) + 1), "count": 0, "sum_ms": 0.0, "max_ms": 0.0}
+                self._endpoints[event.key] = stats
+            stats["counts"][bisect_left(self.buckets_ms, ms)] += 1
+            stats["count"] += 1
+            stats["sum_ms"] += ms
+            stats["max_ms"] = max(stats["max_ms"], ms)
+
+    def _quantile(self, counts: List[int], total: int, q: float) -> Optional[float]:
+        """Límite superior del bucket donde cae el cuantil q (None si supera el último)."""
+        target = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            seen += count
+            if seen >= target:
+                return float(self.buckets_ms[i]) if i < len(self.buckets_ms) else None
+        return None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Resumen por endpoint.
+
+        Returns:
+            Diccionario {"METHOD /plantilla": {...}} con el conteo por bucket
+            ("le_<ms>" y "inf"), la media y máximo en ms y los percentiles
+            50/95/99 aproximados al límite de su bucket (None si caen por
+            encima del último)
+        """
+        with self._lock:
+            endpoints = {
+                key: dict(stats, counts=list(stats["counts"]))
+                for key, stats in self._endpoints.items()
+            }
+
+        summary = {}
+        for key, stats in endpoints.items():
+            labels = [f"le_{b:g}" for b in self.buckets_ms] + ["inf"]
+            total = stats["count"]
+            summary[key] = {
+                "count": total,
+                "mean_ms": round(stats["sum_ms"] / total, 3),
+                "max_ms": round(stats["max_ms"], 3),
+                "p50_ms": self._quantile(stats["counts"], total, 0.50),
+                "p95_ms": self._quantile(stats["counts"], total, 0.95),
+                "p99_ms": self._quantile(stats["counts"], total, 0.99),
+                "buckets": dict(zip(labels, stats["counts"])),
+            }
+        return summary
+
+    def reset(self) -> None:
+        """Reinicia el histograma."""
+        with self._lock:
+            self._endpoints = {}
+
+
+class RequestCounter:
+    """Contadores thread-safe de llamadas por endpoint y por operación."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+        self._operations: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, event: RequestEvent) -> None:
+        status = str(event.status_code) if event.status_code is not None else (event.error or "error")
+        with self._lock:
+            stats = self._endpoints.get(event.key)
+            if stats is None:
+                stats = {"calls": 0, "errors": 0, "retries": 0, "status": {}}
+                self._endpoints[event.key] = stats
+            stats["calls"] += 1
+            stats["errors"] += int(event.failed)
+            stats["retries"] += event.retries
+            stats["status"][status] = stats["status"].get(status, 0) + 1
+
+            name = event.operation or "-"
+            op = self._operations.get(name)
+            if op is None:
+                op = {"jira_calls": 0, "errors": 0, "retries": 0, "jira_seconds": 0.0, "endpoints": {}}
+                self._operations[name] = op
+            op["jira_calls"] += 1
+            op["errors"] += int(event.failed)
+            op["retries"] += event.retries
+            op["jira_seconds"] += event.duration
+            op["endpoints"][event.key] = op["endpoints"].get(event.key, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Resumen de los contadores.
+
+        Returns:
+            Diccionario con "endpoints" ({"METHOD /plantilla": llamadas,
+            errores, reintentos y conteo por status}) y "operations"
+            ({ruta: llamadas a Jira, errores, reintentos, segundos en Jira y
+            llamadas por endpoint}); "-" agrupa las llamadas sin operación
+        """
+        with self._lock:
+            endpoints = {
+                key: dict(stats, status=dict(stats["status"]))
+                for key, stats in self._endpoints.items()
+            }
+            operations = {
+                name: dict(op, endpoints=dict(op["endpoints"]), jira_seconds=round(op["jira_seconds"], 3))
+                for name, op in self._operations.items()
+            }
+        return {"endpoints": endpoints, "operations": operations}
+
+    def reset(self) -> None:
+        """Reinicia los contadores."""
+        with self._lock:
+            self._endpoints = {}
+            self._operations = {}
+
+
+# Colectores globales del proceso
+request_latency = LatencyHistogram()
+request_counter = RequestCounter()
+
+# Hooks que reciben los eventos de todos los clientes
+_default_hooks: List[Any] = [request_latency, request_counter, transfer_stats]
+_default_hooks_lock = threading.Lock()
+
+
+def register_hook(hook: Any) -> None:
+    """
+    Registra un hook para todos los clientes del proceso.
+
+    Args:
+        hook: Objeto con método observe(event: RequestEvent)
+    """
+    if not callable(getattr(hook, "observe", None)):
+        raise ValueError("El hook debe tener un método observe(event)")
+    with _default_hooks_lock:
+        if hook not in _default_hooks:
+            _default_hooks.append(hook)
+
+
+def unregister_hook(hook: Any) -> None:
+    """Quita un hook registrado con register_hook()."""
+    with _default_hooks_lock:
+        if hook in _default_hooks:
+            _default_hooks.remove(hook)
+
+
+def default_hooks() -> List[Any]:
+    """Copia de los hooks registrados para todo el proceso."""
+    with _default_hooks_lock:
+        return list(_default_hooks)
@@ -6,24 +6,209 @@ Soporta autenticación con email + API token y operaciones básicas de issues.
 """
 
 import os
+import time
 import base64
-from typing import Dict, Any, List, Optional
+import contextvars
+import gzip
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple
 import requests
-from requests.exceptions import RequestException, Timeout, HTTPError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException, Timeout, ConnectTimeout
+
+from app.clients.retry import RetryPolicy, describe_retry, log_retry, retry_stats
+from app.clients.rate_limiter import get_rate_limiter
+from app.clients.circuit_breaker import get_circuit_breaker
+from app.clients.deadline import remaining as deadline_remaining
+from app.clients.json_codec import get_codec, is_empty_body
+from app.clients.instrumentation import RequestTrace, default_hooks, emit
+from app.clients import cassette
+from app.clients.pagination import OFFSET, Pager
+from app.clients.single_flight import SingleFlight, request_key
+from app.clients.user_cache import MISS, get_account_id_cache
+from app.clients.create_meta import (
+    FieldMeta,
+    IssueTypeMeta,
+    apply_create_meta,
+    dropped_fields,
+    get_create_meta_cache,
+    match_issue_type,
+)
+
+logger = logging.getLogger(__name__)
+
+# Máximo de issues que acepta Jira en un POST /issue/bulk
+BULK_CREATE_LIMIT = 50
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Lee un booleano desde variables de entorno ("true"/"false", "1"/"0")."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass
+class JiraClientConfig:
+    """
+    Configuración de transporte del cliente de Jira.
+
+    Attributes:
+        pool_connections: Número de pools por host que se mantienen en caché
+        pool_maxsize: Máximo de conexiones abiertas por host
+        pool_block: Si True, las peticiones esperan una conexión libre en lugar
+            de abrir conexiones extra por encima de pool_maxsize
+        keep_alive: Reutilizar conexiones TCP/TLS entre peticiones
+        timeout: Timeout de lectura por defecto en segundos
+        connect_timeout: Timeout de conexión en segundos
+        max_retries: Reintentos máximos por llamada ante fallos transitorios
+        retry_backoff_factor: Multiplicador del techo exponencial entre reintentos
+        retry_base_delay: Espera mínima en segundos entre reintentos
+        retry_max_delay: Espera máxima en segundos entre reintentos
+        rate_limit_per_minute: Tasa inicial del rate limiter por sitio
+            (0 = sin límite del lado del cliente)
+        rate_limit_burst: Capacidad del bucket (default: 10% de la tasa)
+        coalesce_gets: Compartir una sola petición entre GETs idénticos
+            concurrentes del mismo tenant
+        circuit_failure_threshold: Fallos consecutivos del sitio que abren el
+            circuit breaker (0 = sin breaker)
+        circuit_recovery_timeout: Segundos que el circuito queda abierto
+            antes de enviar peticiones de prueba
+        circuit_half_open_max_calls: Peticiones de prueba simultáneas
+        json_codec: Codec JSON de los bodies ("auto", "orjson" o "json")
+        compress_requests: Enviar con gzip los bodies grandes
+        compress_min_bytes: Tamaño mínimo del body para comprimirlo
+        cassette_mode: "off", "record" (grabar el tráfico en cassette_path)
+            o "replay" (responder desde cassette_path sin tocar Jira)
+        cassette_path: Archivo del cassette (ver app/clients/cassette.py)
+        cassette_speed: Escala de los tiempos grabados al reproducir
+            (1 = tiempo original, 0 = sin esperas)
+        user_cache_ttl: Segundos que se cachea el accountId de un nombre
+            (0 = sin caché)
+        user_cache_negative_ttl: Segundos que se cachea un nombre no
+            encontrado (0 = no cachear)
+        user_cache_size: Máximo de nombres en caché por sitio
+        create_meta_ttl: Segundos que se cachean los metadatos de creación
+            (createmeta) con los que se validan los payloads antes de
+            enviarlos (0 = sin validación local)
+    """
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    timeout: float = 30
+    connect_timeout: float = 5
+    max_retries: int = 3
+    retry_backoff_factor: float = 2
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 30
+    rate_limit_per_minute: float = 60
+    rate_limit_burst: Optional[int] = None
+    coalesce_gets: bool = True
+    circuit_failure_threshold: int = 5
+    circuit_recovery_timeout: float = 30
+    circuit_half_open_max_calls: int = 1
+    json_codec: str = "auto"
+    compress_requests: bool = False
+    compress_min_bytes: int = 1024
+    cassette_mode: str = "off"
+    cassette_path: Optional[str] = None
+    cassette_speed: float = 1.0
+    user_cache_ttl: float = 3600
+    user_cache_negative_ttl: float = 300
+    user_cache_size: int = 1000
+    create_meta_ttl: float = 0
+
+    @classmethod
+    def from_env(cls) -> "JiraClientConfig":
+        """
+        Crea la configuración desde variables de entorno.
+
+        Variables soportadas (mismos nombres que en app.core.config.Settings):
+            - JIRA_POOL_CONNECTIONS
+            - JIRA_POOL_MAXSIZE
+            - JIRA_POOL_BLOCK
+            - JIRA_KEEP_ALIVE
+            - JIRA_TIMEOUT
+            - JIRA_CONNECT_TIMEOUT
+            - MAX_RETRIES
+            - RETRY_BACKOFF_FACTOR
+            - RETRY_BASE_DELAY
+            - RETRY_MAX_DELAY
+            - RATE_LIMIT_PER_MINUTE
+            - JIRA_RATE_LIMIT_BURST
+            - JIRA_COALESCE_GETS
+            - JIRA_CIRCUIT_FAILURE_THRESHOLD
+            - JIRA_CIRCUIT_RECOVERY_TIMEOUT
+            - JIRA_CIRCUIT_HALF_OPEN_MAX_CALLS
+            - JIRA_JSON_CODEC
+            - JIRA_COMPRESS_REQUESTS
+            - JIRA_COMPRESS_MIN_BYTES
+            - JIRA_CASSETTE_MODE
+            - JIRA_CASSETTE
+            - JIRA_CASSETTE_SPEED
+            - JIRA_USER_CACHE_TTL
+            - JIRA_USER_CACHE_NEGATIVE_TTL
+            - JIRA_USER_CACHE_SIZE
+            - JIRA_CREATE_META_TTL
+        """
+        defaults = cls()
+        return cls(
+            pool_connections=int(os.getenv("JIRA_POOL_CONNECTIONS", defaults.pool_connections)),
+            pool_maxsize=int(os.getenv("JIRA_POOL_MAXSIZE", defaults.pool_maxsize)),
+            pool_block=_env_bool("JIRA_POOL_BLOCK", defaults.pool_block),
+            keep_alive=_env_bool("JIRA_KEEP_ALIVE", defaults.keep_alive),
+            timeout=float(os.getenv("JIRA_TIMEOUT", defaults.timeout)),
+            connect_timeout=float(os.getenv("JIRA_CONNECT_TIMEOUT", defaults.connect_timeout)),
+            max_retries=int(os.getenv("MAX_RETRIES", defaults.max_retries)),
+            retry_backoff_factor=float(os.getenv("RETRY_BACKOFF_FACTOR", defaults.retry_backoff_factor)),
+            retry_base_delay=float(os.getenv("RETRY_BASE_DELAY", defaults.retry_base_delay)),
+            retry_max_delay=float(os.getenv("RETRY_MAX_DELAY", defaults.retry_max_delay)),
+            rate_limit_per_minute=float(os.getenv("RATE_LIMIT_PER_MINUTE", defaults.rate_limit_per_minute)),
+            rate_limit_burst=int(os.getenv("JIRA_RATE_LIMIT_BURST", 0)) or None,
+            coalesce_gets=_env_bool("JIRA_COALESCE_GETS", defaults.coalesce_gets),
+            circuit_failure_threshold=int(
+                os.getenv("JIRA_CIRCUIT_FAILURE_THRESHOLD", defaults.circuit_failure_threshold)
+            ),
+            circuit_recovery_timeout=float(
+                os.getenv("JIRA_CIRCUIT_RECOVERY_TIMEOUT", defaults.circuit_recovery_timeout)
+            ),
+            circuit_half_open_max_calls=int(
+                os.getenv("JIRA_CIRCUIT_HALF_OPEN_MAX_CALLS", defaults.circuit_half_open_max_calls)
+            ),
+            json_codec=os.getenv("JIRA_JSON_CODEC", defaults.json_codec),
+            compress_requests=_env_bool("JIRA_COMPRESS_REQUESTS", defaults.compress_requests),
+            compress_min_bytes=int(os.getenv("JIRA_COMPRESS_MIN_BYTES", defaults.compress_min_bytes)),
+            cassette_mode=os.getenv("JIRA_CASSETTE_MODE", defaults.cassette_mode),
+            cassette_path=os.getenv("JIRA_CASSETTE") or None,
+            cassette_speed=float(os.getenv("JIRA_CASSETTE_SPEED", defaults.cassette_speed)),
+            user_cache_ttl=float(os.getenv("JIRA_USER_CACHE_TTL", defaults.user_cache_ttl)),
+            user_cache_negative_ttl=float(
+                os.getenv("JIRA_USER_CACHE_NEGATIVE_TTL", defaults.user_cache_negative_ttl)
+            ),
+            user_cache_size=int(os.getenv("JIRA_USER_CACHE_SIZE", defaults.user_cache_size)),
+            create_meta_ttl=float(os.getenv("JIRA_CREATE_META_TTL", defaults.create_meta_ttl)),
+        )
 
 
-class JiraClient:
+class JiraClientBase:
     """
-    Cliente para Jira Cloud REST API v3.
+    Lógica común a los clientes síncrono y asíncrono de Jira.
 
-    Autenticación usando Basic Auth con email y API token.
+    Contiene la configuración, los headers de autenticación y la construcción
+    de payloads y errores; las subclases solo implementan el transporte HTTP.
     """
 
     def __init__(
         self,
         base_url: Optional[str] = None,
         email: Optional[str] = None,
-        api_token: Optional[str] = None
+        api_token: Optional[str] = None,
+        config: Optional[JiraClientConfig] = None
     ):
         """
         Inicializa el cliente de Jira.
@@ -32,6 +217,7 @@ class JiraClient:
             base_url: URL base de Jira (ej: https://company.atlassian.net)
             email: Email del usuario de Jira
             api_token: API token de Jira
+            config: Configuración de transporte (default: JiraClientConfig.from_env())
 
         Si no se proporcionan, se leen desde variables de entorno:
             - JIRA_BASE_URL
@@ -57,6 +243,89 @@ class JiraClient:
         # URL base de la API REST
         self.api_url = f"{self.base_url}/rest/api/3"
 
+        # Configuración de transporte
+        self.config = config or JiraClientConfig.from_env()
+
+        # Política de reintentos y contadores compartidos del proceso
+        self.retry_policy = RetryPolicy(
+            max_retries=self.config.max_retries,
+            backoff_factor=self.config.retry_backoff_factor,
+            base_delay=self.config.retry_base_delay,
+            max_delay=self.config.retry_max_delay
+        )
+        self.retry_stats = retry_stats
+
+        # Rate limiter compartido por todos los clientes del mismo sitio
+        self.rate_limiter = None
+        if self.config.rate_limit_per_minute > 0:
+            self.rate_limiter = get_rate_limiter(
+                self.base_url,
+                self.config.rate_limit_per_minute,
+                self.config.rate_limit_burst
+            )
+
+        # Codec JSON para bodies de petición y respuesta
+        self.codec = get_codec(self.config.json_codec)
+
+        # Grabación / reproducción del tráfico (cassettes)
+        self.cassette_mode = cassette.check_mode(self.config.cassette_mode, self.config.cassette_path)
+        self.cassette = None
+        if self.cassette_mode != cassette.OFF:
+            self.cassette = cassette.get_cassette(self.config.cassette_path)
+
+        # Circuit breaker compartido por todos los clientes del mismo sitio
+        self.circuit_breaker = None
+        if self.config.circuit_failure_threshold > 0:
+            self.circuit_breaker = get_circuit_breaker(
+                self.base_url,
+                self.config.circuit_failure_threshold,
+                self.config.circuit_recovery_timeout,
+                self.config.circuit_half_open_max_calls
+            )
+
+        # Caché de nombre → accountId compartida por todos los clientes del mismo sitio
+        self.account_id_cache = None
+        if self.config.user_cache_ttl > 0:
+            self.account_id_cache = get_account_id_cache(
+                self.base_url,
+                self.config.user_cache_size,
+                self.config.user_cache_ttl,
+                self.config.user_cache_negative_ttl
+            )
+
+        # Metadatos de creación (createmeta) compartidos por los clientes con las mismas credenciales
+        self.create_meta_cache = None
+        if self.config.create_meta_ttl > 0:
+            self.create_meta_cache = get_create_meta_cache(
+                self.base_url, self.email, self.api_token, ttl=self.config.create_meta_ttl
+            )
+
+        # Hooks de instrumentación propios de este cliente (además de los
+        # registrados para todo el proceso)
+        self.hooks: List[Any] = []
+
+        # Identifica sitio + credenciales sin guardar otra copia del token
+        self.tenant_key = hashlib.sha256(
+            f"{self.api_url}\0{self.headers['Authorization']}".encode()
+        ).hexdigest()
+
+    def _coalesce_key(
+        self,
+        method: str,
+        data: Optional[Dict[str, Any]],
+        endpoint: str,
+        params: Optional[Dict[str, Any]]
+    ) -> Optional[tuple]:
+        """
+        Clave de coalescencia, o None si la petición no se puede compartir.
+
+        Solo se comparten GETs sin body: no tienen efectos en Jira y la
+        respuesta es la misma para todos los llamadores del tenant.
+        """
+        if not self.config.coalesce_gets or method.upper() != "GET" or data is not None:
+            return None
+        return request_key(self.tenant_key, method, endpoint, params)
+
     def _create_auth_headers(self) -> Dict[str, str]:
         """
         Crea los headers de autenticación Basic Auth.
@@ -71,94 +340,267 @@ class JiraClient:
         return {
             "Authorization": f"Basic {encoded_credentials}",
             "Content-Type": "application/json",
-            "Accept": "application/json"
+            "Accept": "application/json",
+            # Respuestas grandes (proyectos, usuarios, createmeta) viajan comprimidas
+            "Accept-Encoding": "gzip, deflate"
         }
 
-    def _make_request(
-        self,
-        method: str,
-        endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None,
-        timeout: int = 30
-    ) -> Dict[str, Any]:
+    def _call_timeouts(self, url: str, timeout: Optional[float] = None) -> Tuple[float, float]:
         """
-        Realiza una petición HTTP a la API de Jira.
+        Timeouts de conexión y lectura para un intento.
+
+        Se recortan a lo que queda del deadline de la petición en curso
+        (ver app.clients.deadline).
 
         Args:
-            method: Método HTTP (GET, POST, PUT, DELETE)
-            endpoint: Endpoint de la API (ej: /issue)
-            data: Datos JSON para el body (opcional)
-            params: Parámetros query string (opcional)
-            timeout: Timeout en segundos (default: 30)
+            url: URL de la petición (para el mensaje de error)
+            timeout: Timeout de lectura pedido (default: self.config.timeout)
 
         Returns:
-            Response JSON como diccionario
+            Tupla (connect_timeout, read_timeout) en segundos
 
         Raises:
-            JiraAPIError: Si la petición falla
+            JiraAPIError: Con status 504 si el deadline ya venció
         """
-        url = f"{self.api_url}{endpoint}"
+        read = timeout if timeout is not None else self.config.timeout
+        connect = min(self.config.connect_timeout, read)
+
+        left = deadline_remaining()
+        if left is not None:
+            if left <= 0:
+                raise self._deadline_error(url)
+            connect = min(connect, left)
+            read = min(read, left)
+
+        return connect, read
+
+    def _fits_deadline(self, wait: float) -> bool:
+        """True si esperar `wait` segundos deja algo de presupuesto."""
+        left = deadline_remaining()
+        return left is None or wait < left
+
+    def _deadline_error(self, url: str) -> "JiraAPIError":
+        """Error para una petición que se quedó sin presupuesto de tiempo."""
+        return JiraAPIError(
+            f"Tiempo agotado para completar la petición a Jira: {url}",
+            status_code=504,
+            request_sent=False
+        )
 
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                json=data,
-                params=params,
-                timeout=timeout
+    def _check_circuit(self) -> None:
+        """
+        Falla de inmediato si el circuit breaker del sitio está abierto.
+
+        Raises:
+            JiraAPIError: Con status 503 si el circuito no admite peticiones
+        """
+        if self.circuit_breaker is None:
+            return
+
+        retry_in = self.circuit_breaker.allow()
+        if retry_in is not None:
+            raise JiraAPIError(
+                f"Jira no disponible en {self.base_url}: circuito abierto tras fallos "
+                f"consecutivos, se reintentará en {retry_in:.0f}s",
+                status_code=503,
+                request_sent=False
             )
 
-            # Lanzar excepción para códigos de error HTTP
-            response.raise_for_status()
+    def _record_circuit(self, status_code: Optional[int] = None) -> None:
+        """
+        Registra en el circuit breaker el resultado de un intento.
+
+        Args:
+            status_code: Status HTTP, o None si falló la conexión / timeout
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(failure=status_code is None or status_code >= 500)
+
+    def _release_circuit(self) -> None:
+        """Devuelve al circuit breaker el permiso de un intento que no se envió."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release()
+
+    def _rate_limit_wait(self) -> float:
+        """
+        Reserva un turno en el rate limiter del sitio.
+
+        Returns:
+            Segundos a esperar antes de enviar la petición (0 si no hay límite)
+        """
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.reserve()
+
+    def _observe_rate_limit(self, status_code: Optional[int], headers: Mapping[str, str]) -> None:
+        """Ajusta el rate limiter con los headers de una respuesta de Jira."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(status_code, headers)
 
-            # Retornar JSON si hay contenido
-            if response.text:
-                return response.json()
+    def _next_retry_delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        previous_delay: Optional[float],
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        error: Optional[BaseException] = None,
+        request_sent: bool = True,
+        idempotent: Optional[bool] = None
+    ) -> Optional[float]:
+        """
+        Consulta la política de reintentos y registra la decisión.
+
+        Args:
+            method: Método HTTP
+            url: URL completa de la petición (solo para el log)
+            attempt: Reintentos ya realizados para esta llamada
+            previous_delay: Espera usada en el reintento anterior
+            status_code: Status HTTP recibido (None si no hubo respuesta)
+            headers: Headers de la respuesta
+            error: Excepción de transporte, si la hubo
+            request_sent: False si la petición no llegó a enviarse
+            idempotent: Fuerza el carácter idempotente de la llamada
+
+        Returns:
+            Segundos a esperar antes de reintentar, o None para no reintentar
+            (también si la espera no cabe en el deadline de la petición)
+        """
+        delay = self.retry_policy.retry_delay(
+            method,
+            attempt,
+            previous_delay=previous_delay,
+            status_code=status_code,
+            headers=headers,
+            request_sent=request_sent,
+            idempotent=idempotent
+        )
+
+        if delay is None or not self._fits_deadline(delay):
+            if attempt > 0:
+                self.retry_stats.record_exhausted()
+            return None
+
+        reason = describe_retry(status_code, error)
+        self.retry_stats.record_retry(reason, delay)
+        log_retry(method, url, reason, attempt + 1, delay)
+        return delay
+
+    def add_hook(self, hook: Any) -> None:
+        """
+        Agrega un hook de instrumentación a este cliente.
+
+        Args:
+            hook: Objeto con método observe(event) que recibe un
+                RequestEvent por cada llamada a Jira (ver instrumentation.py)
+        """
+        if not callable(getattr(hook, "observe", None)):
+            raise ValueError("El hook debe tener un método observe(event)")
+        self.hooks.append(hook)
+
+    def _observe_request(self, trace: RequestTrace, error: Optional[BaseException] = None) -> None:
+        """Entrega el evento de una llamada terminada a los hooks."""
+        emit(default_hooks() + self.hooks, trace.finish(error))
+
+    def _encode_body(self, data: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """Serializa el body de una petición con self.codec."""
+        if data is None:
+            return None
+        return self.codec.dumps(data)
+
+    def _compress_body(self, body: Optional[bytes]) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """
+        Comprime con gzip un body grande si la compresión está activada.
+
+        Args:
+            body: Body ya serializado
+
+        Returns:
+            Tupla (body a enviar, headers extra); el body solo se comprime si
+            supera compress_min_bytes y el resultado es más pequeño
+        """
+        if (
+            body is None
+            or not self.config.compress_requests
+            or len(body) < self.config.compress_min_bytes
+        ):
+            return body, {}
+
+        compressed = gzip.compress(body, compresslevel=6)
+        if len(compressed) >= len(body):
+            return body, {}
+        return compressed, {"Content-Encoding": "gzip"}
+
+    def _parse_response(self, response: Any) -> Any:
+        """
+        Convierte el body de una respuesta exitosa en JSON.
+
+        Trabaja sobre los bytes crudos: el body no se decodifica a texto ni
+        se parsea dos veces.
+
+        Args:
+            response: Response de requests o httpx
+
+        Returns:
+            JSON decodificado, o {} si la respuesta no tiene contenido
+        """
+        content = response.content
+        if is_empty_body(content):
             return {}
+        return self.codec.loads(content)
 
-        except Timeout:
-            raise JiraAPIError(
-                f"Timeout al conectar con Jira: {url}",
-                status_code=None
-            )
-        except HTTPError as e:
-            # Intentar extraer mensaje de error de Jira
-            error_message = self._extract_error_message(e.response)
-            raise JiraAPIError(
-                f"Error HTTP {e.response.status_code}: {error_message}",
-                status_code=e.response.status_code,
-                response=e.response.json() if e.response.text else {}
-            )
-        except RequestException as e:
-            raise JiraAPIError(f"Error de conexión con Jira: {str(e)}")
+    def _error_from_response(self, response: Any) -> "JiraAPIError":
+        """
+        Construye un JiraAPIError a partir de una respuesta HTTP de error.
 
-    def _extract_error_message(self, response: requests.Response) -> str:
+        Args:
+            response: Response de requests o httpx con status >= 400
+
+        Returns:
+            JiraAPIError con el mensaje y el body de Jira
+        """
+        # Parsear el body una sola vez; puede no ser JSON (ej: HTML de un proxy)
+        body = {}
+        if not is_empty_body(response.content):
+            try:
+                body = self.codec.loads(response.content)
+            except ValueError:
+                pass
+        if not isinstance(body, dict):
+            body = {}
+
+        # Intentar extraer mensaje de error de Jira
+        error_message = self._extract_error_message(response, body)
+
+        return JiraAPIError(
+            f"Error HTTP {response.status_code}: {error_message}",
+            status_code=response.status_code,
+            response=body
+        )
+
+    def _extract_error_message(self, response: Any, error_data: Dict[str, Any]) -> str:
         """
         Extrae el mensaje de error de una respuesta de Jira.
 
         Args:
-            response: Response object de requests
+            response: Response object de requests o httpx
+            error_data: Body JSON ya parseado ({} si no era JSON)
 
         Returns:
             Mensaje de error legible
         """
-        try:
-            error_data = response.json()
-            # Jira puede retornar errores en diferentes formatos
-            if "errorMessages" in error_data and error_data["errorMessages"]:
-                return "; ".join(error_data["errorMessages"])
-            elif "errors" in error_data:
-                return str(error_data["errors"])
-            elif "message" in error_data:
-                return error_data["message"]
-        except Exception:
-            pass
+        # Jira puede retornar errores en diferentes formatos
+        if error_data.get("errorMessages"):
+            return "; ".join(error_data["errorMessages"])
+        elif "errors" in error_data:
+            return str(error_data["errors"])
+        elif "message" in error_data:
+            return error_data["message"]
 
         return response.text or "Error desconocido"
 
-    def create_issue(
+    def _build_issue_payload(
         self,
         project_key: str,
         summary: str,
@@ -169,27 +611,15 @@ class JiraClient:
         assignee: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Crea un nuevo issue en Jira.
+        Valida los parámetros y construye el payload para crear un issue.
 
         Args:
-            project_key: Clave del proyecto (ej: "PROJ")
-            summary: Resumen del issue (máx 255 caracteres)
-            description: Descripción detallada (opcional)
-            issue_type: Tipo de issue (Task, Bug, Story, Epic) - default: Task
-            priority: Prioridad (Highest, High, Medium, Low, Lowest) - default: Medium
-            labels: Lista de etiquetas (opcional)
-            assignee: Account ID del asignado (opcional)
+            Ver create_issue()
 
         Returns:
-            Diccionario con información del issue creado:
-            {
-                "id": "10001",
-                "key": "PROJ-123",
-                "self": "https://company.atlassian.net/rest/api/3/issue/10001"
-            }
+            Payload {"fields": {...}} listo para POST /issue
 
         Raises:
-            JiraAPIError: Si falla la creación del issue
             ValueError: Si los parámetros son inválidos
         """
         # Validar parámetros requeridos
@@ -228,16 +658,232 @@ class JiraClient:
             fields["assignee"] = {"id": assignee}
 
         # Crear el payload completo
-        payload = {"fields": fields}
+        return {"fields": fields}
 
-        # Hacer la petición POST
-        response = self._make_request(
-            method="POST",
-            endpoint="/issue",
-            data=payload
+    def _local_validation_error(self, errors: Dict[str, str]) -> "JiraAPIError":
+        """
+        Error de un payload rechazado localmente, con el formato de un 400 de Jira.
+
+        Args:
+            errors: Errores por campo
+
+        Returns:
+            JiraAPIError con status 400 y {"errors": errors} como respuesta
+        """
+        if self.create_meta_cache is not None:
+            self.create_meta_cache.record_rejection()
+        return JiraAPIError(
+            f"Payload inválido (validado sin llamar a Jira): {errors}",
+            status_code=400,
+            response={"errorMessages": [], "errors": errors}
         )
 
-        return response
+    def _create_meta_target(self, payload: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """Proyecto y nombre del tipo de un payload, si se pueden validar."""
+        if self.create_meta_cache is None:
+            return None, None
+        fields = payload.get("fields") or {}
+        project_key = (fields.get("project") or {}).get("key")
+        issue_type = (fields.get("issuetype") or {}).get("name")
+        if not project_key or not issue_type:
+            return None, None
+        return project_key, issue_type
+
+    def _match_issue_type(
+        self,
+        project_key: str,
+        issue_types: List[IssueTypeMeta],
+        name: str
+    ) -> Optional[IssueTypeMeta]:
+        """
+        Tipo del proyecto para un nombre pedido.
+
+        Returns:
+            Tipo encontrado, o None si no hay metadatos contra qué validar
+
+        Raises:
+            JiraAPIError: (400 local) Si el proyecto no tiene ese tipo
+        """
+        if not issue_types:
+            return None
+        issue_type = match_issue_type(issue_types, name)
+        if issue_type is None:
+            available = ", ".join(item.name for item in issue_types)
+            raise self._local_validation_error({
+                "issuetype": f"El proyecto {project_key} no tiene el tipo de issue '{name}'. Disponibles: {available}"
+            })
+        return issue_type
+
+    def _apply_create_meta(
+        self,
+        payload: Dict[str, Any],
+        issue_type: Optional[IssueTypeMeta]
+    ) -> Dict[str, Any]:
+        """
+        Normaliza un payload con los metadatos de su tipo (ver create_meta.py).
+
+        Los campos que no están en la pantalla de creación se quitan y se
+        registran en el log y en la caché (ver CreateMetaCache.record_dropped).
+
+        Returns:
+            Payload normalizado (o el mismo si no hay metadatos)
+
+        Raises:
+            JiraAPIError: (400 local) Si algún campo es inválido
+        """
+        if issue_type is None:
+            return payload
+        fields, errors = apply_create_meta(payload["fields"], issue_type)
+        if errors:
+            raise self._local_validation_error(errors)
+
+        dropped = dropped_fields(payload["fields"], fields, errors)
+        if dropped:
+            # Jira rechazaría el issue entero con ellos; que no se pierdan en silencio
+            logger.warning(
+                "Campos quitados del issue %s/%s por no estar en su pantalla de creación: %s",
+                (payload["fields"].get("project") or {}).get("key"), issue_type.name, ", ".join(dropped)
+            )
+            if self.create_meta_cache is not None:
+                self.create_meta_cache.record_dropped(dropped)
+        return {**payload, "fields": fields}
+
+    @staticmethod
+    def _create_meta_unavailable(project_key: str, error: "JiraAPIError") -> None:
+        logger.warning(
+            "No se pudieron obtener los metadatos de creación de %s; se envía sin validar: %s",
+            project_key, error
+        )
+
+    @staticmethod
+    def _bulk_item_error(index: int, error: "JiraAPIError") -> Dict[str, Any]:
+        """Error de un payload del bulk rechazado antes de enviarlo."""
+        return {
+            "index": index,
+            "status": error.status_code,
+            "message": error.message,
+            "errors": error.response.get("errors") or {}
+        }
+
+    @staticmethod
+    def _remap_bulk_result(
+        result: Dict[str, List[Dict[str, Any]]],
+        sent: Dict[str, List[Dict[str, Any]]],
+        positions: List[int]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Junta el resultado de los payloads enviados con los rechazados localmente.
+
+        Args:
+            result: Acumulador con los errores locales (índices originales)
+            sent: Resultado del bulk sobre los payloads enviados
+            positions: Índice original de cada payload enviado
+
+        Returns:
+            result, con los índices de "sent" traducidos a los originales
+        """
+        for key in ("issues", "errors"):
+            for item in sent[key]:
+                result[key].append({**item, "index": positions[item["index"]]})
+            result[key].sort(key=lambda item: item["index"])
+        return result
+
+    def _bulk_chunks(
+        self,
+        payloads: List[Dict[str, Any]],
+        chunk_size: int
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Divide los payloads en bloques aceptados por POST /issue/bulk.
+
+        Args:
+            payloads: Payloads {"fields": {...}} a crear
+            chunk_size: Tamaño de bloque (máximo BULK_CREATE_LIMIT)
+
+        Returns:
+            Lista de bloques en el orden original
+        """
+        if not 1 <= chunk_size <= BULK_CREATE_LIMIT:
+            raise ValueError(f"chunk_size debe estar entre 1 y {BULK_CREATE_LIMIT}")
+        return [payloads[i:i + chunk_size] for i in range(0, len(payloads), chunk_size)]
+
+    def _merge_bulk_response(
+        self,
+        result: Dict[str, List[Dict[str, Any]]],
+        offset: int,
+        chunk_length: int,
+        response: Dict[str, Any]
+    ) -> None:
+        """
+        Agrega al resultado los issues creados y los errores de un bloque.
+
+        Jira retorna los issues creados en orden y los fallidos en "errors"
+        con su posición dentro del bloque (failedElementNumber); aquí se
+        traducen a índices de la lista original de payloads.
+
+        Args:
+            result: Acumulador {"issues": [...], "errors": [...]}
+            offset: Índice del primer payload del bloque
+            chunk_length: Número de payloads del bloque
+            response: Body de la respuesta de Jira
+        """
+        failed = {}
+        for error in response.get("errors", []) or []:
+            position = error.get("failedElementNumber")
+            if position is None:
+                continue
+            element_errors = error.get("elementErrors", {}) or {}
+            messages = element_errors.get("errorMessages") or []
+            field_errors = element_errors.get("errors") or {}
+            failed[position] = {
+                "index": offset + position,
+                "status": error.get("status"),
+                "message": "; ".join(messages) or str(field_errors) or "Error desconocido",
+                "errors": field_errors
+            }
+
+        created = iter(response.get("issues", []) or [])
+        for position in range(chunk_length):
+            if position in failed:
+                result["errors"].append(failed[position])
+                continue
+            issue = next(created, None)
+            if issue is None:
+                result["errors"].append({
+                    "index": offset + position,
+                    "status": None,
+                    "message": "Jira no reportó el resultado de este issue",
+                    "errors": {}
+                })
+            else:
+                result["issues"].append({"index": offset + position, **issue})
+
+    def _merge_bulk_error(
+        self,
+        result: Dict[str, List[Dict[str, Any]]],
+        offset: int,
+        chunk_length: int,
+        error: "JiraAPIError"
+    ) -> None:
+        """
+        Registra el fallo de un bloque completo.
+
+        Si Jira respondió con el formato de errores de bulk (todos los
+        elementos fallaron) se mapea cada error a su payload; si fue un
+        error de red u otro status, todos los payloads del bloque fallan.
+        """
+        if error.response.get("errors"):
+            self._merge_bulk_response(result, offset, chunk_length, error.response)
+            return
+
+        for position in range(chunk_length):
+            result["errors"].append({
+                "index": offset + position,
+                "status": error.status_code,
+                "message": error.message,
+                "errors": {},
+                "request_sent": error.request_sent
+            })
 
     def _create_adf_content(self, text: str) -> Dict[str, Any]:
         """
@@ -281,6 +927,506 @@ class JiraClient:
             ]
         }
 
+
+# GETs idénticos en vuelo, compartidos por todos los clientes síncronos
+_single_flight = SingleFlight()
+
+
+class JiraClient(JiraClientBase):
+    """
+    Cliente para Jira Cloud REST API v3.
+
+    Autenticación usando Basic Auth con email y API token.
+
+    Todas las peticiones comparten una ``requests.Session`` con pool de
+    conexiones keep-alive, de modo que solo la primera llamada a un host
+    paga el handshake TCP + TLS.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        email: Optional[str] = None,
+        api_token: Optional[str] = None,
+        config: Optional[JiraClientConfig] = None
+    ):
+        """
+        Inicializa el cliente de Jira.
+
+        Args:
+            base_url: URL base de Jira (ej: https://company.atlassian.net)
+            email: Email del usuario de Jira
+            api_token: API token de Jira
+            config: Configuración de transporte (default: JiraClientConfig.from_env())
+
+        Si no se proporcionan, se leen desde variables de entorno:
+            - JIRA_BASE_URL
+            - JIRA_EMAIL
+            - JIRA_API_TOKEN
+        """
+        super().__init__(base_url, email, api_token, config)
+
+        # Sesión HTTP persistente con pool de conexiones
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Crea la sesión HTTP compartida por todas las peticiones del cliente.
+
+        Returns:
+            Sesión con adaptador HTTP configurado según self.config
+        """
+        session = requests.Session()
+        session.headers.update(self.headers)
+
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+
+        pool = {
+            "pool_connections": self.config.pool_connections,
+            "pool_maxsize": self.config.pool_maxsize,
+            "pool_block": self.config.pool_block,
+        }
+        if self.cassette_mode == cassette.REPLAY:
+            adapter = cassette.ReplayAdapter(self.cassette, self.config.cassette_speed)
+        elif self.cassette_mode == cassette.RECORD:
+            adapter = cassette.RecordingAdapter(self.cassette, **pool)
+        else:
+            adapter = HTTPAdapter(**pool)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+    @staticmethod
+    def _response_wire_bytes(response: requests.Response) -> int:
+        """Bytes del body recibidos por la red (comprimidos si Jira usó gzip)."""
+        try:
+            # urllib3 cuenta los bytes leídos del socket antes de descomprimir
+            return int(response.raw.tell())
+        except (AttributeError, TypeError, ValueError):
+            return len(response.content)
+
+    def close(self) -> None:
+        """Cierra la sesión y libera las conexiones del pool."""
+        self.session.close()
+
+    def __enter__(self) -> "JiraClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        idempotent: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Realiza una petición HTTP a la API de Jira.
+
+        Los fallos transitorios (429, 502, 503, 504, timeouts y errores de
+        conexión) se reintentan según self.retry_policy, solo cuando repetir
+        la petición no puede duplicar efectos en Jira. Los GETs idénticos
+        que coinciden en el tiempo comparten una sola petición a Jira.
+
+        Args:
+            method: Método HTTP (GET, POST, PUT, DELETE)
+            endpoint: Endpoint de la API (ej: /issue)
+            data: Datos JSON para el body (opcional)
+            params: Parámetros query string (opcional)
+            timeout: Timeout de lectura en segundos (default: self.config.timeout),
+                recortado al deadline de la petición en curso
+            idempotent: Marca la llamada como segura de repetir aunque el
+                método no lo sea (ej: POST de búsqueda). None = según el método
+
+        Returns:
+            Response JSON como diccionario
+
+        Raises:
+            JiraAPIError: Si la petición falla
+        """
+        key = self._coalesce_key(method, data, endpoint, params)
+        if key is not None:
+            return _single_flight.do(
+                key,
+                lambda: self._send_request(method, endpoint, data, params, timeout, idempotent),
+                timeout_error=lambda: self._deadline_error(f"{self.api_url}{endpoint}")
+            )
+        return self._send_request(method, endpoint, data, params, timeout, idempotent)
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        idempotent: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Envía la petición con reintentos (ver _make_request()) y entrega el
+        resultado a los hooks de instrumentación.
+
+        Returns:
+            Response JSON como diccionario
+
+        Raises:
+            JiraAPIError: Si la petición falla
+        """
+        trace = RequestTrace(method, endpoint)
+        try:
+            result = self._send_attempts(trace, method, endpoint, data, params, timeout, idempotent)
+        except BaseException as e:
+            self._observe_request(trace, e)
+            raise
+        self._observe_request(trace)
+        return result
+
+    def _send_attempts(
+        self,
+        trace: RequestTrace,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        idempotent: Optional[bool]
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta los intentos de una petición anotándolos en `trace`.
+
+        Returns:
+            Response JSON como diccionario
+
+        Raises:
+            JiraAPIError: Si la petición falla
+        """
+        url = f"{self.api_url}{endpoint}"
+        body = self._encode_body(data)
+        wire_body, extra_headers = self._compress_body(body)
+        self.retry_stats.record_request()
+
+        attempt = 0
+        delay = None
+        while True:
+            # Sin presupuesto no se intenta; si el sitio está caído, fallar rápido
+            connect_timeout, read_timeout = self._call_timeouts(url, timeout)
+            self._check_circuit()
+
+            # Esperar turno en el rate limiter del sitio; si el intento se
+            # abandona sin enviarse, el permiso del breaker se devuelve
+            try:
+                wait = self._rate_limit_wait()
+                if wait > 0:
+                    if not self._fits_deadline(wait):
+                        raise self._deadline_error(url)
+                    time.sleep(wait)
+                    connect_timeout, read_timeout = self._call_timeouts(url, timeout)
+            except BaseException:
+                self._release_circuit()
+                raise
+
+            trace.sent(body, wire_body)
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    data=wire_body,
+                    params=params,
+                    headers=extra_headers,
+                    timeout=(connect_timeout, read_timeout)
+                )
+            except Timeout as e:
+                sent = not isinstance(e, ConnectTimeout)
+                error = JiraAPIError(
+                    f"Timeout al conectar con Jira: {url}",
+                    status_code=None,
+                    request_sent=sent
+                )
+                self._record_circuit()
+                delay = self._next_retry_delay(
+                    method, url, attempt, delay,
+                    error=e,
+                    request_sent=sent,
+                    idempotent=idempotent
+                )
+            except RequestException as e:
+                error = JiraAPIError(f"Error de conexión con Jira: {str(e)}")
+                self._record_circuit()
+                delay = self._next_retry_delay(
+                    method, url, attempt, delay,
+                    error=e,
+                    idempotent=idempotent
+                )
+            except BaseException:
+                # Cancelado a mitad del envío: no hay resultado que registrar
+                self._release_circuit()
+                raise
+            else:
+                trace.received(response.status_code, response.content, self._response_wire_bytes(response))
+                self._observe_rate_limit(response.status_code, response.headers)
+                self._record_circuit(response.status_code)
+                if response.ok:
+                    # Retornar JSON si hay contenido
+                    return self._parse_response(response)
+
+                error = self._error_from_response(response)
+                delay = self._next_retry_delay(
+                    method, url, attempt, delay,
+                    status_code=response.status_code,
+                    headers=response.headers,
+                    idempotent=idempotent
+                )
+
+            if delay is None:
+                raise error
+
+            attempt += 1
+            time.sleep(delay)
+
+    def create_issue(
+        self,
+        project_key: str,
+        summary: str,
+        description: Optional[str] = None,
+        issue_type: str = "Task",
+        priority: str = "Medium",
+        labels: Optional[List[str]] = None,
+        assignee: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Crea un nuevo issue en Jira.
+
+        Args:
+            project_key: Clave del proyecto (ej: "PROJ")
+            summary: Resumen del issue (máx 255 caracteres)
+            description: Descripción detallada (opcional)
+            issue_type: Tipo de issue (Task, Bug, Story, Epic) - default: Task
+            priority: Prioridad (Highest, High, Medium, Low, Lowest) - default: Medium
+            labels: Lista de etiquetas (opcional)
+            assignee: Account ID del asignado (opcional)
+
+        Returns:
+            Diccionario con información del issue creado:
+            {
+                "id": "10001",
+                "key": "PROJ-123",
+                "self": "https://company.atlassian.net/rest/api/3/issue/10001"
+            }
+
+        Raises:
+            JiraAPIError: Si falla la creación del issue
+            ValueError: Si los parámetros son inválidos
+        """
+        payload = self._prepare_issue_payload(self._build_issue_payload(
+            project_key=project_key,
+            summary=summary,
+            description=description,
+            issue_type=issue_type,
+            priority=priority,
+            labels=labels,
+            assignee=assignee
+        ))
+
+        # Hacer la petición POST
+        response = self._make_request(
+            method="POST",
+            endpoint="/issue",
+            data=payload
+        )
+
+        return response
+
+    def create_issues_bulk(
+        self,
+        payloads: List[Dict[str, Any]],
+        chunk_size: int = BULK_CREATE_LIMIT
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Crea varios issues con POST /issue/bulk.
+
+        Los payloads se envían en bloques de hasta 50 (límite de Jira). Jira
+        permite éxito parcial: los issues válidos se crean aunque otros del
+        mismo bloque fallen, así que el resultado separa creados y errores,
+        ambos con el índice del payload original.
+
+        Args:
+            payloads: Lista de payloads {"fields": {...}} como los de POST /issue
+            chunk_size: Issues por petición (1-50)
+
+        Returns:
+            Diccionario:
+            {
+                "issues": [{"index": 0, "id": "10001", "key": "PROJ-1", "self": "..."}],
+                "errors": [{"index": 1, "status": 400, "message": "...", "errors": {...}}]
+            }
+
+        Los payloads inválidos según createmeta (ver create_meta.py) no se
+        envían: aparecen en "errors" con status 400 como si Jira los hubiera
+        rechazado. Si falló un bloque completo sin respuesta de bulk, sus
+        errores llevan además "request_sent" (ver JiraAPIError).
+
+        Raises:
+            ValueError: Si chunk_size es inválido
+        """
+        result: Dict[str, List[Dict[str, Any]]] = {"issues": [], "errors": []}
+
+        sendable, positions = [], []
+        for index, payload in enumerate(payloads):
+            try:
+                sendable.append(self._prepare_issue_payload(payload))
+                positions.append(index)
+            except JiraAPIError as e:
+                result["errors"].append(self._bulk_item_error(index, e))
+
+        sent: Dict[str, List[Dict[str, Any]]] = {"issues": [], "errors": []}
+        offset = 0
+        for chunk in self._bulk_chunks(sendable, chunk_size):
+            try:
+                response = self._make_request(
+                    method="POST",
+                    endpoint="/issue/bulk",
+                    data={"issueUpdates": chunk}
+                )
+                self._merge_bulk_response(sent, offset, len(chunk), response)
+            except JiraAPIError as e:
+                self._merge_bulk_error(sent, offset, len(chunk), e)
+            offset += len(chunk)
+
+        return self._remap_bulk_result(result, sent, positions)
+
+    def get_create_meta(self, project_key: str, issue_type: str) -> Optional[IssueTypeMeta]:
+        """
+        Metadatos de creación de un tipo de issue, desde la caché o createmeta.
+
+        Args:
+            project_key: Clave del proyecto
+            issue_type: Nombre del tipo ("Subtask" y "Sub-task" son equivalentes)
+
+        Returns:
+            Tipo con sus campos, o None si la validación local está
+            desactivada o Jira no entregó los metadatos
+
+        Raises:
+            JiraAPIError: (400 local) Si el proyecto no tiene ese tipo de issue
+        """
+        cache = self.create_meta_cache
+        if cache is None:
+            return None
+
+        issue_types = cache.get_issue_types(project_key)
+        if issue_types is MISS:
+            try:
+                issue_types = [
+                    IssueTypeMeta.from_api(item)
+                    for item in self.paginate(
+                        f"/issue/createmeta/{project_key}/issuetypes", items_key="issueTypes"
+                    )
+                ]
+            except JiraAPIError as e:
+                self._create_meta_unavailable(project_key, e)
+                return None
+            cache.put_issue_types(project_key, issue_types)
+
+        match = self._match_issue_type(project_key, issue_types, issue_type)
+        if match is None:
+            return None
+
+        fields = cache.get_fields(project_key, match.id)
+        if fields is MISS:
+            try:
+                fields = {
+                    meta.field_id: meta
+                    for meta in (
+                        FieldMeta.from_api(item)
+                        for item in self.paginate(
+                            f"/issue/createmeta/{project_key}/issuetypes/{match.id}", items_key="fields"
+                        )
+                    )
+                }
+            except JiraAPIError as e:
+                self._create_meta_unavailable(project_key, e)
+                return None
+            cache.put_fields(project_key, match.id, fields)
+
+        return replace(match, fields=fields)
+
+    def _prepare_issue_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Valida y normaliza un payload con createmeta antes de enviarlo.
+
+        Raises:
+            JiraAPIError: (400 local) Si el payload es inválido
+        """
+        project_key, issue_type = self._create_meta_target(payload)
+        if project_key is None or issue_type is None:
+            return payload
+        return self._apply_create_meta(payload, self.get_create_meta(project_key, issue_type))
+
+    def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        style: str = OFFSET,
+        page_size: int = 50,
+        items_key: str = "values"
+    ) -> Iterator[Any]:
+        """
+        Recorre un endpoint paginado, resultado por resultado.
+
+        Mientras el llamador procesa una página, la siguiente se pide en un
+        hilo de fondo. Solo hay dos páginas en memoria a la vez, así que se
+        pueden recorrer miles de usuarios o proyectos sin acumularlos.
+
+        Args:
+            endpoint: Endpoint de la API (ej: /project/search)
+            params: Parámetros query string de la búsqueda
+            style: "offset" (startAt/maxResults) o "token" (nextPageToken)
+            page_size: Resultados por página (maxResults)
+            items_key: Clave de la lista de resultados en la respuesta
+
+        Yields:
+            Cada resultado de cada página, en orden
+
+        Raises:
+            JiraAPIError: Si falla la petición de alguna página
+
+        Example:
+            >>> for project in client.paginate("/project/search"):
+            ...     print(project["key"])
+        """
+        pager = Pager(params, style=style, page_size=page_size, items_key=items_key)
+        page_params = pager.first_params()
+
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        def fetch(page: Dict[str, Any]):
+            # El hilo de fondo hereda el contexto (deadline) del llamador
+            context = contextvars.copy_context()
+            return executor.submit(context.run, self._make_request, "GET", endpoint, params=page)
+
+        try:
+            future = fetch(page_params)
+            while future is not None:
+                response = future.result()
+
+                next_params = pager.next_params(page_params, response)
+                future = None
+                if next_params is not None:
+                    # Pedir la página siguiente antes de entregar la actual
+                    page_params = next_params
+                    future = fetch(page_params)
+
+                yield from pager.items(response)
+        finally:
+            # Si el llamador deja de iterar, no esperar la página pendiente
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_issue(self, issue_key: str) -> Dict[str, Any]:
         """
         Obtiene información de un issue por su key.
@@ -345,6 +1491,10 @@ class JiraClient:
         """
         Obtiene el Account ID de un usuario por su nombre.
 
+        El resultado (también "no encontrado") se guarda en la caché de
+        accountIds del sitio, así las tareas siguientes con el mismo
+        assignee no vuelven a llamar a /user/search.
+
         Args:
             name: Nombre del usuario (ej: "Juan", "María")
             project_key: Clave del proyecto para filtrar búsqueda (opcional)
@@ -356,19 +1506,23 @@ class JiraClient:
             >>> client.get_user_account_id("Juan", "KAN")
             "5b10a2844c20165700ede21g"
         """
+        if self.account_id_cache is not None:
+            cached = self.account_id_cache.get(name, project_key)
+            if cached is not MISS:
+                return cached
+
         try:
             users = self.search_user(name, project_key)
-
-            if users and len(users) > 0:
-                # Retornar el Account ID del primer match
-                return users[0].get("accountId")
-
-            return None
-
         except JiraAPIError:
-            # Si hay error en la búsqueda, retornar None
+            # Si hay error en la búsqueda, retornar None (sin cachear)
             return None
 
+        # Account ID del primer match
+        account_id = users[0].get("accountId") if users else None
+        if self.account_id_cache is not None:
+            self.account_id_cache.put(name, project_key, account_id)
+        return account_id
+
     def get_current_user(self) -> Dict[str, Any]:
         """
         Obtiene información del usuario autenticado.
@@ -407,7 +1561,8 @@ class JiraAPIError(Exception):
         self,
         message: str,
         status_code: Optional[int] = None,
-        response: Optional[Dict[str, Any]] = None
+        response: Optional[Dict[str, Any]] = None,
+        request_sent: bool = True
     ):
         """
         Inicializa la excepción.
@@ -416,10 +1571,14 @@ class JiraAPIError(Exception):
             message: Mensaje de error
             status_code: Código de estado HTTP (opcional)
             response: Response JSON de Jira (opcional)
+            request_sent: False si la petición nunca llegó a Jira (conexión
+                fallida, circuito abierto, sin presupuesto): seguro no tuvo
+                efecto y puede repetirse aunque cree recursos
         """
         self.message = message
         self.status_code = status_code
         self.response = response or {}
+        self.request_sent = request_sent
         super().__init__(self.message)
 
     def __str__(self) -> str:
@@ -0,0 +1,92 @@
+"""
+Codificación JSON de los bodies que se envían y reciben de Jira.
+
+Respuestas como createmeta o /user/assignable/search ocupan megabytes, así
+que el codec es intercambiable: se usa orjson cuando está instalado y la
+librería estándar si no. Ambos trabajan con bytes para no decodificar el
+body a texto antes de parsearlo.
+"""
+
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+
+class JsonCodec:
+    """Interfaz de un codec JSON."""
+
+    name = "base"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serializa un objeto a JSON (UTF-8)."""
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Parsea un body JSON.
+
+        Raises:
+            ValueError: Si el body no es JSON válido
+        """
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Codec basado en el módulo json de la librería estándar."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec basado en orjson (varias veces más rápido que json)."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ValueError("orjson no está instalado")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        # orjson.JSONDecodeError hereda de ValueError
+        return orjson.loads(data)
+
+
+def get_codec(name: Optional[str] = "auto") -> JsonCodec:
+    """
+    Obtiene un codec por nombre.
+
+    Args:
+        name: "orjson", "json" o "auto" (orjson si está instalado)
+
+    Returns:
+        Instancia del codec
+
+    Raises:
+        ValueError: Si el nombre es inválido o orjson no está instalado
+    """
+    name = (name or "auto").lower()
+    if name == "auto":
+        return OrjsonCodec() if orjson is not None else StdlibJsonCodec()
+    if name == "orjson":
+        return OrjsonCodec()
+    if name == "json":
+        return StdlibJsonCodec()
+    raise ValueError(f"Codec JSON inválido: {name}")
+
+
+def is_empty_body(content: Optional[bytes]) -> bool:
+    """True si el body está vacío o solo tiene espacios (sin decodificarlo)."""
+    return not content or content.isspace()
@@ -0,0 +1,117 @@
+"""
+Paginación de endpoints de lista de Jira.
+
+Jira usa dos estilos de paginación:
+
+- ``offset``: parámetros ``startAt``/``maxResults``. La respuesta es un
+  objeto con ``values`` (y ``isLast``/``total``) o, en endpoints como
+  ``/user/assignable/search``, una lista sin metadatos; en ese caso una
+  página con menos de ``maxResults`` resultados es la última.
+- ``token``: parámetro ``nextPageToken``; la respuesta trae el token de la
+  página siguiente (ej: ``/search/jql``). Una respuesta que no es un objeto
+  termina el recorrido.
+
+Pager solo decide qué pedir y cuándo parar; JiraClient.paginate() y
+AsyncJiraClient.paginate() hacen las peticiones y piden la página N+1
+mientras el llamador procesa la N.
+"""
+
+from typing import Any, Dict, List, Optional
+
+OFFSET = "offset"
+TOKEN = "token"
+
+
+class Pager:
+    """
+    Estado de un recorrido paginado.
+
+    Attributes:
+        style: OFFSET o TOKEN
+        page_size: Resultados pedidos por página (maxResults)
+        items_key: Clave de la lista de resultados en la respuesta
+            (ej: "values", "issues"); se ignora si la respuesta es una lista
+    """
+
+    def __init__(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        style: str = OFFSET,
+        page_size: int = 50,
+        items_key: str = "values"
+    ):
+        """
+        Inicializa el recorrido.
+
+        Args:
+            params: Parámetros query string fijos de la búsqueda
+            style: Estilo de paginación (OFFSET o TOKEN)
+            page_size: Resultados por página
+            items_key: Clave de la lista de resultados en la respuesta
+
+        Raises:
+            ValueError: Si el estilo o el tamaño de página son inválidos
+        """
+        if style not in (OFFSET, TOKEN):
+            raise ValueError(f"Estilo de paginación inválido: {style}")
+        if page_size < 1:
+            raise ValueError("page_size debe ser mayor que 0")
+
+        self.style = style
+        self.page_size = page_size
+        self.items_key = items_key
+        self._params = dict(params or {})
+
+    def first_params(self) -> Dict[str, Any]:
+        """Parámetros de la primera página."""
+        params = dict(self._params, maxResults=self.page_size)
+        if self.style == OFFSET:
+            params["startAt"] = params.get("startAt", 0)
+        return params
+
+    def items(self, response: Any) -> List[Any]:
+        """Resultados contenidos en una página."""
+        if isinstance(response, list):
+            return response
+        return (response or {}).get(self.items_key) or []
+
+    def next_params(self, params: Dict[str, Any], response: Any) -> Optional[Dict[str, Any]]:
+        """
+        Parámetros de la página siguiente.
+
+        Args:
+            params: Parámetros con los que se pidió la página actual
+            response: Respuesta de la página actual
+
+        Returns:
+            Parámetros de la siguiente página, o None si era la última
+        """
+        items = self.items(response)
+
+        if self.style == TOKEN:
+            if not isinstance(response, dict):
+                return None
+            token = response.get("nextPageToken")
+            if not token or response.get("isLast") is True:
+                return None
+            return dict(params, nextPageToken=token)
+
+        if not items:
+            return None
+
+        start_at = params.get("startAt", 0)
+        if isinstance(response, list):
+            # Sin metadatos: una página corta es la última, sin pedir otra vacía
+            if len(items) < params["maxResults"]:
+                return None
+            return dict(params, startAt=start_at + len(items))
+
+        if response.get("isLast") is True:
+            return None
+        next_start = start_at + len(items)
+        total = response.get("total")
+        if total is not None and next_start >= total:
+            return None
+        if "isLast" not in response and total is None and len(items) < params["maxResults"]:
+            return None
+        return dict(params, startAt=next_start)
@@ -0,0 +1,236 @@
+"""
+Rate limiter del lado del cliente para Jira Cloud.
+
+Jira Cloud limita por sitio, así que todas las instancias de cliente que
+apuntan al mismo base_url comparten un token bucket. El bucket se siembra
+con RATE_LIMIT_PER_MINUTE y se ajusta solo con los headers de Jira
+(Retry-After, X-RateLimit-*): baja la tasa a la mitad ante un 429 y la
+recupera poco a poco mientras Jira responde sin quejarse (AIMD).
+
+Las peticiones reservan un token y esperan su turno en lugar de disparar
+ráfagas que terminan en 429 para todo el equipo.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from app.clients.client_registry import site_id
+from app.clients.retry import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket adaptativo y thread-safe.
+
+    reserve() nunca bloquea: descuenta un token (el saldo puede quedar
+    negativo) y retorna cuántos segundos debe esperar el llamador, de modo
+    que el cliente síncrono duerma con time.sleep y el asíncrono con
+    asyncio.sleep. Las reservas forman una cola FIFO implícita.
+    """
+
+    # Fracción de la tasa que se recupera por cada respuesta sana
+    RECOVERY_STEP = 0.05
+
+    # La tasa nunca baja de este porcentaje de la tasa inicial
+    MIN_RATE_FRACTION = 0.1
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa el bucket.
+
+        Args:
+            rate_per_minute: Tasa sostenida permitida (peticiones por minuto)
+            burst: Capacidad máxima del bucket (default: 10% de la tasa, mínimo 1)
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute debe ser mayor que 0")
+
+        self.max_rate = rate_per_minute / 60.0
+        self.min_rate = self.max_rate * self.MIN_RATE_FRACTION
+        self.rate = self.max_rate
+        self.capacity = float(burst if burst else max(1, int(rate_per_minute * 0.1)))
+        self.tokens = self.capacity
+        self.blocked_until = 0.0
+
+        self._clock = clock
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+        # Métricas
+        self.acquired = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.throttled = 0
+
+    def _refill(self, now: float) -> None:
+        """Agrega los tokens generados desde la última actualización."""
+        elapsed = max(0.0, now - self._updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Reserva tokens para una petición.
+
+        Args:
+            tokens: Tokens a consumir (1 por petición)
+
+        Returns:
+            Segundos que el llamador debe esperar antes de enviar la petición
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.tokens -= tokens
+
+            wait = 0.0
+            if self.tokens < 0:
+                wait = -self.tokens / self.rate
+            # Pausa impuesta por Jira (Retry-After)
+            wait = max(wait, self.blocked_until - now)
+
+            self.acquired += 1
+            if wait > 0:
+                self.delayed += 1
+                self.wait_seconds += wait
+            return wait
+
+    def observe(self, status_code: Optional[int], headers: Optional[Mapping[str, str]]) -> None:
+        """
+        Ajusta la tasa a partir de una respuesta de Jira.
+
+        Args:
+            status_code: Status HTTP de la respuesta
+            headers: Headers de la respuesta
+        """
+        headers = headers or {}
+        retry_after = parse_retry_after(headers)
+        near_limit = str(headers.get("X-RateLimit-NearLimit", "")).lower() == "true"
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        limit = _int_header(headers, "X-RateLimit-Limit")
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            if limit:
+                # Jira anuncia el tamaño real de su bucket
+                self.capacity = float(min(self.capacity, limit))
+
+            if remaining is not None:
+                # Nunca creer que tenemos más margen del que Jira reporta
+                self.tokens = min(self.tokens, float(remaining))
+
+            if status_code == 429 or retry_after is not None:
+                self.throttled += 1
+                self.rate = max(self.min_rate, self.rate / 2)
+                pause = retry_after if retry_after is not None else _reset_delay(headers)
+                if pause:
+                    self.blocked_until = max(self.blocked_until, now + pause)
+                    self.tokens = min(self.tokens, 0.0)
+                logger.warning(
+                    "Jira limitó la tasa (status=%s); nueva tasa %.2f req/min, pausa %.2fs",
+                    status_code, self.rate * 60, pause or 0.0
+                )
+            elif near_limit:
+                self.rate = max(self.min_rate, self.rate * 0.8)
+            elif status_code is not None and status_code < 400 and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.RECOVERY_STEP)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna el estado y las métricas del bucket.
+
+        Returns:
+            Diccionario con tasa actual, tokens y contadores de espera
+        """
+        with self._lock:
+            self._refill(self._clock())
+            return {
+                "rate_per_minute": round(self.rate * 60, 2),
+                "max_rate_per_minute": round(self.max_rate * 60, 2),
+                "capacity": self.capacity,
+                "tokens": round(self.tokens, 2),
+                "acquired": self.acquired,
+                "delayed": self.delayed,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "throttled": self.throttled,
+            }
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """Lee un header entero, ignorando valores inválidos."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _reset_delay(headers: Mapping[str, str]) -> Optional[float]:
+    """Segundos hasta X-RateLimit-Reset (timestamp ISO 8601), si existe."""
+    value = headers.get("X-RateLimit-Reset")
+    if not value:
+        return None
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Un bucket por sitio de Jira, compartido por todo el proceso
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    base_url: str,
+    rate_per_minute: float,
+    burst: Optional[int] = None
+) -> TokenBucket:
+    """
+    Obtiene (o crea) el token bucket de un sitio de Jira.
+
+    Args:
+        base_url: URL base del sitio (clave del bucket)
+        rate_per_minute: Tasa inicial si el bucket no existe
+        burst: Capacidad del bucket si no existe
+
+    Returns:
+        TokenBucket compartido para ese base_url
+    """
+    key = base_url.rstrip("/").lower()
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate_per_minute, burst)
+            _buckets[key] = bucket
+        return bucket
+
+
+def rate_limiter_snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Estado de todos los buckets del proceso, por sitio.
+
+    Returns:
+        Diccionario {site_id: snapshot} (id opaco, ver site_id)
+    """
+    with _buckets_lock:
+        buckets = dict(_buckets)
+    return {site_id(key): bucket.snapshot() for key, bucket in buckets.items()}
@@ -0,0 +1,245 @@
+"""
+Política de reintentos para peticiones a Jira.
+
+Reintenta con backoff exponencial y jitter decorrelacionado, respeta el
+header Retry-After de Jira y solo repite peticiones que es seguro repetir.
+Los clientes síncrono y asíncrono comparten esta lógica; cada uno solo se
+encarga de dormir (time.sleep / asyncio.sleep) el tiempo calculado.
+"""
+
+import logging
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Métodos que se pueden repetir sin efectos secundarios adicionales
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Status que indican un fallo transitorio de Jira
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Status con los que Jira rechaza la petición antes de procesarla (rate
+# limiting), por lo que incluso un POST es seguro de repetir. Un 503 no lo
+# garantiza: un gateway o proxy puede responderlo después de que Jira ya
+# creó el issue.
+REJECTED_STATUS_CODES = frozenset({429})
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Interpreta el header Retry-After (segundos o fecha HTTP).
+
+    Args:
+        headers: Headers de la respuesta
+
+    Returns:
+        Segundos a esperar, o None si no hay header válido
+    """
+    if not headers:
+        return None
+
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryStats:
+    """
+    Contadores de reintentos compartidos por todos los clientes del proceso.
+
+    Permiten ver cuánto trabajo extra generan los reintentos:
+    ``retries / requests`` es la amplificación de peticiones hacia Jira.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.retry_wait_seconds = 0.0
+        self.retries_by_reason: Dict[str, int] = {}
+
+    def record_request(self) -> None:
+        """Registra una llamada lógica (sin contar reintentos)."""
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, reason: str, delay: float) -> None:
+        """Registra un reintento y el tiempo de espera asociado."""
+        with self._lock:
+            self.retries += 1
+            self.retry_wait_seconds += delay
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+
+    def record_exhausted(self) -> None:
+        """Registra una llamada que falló tras agotar los reintentos."""
+        with self._lock:
+            self.exhausted += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna una copia de los contadores.
+
+        Returns:
+            Diccionario con requests, retries, exhausted, retry_wait_seconds,
+            retries_by_reason y amplification (intentos / llamadas)
+        """
+        with self._lock:
+            amplification = (
+                (self.requests + self.retries) / self.requests if self.requests else 1.0
+            )
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "retry_wait_seconds": round(self.retry_wait_seconds, 3),
+                "retries_by_reason": dict(self.retries_by_reason),
+                "amplification": round(amplification, 4),
+            }
+
+    def reset(self) -> None:
+        """Reinicia todos los contadores."""
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.exhausted = 0
+            self.retry_wait_seconds = 0.0
+            self.retries_by_reason = {}
+
+
+# Contadores globales del proceso
+retry_stats = RetryStats()
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Decide si una petición fallida se reintenta y cuánto esperar.
+
+    Attributes:
+        max_retries: Reintentos máximos por llamada (0 = sin reintentos)
+        backoff_factor: Multiplicador del techo exponencial entre reintentos
+        base_delay: Espera mínima en segundos
+        max_delay: Espera máxima en segundos para el backoff calculado
+        max_retry_after: Retry-After máximo que se acepta esperar; si Jira
+            pide esperar más, se falla de inmediato
+    """
+    max_retries: int = 3
+    backoff_factor: float = 2
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    max_retry_after: float = 60.0
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def is_retry_safe(
+        self,
+        method: str,
+        status_code: Optional[int] = None,
+        request_sent: bool = True,
+        idempotent: Optional[bool] = None
+    ) -> bool:
+        """
+        Indica si repetir la petición no puede duplicar efectos en Jira.
+
+        Args:
+            method: Método HTTP
+            status_code: Status recibido (None si no hubo respuesta)
+            request_sent: False si la conexión falló antes de enviar la petición
+            idempotent: Fuerza el carácter idempotente de la llamada
+                (ej: un POST de búsqueda); None = deducir del método
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        if idempotent or not request_sent:
+            return True
+        return status_code in REJECTED_STATUS_CODES
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        previous_delay: Optional[float] = None,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        request_sent: bool = True,
+        idempotent: Optional[bool] = None
+    ) -> Optional[float]:
+        """
+        Calcula la espera antes del siguiente intento.
+
+        Args:
+            method: Método HTTP
+            attempt: Número de reintentos ya realizados (0 en el primer fallo)
+            previous_delay: Espera usada en el reintento anterior
+            status_code: Status recibido (None para errores de red/timeouts)
+            headers: Headers de la respuesta (para Retry-After)
+            request_sent: False si la petición nunca llegó a enviarse
+            idempotent: Ver is_retry_safe()
+
+        Returns:
+            Segundos a esperar, o None si no se debe reintentar
+        """
+        if attempt >= self.max_retries:
+            return None
+        if status_code is not None and status_code not in RETRYABLE_STATUS_CODES:
+            return None
+        if not self.is_retry_safe(method, status_code, request_sent, idempotent):
+            return None
+
+        # Jira indica cuánto esperar: respetarlo y añadir algo de jitter
+        retry_after = parse_retry_after(headers)
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after + self.rng.uniform(0, self.base_delay)
+
+        # Jitter decorrelacionado: aleatorio entre la base y el techo exponencial
+        previous = previous_delay if previous_delay is not None else self.base_delay
+        upper = max(self.base_delay, previous * self.backoff_factor)
+        return min(self.max_delay, self.rng.uniform(self.base_delay, upper))
+
+
+def describe_retry(status_code: Optional[int], error: Optional[BaseException] = None) -> str:
+    """
+    Etiqueta corta del motivo de un reintento para las métricas.
+
+    Args:
+        status_code: Status HTTP (None si fue un error de red)
+        error: Excepción de transporte, si la hubo
+
+    Returns:
+        "429", "503", "timeout", "connection", ...
+    """
+    if status_code is not None:
+        return str(status_code)
+    if error is not None and "timeout" in type(error).__name__.lower():
+        return "timeout"
+    return "connection"
+
+
+def log_retry(method: str, url: str, reason: str, attempt: int, delay: float) -> None:
+    """Registra en el log un reintento programado."""
+    logger.warning(
+        "Reintentando %s %s (motivo=%s, intento=%d) en %.2fs",
+        method, url, reason, attempt, delay
+    )
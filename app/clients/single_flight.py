@@ -0,0 +1,284 @@
+"""
+Coalescencia de peticiones GET idénticas en vuelo ("single flight").
+
+Cuando varias peticiones iguales (mismo tenant, endpoint y parámetros)
+coinciden en el tiempo, solo la primera llega a Jira; las demás esperan y
+reciben su resultado (o su error). Cada llamador recibe su propia copia del
+resultado, porque el código de las rutas suele mutar las respuestas.
+
+SingleFlight sirve al cliente síncrono (hilos) y AsyncSingleFlight al
+asíncrono (corrutinas); ambos comparten los contadores de
+``single_flight_stats``.
+
+La petición compartida corre en su propio hilo (SingleFlight) o tarea
+(AsyncSingleFlight) con el deadline más lejano de quienes la esperan, no
+con el de quien la inició: cada llamador espera solo hasta su propio
+deadline, y que uno se desconecte (cancelación) o agote su presupuesto no
+hace fallar a los demás. En AsyncSingleFlight la tarea se cancela cuando ya
+no queda nadie esperándola.
+"""
+
+import asyncio
+import contextvars
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.clients.deadline import (
+    SharedDeadline,
+    current as current_deadline,
+    remaining as deadline_remaining,
+    shared_deadline,
+)
+
+
+class SingleFlightStats:
+    """Contadores de coalescencia compartidos por todo el proceso."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.upstream = 0
+        self.coalesced = 0
+
+    def record(self, leader: bool) -> None:
+        """Registra una llamada; leader=True si fue la que llegó a Jira."""
+        with self._lock:
+            self.calls += 1
+            if leader:
+                self.upstream += 1
+            else:
+                self.coalesced += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna una copia de los contadores.
+
+        Returns:
+            Diccionario con calls, upstream, coalesced (llamadas ahorradas)
+            y saved_ratio
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "upstream": self.upstream,
+                "coalesced": self.coalesced,
+                "saved_ratio": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+            }
+
+    def reset(self) -> None:
+        """Reinicia todos los contadores."""
+        with self._lock:
+            self.calls = 0
+            self.upstream = 0
+            self.coalesced = 0
+
+
+# Contadores globales del proceso
+single_flight_stats = SingleFlightStats()
+
+
+def request_key(
+    tenant: str,
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None
+) -> Tuple[Hashable, ...]:
+    """
+    Clave que identifica peticiones equivalentes.
+
+    Args:
+        tenant: Identificador del sitio y las credenciales
+        method: Método HTTP
+        endpoint: Endpoint de la API
+        params: Parámetros query string (el orden no importa)
+
+    Returns:
+        Tupla hashable
+    """
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return tenant, method.upper(), endpoint, items
+
+
+class _Call:
+    """Petición en vuelo, su resultado y cuántos llamadores se unieron."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.deadline = SharedDeadline()
+        self.joined = 0
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalescencia para llamadas síncronas (thread-safe)."""
+
+    def __init__(self, stats: SingleFlightStats = single_flight_stats):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.stats = stats
+
+    def _run(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> None:
+        try:
+            # Cada llamador acota su propia espera; la llamada compartida dura
+            # lo que el deadline más lejano de quienes la esperan
+            with shared_deadline(call.deadline):
+                call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        timeout_error: Optional[Callable[[], BaseException]] = None
+    ) -> Any:
+        """
+        Ejecuta fn, o espera el resultado de una llamada idéntica en vuelo.
+
+        La llamada compartida corre en un hilo propio (con una copia del
+        contexto de quien la inició) bajo el deadline más lejano de sus
+        llamadores; si todos se van, termina igual pero nadie recibe el
+        resultado.
+
+        Args:
+            key: Clave de la petición (ver request_key())
+            fn: Función que hace la petición real
+            timeout_error: Crea el error a lanzar si vence el deadline del
+                llamador antes de que llegue el resultado (default:
+                TimeoutError)
+
+        Returns:
+            Resultado de fn (una copia si hubo llamadas compartidas)
+
+        Raises:
+            La excepción lanzada por fn, o timeout_error() si vence el
+            deadline del llamador
+        """
+        left = deadline_remaining()
+        if left is not None and left <= 0:
+            # Sin presupuesto no vale la pena iniciar ni esperar una llamada
+            raise timeout_error() if timeout_error is not None else TimeoutError()
+
+        with self._lock:
+            existing = self._calls.get(key)
+            leader = existing is None
+            call = existing if existing is not None else _Call()
+            if leader:
+                self._calls[key] = call
+            call.joined += 1
+            call.deadline.join(current_deadline())
+        self.stats.record(leader)
+
+        if leader:
+            context = contextvars.copy_context()
+            threading.Thread(
+                target=context.run,
+                args=(self._run, key, call, fn),
+                name="single-flight",
+                daemon=True
+            ).start()
+
+        if not call.done.wait(left):
+            raise timeout_error() if timeout_error is not None else TimeoutError()
+        if call.error is not None:
+            raise call.error
+
+        # Con varios llamadores, nadie recibe el original: otro podría mutarlo
+        return copy.deepcopy(call.result) if call.joined > 1 else call.result
+
+
+class _AsyncCall:
+    """Tarea compartida en vuelo y cuántos llamadores la esperan."""
+
+    # Se asigna al crear la tarea, justo después de crear la llamada
+    task: "asyncio.Task[Any]"
+
+    def __init__(self):
+        self.deadline = SharedDeadline()
+        self.waiters = 0
+        self.joined = 0
+
+
+class AsyncSingleFlight:
+    """Coalescencia para corrutinas (un dict de tareas por event loop)."""
+
+    def __init__(self, stats: SingleFlightStats = single_flight_stats):
+        self._calls: Dict[Hashable, _AsyncCall] = {}
+        self.stats = stats
+
+    def _forget(self, key: Hashable, call: _AsyncCall) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    async def _run(self, key: Hashable, call: _AsyncCall, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            # Cada llamador acota su propia espera; la llamada compartida dura
+            # lo que el deadline más lejano de quienes la esperan
+            with shared_deadline(call.deadline):
+                return await fn()
+        finally:
+            self._forget(key, call)
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        timeout_error: Optional[Callable[[], BaseException]] = None
+    ) -> Any:
+        """
+        Ejecuta fn, o espera el resultado de una llamada idéntica en vuelo.
+
+        Args:
+            key: Clave de la petición (ver request_key())
+            fn: Corrutina que hace la petición real
+            timeout_error: Crea el error a lanzar si vence el deadline del
+                llamador antes de que llegue el resultado (default:
+                asyncio.TimeoutError)
+
+        Returns:
+            Resultado de fn (una copia si hubo llamadas compartidas)
+
+        Raises:
+            La excepción lanzada por fn, o timeout_error() si vence el
+            deadline del llamador
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+
+        existing = self._calls.get(key)
+        leader = existing is None
+        self.stats.record(leader)
+        call = existing if existing is not None else _AsyncCall()
+        call.deadline.join(current_deadline())
+        if leader:
+            self._calls[key] = call
+            call.task = loop.create_task(self._run(key, call, fn))
+        call.waiters += 1
+        call.joined += 1
+
+        try:
+            # shield: que este llamador se vaya no cancela la llamada compartida
+            result = await asyncio.wait_for(asyncio.shield(call.task), deadline_remaining())
+        except asyncio.TimeoutError:
+            if call.task.done():
+                # El TimeoutError vino de fn, no del deadline de este llamador
+                raise
+            if timeout_error is not None:
+                raise timeout_error() from None
+            raise
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Nadie espera ya el resultado
+                call.task.cancel()
+                self._forget(key, call)
+
+        # Con varios llamadores, nadie recibe el original: otro podría mutarlo
+        return copy.deepcopy(result) if call.joined > 1 else result
@@ -0,0 +1,147 @@
+"""
+Bytes transferidos y latencia por endpoint de Jira.
+
+Sirve para decidir si compensa comprimir: para cada endpoint (como plantilla,
+ej: ``GET /issue/{key}``) acumula los bytes de los bodies antes y después de
+comprimir en ambos sentidos, y la latencia separada según la petición se
+haya enviado comprimida o no. Es un hook de instrumentación: recibe los
+RequestEvent de los clientes (ver instrumentation.py) y está registrado por
+defecto.
+"""
+
+import re
+import threading
+from typing import Any, Dict, Optional
+
+# Segmentos de ruta que son identificadores y no forman parte del endpoint
+_ISSUE_KEY = re.compile(r"^[A-Za-z][A-Za-z0-9_]*-\d+$")
+_NUMERIC_ID = re.compile(r"^\d+$")
+_PROJECT_KEY = re.compile(r"^[A-Z][A-Z0-9_]+$")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Convierte un endpoint concreto en su plantilla.
+
+    Args:
+        endpoint: Endpoint de la API, con o sin query string (ej: /issue/KAN-12)
+
+    Returns:
+        Plantilla con los identificadores reemplazados (ej: /issue/{key})
+
+    Example:
+        >>> endpoint_template("/project/KAN/statuses")
+        "/project/{key}/statuses"
+        >>> endpoint_template("/issue/10023/transitions")
+        "/issue/{id}/transitions"
+    """
+    path = endpoint.split("?", 1)[0]
+    segments = []
+    for segment in path.split("/"):
+        if _ISSUE_KEY.match(segment) or _PROJECT_KEY.match(segment):
+            segments.append("{key}")
+        elif _NUMERIC_ID.match(segment):
+            segments.append("{id}")
+        else:
+            segments.append(segment)
+    return "/".join(segments)
+
+
+class TransferStats:
+    """Hook thread-safe que acumula bytes y latencias por endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, event: Any) -> None:
+        """
+        Hook de instrumentación: acumula una llamada terminada.
+
+        Solo cuenta las llamadas que obtuvieron respuesta; la latencia es la
+        de la llamada completa, con sus reintentos.
+
+        Args:
+            event: RequestEvent de la llamada (ver instrumentation.py)
+        """
+        if event.status_code is None:
+            return
+
+        request_wire_bytes = _wire(event.request_wire_bytes, event.request_bytes)
+        response_wire_bytes = _wire(event.response_wire_bytes, event.response_bytes)
+        compressed = request_wire_bytes < event.request_bytes
+        with self._lock:
+            stats = self._endpoints.get(event.key)
+            if stats is None:
+                stats = {
+                    "calls": 0,
+                    "request_bytes": 0,
+                    "request_wire_bytes": 0,
+                    "response_bytes": 0,
+                    "response_wire_bytes": 0,
+                    "compressed_calls": 0,
+                    "compressed_seconds": 0.0,
+                    "plain_seconds": 0.0,
+                }
+                self._endpoints[event.key] = stats
+
+            stats["calls"] += 1
+            stats["request_bytes"] += event.request_bytes
+            stats["request_wire_bytes"] += request_wire_bytes
+            stats["response_bytes"] += event.response_bytes
+            stats["response_wire_bytes"] += response_wire_bytes
+            if compressed:
+                stats["compressed_calls"] += 1
+                stats["compressed_seconds"] += event.duration
+            else:
+                stats["plain_seconds"] += event.duration
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Resumen por endpoint.
+
+        Returns:
+            Diccionario {"METHOD /plantilla": {...}} con bytes totales,
+            ratios de compresión (wire / original) y latencia media en ms
+            de las peticiones comprimidas y sin comprimir
+        """
+        with self._lock:
+            endpoints = {key: dict(stats) for key, stats in self._endpoints.items()}
+
+        summary = {}
+        for key, stats in endpoints.items():
+            plain_calls = stats["calls"] - stats["compressed_calls"]
+            summary[key] = {
+                "calls": stats["calls"],
+                "request_bytes": stats["request_bytes"],
+                "request_wire_bytes": stats["request_wire_bytes"],
+                "request_ratio": _ratio(stats["request_wire_bytes"], stats["request_bytes"]),
+                "response_bytes": stats["response_bytes"],
+                "response_wire_bytes": stats["response_wire_bytes"],
+                "response_ratio": _ratio(stats["response_wire_bytes"], stats["response_bytes"]),
+                "compressed_calls": stats["compressed_calls"],
+                "compressed_mean_ms": _mean_ms(stats["compressed_seconds"], stats["compressed_calls"]),
+                "plain_mean_ms": _mean_ms(stats["plain_seconds"], plain_calls),
+            }
+        return summary
+
+    def reset(self) -> None:
+        """Reinicia todos los contadores."""
+        with self._lock:
+            self._endpoints = {}
+
+
+def _wire(wire: Optional[int], original: int) -> int:
+    return original if wire is None else wire
+
+
+def _ratio(wire: int, original: int) -> float:
+    return round(wire / original, 4) if original else 1.0
+
+
+def _mean_ms(seconds: float, calls: int) -> float:
+    return round(seconds / calls * 1000, 3) if calls else 0.0
+
+
+# Contadores globales del proceso
+transfer_stats = TransferStats()
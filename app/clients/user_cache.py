@@ -0,0 +1,302 @@
+"""
+Caché de nombre de usuario → accountId de Jira.
+
+Cada tarea con assignee busca el nombre en /user/search, y un batch repite
+la búsqueda por cada item, aunque el equipo sea el mismo puñado de
+personas. La caché guarda el resultado por (proyecto, nombre normalizado)
+en un AccountIdCache por sitio, compartido por todos los clientes del
+proceso.
+
+- Los aciertos viven ``ttl`` segundos; los nombres no encontrados también se
+  cachean (caché negativa) pero por ``negative_ttl``, más corto, para que un
+  usuario recién invitado aparezca pronto.
+- El tamaño está acotado (LRU).
+- Los errores de Jira no se cachean.
+- Si hay caché compartida (cache_backend), un nombre que no está en la
+  memoria del worker se busca ahí antes de ir a Jira, y cada resultado se
+  publica para los demás workers. Desde código async se usan ``aget`` y
+  ``aput``, que no bloquean el event loop esperando a Redis.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# MISS: marca de "no está en caché" (None es un resultado válido: no encontrado)
+from app.clients.cache_backend import MISS, CacheNamespace, cache_namespace
+from app.clients.client_registry import site_id
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normaliza un nombre para usarlo como clave.
+
+    Args:
+        name: Nombre tal como viene del parser (ej: " María  José ")
+
+    Returns:
+        Nombre sin espacios sobrantes y en minúsculas (ej: "maría josé")
+    """
+    return " ".join(name.split()).casefold()
+
+
+class AccountIdCache:
+    """Caché LRU/TTL thread-safe de accountIds, con caché negativa."""
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: float = 3600,
+        negative_ttl: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+        shared: Optional[CacheNamespace] = None
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_size: Máximo de nombres retenidos
+            ttl: Segundos que vale un accountId encontrado
+            negative_ttl: Segundos que vale un "no encontrado" (0 = no cachear)
+            clock: Reloj monotónico (inyectable en tests)
+            shared: Caché compartida entre workers (opcional)
+        """
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor que 0")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self.shared = shared
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Métricas
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(name: str, project_key: Optional[str] = None) -> Tuple[str, str]:
+        """Clave de caché para un nombre dentro de un proyecto."""
+        return (project_key or "").upper(), normalize_name(name)
+
+    @staticmethod
+    def _shared_key(key: Tuple[str, str]) -> str:
+        return f"{key[0]}:{key[1]}"
+
+    def _store(self, key: Tuple[str, str], account_id: Optional[str], ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (account_id, self._clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _get_local(self, key: Tuple[str, str]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                return MISS
+            account_id = entry[0]
+            self._entries.move_to_end(key)
+            if account_id is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return account_id
+
+    def _from_shared(self, key: Tuple[str, str], account_id: Any) -> Any:
+        if account_id is MISS:
+            with self._lock:
+                self.misses += 1
+            return MISS
+        ttl = self.ttl if account_id is not None else self.negative_ttl
+        if ttl > 0:
+            self._store(key, account_id, ttl)
+        with self._lock:
+            self.shared_hits += 1
+        return account_id
+
+    def get(self, name: str, project_key: Optional[str] = None) -> Any:
+        """
+        Busca un nombre en la caché.
+
+        Args:
+            name: Nombre del usuario
+            project_key: Proyecto de la búsqueda (opcional)
+
+        Returns:
+            accountId, None si se cacheó como no encontrado, o MISS
+        """
+        key = self.key(name, project_key)
+        account_id = self._get_local(key)
+        if account_id is not MISS:
+            return account_id
+
+        # Otro worker pudo haberlo resuelto ya (fuera del lock: es I/O)
+        shared = MISS if self.shared is None else self.shared.get(self._shared_key(key))
+        return self._from_shared(key, shared)
+
+    async def aget(self, name: str, project_key: Optional[str] = None) -> Any:
+        """
+        Versión async de get: la consulta a la caché compartida no bloquea
+        el event loop.
+
+        Args:
+            name: Nombre del usuario
+            project_key: Proyecto de la búsqueda (opcional)
+
+        Returns:
+            accountId, None si se cacheó como no encontrado, o MISS
+        """
+        key = self.key(name, project_key)
+        account_id = self._get_local(key)
+        if account_id is not MISS:
+            return account_id
+
+        shared = MISS if self.shared is None else await self.shared.aget(self._shared_key(key))
+        return self._from_shared(key, shared)
+
+    def _put_local(
+        self, name: str, project_key: Optional[str], account_id: Optional[str]
+    ) -> Optional[Tuple[Tuple[str, str], float]]:
+        ttl = self.ttl if account_id is not None else self.negative_ttl
+        if ttl <= 0:
+            return None
+        key = self.key(name, project_key)
+        self._store(key, account_id, ttl)
+        return key, ttl
+
+    def put(self, name: str, project_key: Optional[str], account_id: Optional[str]) -> None:
+        """
+        Guarda el resultado de una búsqueda.
+
+        Args:
+            name: Nombre buscado
+            project_key: Proyecto de la búsqueda (opcional)
+            account_id: accountId encontrado, o None si no hubo resultados
+        """
+        stored = self._put_local(name, project_key, account_id)
+        if stored is not None and self.shared is not None:
+            key, ttl = stored
+            self.shared.set(self._shared_key(key), account_id, ttl)
+
+    async def aput(self, name: str, project_key: Optional[str], account_id: Optional[str]) -> None:
+        """
+        Versión async de put: la publicación en la caché compartida no
+        bloquea el event loop.
+
+        Args:
+            name: Nombre buscado
+            project_key: Proyecto de la búsqueda (opcional)
+            account_id: accountId encontrado, o None si no hubo resultados
+        """
+        stored = self._put_local(name, project_key, account_id)
+        if stored is not None and self.shared is not None:
+            key, ttl = stored
+            await self.shared.aset(self._shared_key(key), account_id, ttl)
+
+    def invalidate(self, name: Optional[str] = None, project_key: Optional[str] = None) -> None:
+        """
+        Descarta un nombre, o toda la caché si no se indica.
+
+        Args:
+            name: Nombre a descartar (None = todos)
+            project_key: Proyecto del nombre
+        """
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self.key(name, project_key), None)
+
+        if self.shared is not None:
+            if name is None:
+                self.shared.clear()
+            else:
+                self.shared.delete(self._shared_key(self.key(name, project_key)))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna el tamaño y los contadores de la caché.
+
+        Returns:
+            Diccionario con size, hits, negative_hits, misses, shared_hits
+            (encontrados en la caché compartida), expirations, evictions y
+            hit_ratio (aciertos locales y compartidos)
+        """
+        with self._lock:
+            found = self.hits + self.negative_hits + self.shared_hits
+            lookups = found + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "shared_hits": self.shared_hits,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "hit_ratio": round(found / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Una caché por sitio de Jira, compartida por todo el proceso
+_caches: Dict[str, AccountIdCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_account_id_cache(
+    base_url: str,
+    max_size: int = 1000,
+    ttl: float = 3600,
+    negative_ttl: float = 300
+) -> AccountIdCache:
+    """
+    Obtiene (o crea) la caché de accountIds de un sitio de Jira.
+
+    Args:
+        base_url: URL base del sitio (clave de la caché)
+        max_size: Tamaño máximo si la caché no existe
+        ttl: TTL de aciertos si la caché no existe
+        negative_ttl: TTL de "no encontrado" si la caché no existe
+
+    Returns:
+        AccountIdCache compartida para ese base_url
+    """
+    key = base_url.rstrip("/").lower()
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = AccountIdCache(
+                max_size, ttl, negative_ttl,
+                shared=cache_namespace(f"jira:account_id:{key}", ttl)
+            )
+            _caches[key] = cache
+        return cache
+
+
+def account_id_cache_snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Estado de todas las cachés del proceso, por sitio.
+
+    Returns:
+        Diccionario {site_id: snapshot} (id opaco, ver site_id)
+    """
+    with _caches_lock:
+        caches = dict(_caches)
+    return {site_id(key): cache.snapshot() for key, cache in caches.items()}
@@ -2,7 +2,7 @@
 Application configuration using Pydantic Settings.
 """
 
-from typing import List, Union
+from typing import List, Optional, Union
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -44,11 +44,31 @@ class Settings(BaseSettings):
     JIRA_API_TOKEN: str = Field(default="", description="Jira API token")
     JIRA_DEFAULT_PROJECT: str = Field(default="PROJ")
 
+    # Jira HTTP transport
+    JIRA_TIMEOUT: float = Field(default=30, description="Default read timeout for Jira requests in seconds")
+    JIRA_CONNECT_TIMEOUT: float = Field(default=5, description="Jira connect timeout in seconds")
+    JIRA_JSON_CODEC: str = Field(default="auto", description="JSON codec for Jira bodies: auto, orjson or json")
+    JIRA_COMPRESS_REQUESTS: bool = Field(default=False, description="Gzip Jira request bodies above JIRA_COMPRESS_MIN_BYTES")
+    JIRA_COMPRESS_MIN_BYTES: int = Field(default=1024, description="Minimum body size in bytes to gzip a Jira request")
+    JIRA_CASSETTE_MODE: str = Field(default="off", description="Record or replay Jira traffic: off, record or replay")
+    JIRA_CASSETTE: Optional[str] = Field(default=None, description="Cassette file (JSONL) for JIRA_CASSETTE_MODE")
+    JIRA_CASSETTE_SPEED: float = Field(default=1.0, description="Replay timing scale (1 = recorded timing, 0 = no waits)")
+    JIRA_USER_CACHE_TTL: float = Field(default=3600, description="Seconds an assignee name → accountId lookup is cached (0 disables)")
+    JIRA_USER_CACHE_NEGATIVE_TTL: float = Field(default=300, description="Seconds a name with no Jira user is cached (0 disables)")
+    JIRA_USER_CACHE_SIZE: int = Field(default=1000, description="Maximum cached names per Jira site")
+    JIRA_CREATE_META_TTL: float = Field(default=0, description="Seconds createmeta is cached to validate issue payloads locally (0 disables, 3600 recommended)")
+    JIRA_POOL_CONNECTIONS: int = Field(default=10, description="Number of per-host connection pools to cache")
+    JIRA_POOL_MAXSIZE: int = Field(default=10, description="Maximum open connections per Jira host")
+    JIRA_POOL_BLOCK: bool = Field(default=False, description="Wait for a free connection instead of exceeding the pool size")
+    JIRA_KEEP_ALIVE: bool = Field(default=True, description="Reuse TCP/TLS connections between Jira requests")
+
     # Authentication & Security
     SECRET_KEY: str = Field(..., description="Secret key for general encryption")
     JWT_SECRET_KEY: str = Field(..., description="Secret key for JWT tokens")
     JWT_ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
     JWT_EXPIRATION_MINUTES: int = Field(default=10080, description="JWT expiration in minutes (default 7 days)")
+    AUTH_PRINCIPAL_CACHE_TTL: float = Field(default=30, description="Seconds a verified token skips the JWT decode and user lookup (0 disables)")
+    AUTH_PRINCIPAL_CACHE_SIZE: int = Field(default=10000, description="Maximum cached tokens per worker")
 
     # Database
     DATABASE_URL: str = Field(default="sqlite:///./jira_agent.db", description="Database connection URL")
@@ -71,17 +91,72 @@ class Settings(BaseSettings):
     LLM_TEMPERATURE: float = Field(default=0.3)
     LLM_MAX_TOKENS: int = Field(default=500)
 
-    # Cache
-    REDIS_URL: str = Field(default="redis://localhost:6379/0")
-    CACHE_TTL: int = Field(default=3600)
-    CACHE_ENABLED: bool = Field(default=False)
+    # Shared cache tier for every worker (Redis, or memory:// for a single process)
+    REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Shared cache URL: redis://, rediss://, unix:// or memory://")
+    CACHE_TTL: int = Field(default=3600, description="Default seconds a shared cache value is kept")
+    CACHE_ENABLED: bool = Field(default=False, description="Share cached lookups between workers through REDIS_URL")
+    CACHE_KEY_PREFIX: str = Field(default="jira_agent:", description="Prefix of every shared cache key")
+    CACHE_SOCKET_TIMEOUT: float = Field(default=0.25, description="Seconds a shared cache command may take before it counts as a miss")
+
+    # Memoized TaskParser results (preview → create and batch reparses)
+    PARSE_CACHE_MAX_BYTES: int = Field(default=8 * 1024 * 1024, description="Approximate memory budget of cached parse results (0 disables)")
+    PARSE_CACHE_SHARED_TTL: int = Field(default=86400, description="Seconds a parse result is kept in the shared cache")
 
     # Rate Limiting
-    RATE_LIMIT_PER_MINUTE: int = Field(default=60)
+    RATE_LIMIT_PER_MINUTE: int = Field(default=60, description="Initial client-side Jira request rate per site (0 disables)")
+    JIRA_RATE_LIMIT_BURST: int = Field(default=0, description="Jira rate limiter bucket size (0 = 10% of the rate)")
+    JIRA_COALESCE_GETS: bool = Field(default=True, description="Share one upstream call between identical concurrent GETs")
+
+    # Deadlines for incoming requests (whole request budget shared by every Jira call)
+    REQUEST_DEADLINE_SECONDS: float = Field(default=60, description="Time budget for a single API request that calls Jira")
+    WORKFLOW_DEADLINE_SECONDS: float = Field(default=30, description="Time budget for one Instagram workflow inside a batch")
+    BATCH_DEADLINE_SECONDS: float = Field(default=300, description="Time budget for a whole /tasks/batch request")
+    HEALTH_DEADLINE_SECONDS: float = Field(default=5, description="Time budget for each background dependency check")
+
+    # Dependency checks refreshed in the background (probes read the last result)
+    HEALTH_CHECK_INTERVAL: float = Field(default=15, description="Seconds between background dependency checks")
+    HEALTH_STALE_AFTER: float = Field(default=0, description="Age after which a check result is stale (0 = 3 intervals plus the deadline)")
+
+    # Circuit breaker per Jira site
+    JIRA_CIRCUIT_FAILURE_THRESHOLD: int = Field(default=5, description="Consecutive site failures that open the circuit (0 disables)")
+    JIRA_CIRCUIT_RECOVERY_TIMEOUT: float = Field(default=30, description="Seconds the circuit stays open before probing")
+    JIRA_CIRCUIT_HALF_OPEN_MAX_CALLS: int = Field(default=1, description="Concurrent probe requests while half-open")
+
+    # Per-user Jira client registry
+    JIRA_CLIENT_CACHE_SIZE: int = Field(default=100, description="Maximum Jira clients kept alive across requests")
+    JIRA_CLIENT_IDLE_TTL: int = Field(default=900, description="Seconds an unused Jira client is kept before closing it")
+
+    # Outbox for Jira writes accepted with "Prefer: respond-async"
+    OUTBOX_ENABLED: bool = Field(default=True, description="Accept Jira writes asynchronously and send them in the background")
+    OUTBOX_POLL_INTERVAL: float = Field(default=2, description="Seconds between outbox polls when idle")
+    OUTBOX_BATCH_SIZE: int = Field(default=50, description="Outbox entries sent per drain")
+    OUTBOX_MAX_ATTEMPTS: int = Field(default=8, description="Attempts before an outbox entry is marked failed")
+    OUTBOX_RETRY_BASE_DELAY: float = Field(default=5, description="Seconds before the first outbox retry (doubles per attempt)")
+    OUTBOX_RETRY_MAX_DELAY: float = Field(default=300, description="Maximum seconds between outbox retries")
+    OUTBOX_LEASE_SECONDS: float = Field(default=300, description="Seconds before an in-flight outbox entry is considered abandoned")
+
+    # Idempotency-Key support on create endpoints
+    IDEMPOTENCY_ENABLED: bool = Field(default=True, description="Honour the Idempotency-Key header on create endpoints")
+    IDEMPOTENCY_TTL_SECONDS: int = Field(default=86400, description="Seconds a stored idempotent response is replayed")
+    IDEMPOTENCY_LOCK_SECONDS: float = Field(default=120, description="Seconds before an unfinished idempotent request can be taken over")
+    IDEMPOTENCY_WAIT_SECONDS: float = Field(default=60, description="Maximum seconds a concurrent duplicate waits for the original")
+    IDEMPOTENCY_PURGE_INTERVAL: float = Field(default=3600, description="Seconds between background purges of expired idempotency keys")
+
+    # Stale-while-revalidate cache for /api/v1/projects
+    PROJECT_CACHE_SOFT_TTL: float = Field(default=60, description="Seconds a cached project list is served without refreshing it")
+    PROJECT_CACHE_HARD_TTL: float = Field(default=3600, description="Seconds after which a cached project list is no longer served (0 disables)")
+    PROJECT_CACHE_REFRESH_TIMEOUT: float = Field(default=30, description="Deadline in seconds for a background project list refresh")
+
+    # Local directory of assignable users for assignee resolution
+    USER_DIRECTORY_ENABLED: bool = Field(default=True, description="Resolve assignee names against a local per-project user directory")
+    USER_DIRECTORY_REFRESH_SECONDS: float = Field(default=900, description="Seconds before a project's user directory is synced again")
+    USER_DIRECTORY_MAX_DISTANCE: int = Field(default=2, description="Maximum edit distance for fuzzy name matches (0 disables)")
 
     # Retry Configuration
     MAX_RETRIES: int = Field(default=3)
-    RETRY_BACKOFF_FACTOR: int = Field(default=2)
+    RETRY_BACKOFF_FACTOR: float = Field(default=2)
+    RETRY_BASE_DELAY: float = Field(default=0.5, description="Minimum wait in seconds between Jira retries")
+    RETRY_MAX_DELAY: float = Field(default=30, description="Maximum wait in seconds between Jira retries")
 
 
 # Global settings instance
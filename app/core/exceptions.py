@@ -45,3 +45,13 @@ class AuthenticationException(BaseAppException):
 class ResourceNotFoundException(BaseAppException):
     """Exception raised when a resource is not found."""
     pass
+
+
+class IdempotencyKeyMismatchException(BaseAppException):
+    """Exception raised when an Idempotency-Key is reused with a different request."""
+    pass
+
+
+class IdempotencyInProgressException(BaseAppException):
+    """Exception raised when the original request for an Idempotency-Key is still running."""
+    pass
@@ -4,21 +4,56 @@ FastAPI application entry point.
 Implementa endpoints para crear issues de Jira desde texto en lenguaje natural.
 """
 
-from fastapi import FastAPI, HTTPException, status, Depends
+from fastapi import FastAPI, HTTPException, status, Depends, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
 from typing import Optional, List
 from dotenv import load_dotenv
 
 # Cargar variables de entorno desde .env
 load_dotenv()
 
-from app.parsers.task_parser import create_parser, ParsedTask
-from app.clients.jira_client import JiraAPIError, JiraClient
-from app.api.routes import instagram, batch_tasks, projects, auth, subtasks
-from app.api.dependencies import get_jira_client, get_user_jira_client, get_current_user
-from app.models.user import User
+from app.parsers.task_parser import create_parser
+from app.clients.jira_client import JiraAPIError
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.retry import retry_stats
+from app.clients.rate_limiter import rate_limiter_snapshot
+from app.clients.circuit_breaker import circuit_breaker_snapshot
+from app.clients.single_flight import single_flight_stats
+from app.clients.user_cache import account_id_cache_snapshot
+from app.clients.cache_backend import cache_snapshot, configure_cache
+from app.parsers.parse_cache import get_parse_cache
+from app.clients.create_meta import create_meta_cache_snapshot
+from app.clients.instrumentation import request_counter, request_latency, transfer_stats
+from app.api.routes import instagram, batch_tasks, projects, auth, subtasks, outbox
+from app.api.routes.outbox import OutboxAcceptedResponse, accepted_response
+from app.api.dependencies import (
+    get_user_async_jira_client,
+    get_current_user,
+    get_current_active_superuser,
+    lease_user_async_jira_client,
+    jira_tenant_key,
+    project_cache,
+    request_deadline,
+    instrument_request,
+    prefers_async,
+    outbox_worker,
+    idempotency_guard,
+    idempotency_store,
+    IdempotencyContext,
+    user_directory,
+    principal_cache,
+    jira_client_registry,
+    async_jira_client_registry,
+    health_monitor,
+)
+from app.models.outbox import OUTBOX_ISSUE
+from app.services.principal_cache import Principal
+from app.services.outbox_service import enqueue_jira_write
+from app.services.user_directory import resolve_assignee
 from app.core.config import settings
+from app.core.database import get_db
 
 
 # ============================================================================
@@ -117,6 +152,7 @@ app.include_router(subtasks.router, prefix="/api/v1")
 app.include_router(instagram.router, prefix="/api/v1/content")
 app.include_router(batch_tasks.router, prefix="/api/v1/tasks")
 app.include_router(projects.router, prefix="/api/v1")
+app.include_router(outbox.router, prefix="/api/v1")
 
 
 # ============================================================================
@@ -127,6 +163,7 @@ def get_parser():
     """Obtiene instancia del parser."""
     # Por ahora usa el parser basado en reglas
     # En el futuro se puede cambiar a LLM con: create_parser(use_llm=True, ...)
+    # El parser basado en reglas reutiliza los resultados de /tasks/parse en /tasks/create
     return create_parser(use_llm=False)
 
 
@@ -144,6 +181,9 @@ async def root():
         "authentication": "enabled",
         "endpoints": {
             "health": "/api/v1/health",
+            "liveness": "/api/v1/health/live",
+            "readiness": "/api/v1/health/ready",
+            "health_details": "/api/v1/health/details",
             "auth": {
                 "register": "/api/v1/auth/register",
                 "login": "/api/v1/auth/login",
@@ -155,60 +195,156 @@ async def root():
             "create_task": "/api/v1/tasks/create",
             "parse_preview": "/api/v1/tasks/parse",
             "create_batch_tasks": "/api/v1/tasks/batch",
-            "create_instagram_content": "/api/v1/content/instagram"
+            "create_instagram_content": "/api/v1/content/instagram",
+            "outbox_status": "/api/v1/outbox/{outbox_id}"
         },
         "docs": "/docs"
     }
 
 
+@app.get("/api/v1/health/live")
+async def liveness_check():
+    """
+    Liveness probe.
+
+    Responde mientras el proceso y su event loop estén vivos; no consulta
+    ninguna dependencia, así un Jira o una base de datos lentos no hacen
+    reiniciar el contenedor.
+    """
+    return health_monitor.liveness()
+
+
+@app.get("/api/v1/health/ready")
+async def readiness_check(response: Response):
+    """
+    Readiness probe.
+
+    Responde con el último resultado de los chequeos de fondo (base de
+    datos, Jira, caché compartida), con su latencia y antigüedad. Retorna
+    503 si una dependencia crítica está caída o su resultado está viejo.
+    """
+    ready, result = health_monitor.readiness()
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
+
+
+# Estado público según readiness → campo "status" de /api/v1/health
+_HEALTH_STATUS = {"ready": "healthy", "degraded": "degraded", "not_ready": "unhealthy"}
+
+
 @app.get("/api/v1/health")
-async def health_check():
+async def health_check(response: Response):
     """
     Health check endpoint.
 
-    Verifica que la API está funcionando.
+    Verifica que la API está funcionando. El estado de las dependencias sale
+    de los chequeos de fondo (ver /api/v1/health/ready), no de llamadas
+    hechas durante el request. Retorna 503 si la base de datos falló en el
+    último chequeo o su resultado está viejo.
     """
-    try:
-        # Verificar si hay credenciales de Jira configuradas globalmente
-        jira_configured = bool(settings.JIRA_BASE_URL and settings.JIRA_EMAIL and settings.JIRA_API_TOKEN)
-
-        response = {
-            "status": "healthy",
-            "parser": "rule-based",
-            "database": "connected" if settings.DATABASE_URL else "not configured"
-        }
-
-        if jira_configured:
-            try:
-                jira_client = get_jira_client()
-                user = jira_client.get_current_user()
-                response["jira_connection"] = "ok"
-                response["jira_user"] = user.get("displayName", "unknown")
-            except Exception as e:
-                response["jira_connection"] = "error"
-                response["jira_error"] = str(e)
-        else:
-            response["jira_connection"] = "not configured (per-user credentials)"
+    ready, readiness = health_monitor.readiness()
+    checks = readiness["checks"]
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    database = checks["database"]["status"]
+    body = {
+        "status": _HEALTH_STATUS[readiness["status"]],
+        "parser": "rule-based",
+        "database": "connected" if database == "ok" else database,
+    }
+
+    jira = checks.get("jira")
+    if jira is None:
+        body["jira_connection"] = "not configured (per-user credentials)"
+    elif jira["status"] == "ok":
+        body["jira_connection"] = "ok"
+        body["jira_user"] = jira["detail"]["user"]
+    elif jira["status"] == "error":
+        body["jira_connection"] = "error"
+        body["jira_error"] = jira["error"]
+    else:
+        body["jira_connection"] = "pending"
+
+    body["checks"] = checks
+    return body
 
-        return response
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Error al verificar salud del servicio: {str(e)}"
-        )
 
+@app.get("/api/v1/health/details")
+async def health_details(current_user: Principal = Depends(get_current_active_superuser)):
+    """
+    Métricas internas de clientes, cachés y workers.
+
+    Solo para administradores: incluye datos por sitio de Jira de todos los
+    usuarios. Todo sale de contadores en memoria o de los chequeos de fondo;
+    no consulta dependencias durante el request.
+
+    Args:
+        current_user: Superusuario autenticado (inyectado)
 
-@app.get("/api/v1/projects", response_model=ProjectsListResponse)
+    Raises:
+        HTTPException 401: Token inválido o expirado
+        HTTPException 403: El usuario no es administrador
+    """
+    _, readiness = health_monitor.readiness()
+    response = {
+        "status": readiness["status"],
+        "checks": readiness["checks"],
+        "health_monitor": health_monitor.snapshot(),
+    }
+
+    # Cuánto trabajo extra generan los reintentos hacia Jira
+    response["jira_retries"] = retry_stats.snapshot()
+    response["jira_rate_limits"] = rate_limiter_snapshot()
+    response["jira_clients"] = async_jira_client_registry.snapshot()
+    response["jira_coalescing"] = single_flight_stats.snapshot()
+    response["jira_circuits"] = circuit_breaker_snapshot()
+    response["jira_user_cache"] = account_id_cache_snapshot()
+    response["shared_cache"] = cache_snapshot()
+    parse_cache = get_parse_cache()
+    if parse_cache is not None:
+        response["parse_cache"] = parse_cache.snapshot()
+    response["jira_create_meta"] = create_meta_cache_snapshot()
+    response["project_cache"] = project_cache.snapshot()
+    if user_directory is not None:
+        response["user_directory"] = user_directory.snapshot()
+    if principal_cache is not None:
+        response["principal_cache"] = principal_cache.snapshot()
+    response["jira_requests"] = {
+        "latency": request_latency.snapshot(),
+        "counts": request_counter.snapshot(),
+        "transfer": transfer_stats.snapshot(),
+    }
+    if settings.IDEMPOTENCY_ENABLED:
+        response["idempotency"] = idempotency_store.snapshot()
+    return response
+
+
+@app.get(
+    "/api/v1/projects",
+    response_model=ProjectsListResponse,
+    dependencies=[Depends(request_deadline), Depends(instrument_request)]
+)
 async def list_projects(
-    jira_client: JiraClient = Depends(get_user_jira_client)
+    response: Response,
+    refresh: bool = Query(False, description="Ignorar la caché y consultar Jira"),
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Lista todos los proyectos disponibles en Jira del usuario autenticado.
 
     Requiere autenticación con JWT token.
 
+    La lista se cachea por cuenta de Jira (stale-while-revalidate): se
+    responde con la copia en caché y, si pasó PROJECT_CACHE_SOFT_TTL, se
+    refresca en segundo plano. El header X-Cache indica cómo se sirvió
+    (hit, stale, miss o refresh).
+
     Args:
-        jira_client: Cliente de Jira con credenciales del usuario (inyectado)
+        response: Respuesta (para el header X-Cache)
+        refresh: Si es True, consulta Jira aunque haya una copia en caché
+        current_user: Usuario autenticado (inyectado)
 
     Returns:
         ProjectsListResponse con la lista de proyectos disponibles
@@ -218,21 +354,26 @@ async def list_projects(
         HTTPException 400: Usuario sin credenciales de Jira configuradas
         HTTPException 500: Error interno del servidor
     """
-    try:
-
-        # Obtener proyectos
-        projects_data = jira_client._make_request("GET", "/project")
-
-        # Formatear respuesta
-        projects = []
-        for project in projects_data:
-            projects.append(
-                JiraProject(
-                    key=project.get("key", ""),
-                    name=project.get("name", ""),
-                    project_type=project.get("projectTypeKey", "unknown")
+    async def load_projects() -> List[JiraProject]:
+        # Toma su propio cliente: un refresco en segundo plano sobrevive a la petición
+        async with lease_user_async_jira_client(current_user) as jira_client:
+            # Obtener proyectos (/project/search está paginado; /project no)
+            projects = []
+            async for project in jira_client.paginate("/project/search", page_size=100):
+                projects.append(
+                    JiraProject(
+                        key=project.get("key", ""),
+                        name=project.get("name", ""),
+                        project_type=project.get("projectTypeKey", "unknown")
+                    )
                 )
-            )
+            return projects
+
+    try:
+        projects, cache_status = await project_cache.get(
+            jira_tenant_key(current_user), load_projects, refresh=refresh
+        )
+        response.headers["X-Cache"] = cache_status
 
         return ProjectsListResponse(
             success=True,
@@ -273,7 +414,7 @@ async def parse_task_preview(request: CreateTaskRequest):
     try:
         # Parsear texto
         parser = get_parser()
-        result = parser.parse(request.text)
+        result = await parser.aparse(request.text)
 
         return ParsePreviewResponse(
             summary=result.summary,
@@ -297,10 +438,19 @@ async def parse_task_preview(request: CreateTaskRequest):
         )
 
 
-@app.post("/api/v1/tasks/create", response_model=CreateTaskResponse)
+@app.post(
+    "/api/v1/tasks/create",
+    response_model=CreateTaskResponse,
+    responses={202: {"model": OutboxAcceptedResponse}},
+    dependencies=[Depends(request_deadline), Depends(instrument_request)]
+)
 async def create_task_from_text(
     request: CreateTaskRequest,
-    jira_client: JiraClient = Depends(get_user_jira_client)
+    jira_client: AsyncJiraClient = Depends(get_user_async_jira_client),
+    respond_async: bool = Depends(prefers_async),
+    idempotency: IdempotencyContext = Depends(idempotency_guard),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
     Crea un issue de Jira desde texto en lenguaje natural.
@@ -312,36 +462,70 @@ async def create_task_from_text(
     2. Crea el issue en Jira usando las credenciales del usuario autenticado
     3. Retorna el issue key y URL
 
+    Con el header ``Prefer: respond-async`` el issue se guarda en el outbox
+    tras el parseo y se responde 202 con la URL de su estado; el worker lo
+    crea en Jira en segundo plano, junto con otros pendientes en un solo bulk.
+
+    Con el header ``Idempotency-Key`` un reintento recibe la respuesta del
+    primer request en lugar de crear otro issue.
+
     Args:
         request: Objeto con 'text' (descripción natural) y 'project_key' (proyecto Jira)
         jira_client: Cliente de Jira con credenciales del usuario (inyectado)
+        respond_async: Si el cliente pidió procesamiento asíncrono (inyectado)
+        idempotency: Estado del Idempotency-Key del request (inyectado)
+        current_user: Usuario autenticado (inyectado)
+        db: Sesión de base de datos (inyectada)
 
     Returns:
-        CreateTaskResponse con el issue_key, issue_url y datos parseados
+        CreateTaskResponse con el issue_key, issue_url y datos parseados, u
+        OutboxAcceptedResponse (202) si se procesa en segundo plano
 
     Raises:
         HTTPException 400: Error de validación o parsing
         HTTPException 401: Token inválido o expirado
         HTTPException 404: Proyecto no encontrado
+        HTTPException 409: Request con el mismo Idempotency-Key aún en curso
+        HTTPException 422: Idempotency-Key reusado con otro body
         HTTPException 500: Error interno del servidor
     """
+    if idempotency.replay is not None:
+        return idempotency.replay
+
     try:
         # 1. Parsear el texto
         parser = get_parser()
-        parsed_task = parser.parse(request.text)
+        parsed_task = await parser.aparse(request.text)
+
+        if respond_async:
+            # El worker resuelve el assignee y crea el issue más tarde
+            entry = enqueue_jira_write(db, current_user.id, OUTBOX_ISSUE, {
+                "project_key": request.project_key,
+                "summary": parsed_task.summary,
+                "description": parsed_task.description,
+                "issue_type": parsed_task.issue_type,
+                "priority": parsed_task.priority,
+                "labels": parsed_task.labels,
+                "assignee_name": parsed_task.assignee,
+            })
+            outbox_worker.wake()
+            return await idempotency.save(accepted_response(entry))
 
         # 3. Si hay assignee, buscar el Account ID
         assignee_account_id = None
         if parsed_task.assignee:
-            assignee_account_id = jira_client.get_user_account_id(
+            assignee_account_id = await resolve_assignee(
+                jira_client,
                 parsed_task.assignee,
-                request.project_key
+                request.project_key,
+                user_directory,
+                lease=lambda: lease_user_async_jira_client(current_user)
             )
             if not assignee_account_id:
                 print(f"⚠️  Usuario '{parsed_task.assignee}' no encontrado en Jira. El issue se creará sin asignar.")
 
         # 4. Crear issue en Jira
-        jira_response = jira_client.create_issue(
+        jira_response = await jira_client.create_issue(
             project_key=request.project_key,
             summary=parsed_task.summary,
             description=parsed_task.description,
@@ -355,13 +539,13 @@ async def create_task_from_text(
         issue_key = jira_response["key"]
         issue_url = f"{jira_client.base_url}/browse/{issue_key}"
 
-        return CreateTaskResponse(
+        return await idempotency.save(CreateTaskResponse(
             success=True,
             issue_key=issue_key,
             issue_url=issue_url,
             parsed_data=parsed_task.to_dict(),
             confidence=parsed_task.confidence
-        )
+        ))
 
     except ValueError as e:
         # Error de validación o parsing
@@ -449,7 +633,41 @@ async def startup_event():
     print(f"✓ Database: {settings.DATABASE_URL[:50]}..." if len(settings.DATABASE_URL) > 50 else f"✓ Database: {settings.DATABASE_URL}")
     print(f"✓ JWT Algorithm: {settings.JWT_ALGORITHM}")
 
+    if settings.OUTBOX_ENABLED:
+        outbox_worker.start()
+        print("✓ Outbox worker started")
+
+    health_monitor.start()
+    print(f"✓ Health checks every {settings.HEALTH_CHECK_INTERVAL}s")
+
+    if settings.IDEMPOTENCY_ENABLED:
+        idempotency_store.start()
+        print(f"✓ Expired idempotency keys purged every {settings.IDEMPOTENCY_PURGE_INTERVAL}s")
+
     print("\n✓ Servidor iniciado")
     print("  - Health check: http://localhost:8000/api/v1/health")
+    print("  - Liveness/readiness: /api/v1/health/live, /api/v1/health/ready")
     print("  - Docs: http://localhost:8000/docs")
     print("=" * 70)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Detiene las tareas en segundo plano y libera los recursos compartidos.
+
+    Para el outbox worker, los health checks, el borrado de idempotency keys
+    y los refrescos de la caché de proyectos y del directorio de usuarios;
+    luego cierra la caché compartida y los clientes de Jira retenidos entre
+    peticiones.
+    """
+    await outbox_worker.stop()
+    await health_monitor.stop()
+    await idempotency_store.stop()
+    await project_cache.close()
+    if user_directory is not None:
+        await user_directory.close()
+    configure_cache(None)
+    jira_client_registry.clear()
+    for jira_client in async_jira_client_registry.clear(close=False):
+        await jira_client.aclose()
@@ -3,5 +3,7 @@ Models module.
 """
 from app.models.user import User
 from app.models.subtask import SubtaskTemplate
+from app.models.outbox import OutboxEntry
+from app.models.idempotency import IdempotencyRecord
 
-__all__ = ["User", "SubtaskTemplate"]
+__all__ = ["User", "SubtaskTemplate", "OutboxEntry", "IdempotencyRecord"]
@@ -0,0 +1,60 @@
+"""
+Idempotency record model for create endpoints that honour Idempotency-Key.
+"""
+import json
+from typing import Any, Dict
+
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, UniqueConstraint
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# Record status
+IDEMPOTENCY_IN_PROGRESS = "in_progress"
+IDEMPOTENCY_COMPLETED = "completed"
+
+
+class IdempotencyRecord(Base):
+    """
+    The outcome of a request sent with an ``Idempotency-Key`` header.
+
+    The first request with a given key claims the record (in progress);
+    once it succeeds its response is stored so retries with the same key
+    get that response back instead of creating the Jira issues again.
+    """
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        UniqueConstraint("user_id", "key", name="uq_idempotency_user_key"),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Keys are scoped per user
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    key = Column(String(255), nullable=False)
+
+    # Request the key was first used with (method + path + body hash)
+    endpoint = Column(String(255), nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+
+    # Processing state
+    status = Column(String(20), nullable=False, default=IDEMPOTENCY_IN_PROGRESS)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Stored response, once completed
+    response_status = Column(Integer, nullable=True)
+    response_headers = Column(Text, nullable=True)
+    response_body = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyRecord(id={self.id}, key='{self.key}', status='{self.status}', user_id={self.user_id})>"
+
+    @property
+    def headers_data(self) -> Dict[str, Any]:
+        """Decoded stored response headers."""
+        return json.loads(self.response_headers) if self.response_headers else {}
@@ -0,0 +1,68 @@
+"""
+Outbox model for Jira writes that are acknowledged before reaching Jira.
+"""
+import json
+from typing import Any, Optional
+
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# Entry status
+OUTBOX_PENDING = "pending"
+OUTBOX_PROCESSING = "processing"
+OUTBOX_DONE = "done"
+OUTBOX_FAILED = "failed"
+
+# Entry kinds
+OUTBOX_ISSUE = "issue"
+OUTBOX_WORKFLOW = "workflow"
+
+
+class OutboxEntry(Base):
+    """
+    A Jira write (single issue or full content workflow) waiting to be sent.
+
+    Requests that ask for asynchronous processing are stored here and
+    acknowledged immediately; the outbox worker sends them to Jira, retries
+    transient failures and stores the resulting issue keys in ``result``.
+    """
+    __tablename__ = "jira_outbox"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Owner: the worker uses this user's Jira credentials
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    # What to create: OUTBOX_ISSUE or OUTBOX_WORKFLOW, with its parameters (JSON)
+    kind = Column(String(20), nullable=False)
+    payload = Column(Text, nullable=False)
+
+    # Delivery state
+    status = Column(String(20), nullable=False, default=OUTBOX_PENDING, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    # Created issue keys (JSON), once done
+    result = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<OutboxEntry(id={self.id}, kind='{self.kind}', status='{self.status}', user_id={self.user_id})>"
+
+    @property
+    def payload_data(self) -> dict:
+        """Decoded payload."""
+        return json.loads(self.payload)
+
+    @property
+    def result_data(self) -> Optional[Any]:
+        """Decoded result, or None if the entry has not been delivered."""
+        return json.loads(self.result) if self.result else None
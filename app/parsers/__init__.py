@@ -1,5 +1,14 @@
 """Parsers package for text processing."""
 
-from app.parsers.task_parser import TaskParser, ParsedTask, LLMTaskParser, create_parser
+from app.parsers.task_parser import PARSER_VERSION, TaskParser, ParsedTask, LLMTaskParser, create_parser
+from app.parsers.parse_cache import ParseCache, get_parse_cache
 
-__all__ = ["TaskParser", "ParsedTask", "LLMTaskParser", "create_parser"]
+__all__ = [
+    "PARSER_VERSION",
+    "TaskParser",
+    "ParsedTask",
+    "LLMTaskParser",
+    "create_parser",
+    "ParseCache",
+    "get_parse_cache",
+]
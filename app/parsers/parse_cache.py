@@ -0,0 +1,233 @@
+"""
+Caché de resultados del parser.
+
+El frontend llama a /tasks/parse para la vista previa y luego a
+/tasks/create con el mismo texto, y los endpoints batch repiten textos
+idénticos: cada llamada volvía a correr todas las expresiones regulares del
+TaskParser. La caché guarda el ParsedTask por hash del texto y de
+PARSER_VERSION:
+
+- El texto se normaliza solo quitando espacios al inicio y al final; el
+  parser distingue mayúsculas (assignee, descripción), así que no se pasa a
+  minúsculas.
+- Al cambiar las reglas del parser se sube PARSER_VERSION y las entradas
+  viejas dejan de coincidir.
+- Cada llamador recibe su propia copia: modificar ``labels`` de un
+  resultado no altera la caché.
+- El tamaño se acota por un presupuesto de memoria (LRU), no por cantidad
+  de entradas, porque las descripciones varían mucho de largo.
+- Si hay caché compartida (app/clients/cache_backend.py), los resultados
+  también se publican ahí para los demás workers. Los endpoints async usan
+  TaskParser.aparse, que consulta esa caché sin bloquear el event loop.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple
+
+from app.clients.cache_backend import MISS, CacheNamespace
+from app.parsers.task_parser import PARSER_VERSION, ParsedTask
+
+# Memoria aproximada de una entrada además de sus strings (objeto, nodo LRU, tupla)
+ENTRY_OVERHEAD = 512
+
+
+def parse_key(text: str, version: str = PARSER_VERSION) -> str:
+    """
+    Clave de caché de un texto.
+
+    Args:
+        text: Texto a parsear
+        version: Versión de las reglas del parser
+
+    Returns:
+        Hash SHA-256 (hex) de la versión y el texto normalizado
+    """
+    return hashlib.sha256(f"{version}\0{text.strip()}".encode("utf-8")).hexdigest()
+
+
+def copy_task(task: ParsedTask) -> ParsedTask:
+    """Copia un ParsedTask (labels incluidas) para entregarlo a un llamador."""
+    return replace(task, labels=list(task.labels))
+
+
+def _task_size(key: str, task: ParsedTask) -> int:
+    strings = [key, task.summary, task.description, task.issue_type, task.priority, task.assignee or ""]
+    strings.extend(task.labels)
+    return ENTRY_OVERHEAD + sum(sys.getsizeof(value) for value in strings)
+
+
+class ParseCache:
+    """Caché LRU thread-safe de ParsedTask con presupuesto de memoria."""
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024, shared: Optional[CacheNamespace] = None):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_bytes: Memoria aproximada máxima de las entradas
+            shared: Caché compartida entre workers (opcional)
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes debe ser mayor que 0")
+
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self._entries: "OrderedDict[str, Tuple[ParsedTask, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Métricas
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Clave de caché de un texto (ver parse_key)."""
+        return parse_key(text)
+
+    def _store(self, key: str, task: ParsedTask) -> None:
+        size = _task_size(key, task)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (task, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def _get_local(self, key: str) -> Optional[ParsedTask]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy_task(entry[0])
+
+    def _from_shared(self, key: str, data: Any) -> Optional[ParsedTask]:
+        task = None
+        if data is not MISS:
+            try:
+                task = ParsedTask(**data)
+            except TypeError:
+                # Formato de otra versión del código: se ignora
+                task = None
+        if task is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        self._store(key, task)
+        with self._lock:
+            self.shared_hits += 1
+        return copy_task(task)
+
+    def get(self, key: str) -> Optional[ParsedTask]:
+        """
+        Busca un resultado.
+
+        Args:
+            key: Clave de key()
+
+        Returns:
+            Copia del ParsedTask, o None si no está en caché
+        """
+        task = self._get_local(key)
+        if task is not None:
+            return task
+        return self._from_shared(key, MISS if self.shared is None else self.shared.get(key))
+
+    async def aget(self, key: str) -> Optional[ParsedTask]:
+        """Versión async de get: la caché compartida no bloquea el event loop."""
+        task = self._get_local(key)
+        if task is not None:
+            return task
+        return self._from_shared(key, MISS if self.shared is None else await self.shared.aget(key))
+
+    def put(self, key: str, task: ParsedTask) -> None:
+        """
+        Guarda un resultado (una copia, el llamador puede seguir usándolo).
+
+        Args:
+            key: Clave de key()
+            task: Resultado del parser
+        """
+        task = copy_task(task)
+        self._store(key, task)
+        if self.shared is not None:
+            self.shared.set(key, task.to_dict())
+
+    async def aput(self, key: str, task: ParsedTask) -> None:
+        """Versión async de put: la caché compartida no bloquea el event loop."""
+        task = copy_task(task)
+        self._store(key, task)
+        if self.shared is not None:
+            await self.shared.aset(key, task.to_dict())
+
+    def clear(self) -> None:
+        """Descarta todas las entradas locales."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna el tamaño y los contadores de la caché.
+
+        Returns:
+            Diccionario con version, size, bytes, max_bytes, hits,
+            shared_hits, misses, evictions y hit_ratio
+        """
+        with self._lock:
+            found = self.hits + self.shared_hits
+            lookups = found + self.misses
+            return {
+                "version": PARSER_VERSION,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(found / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Caché del proceso que usan los parsers de create_parser() (None = desactivada)
+_parse_cache: Optional[ParseCache] = ParseCache()
+
+
+def configure_parse_cache(max_bytes: int, shared: Optional[CacheNamespace] = None) -> Optional[ParseCache]:
+    """
+    Reemplaza la caché del proceso.
+
+    Args:
+        max_bytes: Presupuesto de memoria (0 = sin caché)
+        shared: Caché compartida entre workers (opcional)
+
+    Returns:
+        La nueva caché, o None si quedó desactivada
+    """
+    global _parse_cache
+    _parse_cache = ParseCache(max_bytes, shared) if max_bytes > 0 else None
+    return _parse_cache
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Caché del proceso, o None si está desactivada."""
+    return _parse_cache
@@ -12,6 +12,10 @@ import re
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
+# Versión de las reglas del parser: subirla al cambiar keywords, patrones o
+# heurísticas invalida los resultados cacheados (app/parsers/parse_cache.py)
+PARSER_VERSION = "1"
+
 
 @dataclass
 class ParsedTask:
@@ -138,10 +142,16 @@ class TaskParser:
         "documentar", "escribir", "redactar"
     ]
 
-    def __init__(self):
-        """Inicializa el parser."""
+    def __init__(self, cache=None):
+        """
+        Inicializa el parser.
+
+        Args:
+            cache: ParseCache donde reutilizar resultados (opcional)
+        """
         self.default_priority = "Medium"
         self.default_issue_type = "Task"
+        self.cache = cache
 
     def parse(self, text: str) -> ParsedTask:
         """
@@ -151,7 +161,8 @@ class TaskParser:
             text: Texto en lenguaje natural describiendo la tarea
 
         Returns:
-            ParsedTask con la información extraída
+            ParsedTask con la información extraída (una copia propia si
+            viene de la caché)
 
         Example:
             >>> parser = TaskParser()
@@ -162,6 +173,46 @@ class TaskParser:
         if not text or not text.strip():
             raise ValueError("El texto no puede estar vacío")
 
+        if self.cache is None:
+            return self._parse(text)
+
+        key = self.cache.key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._parse(text)
+        self.cache.put(key, result)
+        return result
+
+    async def aparse(self, text: str) -> ParsedTask:
+        """
+        Versión para endpoints async de parse().
+
+        El parsing en sí es CPU y corre en el event loop, pero la caché
+        compartida (Redis) se consulta sin bloquearlo.
+
+        Args:
+            text: Texto en lenguaje natural describiendo la tarea
+
+        Returns:
+            ParsedTask con la información extraída
+        """
+        if not text or not text.strip():
+            raise ValueError("El texto no puede estar vacío")
+
+        if self.cache is None:
+            return self._parse(text)
+
+        key = self.cache.key(text)
+        cached = await self.cache.aget(key)
+        if cached is not None:
+            return cached
+        result = self._parse(text)
+        await self.cache.aput(key, result)
+        return result
+
+    def _parse(self, text: str) -> ParsedTask:
+        """Corre todas las reglas sobre el texto (sin caché)."""
         # Normalizar texto para la mayoría de extracciones
         text_normalized = self._normalize_text(text)
 
@@ -511,6 +562,10 @@ class LLMTaskParser:
             "Usa TaskParser para parsing basado en reglas."
         )
 
+    async def aparse(self, text: str) -> ParsedTask:
+        """Versión async de parse() (misma interfaz que TaskParser)."""
+        return self.parse(text)
+
 
 # Factory function para facilitar el cambio entre parsers
 def create_parser(use_llm: bool = False, **kwargs) -> TaskParser:
@@ -522,7 +577,8 @@ def create_parser(use_llm: bool = False, **kwargs) -> TaskParser:
         **kwargs: Argumentos adicionales para el parser (api_key, model, etc.)
 
     Returns:
-        Instancia del parser
+        Instancia del parser. El basado en reglas usa la caché de resultados
+        del proceso (ver app/parsers/parse_cache.py).
 
     Example:
         >>> # Parser basado en reglas (default)
@@ -533,7 +589,11 @@ def create_parser(use_llm: bool = False, **kwargs) -> TaskParser:
     """
     if use_llm:
         return LLMTaskParser(**kwargs)
-    return TaskParser()
+
+    from app.parsers.parse_cache import get_parse_cache
+
+    # Todos los parsers comparten la caché del proceso
+    return TaskParser(cache=get_parse_cache())
 
 
 # Ejemplo de uso
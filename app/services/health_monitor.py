@@ -0,0 +1,254 @@
+"""
+Health checks de dependencias refrescados en segundo plano.
+
+El HEALTHCHECK de Docker llama cada 30 segundos al health check, que abría
+un cliente de Jira y esperaba a /myself dentro del propio request: un Jira
+lento hacía parecer caído al contenedor. HealthMonitor separa las dos
+preguntas:
+
+- Liveness: el proceso y su event loop responden. No toca ninguna
+  dependencia.
+- Readiness: las dependencias críticas (base de datos) respondieron bien en
+  el último chequeo y ese chequeo no está viejo.
+
+Los chequeos (Jira, base de datos, caché compartida) corren en una tarea de
+fondo cada ``interval`` segundos, en paralelo y cada uno con su timeout. Los
+probes solo leen el último resultado guardado, con su latencia, su
+antigüedad y una marca ``stale`` si el refresco se atrasó.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HEALTH_OK = "ok"
+HEALTH_ERROR = "error"
+HEALTH_PENDING = "pending"
+
+
+@dataclass
+class _Check:
+    name: str
+    probe: Callable[[], Awaitable[Any]]
+    critical: bool
+    status: str = HEALTH_PENDING
+    detail: Any = None
+    error: Optional[str] = None
+    latency_ms: Optional[float] = None
+    checked_at: Optional[float] = None
+    checked_at_wall: Optional[float] = None
+    consecutive_failures: int = 0
+
+
+class HealthMonitor:
+    """Corre los chequeos de dependencias en segundo plano y guarda el último resultado."""
+
+    def __init__(
+        self,
+        interval: float = 15.0,
+        timeout: float = 5.0,
+        stale_after: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time
+    ):
+        """
+        Inicializa el monitor.
+
+        Args:
+            interval: Segundos entre rondas de chequeos
+            timeout: Tiempo máximo de cada chequeo
+            stale_after: Antigüedad a partir de la cual un resultado se
+                considera viejo (None = 3 intervalos más el timeout)
+            clock: Reloj monotónico (inyectable en tests)
+            wall_clock: Reloj de pared para informar checked_at
+        """
+        if interval <= 0:
+            raise ValueError("interval debe ser mayor que 0")
+        if timeout <= 0:
+            raise ValueError("timeout debe ser mayor que 0")
+
+        self.interval = interval
+        self.timeout = timeout
+        self.stale_after = stale_after if stale_after is not None else 3 * interval + timeout
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._checks: Dict[str, _Check] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._started_at = clock()
+
+        # Métricas
+        self.rounds = 0
+
+    def register(self, name: str, probe: Callable[[], Awaitable[Any]], critical: bool = True) -> None:
+        """
+        Agrega un chequeo.
+
+        El probe es una corrutina sin argumentos: si termina, la dependencia
+        está bien y su valor de retorno se informa como ``detail``; si lanza
+        una excepción o supera el timeout, está caída.
+
+        Args:
+            name: Nombre de la dependencia (ej: "database")
+            probe: Corrutina que verifica la dependencia
+            critical: Si es False, su fallo degrada el servicio pero no lo
+                marca como no listo
+        """
+        self._checks[name] = _Check(name=name, probe=probe, critical=critical)
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Arranca los refrescos en el event loop actual."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Detiene los refrescos."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def running(self) -> bool:
+        """True si la tarea de refresco está viva."""
+        return self._task is not None and not self._task.done()
+
+    async def run(self) -> None:
+        """Refresca los chequeos en bucle hasta que se cancele la tarea."""
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Error refrescando los health checks")
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self) -> None:
+        """Corre todos los chequeos en paralelo y guarda sus resultados."""
+        await asyncio.gather(*(self._run_check(check) for check in list(self._checks.values())))
+        self.rounds += 1
+
+    async def _run_check(self, check: _Check) -> None:
+        started = self._clock()
+        try:
+            detail = await asyncio.wait_for(check.probe(), timeout=self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self._record(check, started, HEALTH_ERROR, error=f"Sin respuesta en {self.timeout}s")
+        except Exception as e:
+            self._record(check, started, HEALTH_ERROR, error=str(e) or type(e).__name__)
+        else:
+            self._record(check, started, HEALTH_OK, detail=detail)
+
+    def _record(self, check: _Check, started: float, status: str, detail: Any = None, error: Optional[str] = None) -> None:
+        now = self._clock()
+        check.status = status
+        check.detail = detail
+        check.error = error
+        check.latency_ms = round((now - started) * 1000, 2)
+        check.checked_at = now
+        check.checked_at_wall = self._wall_clock()
+        check.consecutive_failures = 0 if status == HEALTH_OK else check.consecutive_failures + 1
+
+    # ------------------------------------------------------------------
+    # Probes (solo leen resultados guardados)
+    # ------------------------------------------------------------------
+
+    def liveness(self) -> Dict[str, Any]:
+        """
+        Estado de liveness: el proceso responde.
+
+        Returns:
+            Diccionario con status, uptime_seconds y si el monitor corre
+        """
+        return {
+            "status": "alive",
+            "uptime_seconds": round(self._clock() - self._started_at, 1),
+            "monitor_running": self.running,
+        }
+
+    def _result(self, check: _Check, now: float) -> Dict[str, Any]:
+        age = None if check.checked_at is None else now - check.checked_at
+        result = {
+            "status": check.status,
+            "critical": check.critical,
+            "latency_ms": check.latency_ms,
+            "checked_at": (
+                datetime.fromtimestamp(check.checked_at_wall, timezone.utc).isoformat()
+                if check.checked_at_wall is not None else None
+            ),
+            "age_seconds": round(age, 1) if age is not None else None,
+            "stale": age is not None and age > self.stale_after,
+        }
+        if check.detail is not None:
+            result["detail"] = check.detail
+        if check.error is not None:
+            result["error"] = check.error
+            result["consecutive_failures"] = check.consecutive_failures
+        return result
+
+    def readiness(self) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Estado de readiness según el último resultado de cada chequeo.
+
+        Un chequeo crítico pendiente, caído o viejo deja al servicio como no
+        listo. Un chequeo no crítico en ese estado solo lo degrada.
+
+        Returns:
+            Tupla (listo, diccionario con status y el resultado de cada
+            chequeo)
+        """
+        now = self._clock()
+        checks = {name: self._result(check, now) for name, check in self._checks.items()}
+
+        def healthy(result: Dict[str, Any]) -> bool:
+            return result["status"] == HEALTH_OK and not result["stale"]
+
+        ready = all(healthy(result) for result in checks.values() if result["critical"])
+        if not ready:
+            status = "not_ready"
+        elif all(healthy(result) for result in checks.values()):
+            status = "ready"
+        else:
+            status = "degraded"
+        return ready, {"status": status, "checks": checks}
+
+    def result(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Último resultado de un chequeo.
+
+        Args:
+            name: Nombre del chequeo
+
+        Returns:
+            Resultado (ver readiness), o None si no está registrado
+        """
+        check = self._checks.get(name)
+        return self._result(check, self._clock()) if check is not None else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Estado del monitor para el health check.
+
+        Returns:
+            Diccionario con running, interval, rounds y stale_after
+        """
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "stale_after": self.stale_after,
+            "rounds": self.rounds,
+        }
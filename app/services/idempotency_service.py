@@ -0,0 +1,380 @@
+"""
+Idempotency-Key para los endpoints que crean issues en Jira.
+
+El primer request con un key lo reclama (registro "in_progress") y, si
+termina bien, su respuesta queda guardada. Un reintento con el mismo key
+recibe esa respuesta sin volver a llamar a Jira; uno que llega mientras el
+original sigue corriendo espera a que termine. Reusar un key con otro body
+es un error del cliente.
+
+Solo se guardan respuestas exitosas (2xx). Si el request original falla, el
+key se libera para que el cliente pueda reintentar. Guardar y liberar solo
+tocan el registro si sigue siendo del mismo reclamo (``locked_at``): un
+request lento cuyo key otro tomó por abandonado no pisa ni borra al nuevo
+dueño.
+
+Los keys vencidos se borran en segundo plano cada ``purge_interval``
+segundos (``start()``/``stop()``), en un thread para no bloquear el event
+loop con el DELETE.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session
+
+from app.clients.deadline import remaining as deadline_remaining
+from app.core.exceptions import IdempotencyInProgressException, IdempotencyKeyMismatchException
+from app.models.idempotency import IDEMPOTENCY_COMPLETED, IDEMPOTENCY_IN_PROGRESS, IdempotencyRecord
+
+logger = logging.getLogger(__name__)
+
+# Resultado de intentar reclamar un key
+CLAIMED = "claimed"
+REPLAY = "replay"
+WAIT = "wait"
+
+MAX_KEY_LENGTH = 255
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def request_fingerprint(method: str, path: str, body: bytes) -> str:
+    """
+    Huella de un request para detectar un key reusado con otro contenido.
+
+    Un body JSON se normaliza (orden de claves y espacios) para que el mismo
+    contenido serializado distinto dé la misma huella.
+
+    Args:
+        method: Método HTTP
+        path: Path del endpoint
+        body: Body crudo del request
+
+    Returns:
+        SHA-256 en hexadecimal
+    """
+    try:
+        canonical = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":")).encode("utf-8")
+    except ValueError:
+        canonical = body
+    digest = hashlib.sha256(f"{method.upper()} {path}\n".encode("utf-8"))
+    digest.update(canonical)
+    return digest.hexdigest()
+
+
+class IdempotencyStore:
+    """Registros de Idempotency-Key en la base de datos."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        ttl: float = 86400,
+        lock_timeout: float = 120,
+        wait_timeout: float = 60,
+        poll_interval: float = 0.1,
+        purge_interval: float = 3600,
+        clock: Callable[[], datetime] = _utcnow
+    ):
+        """
+        Inicializa el store.
+
+        Args:
+            session_factory: Crea sesiones de base de datos (ej: SessionLocal)
+            ttl: Segundos que se conserva un key (y su respuesta)
+            lock_timeout: Tras este tiempo un request "in_progress" se
+                considera abandonado (proceso caído) y otro puede reclamarlo
+            wait_timeout: Máximo que espera un duplicado concurrente
+            poll_interval: Espera inicial entre revisiones de un key en curso
+                (se duplica hasta 1 segundo)
+            purge_interval: Segundos entre borrados de keys vencidos
+            clock: Reloj UTC (inyectable en tests)
+        """
+        if purge_interval <= 0:
+            raise ValueError("purge_interval debe ser mayor que 0")
+
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.purge_interval = purge_interval
+        self._clock = clock
+        self._purge_task: Optional[asyncio.Task] = None
+
+        # Duplicados esperando en este proceso, despertados al terminar el original
+        self._waiters: Dict[Tuple[int, str], asyncio.Event] = {}
+
+        # Métricas
+        self.claimed = 0
+        self.replayed = 0
+        self.waited = 0
+        self.purged = 0
+
+    def _claim(self, user_id: int, key: str, endpoint: str, fingerprint: str) -> Tuple[str, Optional[IdempotencyRecord]]:
+        """Reclama el key, o retorna su respuesta guardada, o indica que hay que esperar."""
+        now = self._clock()
+        db = self.session_factory()
+        try:
+            scope = db.query(IdempotencyRecord).filter(
+                IdempotencyRecord.user_id == user_id,
+                IdempotencyRecord.key == key
+            )
+            if scope.filter(IdempotencyRecord.expires_at <= now).delete(synchronize_session=False):
+                db.commit()
+
+            record = scope.first()
+            if record is None:
+                record = IdempotencyRecord(
+                    user_id=user_id,
+                    key=key,
+                    endpoint=endpoint,
+                    fingerprint=fingerprint,
+                    status=IDEMPOTENCY_IN_PROGRESS,
+                    locked_at=now,
+                    expires_at=now + timedelta(seconds=self.ttl)
+                )
+                db.add(record)
+                try:
+                    db.commit()
+                except IntegrityError:
+                    # Otro request con el mismo key lo reclamó primero
+                    db.rollback()
+                    return WAIT, None
+                db.refresh(record)
+                return CLAIMED, record
+
+            if record.endpoint != endpoint or record.fingerprint != fingerprint:
+                raise IdempotencyKeyMismatchException(
+                    f"El Idempotency-Key '{key}' ya se usó con un request distinto",
+                    {"endpoint": record.endpoint}
+                )
+
+            if record.status == IDEMPOTENCY_COMPLETED:
+                return REPLAY, record
+
+            # En curso: se puede tomar solo si el dueño lo abandonó
+            taken = db.query(IdempotencyRecord).filter(
+                IdempotencyRecord.id == record.id,
+                IdempotencyRecord.status == IDEMPOTENCY_IN_PROGRESS,
+                IdempotencyRecord.locked_at <= now - timedelta(seconds=self.lock_timeout)
+            ).update({IdempotencyRecord.locked_at: now}, synchronize_session=False)
+            if taken:
+                db.commit()
+                db.refresh(record)
+                return CLAIMED, record
+            return WAIT, None
+        finally:
+            db.close()
+
+    async def begin(
+        self,
+        user_id: int,
+        key: str,
+        endpoint: str,
+        fingerprint: str
+    ) -> Tuple[str, IdempotencyRecord]:
+        """
+        Reclama un key o espera al request que lo tiene.
+
+        Args:
+            user_id: Dueño del key (los keys no se comparten entre usuarios)
+            key: Valor del header Idempotency-Key
+            endpoint: Método y path del request
+            fingerprint: Huella del request (ver request_fingerprint)
+
+        Returns:
+            (CLAIMED, registro) si este request debe ejecutarse, o
+            (REPLAY, registro) con la respuesta guardada del original
+
+        Raises:
+            ValueError: Si el key es vacío o demasiado largo
+            IdempotencyKeyMismatchException: Si el key se usó con otro request
+            IdempotencyInProgressException: Si el original no terminó a tiempo
+        """
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise ValueError(f"Idempotency-Key debe tener entre 1 y {MAX_KEY_LENGTH} caracteres")
+
+        # No esperar más allá del deadline del request
+        budget = self.wait_timeout
+        left = deadline_remaining()
+        if left is not None:
+            budget = min(budget, left)
+        give_up_at = time.monotonic() + budget
+
+        delay = self.poll_interval
+        waited = False
+        while True:
+            state, record = await asyncio.to_thread(self._claim, user_id, key, endpoint, fingerprint)
+            if record is not None:
+                # CLAIMED o REPLAY; WAIT nunca trae registro
+                if state == CLAIMED:
+                    self.claimed += 1
+                else:
+                    self.replayed += 1
+                return state, record
+
+            if not waited:
+                waited = True
+                self.waited += 1
+            left = give_up_at - time.monotonic()
+            if left <= 0:
+                raise IdempotencyInProgressException(
+                    f"El request original con Idempotency-Key '{key}' sigue en curso"
+                )
+            event = self._waiters.setdefault((user_id, key), asyncio.Event())
+            try:
+                await asyncio.wait_for(event.wait(), timeout=min(delay, left))
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, 1.0)
+
+    def _wake(self, user_id: int, key: str) -> None:
+        event = self._waiters.pop((user_id, key), None)
+        if event is not None:
+            event.set()
+
+    def _owned(self, db: Session, record_id: int, locked_at: Optional[datetime]) -> "Query[IdempotencyRecord]":
+        """Query del registro si sigue en curso con el reclamo de `locked_at`."""
+        return db.query(IdempotencyRecord).filter(
+            IdempotencyRecord.id == record_id,
+            IdempotencyRecord.status == IDEMPOTENCY_IN_PROGRESS,
+            IdempotencyRecord.locked_at == locked_at
+        )
+
+    def _store(
+        self,
+        record_id: int,
+        locked_at: Optional[datetime],
+        status_code: int,
+        headers: Dict[str, str],
+        body: str
+    ) -> bool:
+        db = self.session_factory()
+        try:
+            stored = self._owned(db, record_id, locked_at).update(
+                {
+                    IdempotencyRecord.status: IDEMPOTENCY_COMPLETED,
+                    IdempotencyRecord.response_status: status_code,
+                    IdempotencyRecord.response_headers: json.dumps(headers),
+                    IdempotencyRecord.response_body: body,
+                    IdempotencyRecord.locked_at: None,
+                    IdempotencyRecord.completed_at: self._clock(),
+                },
+                synchronize_session=False
+            )
+            db.commit()
+            return bool(stored)
+        finally:
+            db.close()
+
+    def _delete(self, record_id: int, locked_at: Optional[datetime]) -> bool:
+        db = self.session_factory()
+        try:
+            deleted = self._owned(db, record_id, locked_at).delete(synchronize_session=False)
+            db.commit()
+            return bool(deleted)
+        finally:
+            db.close()
+
+    async def complete(
+        self,
+        record: IdempotencyRecord,
+        status_code: int,
+        body: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Guarda la respuesta del request que reclamó el key.
+
+        Args:
+            record: Registro retornado por begin()
+            status_code: Status HTTP de la respuesta
+            body: Body JSON de la respuesta
+            headers: Headers a reproducir (ej: Location)
+        """
+        stored = await asyncio.to_thread(
+            self._store, record.id, record.locked_at, status_code, headers or {}, body
+        )
+        if not stored:
+            # Otro request tomó el key por abandonado; su respuesta es la que vale
+            logger.warning("Idempotency-Key %s tomado por otro request; no se guarda la respuesta", record.key)
+        self._wake(record.user_id, record.key)
+
+    async def release(self, record: IdempotencyRecord) -> None:
+        """Libera el key de un request que falló para permitir reintentarlo."""
+        try:
+            await asyncio.to_thread(self._delete, record.id, record.locked_at)
+        except Exception:
+            # Si no se puede borrar, el key se libera al vencer lock_timeout
+            logger.exception("No se pudo liberar el Idempotency-Key %s", record.key)
+        self._wake(record.user_id, record.key)
+
+    def purge_expired(self) -> int:
+        """
+        Borra los keys vencidos.
+
+        Returns:
+            Número de registros borrados
+        """
+        db = self.session_factory()
+        try:
+            deleted = db.query(IdempotencyRecord).filter(
+                IdempotencyRecord.expires_at <= self._clock()
+            ).delete(synchronize_session=False)
+            db.commit()
+            self.purged += deleted
+            return deleted
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # Borrado periódico
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Arranca el borrado periódico de keys vencidos en el event loop actual."""
+        if self._purge_task is None or self._purge_task.done():
+            self._purge_task = asyncio.create_task(self.run_purge())
+
+    async def stop(self) -> None:
+        """Detiene el borrado periódico."""
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            try:
+                await self._purge_task
+            except asyncio.CancelledError:
+                pass
+            self._purge_task = None
+
+    async def run_purge(self) -> None:
+        """Borra los keys vencidos en bucle hasta que se cancele la tarea."""
+        while True:
+            try:
+                deleted = await asyncio.to_thread(self.purge_expired)
+                if deleted:
+                    logger.info("Idempotency keys vencidos borrados: %d", deleted)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Error borrando idempotency keys vencidos")
+            await asyncio.sleep(self.purge_interval)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Contadores para el health check."""
+        return {
+            "claimed": self.claimed,
+            "replayed": self.replayed,
+            "waited": self.waited,
+            "waiting": len(self._waiters),
+            "purged": self.purged,
+            "purge_running": self._purge_task is not None and not self._purge_task.done(),
+        }
@@ -0,0 +1,498 @@
+"""
+Outbox de escrituras a Jira.
+
+Cuando el cliente lo pide (header ``Prefer: respond-async``), la creación de
+un issue o de un workflow de contenido se guarda en la tabla ``jira_outbox``
+y se responde 202 de inmediato, sin esperar a Jira. OutboxWorker corre en
+segundo plano y vacía el outbox: agrupa por usuario, crea los issues
+simples con una sola llamada a /issue/bulk, crea los workflows con
+ReelWorkflowService y guarda los keys resultantes en cada entrada.
+
+Todas las entradas crean issues, así que solo se reprograman (con backoff
+exponencial hasta OUTBOX_MAX_ATTEMPTS) los fallos que seguro no crearon
+nada: un 429, o una petición que no llegó a enviarse (conexión fallida,
+circuito abierto, deadline agotado antes de enviar). Un timeout o un 5xx
+después de enviar deja el resultado incierto: Jira pudo haber creado el
+issue, así que la entrada se marca como fallida para revisarla en vez de
+arriesgar un duplicado. Los demás errores (validación, permisos) también la
+marcan como fallida. Si el proceso muere a mitad de un envío, la entrada
+vuelve a intentarse al vencer su lease, así que la entrega es "al menos
+una vez".
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.deadline import deadline
+from app.clients.instrumentation import operation
+from app.clients.jira_client import JiraAPIError
+from app.models.outbox import (
+    OUTBOX_DONE,
+    OUTBOX_FAILED,
+    OUTBOX_ISSUE,
+    OUTBOX_PENDING,
+    OUTBOX_PROCESSING,
+    OUTBOX_WORKFLOW,
+    OutboxEntry,
+)
+from app.models.user import User
+from app.services.reel_workflow_service import ReelWorkflowService
+from app.services.user_directory import UserDirectory, resolve_assignee
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def enqueue_jira_write(db: Session, user_id: int, kind: str, payload: Dict[str, Any]) -> OutboxEntry:
+    """
+    Guarda una escritura a Jira para que la envíe el worker.
+
+    Args:
+        db: Sesión de base de datos
+        user_id: Usuario con cuyas credenciales se enviará
+        kind: OUTBOX_ISSUE u OUTBOX_WORKFLOW
+        payload: Parámetros de la escritura (ver OutboxWorker)
+
+    Returns:
+        Entrada creada (con id)
+
+    Raises:
+        ValueError: Si el tipo es inválido
+    """
+    if kind not in (OUTBOX_ISSUE, OUTBOX_WORKFLOW):
+        raise ValueError(f"Tipo de entrada de outbox inválido: {kind}")
+
+    entry = OutboxEntry(
+        user_id=user_id,
+        kind=kind,
+        payload=json.dumps(payload, ensure_ascii=False),
+        status=OUTBOX_PENDING,
+        attempts=0,
+        next_attempt_at=_utcnow()
+    )
+    db.add(entry)
+    db.commit()
+    db.refresh(entry)
+    return entry
+
+
+def get_outbox_entry(db: Session, entry_id: int, user_id: int) -> Optional[OutboxEntry]:
+    """Obtiene una entrada del outbox si pertenece al usuario."""
+    return db.query(OutboxEntry).filter(
+        OutboxEntry.id == entry_id,
+        OutboxEntry.user_id == user_id
+    ).first()
+
+
+def is_transient(error: JiraAPIError) -> bool:
+    """True si el error de Jira puede resolverse reintentando más tarde."""
+    return error.status_code is None or error.status_code == 429 or error.status_code >= 500
+
+
+def is_retry_safe(error: JiraAPIError) -> bool:
+    """
+    True si reenviar una creación no puede duplicar el issue.
+
+    Igual que retry.REJECTED_STATUS_CODES: solo un 429 garantiza que Jira
+    rechazó la petición sin aplicarla; si no, tiene que no haberse enviado.
+    """
+    return error.status_code == 429 or not error.request_sent
+
+
+class OutboxWorker:
+    """Envía a Jira las entradas pendientes del outbox en segundo plano."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        client_provider: Callable[[User], AsyncContextManager[AsyncJiraClient]],
+        batch_size: int = 50,
+        poll_interval: float = 2.0,
+        max_attempts: int = 8,
+        retry_base_delay: float = 5.0,
+        retry_max_delay: float = 300.0,
+        lease_seconds: float = 300.0,
+        workflow_deadline: Optional[float] = None,
+        user_directory: Optional[UserDirectory] = None,
+        clock: Callable[[], datetime] = _utcnow
+    ):
+        """
+        Inicializa el worker.
+
+        Args:
+            session_factory: Crea sesiones de base de datos (ej: SessionLocal)
+            client_provider: Context manager async que presta un
+                AsyncJiraClient con las credenciales de un usuario
+            batch_size: Entradas tomadas por vuelta
+            poll_interval: Segundos entre vueltas cuando no hay trabajo
+            max_attempts: Intentos antes de marcar una entrada como fallida
+            retry_base_delay: Espera antes del primer reintento (se duplica
+                en cada intento)
+            retry_max_delay: Espera máxima entre reintentos
+            lease_seconds: Tras este tiempo una entrada "processing" se
+                considera abandonada y se vuelve a tomar
+            workflow_deadline: Presupuesto en segundos por workflow
+            user_directory: Directorio local para resolver assignees por
+                nombre (None = solo /user/search)
+            clock: Reloj UTC (inyectable en tests)
+        """
+        self.session_factory = session_factory
+        self.client_provider = client_provider
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.lease_seconds = lease_seconds
+        self.workflow_deadline = workflow_deadline
+        self.user_directory = user_directory
+        self._clock = clock
+
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        # Métricas
+        self.delivered = 0
+        self.failed = 0
+        self.rescheduled = 0
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Arranca el worker en el event loop actual."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Detiene el worker; las entradas en curso se retoman al vencer su lease."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def wake(self) -> None:
+        """Pide al worker que revise el outbox sin esperar al próximo poll."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run(self) -> None:
+        """Vacía el outbox en bucle hasta que se cancele la tarea."""
+        while True:
+            try:
+                processed = await self.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Error vaciando el outbox de Jira")
+                processed = 0
+
+            # Con un lote completo probablemente queda más trabajo
+            if processed >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    # ------------------------------------------------------------------
+    # Base de datos (se ejecuta en un hilo para no bloquear el event loop)
+    # ------------------------------------------------------------------
+
+    def _claim(self) -> List[OutboxEntry]:
+        """Toma hasta batch_size entradas vencidas y las marca como processing."""
+        now = self._clock()
+        due = or_(
+            and_(OutboxEntry.status == OUTBOX_PENDING, OutboxEntry.next_attempt_at <= now),
+            and_(
+                OutboxEntry.status == OUTBOX_PROCESSING,
+                OutboxEntry.locked_at <= now - timedelta(seconds=self.lease_seconds)
+            )
+        )
+        db = self.session_factory()
+        try:
+            ids = [
+                row.id for row in
+                db.query(OutboxEntry.id).filter(due).order_by(OutboxEntry.id).limit(self.batch_size)
+            ]
+            claimed = []
+            for entry_id in ids:
+                # Update condicional: si otro worker la tomó, no se actualiza
+                updated = db.query(OutboxEntry).filter(OutboxEntry.id == entry_id, due).update(
+                    {
+                        OutboxEntry.status: OUTBOX_PROCESSING,
+                        OutboxEntry.locked_at: now,
+                        OutboxEntry.attempts: OutboxEntry.attempts + 1,
+                    },
+                    synchronize_session=False
+                )
+                if updated:
+                    claimed.append(entry_id)
+            db.commit()
+            if not claimed:
+                return []
+            return db.query(OutboxEntry).filter(OutboxEntry.id.in_(claimed)).order_by(OutboxEntry.id).all()
+        finally:
+            db.close()
+
+    def _load_user(self, user_id: int) -> Optional[User]:
+        db = self.session_factory()
+        try:
+            return db.query(User).filter(User.id == user_id).first()
+        finally:
+            db.close()
+
+    def _finish(self, entry: OutboxEntry, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        """Guarda el resultado final (done o failed) de una entrada."""
+        db = self.session_factory()
+        try:
+            db.query(OutboxEntry).filter(OutboxEntry.id == entry.id).update(
+                {
+                    OutboxEntry.status: status,
+                    OutboxEntry.result: json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    OutboxEntry.last_error: error,
+                    OutboxEntry.locked_at: None,
+                    OutboxEntry.completed_at: self._clock(),
+                },
+                synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+        entry.status = status
+
+    def _reschedule(self, entry: OutboxEntry, error: str) -> None:
+        """Devuelve una entrada a pending con backoff, o la marca fallida sin intentos."""
+        if entry.attempts >= self.max_attempts:
+            self._finish(entry, OUTBOX_FAILED, error=f"{error} (tras {entry.attempts} intentos)")
+            self.failed += 1
+            return
+
+        delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** (entry.attempts - 1))
+        db = self.session_factory()
+        try:
+            db.query(OutboxEntry).filter(OutboxEntry.id == entry.id).update(
+                {
+                    OutboxEntry.status: OUTBOX_PENDING,
+                    OutboxEntry.last_error: error,
+                    OutboxEntry.locked_at: None,
+                    OutboxEntry.next_attempt_at: self._clock() + timedelta(seconds=delay),
+                },
+                synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+        entry.status = OUTBOX_PENDING
+        self.rescheduled += 1
+
+    async def _complete(self, entry: OutboxEntry, result: Any) -> None:
+        await asyncio.to_thread(self._finish, entry, OUTBOX_DONE, result)
+        self.delivered += 1
+
+    async def _fail(self, entry: OutboxEntry, error: str) -> None:
+        await asyncio.to_thread(self._finish, entry, OUTBOX_FAILED, None, error)
+        self.failed += 1
+
+    async def _retry_or_fail(self, entry: OutboxEntry, error: JiraAPIError) -> None:
+        if not is_transient(error):
+            await self._fail(entry, str(error))
+        elif is_retry_safe(error):
+            await asyncio.to_thread(self._reschedule, entry, str(error))
+        else:
+            await self._fail(
+                entry,
+                f"Resultado incierto, el issue pudo haberse creado en Jira; "
+                f"revisar antes de reenviar: {error}"
+            )
+
+    # ------------------------------------------------------------------
+    # Envío a Jira
+    # ------------------------------------------------------------------
+
+    async def drain_once(self) -> int:
+        """
+        Procesa un lote de entradas vencidas.
+
+        Returns:
+            Número de entradas tomadas
+        """
+        entries = await asyncio.to_thread(self._claim)
+        if not entries:
+            return 0
+
+        by_user: Dict[int, List[OutboxEntry]] = defaultdict(list)
+        for entry in entries:
+            by_user[entry.user_id].append(entry)
+
+        with operation("outbox drain"):
+            for user_id, user_entries in by_user.items():
+                await self._drain_user(user_id, user_entries)
+
+        return len(entries)
+
+    async def _drain_user(self, user_id: int, entries: List[OutboxEntry]) -> None:
+        user = await asyncio.to_thread(self._load_user, user_id)
+        if user is None:
+            for entry in entries:
+                await self._fail(entry, "El usuario ya no existe")
+            return
+
+        try:
+            async with self.client_provider(user) as jira_client:
+                issues = [e for e in entries if e.kind == OUTBOX_ISSUE]
+                if issues:
+                    await self._deliver_issues(jira_client, issues)
+                for entry in entries:
+                    if entry.kind == OUTBOX_WORKFLOW:
+                        await self._deliver_workflow(jira_client, entry)
+                    elif entry.kind != OUTBOX_ISSUE:
+                        await self._fail(entry, f"Tipo de entrada desconocido: {entry.kind}")
+        except Exception as e:
+            # Credenciales faltantes o inválidas: no se puede enviar lo que queda del usuario
+            detail = getattr(e, "detail", None) or str(e)
+            logger.warning("Outbox: no se pudo obtener el cliente de Jira del usuario %s: %s", user_id, detail)
+            for entry in entries:
+                if entry.status == OUTBOX_PROCESSING:
+                    await self._fail(entry, f"Cliente de Jira no disponible: {detail}")
+
+    async def _resolve_assignee(
+        self,
+        jira_client: AsyncJiraClient,
+        payload: Dict[str, Any],
+        cache: Dict[Tuple[str, str], Optional[str]]
+    ) -> Optional[str]:
+        """Account ID del assignee por nombre; None si no se encuentra."""
+        if payload.get("assignee"):
+            return payload["assignee"]
+        name = payload.get("assignee_name")
+        if not name:
+            return None
+        key = (name, payload["project_key"])
+        if key not in cache:
+            try:
+                cache[key] = await resolve_assignee(
+                    jira_client, name, payload["project_key"], self.user_directory
+                )
+            except JiraAPIError as e:
+                logger.warning("Outbox: no se pudo buscar el usuario '%s': %s", name, e)
+                cache[key] = None
+        return cache[key]
+
+    async def _deliver_issues(self, jira_client: AsyncJiraClient, entries: List[OutboxEntry]) -> None:
+        """Crea los issues simples de un usuario con una sola llamada bulk."""
+        assignees: Dict[Tuple[str, str], Optional[str]] = {}
+        payloads, sendable = [], []
+        for entry in entries:
+            data = entry.payload_data
+            try:
+                payloads.append(jira_client._build_issue_payload(
+                    project_key=data["project_key"],
+                    summary=data["summary"],
+                    description=data.get("description"),
+                    issue_type=data.get("issue_type", "Task"),
+                    priority=data.get("priority", "Medium"),
+                    labels=data.get("labels"),
+                    assignee=await self._resolve_assignee(jira_client, data, assignees)
+                ))
+                sendable.append(entry)
+            except (KeyError, ValueError) as e:
+                await self._fail(entry, f"Payload inválido: {e}")
+
+        if not payloads:
+            return
+
+        result = await jira_client.create_issues_bulk(payloads)
+        for issue in result["issues"]:
+            entry = sendable[issue["index"]]
+            await self._complete(entry, {
+                "issue_key": issue["key"],
+                "issue_url": f"{jira_client.base_url}/browse/{issue['key']}",
+            })
+        for error in result["errors"]:
+            entry = sendable[error["index"]]
+            await self._retry_or_fail(entry, JiraAPIError(
+                error["message"],
+                status_code=error.get("status"),
+                request_sent=error.get("request_sent", True)
+            ))
+
+    async def _deliver_workflow(self, jira_client: AsyncJiraClient, entry: OutboxEntry) -> None:
+        """Crea un workflow completo (tarea principal + subtareas)."""
+        data = entry.payload_data
+        try:
+            assignee = await self._resolve_assignee(jira_client, data, {})
+            with deadline(self.workflow_deadline):
+                result = await ReelWorkflowService(jira_client).create_reel_workflow(
+                    project_key=data["project_key"],
+                    title=data["title"],
+                    content_type=data.get("content_type", "Reel"),
+                    priority=data.get("priority", "Medium"),
+                    labels=data.get("labels"),
+                    assignee=assignee,
+                    description=data.get("description"),
+                    subtask_ids=data.get("subtask_ids")
+                )
+        except JiraAPIError as e:
+            await self._retry_or_fail(entry, e)
+            return
+        except (KeyError, ValueError) as e:
+            await self._fail(entry, f"Payload inválido: {e}")
+            return
+
+        # La tarea principal ya existe: aunque fallen subtareas no se reintenta
+        await self._complete(entry, {
+            "success": result["success"],
+            "main_task_key": result["main_task"]["key"],
+            "main_task_url": result["main_task"]["url"],
+            "subtasks": [{"key": s["key"], "phase": s["phase"]} for s in result["subtasks"]],
+            "failed_subtasks": [
+                {"phase": f["phase"], "error": f["error"]} for f in result["failed_subtasks"]
+            ],
+            "total_tasks": result["total_tasks"],
+        })
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Estado del outbox para el health check.
+
+        Returns:
+            Diccionario con entradas por estado, la pendiente más antigua y
+            contadores del worker
+        """
+        db = self.session_factory()
+        try:
+            counts = dict(
+                db.query(OutboxEntry.status, func.count(OutboxEntry.id)).group_by(OutboxEntry.status).all()
+            )
+            oldest = db.query(func.min(OutboxEntry.created_at)).filter(
+                OutboxEntry.status.in_([OUTBOX_PENDING, OUTBOX_PROCESSING])
+            ).scalar()
+        finally:
+            db.close()
+
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "entries": counts,
+            "oldest_pending": oldest.isoformat() if oldest else None,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "rescheduled": self.rescheduled,
+        }
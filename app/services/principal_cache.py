@@ -0,0 +1,259 @@
+"""
+Caché de usuarios autenticados (principals).
+
+get_current_user decodificaba el JWT y consultaba la tabla users en cada
+request autenticado, aunque el mismo token se repite durante toda la
+sesión. La caché guarda, por hash del token ya verificado, una foto
+inmutable del usuario (Principal) durante unos segundos:
+
+- Un acierto no decodifica el JWT ni toca la base de datos.
+- Una entrada nunca vive más que el propio token (claim ``exp``).
+- Solo se cachean usuarios activos.
+- Las entradas de un usuario se descartan al cambiar sus credenciales de
+  Jira, al desactivarlo (cualquier UPDATE del usuario vía ORM) y al hacer
+  logout. Entre workers, el TTL corto acota cuánto puede durar una foto
+  vieja.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import event, inspect
+
+from app.clients.client_registry import credential_fingerprint
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Foto inmutable del usuario autenticado.
+
+    Tiene los mismos nombres de atributo que User, así las dependencias que
+    solo leen el usuario (credenciales de Jira, id, permisos) aceptan ambos.
+    El token de Jira se guarda cifrado, tal como está en la base de datos.
+    """
+
+    id: int
+    username: str
+    email: str
+    is_active: bool
+    is_superuser: bool
+    jira_base_url: Optional[str]
+    jira_email: Optional[str]
+    jira_api_token: Optional[str]
+    jira_fingerprint: str
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """
+        Toma la foto de un usuario cargado de la base de datos.
+
+        Args:
+            user: Usuario (modelo ORM)
+
+        Returns:
+            Principal con sus datos actuales
+        """
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=bool(user.is_active),
+            is_superuser=bool(user.is_superuser),
+            jira_base_url=user.jira_base_url,
+            jira_email=user.jira_email,
+            jira_api_token=user.jira_api_token,
+            jira_fingerprint=credential_fingerprint(user.jira_base_url, user.jira_email, user.jira_api_token)
+        )
+
+
+# Columnas de User que forman parte de un Principal
+PRINCIPAL_FIELDS = (
+    "username", "email", "is_active", "is_superuser",
+    "jira_base_url", "jira_email", "jira_api_token",
+)
+
+
+def token_key(token: str) -> str:
+    """Clave de caché de un token (nunca se guarda el token en claro)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class PrincipalCache:
+    """Caché LRU/TTL thread-safe de token verificado → Principal."""
+
+    def __init__(
+        self,
+        ttl: float = 30,
+        max_size: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            ttl: Segundos que vale una foto del usuario
+            max_size: Máximo de tokens retenidos
+            clock: Reloj monotónico (inyectable en tests)
+            wall_clock: Reloj de pared para comparar con ``exp`` del token
+        """
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor que 0")
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._entries: "OrderedDict[str, Tuple[Principal, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Métricas
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, token: str) -> Optional[Principal]:
+        """
+        Busca el usuario de un token.
+
+        Args:
+            token: JWT tal como llegó en el header Authorization
+
+        Returns:
+            Principal, o None si no está en caché o expiró
+        """
+        key = token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, token: str, principal: Principal, expires_at: Optional[float] = None) -> None:
+        """
+        Guarda el usuario de un token ya verificado.
+
+        Args:
+            token: JWT verificado
+            principal: Foto del usuario
+            expires_at: Claim ``exp`` del token (epoch en segundos), si tiene
+        """
+        if not principal.is_active:
+            return
+
+        ttl = self.ttl
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - self._wall_clock())
+        if ttl <= 0:
+            return
+
+        key = token_key(token)
+        with self._lock:
+            self._entries[key] = (principal, self._clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_token(self, token: str) -> None:
+        """
+        Descarta la entrada de un token (logout).
+
+        Args:
+            token: JWT a descartar
+        """
+        with self._lock:
+            if self._entries.pop(token_key(token), None) is not None:
+                self.invalidations += 1
+
+    def invalidate_user(self, user_id: int) -> int:
+        """
+        Descarta todas las entradas de un usuario.
+
+        Llamar siempre que cambien sus credenciales, is_active o
+        is_superuser. Los UPDATE hechos con el ORM lo hacen solos.
+
+        Args:
+            user_id: Id del usuario
+
+        Returns:
+            Cantidad de entradas descartadas
+        """
+        with self._lock:
+            keys = [key for key, (principal, _) in self._entries.items() if principal.id == user_id]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Descarta todas las entradas."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna el tamaño y los contadores de la caché.
+
+        Returns:
+            Diccionario con size, hits, misses, invalidations y hit_ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def expiration_timestamp(payload: Dict[str, Any]) -> Optional[float]:
+    """
+    Claim ``exp`` de un JWT decodificado, en epoch segundos.
+
+    Args:
+        payload: Payload devuelto por verify_token
+
+    Returns:
+        Epoch en segundos, o None si el token no expira
+    """
+    exp = payload.get("exp")
+    if isinstance(exp, datetime):
+        return exp.timestamp()
+    if isinstance(exp, (int, float)):
+        return float(exp)
+    return None
+
+
+def invalidate_on_user_update(cache: PrincipalCache) -> None:
+    """
+    Descarta las fotos de un usuario cada vez que el ORM actualiza alguno de
+    los campos de PRINCIPAL_FIELDS (desactivación, permisos, credenciales).
+    Otros cambios, como last_login en cada login, no invalidan nada.
+
+    Args:
+        cache: Caché a mantener al día
+    """
+    @event.listens_for(User, "after_update")
+    def _user_updated(mapper, connection, target: User) -> None:
+        state = inspect(target)
+        if any(state.attrs[name].history.has_changes() for name in PRINCIPAL_FIELDS):
+            cache.invalidate_user(target.id)
@@ -0,0 +1,191 @@
+"""
+Caché stale-while-revalidate de la lista de proyectos.
+
+El frontend pide /api/v1/projects en cada carga de página y cada vez se
+recorría /project/search completo en Jira. La caché guarda la lista por
+tenant (usuario + huella de sus credenciales de Jira, token incluido):
+
+- Más joven que ``soft_ttl``: se sirve sin ir a Jira.
+- Entre ``soft_ttl`` y ``hard_ttl``: se sirve igual y se refresca en segundo
+  plano; la respuesta no espera a Jira.
+- Más vieja que ``hard_ttl`` (o sin entrada): se carga antes de responder.
+- ``refresh=True`` fuerza la carga.
+
+Las cargas concurrentes de un mismo tenant comparten una sola llamada, y un
+refresco en segundo plano que falla conserva la entrada anterior hasta que
+vence ``hard_ttl``.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from app.clients.deadline import deadline
+
+logger = logging.getLogger(__name__)
+
+# Cómo se sirvió una lista (header X-Cache)
+HIT = "hit"
+STALE = "stale"
+MISS = "miss"
+REFRESH = "refresh"
+
+
+class ProjectListCache:
+    """Caché stale-while-revalidate por tenant, con cargas compartidas."""
+
+    def __init__(
+        self,
+        soft_ttl: float = 60,
+        hard_ttl: float = 3600,
+        max_size: int = 1000,
+        refresh_timeout: Optional[float] = 30,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            soft_ttl: Segundos en que una lista se sirve sin refrescarla
+            hard_ttl: Segundos tras los cuales una lista ya no se sirve
+                (0 = no cachear)
+            max_size: Máximo de tenants retenidos (LRU)
+            refresh_timeout: Deadline en segundos de un refresco en segundo
+                plano (no hereda el de la petición que lo disparó)
+            clock: Reloj monotónico (inyectable en tests)
+
+        Raises:
+            ValueError: Si soft_ttl supera a hard_ttl o max_size es menor que 1
+        """
+        if hard_ttl and soft_ttl > hard_ttl:
+            raise ValueError("soft_ttl no puede ser mayor que hard_ttl")
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor que 0")
+
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.max_size = max_size
+        self.refresh_timeout = refresh_timeout
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._loads: Dict[Hashable, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+
+        # Métricas
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        if self.hard_ttl > 0:
+            self._entries[key] = (value, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def _start_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Carga compartida: una sola tarea por tenant a la vez."""
+        task = self._loads.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._load(key, loader))
+            self._loads[key] = task
+            task.add_done_callback(lambda _: self._loads.pop(key, None))
+        return task
+
+    async def _revalidate(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        self.refreshes += 1
+        try:
+            with deadline(self.refresh_timeout):
+                await self._start_load(key, loader)
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.warning("No se pudo refrescar la lista de proyectos en segundo plano: %s", e)
+
+    async def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        refresh: bool = False
+    ) -> Tuple[Any, str]:
+        """
+        Retorna la lista de un tenant, cargándola o refrescándola según su edad.
+
+        Args:
+            key: Tenant (ej: sitio y email de Jira)
+            loader: Función async sin argumentos que trae la lista de Jira.
+                Puede ejecutarse en segundo plano después de que termine la
+                petición, así que no debe depender de recursos de la misma.
+            refresh: Ignorar la entrada y cargar de nuevo
+
+        Returns:
+            Tupla (lista, cómo se sirvió: HIT, STALE, MISS o REFRESH)
+
+        Raises:
+            Exception: Lo que lance el loader cuando hay que esperarlo
+        """
+        entry = self._entries.get(key)
+        age = self._clock() - entry[1] if entry is not None else None
+
+        if not refresh and entry is not None and age < self.hard_ttl:
+            self._entries.move_to_end(key)
+            if age < self.soft_ttl:
+                self.hits += 1
+                return entry[0], HIT
+
+            self.stale_hits += 1
+            if key not in self._loads:
+                # Contexto vacío: el refresco no hereda el deadline de esta petición
+                task = asyncio.get_running_loop().create_task(
+                    self._revalidate(key, loader), context=contextvars.Context()
+                )
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+            return entry[0], STALE
+
+        self.misses += 1
+        # shield: si esta petición se cancela, la carga sigue para los demás
+        value = await asyncio.shield(self._start_load(key, loader))
+        return value, REFRESH if refresh else MISS
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Descarta la lista de un tenant, o todas si no se indica.
+
+        Args:
+            key: Tenant a descartar (None = todos)
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def close(self) -> None:
+        """Cancela los refrescos en segundo plano pendientes (al apagar la app)."""
+        tasks = list(self._background) + list(self._loads.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Estado de la caché para el health check.
+
+        Returns:
+            Diccionario con tenants en caché, refrescos en curso y contadores
+        """
+        return {
+            "size": len(self._entries),
+            "loading": len(self._loads),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+        }
@@ -6,7 +6,9 @@ siguiendo el flujo de producción de contenido para Instagram.
 """
 
 from typing import Dict, Any, List, Optional
-from app.clients.jira_client import JiraClient, JiraAPIError
+from app.clients.jira_client import JiraAPIError
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.deadline import expired as deadline_expired
 
 
 class ReelWorkflowService:
@@ -117,16 +119,16 @@ class ReelWorkflowService:
         }
     ]
 
-    def __init__(self, jira_client: JiraClient):
+    def __init__(self, jira_client: AsyncJiraClient):
         """
         Inicializa el servicio de workflow.
 
         Args:
-            jira_client: Instancia del cliente de Jira
+            jira_client: Instancia del cliente asíncrono de Jira
         """
         self.jira_client = jira_client
 
-    def create_reel_workflow(
+    async def create_reel_workflow(
         self,
         project_key: str,
         title: str,
@@ -155,15 +157,22 @@ class ReelWorkflowService:
                 "success": True,
                 "main_task": {...},
                 "subtasks": [...],
-                "total_tasks": 8
+                "failed_subtasks": [],
+                "total_tasks": 7
             }
 
+            Las subtareas se crean en una sola petición a /issue/bulk; si Jira
+            rechaza alguna, las demás se crean igual, "success" es False y
+            "failed_subtasks" detalla las fallidas. Si el deadline de la
+            petición (app.clients.deadline) vence tras crear la tarea
+            principal, las subtareas no se intentan y se reportan como fallidas.
+
         Raises:
-            JiraAPIError: Si falla la creación de algún issue
+            JiraAPIError: Si falla la creación de la tarea principal
 
         Example:
             >>> service = ReelWorkflowService(jira_client)
-            >>> result = service.create_reel_workflow(
+            >>> result = await service.create_reel_workflow(
             ...     project_key="KAN",
             ...     title="Viaje a Cartagena",
             ...     content_type="Reel",
@@ -199,7 +208,13 @@ class ReelWorkflowService:
         )
 
         try:
-            main_task = self.jira_client.create_issue(
+            # Metadatos de creación de las subtareas (de la caché casi siempre):
+            # un proyecto sin tipo de subtarea falla aquí, antes de crear nada
+            subtask_meta = await self.jira_client.get_create_meta(project_key, "Subtask")
+            # La prioridad solo va en las subtareas si su pantalla la tiene
+            subtask_priority = priority if subtask_meta is not None and "priority" in subtask_meta.fields else None
+
+            main_task = await self.jira_client.create_issue(
                 project_key=project_key,
                 summary=main_task_summary,
                 description=main_task_description,
@@ -220,8 +235,9 @@ class ReelWorkflowService:
                     if phase["id"] in subtask_ids
                 ]
 
-            # 3. Crear subtareas para cada fase seleccionada
-            subtasks = []
+            # 3. Construir el payload de cada fase seleccionada
+            summaries = []
+            payloads = []
             for phase in phases_to_create:
                 subtask_summary = self._format_subtask_title(
                     phase['emoji'],
@@ -233,27 +249,52 @@ class ReelWorkflowService:
                 subtask_labels = workflow_labels.copy()
                 subtask_labels.extend(phase["labels"])
 
-                subtask = self._create_subtask(
+                summaries.append(subtask_summary)
+                payloads.append(self._build_subtask_payload(
                     project_key=project_key,
                     parent_key=main_task_key,
                     summary=subtask_summary,
                     description=phase["description"],
-                    priority=priority,
+                    priority=subtask_priority,
                     labels=subtask_labels,
                     assignee=assignee
-                )
+                ))
+
+            # 4. Crear todas las subtareas en una sola petición
+            bulk_result = {"issues": [], "errors": []}
+            if payloads and deadline_expired():
+                # Sin tiempo para más llamadas: no empezar trabajo que no terminará
+                bulk_result["errors"] = [
+                    {"index": index, "message": "Tiempo agotado antes de crear la subtarea"}
+                    for index in range(len(payloads))
+                ]
+            elif payloads:
+                bulk_result = await self.jira_client.create_issues_bulk(payloads)
 
+            subtasks = []
+            for issue in bulk_result["issues"]:
+                phase = phases_to_create[issue["index"]]
                 subtasks.append({
-                    "key": subtask["key"],
-                    "summary": subtask_summary,
+                    "key": issue["key"],
+                    "summary": summaries[issue["index"]],
                     "phase": phase["name"],
                     "emoji": phase["emoji"],
-                    "url": f"{self.jira_client.base_url}/browse/{subtask['key']}"
+                    "url": f"{self.jira_client.base_url}/browse/{issue['key']}"
                 })
 
-            # 4. Construir respuesta
+            failed_subtasks = []
+            for error in bulk_result["errors"]:
+                phase = phases_to_create[error["index"]]
+                failed_subtasks.append({
+                    "summary": summaries[error["index"]],
+                    "phase": phase["name"],
+                    "emoji": phase["emoji"],
+                    "error": error["message"]
+                })
+
+            # 5. Construir respuesta
             return {
-                "success": True,
+                "success": not failed_subtasks,
                 "main_task": {
                     "key": main_task_key,
                     "summary": main_task_summary,
@@ -263,6 +304,7 @@ class ReelWorkflowService:
                     "labels": workflow_labels
                 },
                 "subtasks": subtasks,
+                "failed_subtasks": failed_subtasks,
                 "total_tasks": 1 + len(subtasks)
             }
 
@@ -272,30 +314,31 @@ class ReelWorkflowService:
                 status_code=e.status_code
             )
 
-    def _create_subtask(
+    def _build_subtask_payload(
         self,
         project_key: str,
         parent_key: str,
         summary: str,
         description: str,
-        priority: str,
+        priority: Optional[str],
         labels: List[str],
         assignee: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Crea una subtarea vinculada a una tarea principal.
+        Construye el payload de una subtarea vinculada a una tarea principal.
 
         Args:
             project_key: Clave del proyecto
             parent_key: Key de la tarea padre
             summary: Título de la subtarea
             description: Descripción de la subtarea
-            priority: Prioridad
+            priority: Prioridad (None = sin prioridad, para proyectos cuyas
+                subtareas no tienen el campo)
             labels: Labels
             assignee: Account ID del asignado
 
         Returns:
-            Respuesta de Jira con el issue creado
+            Payload {"fields": {...}} para /issue o /issue/bulk
         """
         # Construir payload con parent
         payload = {
@@ -313,17 +356,10 @@ class ReelWorkflowService:
         if assignee:
             payload["fields"]["assignee"] = {"id": assignee}
 
-        # Nota: Las subtasks en este proyecto no tienen campo priority
-        # Si tu proyecto sí lo soporta, descomenta la siguiente línea:
-        # payload["fields"]["priority"] = {"name": priority}
-
-        response = self.jira_client._make_request(
-            method="POST",
-            endpoint="/issue",
-            data=payload
-        )
+        if priority:
+            payload["fields"]["priority"] = {"name": priority}
 
-        return response
+        return payload
 
     def _generate_main_task_description(
         self,
@@ -423,7 +459,7 @@ class ReelWorkflowService:
 
         return f"{emoji} {phase_name} – {title_clean}"
 
-    def get_workflow_status(self, main_task_key: str) -> Dict[str, Any]:
+    async def get_workflow_status(self, main_task_key: str) -> Dict[str, Any]:
         """
         Obtiene el estado de un workflow y sus subtareas.
 
@@ -434,7 +470,7 @@ class ReelWorkflowService:
             Diccionario con el estado del workflow
 
         Example:
-            >>> service.get_workflow_status("KAN-123")
+            >>> await service.get_workflow_status("KAN-123")
             {
                 "main_task": {...},
                 "subtasks": [...],
@@ -447,7 +483,7 @@ class ReelWorkflowService:
         """
         try:
             # Obtener tarea principal
-            main_task = self.jira_client.get_issue(main_task_key)
+            main_task = await self.jira_client.get_issue(main_task_key)
 
             # Obtener subtareas
             subtasks_data = main_task.get("fields", {}).get("subtasks", [])
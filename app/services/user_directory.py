@@ -0,0 +1,445 @@
+"""
+Directorio local de usuarios asignables por proyecto.
+
+El parser entrega el assignee tal como aparece en el texto ("santiago",
+"Maria Jose", "andres.rodriguez"), y /user/search de Jira no siempre
+devuelve primero al usuario correcto. El directorio guarda en memoria los
+usuarios de /user/assignable/search de cada proyecto y resuelve el nombre
+localmente, sin ir a Jira:
+
+1. Nombre completo exacto
+2. Prefijo del email ("andres.rodriguez" o "andres")
+3. Primer nombre, o cualquier otra palabra del nombre (apellido), si es único
+4. Inicio del nombre completo ("maria jose" → "María José Gómez")
+5. Distancia de edición contra primeros nombres y nombres completos
+   ("santigo" → "Santiago"), si hay un único candidato más cercano
+
+Todas las comparaciones ignoran tildes, mayúsculas y espacios sobrantes.
+Si el nombre es ambiguo o no aparece, resolve() retorna None y el llamador
+puede recurrir a /user/search (ver resolve_assignee).
+
+El directorio de un proyecto se sincroniza la primera vez que se usa y de
+nuevo cuando pasan ``refresh_interval`` segundos. Si el llamador pasa un
+``lease`` (un cliente propio, ej: lease_user_async_jira_client), la
+sincronización corre en segundo plano y la petición no la espera: un
+directorio vencido se sigue usando mientras se refresca, y uno que aún no
+existe deja el nombre sin resolver (resolve_assignee cae a /user/search).
+Se retienen los ``max_projects`` proyectos usados más recientemente.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from typing import (
+    Any, AsyncContextManager, Callable, Dict, Iterable, List, Optional, Set, Tuple
+)
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.deadline import deadline
+from app.clients.jira_client import JiraAPIError
+
+logger = logging.getLogger(__name__)
+
+# Cómo se resolvió un nombre (para métricas)
+EXACT = "exact"
+EMAIL = "email"
+WORD = "word"
+PREFIX = "prefix"
+FUZZY = "fuzzy"
+AMBIGUOUS = "ambiguous"
+NOT_FOUND = "not_found"
+
+# Presta un cliente de Jira propio para sincronizar en segundo plano
+ClientLease = Callable[[], AsyncContextManager[AsyncJiraClient]]
+
+
+def fold(text: str) -> str:
+    """
+    Normaliza un texto para comparar nombres.
+
+    Args:
+        text: Nombre o email (ej: " María  José ")
+
+    Returns:
+        Texto sin tildes, en minúsculas y con un espacio entre palabras
+        (ej: "maria jose")
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Distancia de edición (inserción, borrado, sustitución o transposición).
+
+    Args:
+        a: Primer texto
+        b: Segundo texto
+        limit: Distancia máxima de interés
+
+    Returns:
+        Distancia, o limit + 1 si la supera
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+def _email_prefix(email: Optional[str]) -> Optional[str]:
+    if not email or "@" not in email:
+        return None
+    return fold(email.split("@", 1)[0])
+
+
+class ProjectUsers:
+    """Índices en memoria de los usuarios asignables de un proyecto."""
+
+    def __init__(self, users: Iterable[Dict[str, Any]], max_distance: int = 2):
+        """
+        Construye los índices.
+
+        Args:
+            users: Usuarios como los retorna /user/assignable/search
+            max_distance: Distancia de edición máxima para la búsqueda difusa
+        """
+        self.max_distance = max_distance
+        self.full_names: Dict[str, Set[str]] = defaultdict(set)
+        self.words: Dict[str, Set[str]] = defaultdict(set)
+        self.first_names: Dict[str, Set[str]] = defaultdict(set)
+        self.emails: Dict[str, Set[str]] = defaultdict(set)
+        self.count = 0
+
+        for user in users:
+            account_id = user.get("accountId")
+            if not account_id or not user.get("active", True):
+                continue
+            self.count += 1
+            name = fold(user.get("displayName") or "")
+            if name:
+                self.full_names[name].add(account_id)
+                tokens = name.split()
+                self.first_names[tokens[0]].add(account_id)
+                for token in tokens:
+                    self.words[token].add(account_id)
+            prefix = _email_prefix(user.get("emailAddress"))
+            if prefix:
+                self.emails[prefix].add(account_id)
+                # "andres.rodriguez" también se encuentra como "andres rodriguez"
+                spaced = " ".join(prefix.replace(".", " ").replace("_", " ").replace("-", " ").split())
+                if spaced != prefix:
+                    self.emails[spaced].add(account_id)
+
+    def resolve(self, name: str) -> Tuple[Optional[str], str]:
+        """
+        Resuelve un nombre a un accountId.
+
+        Args:
+            name: Nombre como lo extrajo el parser
+
+        Returns:
+            Tupla (accountId o None, cómo se resolvió: EXACT, EMAIL, WORD,
+            PREFIX, FUZZY, AMBIGUOUS o NOT_FOUND)
+        """
+        query = fold(name)
+        if not query:
+            return None, NOT_FOUND
+
+        ambiguous = False
+        for index, kind in ((self.full_names, EXACT), (self.emails, EMAIL), (self.words, WORD)):
+            matches = index.get(query)
+            if matches:
+                if len(matches) == 1:
+                    return next(iter(matches)), kind
+                ambiguous = True
+
+        # "maria jose" → "maria jose gomez"
+        prefixed = {
+            account_id
+            for full_name, ids in self.full_names.items()
+            if full_name.startswith(query + " ")
+            for account_id in ids
+        }
+        if len(prefixed) == 1:
+            return next(iter(prefixed)), PREFIX
+        if prefixed or ambiguous:
+            return None, AMBIGUOUS
+
+        return self._fuzzy(query)
+
+    def _fuzzy(self, query: str) -> Tuple[Optional[str], str]:
+        # Nombres cortos toleran menos errores ("ana" no debe ser "luz")
+        limit = min(self.max_distance, max(0, (len(query) - 2) // 3))
+        if limit == 0:
+            return None, NOT_FOUND
+
+        best = limit + 1
+        candidates: Set[str] = set()
+        index = self.full_names if " " in query else self.first_names
+        for candidate, ids in index.items():
+            distance = edit_distance(query, candidate, limit)
+            if distance < best:
+                best, candidates = distance, set(ids)
+            elif distance == best and distance <= limit:
+                candidates |= ids
+
+        if best > limit:
+            return None, NOT_FOUND
+        if len(candidates) > 1:
+            return None, AMBIGUOUS
+        return next(iter(candidates)), FUZZY
+
+
+class UserDirectory:
+    """Directorios de usuarios por (sitio, proyecto), compartidos por el proceso."""
+
+    def __init__(
+        self,
+        refresh_interval: float = 900,
+        max_distance: int = 2,
+        page_size: int = 1000,
+        max_projects: int = 1000,
+        refresh_timeout: Optional[float] = 30,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa el directorio.
+
+        Args:
+            refresh_interval: Segundos entre sincronizaciones de un proyecto
+            max_distance: Distancia de edición máxima de la búsqueda difusa
+            page_size: Usuarios por página al sincronizar
+            max_projects: Máximo de proyectos retenidos (LRU)
+            refresh_timeout: Deadline en segundos de una sincronización en
+                segundo plano (no hereda el de la petición que la disparó)
+            clock: Reloj monotónico (inyectable en tests)
+
+        Raises:
+            ValueError: Si max_projects es menor que 1
+        """
+        if max_projects < 1:
+            raise ValueError("max_projects debe ser mayor que 0")
+
+        self.refresh_interval = refresh_interval
+        self.max_distance = max_distance
+        self.page_size = page_size
+        self.max_projects = max_projects
+        self.refresh_timeout = refresh_timeout
+        self._clock = clock
+        self._projects: "OrderedDict[Tuple[str, str], Tuple[ProjectUsers, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        # Métricas
+        self.syncs = 0
+        self.sync_errors = 0
+        self.resolutions: Dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def _key(base_url: str, project_key: str) -> Tuple[str, str]:
+        return base_url.rstrip("/").lower(), project_key.upper()
+
+    def load(self, base_url: str, project_key: str, users: Iterable[Dict[str, Any]]) -> ProjectUsers:
+        """
+        Reemplaza el directorio de un proyecto con una lista de usuarios.
+
+        Args:
+            base_url: URL base del sitio de Jira
+            project_key: Clave del proyecto
+            users: Usuarios asignables (formato de la API de Jira)
+
+        Returns:
+            Índices construidos
+        """
+        directory = ProjectUsers(users, self.max_distance)
+        key = self._key(base_url, project_key)
+        with self._lock:
+            self._projects[key] = (directory, self._clock())
+            self._projects.move_to_end(key)
+            while len(self._projects) > self.max_projects:
+                self._projects.popitem(last=False)
+        return directory
+
+    def _lookup(self, key: Tuple[str, str]) -> Tuple[Optional[ProjectUsers], bool]:
+        """Directorio de un proyecto (aunque haya vencido) y si sigue vigente."""
+        with self._lock:
+            entry = self._projects.get(key)
+            if entry is None:
+                return None, False
+            self._projects.move_to_end(key)
+        return entry[0], self._clock() - entry[1] < self.refresh_interval
+
+    def get(self, base_url: str, project_key: str) -> Optional[ProjectUsers]:
+        """Directorio vigente de un proyecto, o None si falta o venció."""
+        directory, fresh = self._lookup(self._key(base_url, project_key))
+        return directory if fresh else None
+
+    async def sync(self, jira_client: AsyncJiraClient, project_key: str) -> ProjectUsers:
+        """
+        Descarga los usuarios asignables de un proyecto.
+
+        Args:
+            jira_client: Cliente con credenciales del sitio
+            project_key: Clave del proyecto
+
+        Returns:
+            Índices construidos
+
+        Raises:
+            JiraAPIError: Si Jira falla
+        """
+        users = []
+        async for user in jira_client.paginate(
+            "/user/assignable/search",
+            params={"project": project_key},
+            page_size=self.page_size
+        ):
+            users.append(user)
+        self.syncs += 1
+        return self.load(jira_client.base_url, project_key, users)
+
+    async def _refresh(self, project_key: str, lease: ClientLease) -> None:
+        try:
+            with deadline(self.refresh_timeout):
+                async with lease() as jira_client:
+                    await self.sync(jira_client, project_key)
+        except Exception as e:
+            self.sync_errors += 1
+            logger.warning("No se pudo sincronizar el directorio de %s en segundo plano: %s", project_key, e)
+
+    def _refresh_in_background(self, key: Tuple[str, str], project_key: str, lease: ClientLease) -> None:
+        """Una sola sincronización en segundo plano por proyecto a la vez."""
+        if key in self._refreshing:
+            return
+        # Contexto vacío: la sincronización no hereda el deadline de esta petición
+        task = asyncio.get_running_loop().create_task(
+            self._refresh(project_key, lease), context=contextvars.Context()
+        )
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def resolve(
+        self,
+        jira_client: AsyncJiraClient,
+        name: str,
+        project_key: str,
+        lease: Optional[ClientLease] = None
+    ) -> Optional[str]:
+        """
+        Resuelve un nombre con el directorio del proyecto, sincronizándolo si hace falta.
+
+        Args:
+            jira_client: Cliente con credenciales del sitio
+            name: Nombre como lo extrajo el parser
+            project_key: Clave del proyecto
+            lease: Presta un cliente propio para sincronizar en segundo plano
+                (ej: ``lambda: lease_user_async_jira_client(user)``). Sin él
+                la sincronización se espera aquí con jira_client, lo que
+                solo conviene fuera del camino de una petición (ej: outbox)
+
+        Returns:
+            accountId, o None si el nombre es ambiguo, no aparece, el
+            directorio no se pudo sincronizar o se está cargando
+        """
+        key = self._key(jira_client.base_url, project_key)
+        directory, fresh = self._lookup(key)
+        if not fresh:
+            if lease is not None:
+                self._refresh_in_background(key, project_key, lease)
+            else:
+                try:
+                    directory = await self.sync(jira_client, project_key)
+                except JiraAPIError as e:
+                    self.sync_errors += 1
+                    logger.warning("No se pudo sincronizar el directorio de %s: %s", project_key, e)
+        if directory is None:
+            return None
+
+        account_id, kind = directory.resolve(name)
+        self.resolutions[kind] += 1
+        return account_id
+
+    def invalidate(self, base_url: Optional[str] = None, project_key: Optional[str] = None) -> None:
+        """
+        Descarta el directorio de un proyecto, o todos si no se indica.
+
+        Args:
+            base_url: URL base del sitio
+            project_key: Clave del proyecto
+        """
+        with self._lock:
+            if base_url is None or project_key is None:
+                self._projects.clear()
+            else:
+                self._projects.pop(self._key(base_url, project_key), None)
+
+    async def close(self) -> None:
+        """Cancela las sincronizaciones en segundo plano pendientes (al apagar la app)."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Estado del directorio para el health check.
+
+        Returns:
+            Diccionario con proyectos y usuarios en memoria, sincronizaciones
+            (y las que corren en segundo plano) y resoluciones por tipo
+        """
+        with self._lock:
+            projects = list(self._projects.values())
+        return {
+            "projects": len(projects),
+            "users": sum(directory.count for directory, _ in projects),
+            "refreshing": len(self._refreshing),
+            "syncs": self.syncs,
+            "sync_errors": self.sync_errors,
+            "resolutions": dict(self.resolutions),
+        }
+
+
+async def resolve_assignee(
+    jira_client: AsyncJiraClient,
+    name: str,
+    project_key: str,
+    directory: Optional[UserDirectory] = None,
+    lease: Optional[ClientLease] = None
+) -> Optional[str]:
+    """
+    Account ID del assignee: primero el directorio local, luego /user/search.
+
+    Args:
+        jira_client: Cliente con credenciales del usuario
+        name: Nombre como lo extrajo el parser
+        project_key: Clave del proyecto
+        directory: Directorio de usuarios (None = solo /user/search)
+        lease: Cliente propio para sincronizar el directorio en segundo
+            plano (ver UserDirectory.resolve)
+
+    Returns:
+        accountId o None si no se encuentra
+    """
+    if directory is not None:
+        account_id = await directory.resolve(jira_client, name, project_key, lease)
+        if account_id is not None:
+            return account_id
+    return await jira_client.get_user_account_id(name, project_key)
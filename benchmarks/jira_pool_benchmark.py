@@ -0,0 +1,78 @@
+"""
+Benchmark: latencia por petición con y sin conexiones keep-alive.
+
+Compara JiraClient con keep-alive (pool de conexiones reutilizadas) contra
+JiraClient enviando "Connection: close" (un handshake TCP nuevo por petición)
+contra un servidor stub local.
+
+En local solo se mide el coste del handshake TCP; contra *.atlassian.net
+cada conexión nueva además paga el handshake TLS y la latencia de red, por
+lo que la diferencia real es bastante mayor.
+
+Uso:
+    python benchmarks/jira_pool_benchmark.py [--requests 500]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.clients.jira_client import JiraClient, JiraClientConfig
+from benchmarks.stub_server import start_stub_server
+
+
+def run(base_url: str, keep_alive: bool, total: int) -> list:
+    """
+    Ejecuta `total` peticiones GET /myself y retorna las latencias en ms.
+    """
+    # Sin rate limiter para medir solo el coste de las conexiones
+    config = JiraClientConfig(keep_alive=keep_alive, rate_limit_per_minute=0)
+    latencies = []
+
+    with JiraClient(base_url=base_url, email="bench@example.com", api_token="x", config=config) as client:
+        for _ in range(total):
+            start = time.perf_counter()
+            client.get_current_user()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+def report(label: str, latencies: list) -> None:
+    """Imprime un resumen de latencias."""
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<22} mean={statistics.mean(latencies):7.3f} ms  "
+        f"p50={statistics.median(latencies):7.3f} ms  p95={p95:7.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500, help="Peticiones por escenario")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server()
+    try:
+        # Calentamiento para que el servidor y el intérprete estén listos
+        run(base_url, keep_alive=True, total=20)
+
+        fresh = run(base_url, keep_alive=False, total=args.requests)
+        pooled = run(base_url, keep_alive=True, total=args.requests)
+    finally:
+        server.shutdown()
+
+    print(f"{args.requests} peticiones GET /myself contra {base_url}")
+    report("conexión nueva", fresh)
+    report("pool keep-alive", pooled)
+    saved = statistics.mean(fresh) - statistics.mean(pooled)
+    print(f"ahorro por petición: {saved:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,783 @@
+"""
+Simulador local de Jira Cloud (REST API v3) para pruebas de carga y
+desarrollo sin conexión.
+
+A diferencia de ``stub_server`` (que responde siempre lo mismo), el
+simulador guarda estado en memoria: proyectos, usuarios e issues creados,
+con keys consecutivas por proyecto. Cubre los endpoints que usa la app:
+
+- ``POST /issue``, ``POST /issue/bulk``, ``GET /issue/{key}``
+- ``GET /project``, ``GET /project/search``, ``GET /project/{key}``
+- ``GET /user/search``, ``GET /user/assignable/search``
+- ``GET /issue/createmeta/{key}/issuetypes[/{id}]``
+- ``GET /myself``
+- ``GET|POST /search/jql`` (paginado por token) y ``GET|POST /search``
+
+Y permite inyectar los problemas de un sitio real (``SimulatorConfig``):
+latencia con jitter, rate limiting con 429 + Retry-After y headers
+X-RateLimit-*, y fallos aleatorios (5xx). Como en el stub, se pueden
+encolar respuestas puntuales en ``simulator.script`` y revisar lo recibido
+en ``simulator.received``.
+
+Uso en tests o benchmarks:
+    >>> with JiraSimulator(SimulatorConfig(latency_ms=50)) as jira:
+    ...     client = JiraClient(base_url=jira.base_url, email="a@b.c", api_token="x")
+
+Uso standalone (luego JIRA_BASE_URL=http://127.0.0.1:8081):
+    python -m benchmarks.jira_simulator --port 8081 --latency-ms 150 --rate-limit 300
+"""
+
+import argparse
+import gzip
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Pattern, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = "/rest/api/3"
+
+# Tipos de issue y prioridades de un proyecto por defecto de Jira Cloud
+DEFAULT_ISSUE_TYPES = ("Task", "Story", "Bug", "Epic", "Subtask")
+PRIORITIES = ("Highest", "High", "Medium", "Low", "Lowest")
+
+# Respuesta del simulador: (status, headers, body JSON o None)
+Response = Tuple[int, Dict[str, str], Any]
+
+
+@dataclass
+class SimulatorConfig:
+    """Problemas a inyectar en las respuestas del simulador."""
+
+    # Latencia añadida a cada respuesta (ms), más un jitter uniforme
+    latency_ms: float = 0
+    latency_jitter_ms: float = 0
+    # Peticiones por minuto antes de responder 429 (0 = sin límite) y ráfaga
+    rate_limit_per_minute: int = 0
+    rate_limit_burst: int = 10
+    # Probabilidad de responder con un status de failure_statuses
+    failure_rate: float = 0.0
+    failure_statuses: Sequence[int] = (500, 502, 503)
+    # Semilla para que la latencia y los fallos sean reproducibles
+    seed: Optional[int] = None
+
+
+@dataclass
+class SimulatedProject:
+    """Proyecto del simulador."""
+
+    id: str
+    key: str
+    name: str
+    issue_types: Sequence[str] = DEFAULT_ISSUE_TYPES
+    # Campos que no están en la pantalla de creación (Jira los rechaza)
+    hidden_fields: Sequence[str] = ()
+    # Igual, pero solo en los tipos de subtarea (ej: priority)
+    subtask_hidden_fields: Sequence[str] = ()
+    # Campos extra obligatorios al crear (ej: duedate)
+    required_fields: Sequence[str] = ()
+    members: List[str] = field(default_factory=list)
+    next_number: int = 1
+
+
+class JiraSimulator:
+    """Servidor HTTP con el estado y las reglas de un sitio de Jira."""
+
+    def __init__(
+        self,
+        config: Optional[SimulatorConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed_data: bool = True
+    ):
+        """
+        Inicializa el simulador (sin arrancarlo; ver start()).
+
+        Args:
+            config: Latencia, rate limit y fallos a inyectar
+            host: Interfaz de escucha
+            port: Puerto (0 = puerto libre aleatorio)
+            seed_data: Crear el proyecto KAN con algunos usuarios
+        """
+        self.config = config or SimulatorConfig()
+        self.host = host
+        self.port = port
+
+        self.projects: Dict[str, SimulatedProject] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.myself: Optional[Dict[str, Any]] = None
+
+        # Respuestas forzadas y registro de peticiones, como en stub_server
+        self.script: Deque[Response] = deque()
+        self.received: List[Tuple[str, str, Any]] = []
+
+        # Métricas
+        self.request_count = 0
+        self.throttled = 0
+        self.injected_failures = 0
+
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._ids = itertools.count(10000)
+        self._tokens = float(self.config.rate_limit_burst)
+        self._refilled_at = time.monotonic()
+        self._server: Optional[_SimulatorServer] = None
+
+        if seed_data:
+            self.add_project("KAN", "Contenido Instagram")
+            self.myself = self.add_user("Santiago Pérez", "santiago@example.com", projects=["KAN"])
+            self.add_user("María José Gómez", "maria@example.com", projects=["KAN"])
+            self.add_user("Andrés Rodríguez", "andres@example.com", projects=["KAN"])
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    @property
+    def base_url(self) -> str:
+        """URL base del sitio (equivalente a https://empresa.atlassian.net)."""
+        if self._server is None:
+            raise RuntimeError("El simulador no está arrancado")
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def start(self) -> str:
+        """
+        Arranca el servidor en un hilo daemon.
+
+        Returns:
+            base_url del simulador
+        """
+        self._server = _SimulatorServer((self.host, self.port), self)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def stop(self) -> None:
+        """Detiene el servidor."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "JiraSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Datos
+    # ------------------------------------------------------------------
+
+    def add_project(
+        self,
+        key: str,
+        name: str,
+        issue_types: Sequence[str] = DEFAULT_ISSUE_TYPES,
+        hidden_fields: Sequence[str] = (),
+        subtask_hidden_fields: Sequence[str] = (),
+        required_fields: Sequence[str] = ()
+    ) -> SimulatedProject:
+        """
+        Agrega un proyecto.
+
+        Args:
+            key: Clave del proyecto (ej: "KAN")
+            name: Nombre visible
+            issue_types: Tipos de issue disponibles (ej: con "Sub-task" en
+                lugar de "Subtask" para simular un sitio antiguo)
+            hidden_fields: Campos fuera de la pantalla de creación
+                (ej: ["priority"])
+            subtask_hidden_fields: Campos fuera de la pantalla de creación
+                de las subtareas
+            required_fields: Campos extra obligatorios (ej: ["duedate"])
+
+        Returns:
+            Proyecto creado
+        """
+        with self._lock:
+            project = SimulatedProject(
+                id=str(next(self._ids)),
+                key=key.upper(),
+                name=name,
+                issue_types=tuple(issue_types),
+                hidden_fields=tuple(hidden_fields),
+                subtask_hidden_fields=tuple(subtask_hidden_fields),
+                required_fields=tuple(required_fields)
+            )
+            self.projects[project.key] = project
+            return project
+
+    def add_user(self, display_name: str, email: str, projects: Sequence[str] = ()) -> Dict[str, Any]:
+        """
+        Agrega un usuario activo.
+
+        Args:
+            display_name: Nombre visible
+            email: Email del usuario
+            projects: Keys de los proyectos donde es asignable
+
+        Returns:
+            Usuario con el formato de la API de Jira
+        """
+        with self._lock:
+            account_id = f"5b10a2844c20165700ede{next(self._ids):05d}"
+            user = {
+                "accountId": account_id,
+                "accountType": "atlassian",
+                "emailAddress": email,
+                "displayName": display_name,
+                "active": True,
+                "timeZone": "America/Bogota",
+                "locale": "es_ES",
+            }
+            self.users[account_id] = user
+            for key in projects:
+                self.projects[key.upper()].members.append(account_id)
+            return user
+
+    # ------------------------------------------------------------------
+    # Inyección de problemas
+    # ------------------------------------------------------------------
+
+    def _take_token(self) -> Optional[float]:
+        """Consume un token del rate limit; retorna los segundos a esperar si no hay."""
+        rate = self.config.rate_limit_per_minute / 60.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.config.rate_limit_burst),
+                self._tokens + (now - self._refilled_at) * rate
+            )
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            self.throttled += 1
+            return (1 - self._tokens) / rate
+
+    def _rate_limit_headers(self) -> Dict[str, str]:
+        limit = self.config.rate_limit_burst
+        remaining = int(self._tokens)
+        headers = {"X-RateLimit-Limit": str(limit), "X-RateLimit-Remaining": str(remaining)}
+        if remaining < limit * 0.2:
+            headers["X-RateLimit-NearLimit"] = "true"
+        return headers
+
+    def _inject(self) -> Optional[Response]:
+        """Respuesta forzada (script, 429 o fallo aleatorio), si corresponde."""
+        if self.script:
+            try:
+                return self.script.popleft()
+            except IndexError:
+                pass
+
+        if self.config.rate_limit_per_minute > 0:
+            wait = self._take_token()
+            if wait is not None:
+                headers = self._rate_limit_headers()
+                headers["Retry-After"] = str(max(1, math.ceil(wait)))
+                return 429, headers, {"errorMessages": ["Rate limit exceeded."]}
+
+        if self.config.failure_rate > 0:
+            status: Optional[int] = None
+            with self._lock:
+                if self._random.random() < self.config.failure_rate:
+                    status = self._random.choice(list(self.config.failure_statuses))
+            if status is not None:
+                self.injected_failures += 1
+                return status, {}, {"errorMessages": [f"Fallo simulado ({status})"]}
+
+        return None
+
+    def _latency(self) -> float:
+        """Segundos de latencia para la próxima respuesta."""
+        if not self.config.latency_ms and not self.config.latency_jitter_ms:
+            return 0.0
+        with self._lock:
+            jitter = self._random.uniform(0, self.config.latency_jitter_ms)
+        return (self.config.latency_ms + jitter) / 1000
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def handle(self, method: str, path: str, body: Any, authorized: bool) -> Response:
+        """
+        Atiende una petición.
+
+        Args:
+            method: Método HTTP
+            path: Path con query string (ej: /rest/api/3/issue/KAN-1)
+            body: Body JSON ya parseado (o None)
+            authorized: Si la petición trae header Authorization
+
+        Returns:
+            Tupla (status, headers, body)
+        """
+        with self._lock:
+            self.request_count += 1
+            self.received.append((method, path, body))
+
+        delay = self._latency()
+        if delay:
+            time.sleep(delay)
+
+        injected = self._inject()
+        if injected is not None:
+            return injected
+
+        if not authorized:
+            return 401, {}, {"errorMessages": ["Client must be authenticated to access this resource."]}
+
+        url = urlsplit(path)
+        if not url.path.startswith(API_PREFIX):
+            return 404, {}, {"errorMessages": ["Not found"]}
+        route = url.path[len(API_PREFIX):].rstrip("/")
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        for route_method, pattern, handler in _ROUTES:
+            if route_method != method and not (route_method == "*" and method in ("GET", "POST")):
+                continue
+            match = pattern.fullmatch(route)
+            if match:
+                if method == "POST" and isinstance(body, dict):
+                    # Las búsquedas por POST llevan los parámetros en el body
+                    query = {**query, **{k: v for k, v in body.items() if not isinstance(v, (dict, list))}}
+                status, payload = handler(self, *match.groups(), query=query, body=body)
+                headers = self._rate_limit_headers() if self.config.rate_limit_per_minute > 0 else {}
+                return status, headers, payload
+
+        return 404, {}, {"errorMessages": [f"No existe el recurso {route}"]}
+
+    def _issue_url(self, issue: Dict[str, Any]) -> str:
+        return f"{self.base_url}{API_PREFIX}/issue/{issue['id']}"
+
+    def _validate_fields(self, fields: Dict[str, Any]) -> Tuple[Optional[SimulatedProject], Dict[str, str]]:
+        """Valida los campos de un issue nuevo como lo hace Jira."""
+        errors: Dict[str, str] = {}
+
+        project_ref = fields.get("project") or {}
+        project = self.projects.get(str(project_ref.get("key", "")).upper())
+        if project is None:
+            project = next((p for p in self.projects.values() if p.id == str(project_ref.get("id"))), None)
+        if project is None:
+            return None, {"project": "Specify a valid project ID or key"}
+
+        issue_type = (fields.get("issuetype") or {}).get("name")
+        hidden = self._hidden_fields(project, issue_type)
+        for name in fields:
+            if name in hidden:
+                errors[name] = (
+                    f"Field '{name}' cannot be set. It is not on the appropriate screen, or unknown."
+                )
+        for name in project.required_fields:
+            if not fields.get(name):
+                errors[name] = f"{name} is required."
+
+        summary = fields.get("summary")
+        if not summary:
+            errors["summary"] = "You must specify a summary of the issue."
+        elif len(summary) > 255:
+            errors["summary"] = "Summary must be less than 255 characters."
+
+        if issue_type not in project.issue_types:
+            errors["issuetype"] = "Specify an issue type"
+        elif issue_type is not None and _is_subtask(issue_type):
+            parent = self.issues.get(str((fields.get("parent") or {}).get("key", "")).upper())
+            if parent is None:
+                errors["parent"] = "Given parent work item does not belong to appropriate hierarchy."
+
+        priority = (fields.get("priority") or {}).get("name")
+        if "priority" in fields and "priority" not in errors and priority not in PRIORITIES:
+            errors["priority"] = f"Specify a valid priority. '{priority}' is not valid."
+
+        assignee = (fields.get("assignee") or {}).get("id") or (fields.get("assignee") or {}).get("accountId")
+        if assignee and assignee not in self.users:
+            errors["assignee"] = f"User '{assignee}' does not exist."
+
+        return project, errors
+
+    @staticmethod
+    def _hidden_fields(project: SimulatedProject, issue_type: Optional[str]) -> Sequence[str]:
+        if issue_type and _is_subtask(issue_type):
+            return tuple(project.hidden_fields) + tuple(project.subtask_hidden_fields)
+        return project.hidden_fields
+
+    def _create(self, fields: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        """Crea un issue; retorna (issue, errores de campo)."""
+        with self._lock:
+            project, errors = self._validate_fields(fields)
+            if project is None or errors:
+                return None, errors
+
+            issue_id = str(next(self._ids))
+            key = f"{project.key}-{project.next_number}"
+            project.next_number += 1
+            issue = {
+                "id": issue_id,
+                "key": key,
+                "fields": dict(fields),
+                "created": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            }
+            self.issues[key] = issue
+            return issue, {}
+
+    def _created_ref(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        return {"id": issue["id"], "key": issue["key"], "self": self._issue_url(issue)}
+
+    def _issue_view(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Issue con el formato de GET /issue/{key}."""
+        fields = dict(issue["fields"])
+        project = self.projects[issue["key"].rsplit("-", 1)[0]]
+        fields["project"] = {"id": project.id, "key": project.key, "name": project.name}
+        fields["status"] = {"name": "To Do", "statusCategory": {"key": "new"}}
+        fields["created"] = issue["created"]
+        assignee = (fields.get("assignee") or {}).get("id")
+        fields["assignee"] = self.users.get(assignee) if assignee else None
+        if "parent" in fields:
+            fields["parent"] = {"key": fields["parent"].get("key")}
+        fields["subtasks"] = [
+            {"id": other["id"], "key": other["key"], "fields": {"summary": other["fields"].get("summary")}}
+            for other in self.issues.values()
+            if (other["fields"].get("parent") or {}).get("key") == issue["key"]
+        ]
+        return {**self._created_ref(issue), "fields": fields}
+
+    def _create_issue(self, query, body) -> Tuple[int, Any]:
+        issue, errors = self._create((body or {}).get("fields") or {})
+        if issue is None:
+            return 400, {"errorMessages": [], "errors": errors}
+        return 201, self._created_ref(issue)
+
+    def _create_bulk(self, query, body) -> Tuple[int, Any]:
+        updates = (body or {}).get("issueUpdates") or []
+        if len(updates) > 50:
+            return 400, {"errorMessages": ["Can't create more than 50 issues in one request."]}
+
+        created, failed = [], []
+        for position, update in enumerate(updates):
+            issue, errors = self._create(update.get("fields") or {})
+            if issue is None:
+                failed.append({
+                    "status": 400,
+                    "elementErrors": {"errorMessages": [], "errors": errors},
+                    "failedElementNumber": position,
+                })
+            else:
+                created.append(self._created_ref(issue))
+
+        status = 201 if created or not failed else 400
+        return status, {"issues": created, "errors": failed}
+
+    def _get_issue(self, key, query, body) -> Tuple[int, Any]:
+        with self._lock:
+            issue = self.issues.get(key.upper())
+            if issue is None:
+                issue = next((i for i in self.issues.values() if i["id"] == key), None)
+            if issue is None:
+                return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+            return 200, self._issue_view(issue)
+
+    def _project_view(self, project: SimulatedProject) -> Dict[str, Any]:
+        return {
+            "id": project.id,
+            "key": project.key,
+            "name": project.name,
+            "projectTypeKey": "software",
+            "self": f"{self.base_url}{API_PREFIX}/project/{project.id}",
+            "issueTypes": [self._issue_type_view(project, name) for name in project.issue_types],
+        }
+
+    @staticmethod
+    def _issue_type_view(project: SimulatedProject, name: str) -> Dict[str, Any]:
+        return {
+            "id": str(10001 + list(project.issue_types).index(name)),
+            "name": name,
+            "subtask": _is_subtask(name),
+        }
+
+    def _createmeta_issue_types(self, key, query, body) -> Tuple[int, Any]:
+        project = self.projects.get(key.upper())
+        if project is None:
+            return 404, {"errorMessages": [f"No project could be found with key '{key}'."]}
+        issue_types = [self._issue_type_view(project, name) for name in project.issue_types]
+        page = _offset_page(issue_types, query, default_size=50, items_key="issueTypes")
+        page.pop("isLast")
+        return 200, page
+
+    def _createmeta_fields(self, key, issue_type_id, query, body) -> Tuple[int, Any]:
+        project = self.projects.get(key.upper())
+        if project is None:
+            return 404, {"errorMessages": [f"No project could be found with key '{key}'."]}
+        issue_type = next(
+            (name for name in project.issue_types
+             if self._issue_type_view(project, name)["id"] == issue_type_id),
+            None
+        )
+        if issue_type is None:
+            return 404, {"errorMessages": ["Issue type with given ID does not exist."]}
+
+        # (id, nombre, requerido, valor por defecto, valores permitidos)
+        fields = [
+            ("summary", "Summary", True, False, None),
+            ("issuetype", "Issue Type", True, False, None),
+            ("project", "Project", True, False, None),
+            ("description", "Description", False, False, None),
+            ("labels", "Labels", False, False, None),
+            ("assignee", "Assignee", False, False, None),
+            ("reporter", "Reporter", True, True, None),
+            ("priority", "Priority", False, True, PRIORITIES),
+        ]
+        if _is_subtask(issue_type):
+            fields.append(("parent", "Parent", True, False, None))
+        fields.extend((name, name, True, False, None) for name in project.required_fields)
+
+        hidden = self._hidden_fields(project, issue_type)
+        views = [
+            {
+                "fieldId": field_id,
+                "key": field_id,
+                "name": name,
+                "required": required,
+                "hasDefaultValue": has_default,
+                **({"allowedValues": [{"name": value} for value in allowed]} if allowed else {}),
+            }
+            for field_id, name, required, has_default, allowed in fields
+            if field_id not in hidden
+        ]
+        page = _offset_page(views, query, default_size=50, items_key="fields")
+        page.pop("isLast")
+        return 200, page
+
+    def _list_projects(self, query, body) -> Tuple[int, Any]:
+        return 200, [self._project_view(p) for p in self.projects.values()]
+
+    def _search_projects(self, query, body) -> Tuple[int, Any]:
+        projects = [self._project_view(p) for p in self.projects.values()]
+        return 200, _offset_page(projects, query, default_size=50)
+
+    def _get_project(self, key, query, body) -> Tuple[int, Any]:
+        project = self.projects.get(key.upper())
+        if project is None:
+            project = next((p for p in self.projects.values() if p.id == key), None)
+        if project is None:
+            return 404, {"errorMessages": [f"No project could be found with key '{key}'."]}
+        return 200, self._project_view(project)
+
+    def _search_users(self, query, body) -> Tuple[int, Any]:
+        text = (query.get("query") or "").lower()
+        users = [
+            user for user in self.users.values()
+            if text in user["displayName"].lower() or text in user["emailAddress"].lower()
+        ]
+        return 200, _offset_list(users, query)
+
+    def _assignable_users(self, query, body) -> Tuple[int, Any]:
+        project = self.projects.get(str(query.get("project", "")).upper())
+        if project is None:
+            return 404, {"errorMessages": [f"No project could be found with key '{query.get('project')}'."]}
+        text = (query.get("query") or "").lower()
+        users = [
+            self.users[account_id] for account_id in project.members
+            if text in self.users[account_id]["displayName"].lower()
+        ]
+        return 200, _offset_list(users, query)
+
+    def _get_myself(self, query, body) -> Tuple[int, Any]:
+        if self.myself is None:
+            return 401, {"errorMessages": ["Client must be authenticated to access this resource."]}
+        return 200, self.myself
+
+    def _matching_issues(self, jql: str) -> List[Dict[str, Any]]:
+        """Issues que cumplen un JQL simple: solo entiende project = KEY."""
+        match = re.search(r"project\s*=\s*\"?([A-Za-z][A-Za-z0-9_]*)\"?", jql or "", re.IGNORECASE)
+        with self._lock:
+            issues = list(self.issues.values())
+            if match:
+                prefix = match.group(1).upper() + "-"
+                issues = [i for i in issues if i["key"].startswith(prefix)]
+            return [self._issue_view(i) for i in issues]
+
+    def _search_jql(self, query, body) -> Tuple[int, Any]:
+        issues = self._matching_issues(query.get("jql", ""))
+        size = _int(query.get("maxResults"), 50)
+        start = _int(query.get("nextPageToken"), 0)
+        page = {"issues": issues[start:start + size], "isLast": start + size >= len(issues)}
+        if not page["isLast"]:
+            page["nextPageToken"] = str(start + size)
+        return 200, page
+
+    def _search_legacy(self, query, body) -> Tuple[int, Any]:
+        issues = self._matching_issues(query.get("jql", ""))
+        page = _offset_page(issues, query, default_size=50, items_key="issues")
+        page.pop("isLast")
+        return 200, page
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Métricas del simulador."""
+        with self._lock:
+            return {
+                "requests": self.request_count,
+                "throttled": self.throttled,
+                "injected_failures": self.injected_failures,
+                "issues": len(self.issues),
+            }
+
+
+def _is_subtask(issue_type: str) -> bool:
+    return issue_type.lower().replace("-", "") == "subtask"
+
+
+def _int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _offset_list(items: List[Any], query: Dict[str, Any]) -> List[Any]:
+    """Página de una lista sin metadatos (startAt/maxResults)."""
+    start = _int(query.get("startAt"), 0)
+    size = _int(query.get("maxResults"), 50)
+    return items[start:start + size]
+
+
+def _offset_page(
+    items: List[Any],
+    query: Dict[str, Any],
+    default_size: int,
+    items_key: str = "values"
+) -> Dict[str, Any]:
+    """Página con metadatos (startAt, maxResults, total, isLast)."""
+    start = _int(query.get("startAt"), 0)
+    size = _int(query.get("maxResults"), default_size)
+    return {
+        items_key: items[start:start + size],
+        "startAt": start,
+        "maxResults": size,
+        "total": len(items),
+        "isLast": start + size >= len(items),
+    }
+
+
+# (método, patrón del path bajo /rest/api/3, handler); "*" = GET o POST
+_SEGMENT = r"([^/]+)"
+_ROUTES: List[Tuple[str, Pattern[str], Callable[..., Tuple[int, Any]]]] = [
+    ("POST", re.compile(r"/issue"), JiraSimulator._create_issue),
+    ("POST", re.compile(r"/issue/bulk"), JiraSimulator._create_bulk),
+    ("GET", re.compile(rf"/issue/createmeta/{_SEGMENT}/issuetypes"), JiraSimulator._createmeta_issue_types),
+    ("GET", re.compile(rf"/issue/createmeta/{_SEGMENT}/issuetypes/{_SEGMENT}"), JiraSimulator._createmeta_fields),
+    ("GET", re.compile(rf"/issue/{_SEGMENT}"), JiraSimulator._get_issue),
+    ("GET", re.compile(r"/project"), JiraSimulator._list_projects),
+    ("GET", re.compile(r"/project/search"), JiraSimulator._search_projects),
+    ("GET", re.compile(rf"/project/{_SEGMENT}"), JiraSimulator._get_project),
+    ("GET", re.compile(r"/user/search"), JiraSimulator._search_users),
+    ("GET", re.compile(r"/user/assignable/search"), JiraSimulator._assignable_users),
+    ("GET", re.compile(r"/myself"), JiraSimulator._get_myself),
+    ("*", re.compile(r"/search/jql"), JiraSimulator._search_jql),
+    ("*", re.compile(r"/search"), JiraSimulator._search_legacy),
+]
+
+
+class _SimulatorServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer que sabe a qué simulador entregar las peticiones."""
+
+    daemon_threads = True
+
+    def __init__(self, server_address: Tuple[str, int], simulator: JiraSimulator):
+        super().__init__(server_address, _SimulatorHandler)
+        self.simulator = simulator
+
+
+class _SimulatorHandler(BaseHTTPRequestHandler):
+    """Traduce peticiones HTTP a JiraSimulator.handle()."""
+
+    server: _SimulatorServer
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding", "").lower() == "gzip":
+            raw = gzip.decompress(raw)
+
+        response: Response
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            response = 400, {}, {"errorMessages": ["Unexpected character in request body."]}
+        else:
+            response = self.server.simulator.handle(
+                self.command, self.path, body, authorized=bool(self.headers.get("Authorization"))
+            )
+        status, headers, payload = response
+
+        data = json.dumps(payload, ensure_ascii=False).encode() if payload is not None else b""
+        headers = dict(headers)
+        if len(data) > 1024 and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = _reply
+    do_POST = _reply
+    do_PUT = _reply
+    do_DELETE = _reply
+
+    def log_message(self, format, *args) -> None:
+        """Silenciar el log de cada petición."""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulador local de Jira Cloud (REST API v3)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Latencia base por respuesta")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Jitter uniforme añadido a la latencia")
+    parser.add_argument("--rate-limit", type=int, default=0, help="Peticiones por minuto antes de 429 (0 = sin límite)")
+    parser.add_argument("--burst", type=int, default=10, help="Ráfaga permitida por el rate limit")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probabilidad de responder 5xx")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.jitter_ms,
+        rate_limit_per_minute=args.rate_limit,
+        rate_limit_burst=args.burst,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    simulator = JiraSimulator(config, host=args.host, port=args.port)
+    base_url = simulator.start()
+    print(f"Simulador de Jira en {base_url} (proyecto KAN). Ctrl+C para salir.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(f"\n{simulator.snapshot()}")
+    finally:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
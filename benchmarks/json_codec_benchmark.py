@@ -0,0 +1,170 @@
+"""
+Benchmark: coste de decodificar respuestas grandes de Jira.
+
+Compara el camino anterior de JiraClient._parse_response (``response.text``
+para ver si hay contenido y luego ``response.json()``, que vuelve a
+decodificar el body) contra el camino actual sobre bytes con el codec
+estándar y con orjson.
+
+Por defecto usa payloads sintéticos con la forma de createmeta y de
+/user/assignable/search (~1-2 MB). Con ``--payload`` se puede medir una
+respuesta real grabada de Jira.
+
+Uso:
+    python benchmarks/json_codec_benchmark.py [--iterations 50] [--payload respuesta.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.clients.json_codec import OrjsonCodec, StdlibJsonCodec, is_empty_body, orjson
+
+
+def assignable_users_payload(count: int = 5000) -> list:
+    """Lista de usuarios como la de /user/assignable/search."""
+    return [
+        {
+            "self": f"https://example.atlassian.net/rest/api/3/user?accountId=5b10a2844c20165700ede{i:05d}",
+            "accountId": f"5b10a2844c20165700ede{i:05d}",
+            "accountType": "atlassian",
+            "emailAddress": f"usuario{i}@example.com",
+            "avatarUrls": {
+                size: f"https://avatar-management.example.com/{i}/{size}.png"
+                for size in ("48x48", "24x24", "16x16", "32x32")
+            },
+            "displayName": f"Usuario Número {i} Pérez",
+            "active": i % 7 != 0,
+            "timeZone": "America/Bogota",
+            "locale": "es_ES",
+        }
+        for i in range(count)
+    ]
+
+
+def createmeta_payload(projects: int = 20, issue_types: int = 6, fields: int = 40) -> dict:
+    """Respuesta de /issue/createmeta con expand=projects.issuetypes.fields."""
+    return {
+        "projects": [
+            {
+                "id": str(10000 + p),
+                "key": f"P{p}",
+                "name": f"Proyecto {p}",
+                "issuetypes": [
+                    {
+                        "id": str(t),
+                        "name": ["Task", "Subtask", "Bug", "Story", "Epic", "Reel"][t % 6],
+                        "subtask": t == 1,
+                        "fields": {
+                            f"customfield_{10000 + f}": {
+                                "required": f % 5 == 0,
+                                "schema": {"type": "option", "custom": "select", "customId": 10000 + f},
+                                "name": f"Campo personalizado {f}",
+                                "key": f"customfield_{10000 + f}",
+                                "hasDefaultValue": False,
+                                "operations": ["set"],
+                                "allowedValues": [
+                                    {"id": str(v), "value": f"Opción {v}", "self": f"https://example/option/{v}"}
+                                    for v in range(8)
+                                ],
+                            }
+                            for f in range(fields)
+                        },
+                    }
+                    for t in range(issue_types)
+                ],
+            }
+            for p in range(projects)
+        ]
+    }
+
+
+def make_response(content: bytes) -> requests.Response:
+    """Construye un requests.Response con el body dado."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    response.encoding = "utf-8"
+    return response
+
+
+def legacy_parse(response: requests.Response):
+    """Camino anterior: decodifica a texto y luego parsea (texto otra vez)."""
+    if response.text:
+        return response.json()
+    return {}
+
+
+def codec_parse(codec):
+    def parse(response: requests.Response):
+        content = response.content
+        if is_empty_body(content):
+            return {}
+        return codec.loads(content)
+    return parse
+
+
+def measure(parse, content: bytes, iterations: int) -> list:
+    """Retorna los tiempos en ms de `iterations` decodificaciones."""
+    timings = []
+    for _ in range(iterations):
+        response = make_response(content)
+        start = time.perf_counter()
+        parse(response)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50, help="Decodificaciones por escenario")
+    parser.add_argument("--payload", help="Archivo JSON con una respuesta real de Jira")
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, "rb") as f:
+            payloads = {os.path.basename(args.payload): f.read()}
+    else:
+        payloads = {
+            "assignable/search": json.dumps(assignable_users_payload(), ensure_ascii=False).encode(),
+            "createmeta": json.dumps(createmeta_payload(), ensure_ascii=False).encode(),
+        }
+
+    scenarios = [("text + json()", legacy_parse), ("json (bytes)", codec_parse(StdlibJsonCodec()))]
+    if orjson is not None:
+        scenarios.append(("orjson (bytes)", codec_parse(OrjsonCodec())))
+    else:
+        print("orjson no está instalado; se omite ese escenario")
+
+    for name, content in payloads.items():
+        print(f"\n{name}: {len(content) / 1024 / 1024:.2f} MB, {args.iterations} iteraciones")
+        baseline = None
+        for label, parse in scenarios:
+            timings = measure(parse, content, args.iterations)
+            mean = statistics.mean(timings)
+            baseline = baseline or mean
+            print(
+                f"  {label:<16} mean={mean:8.2f} ms  p50={statistics.median(timings):8.2f} ms  "
+                f"speedup={baseline / mean:5.2f}x"
+            )
+
+    # Serialización de un payload de creación de issues en bulk
+    bulk = {"issueUpdates": [{"fields": {"summary": f"Subtarea {i}", "labels": ["reel"]}} for i in range(50)]}
+    print("\nSerialización de /issue/bulk (50 issues)")
+    for codec in [StdlibJsonCodec()] + ([OrjsonCodec()] if orjson is not None else []):
+        start = time.perf_counter()
+        for _ in range(args.iterations * 20):
+            codec.dumps(bulk)
+        elapsed = (time.perf_counter() - start) * 1000 / (args.iterations * 20)
+        print(f"  {codec.name:<16} {elapsed * 1000:8.1f} µs por payload")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: batch de workflows reproducido desde un cassette grabado.
+
+Con ``record`` ejecuta un batch (el mismo body que recibe
+POST /api/v1/tasks/batch) contra un sitio de Jira y graba el tráfico en un
+cassette sin credenciales. Sin ``--base-url`` graba contra el simulador
+local; con ``--base-url`` usa un sitio real (JIRA_EMAIL y JIRA_API_TOKEN).
+
+Con ``replay`` ejecuta el mismo batch respondiendo desde el cassette, sin
+red, y reporta el tiempo de cada ronda. Con ``--speed 1`` se reproducen los
+tiempos de Jira grabados; con ``--speed 0`` solo se mide el costo propio de
+la app (parseo, payloads, reintentos, serialización).
+
+Uso:
+    python benchmarks/replay_benchmark.py record batch.jsonl [--batch batch.json] [--base-url URL]
+    python benchmarks/replay_benchmark.py replay batch.jsonl [--batch batch.json] [--speed 0] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.api.dependencies import IdempotencyContext
+from app.api.routes.batch_tasks import CreateBatchTasksRequest, create_batch_tasks
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.cassette import get_cassette
+from app.clients.jira_client import JiraClientConfig
+from benchmarks.jira_simulator import JiraSimulator, SimulatorConfig
+
+# Batch por defecto: la forma típica de un batch de producción
+DEFAULT_BATCH = {
+    "project_key": "KAN",
+    "tasks": [
+        {"text": "Crear reel sobre viaje a Cartagena en la playa, alta prioridad, asignado a santiago"},
+        {"text": "Historia de receta de arepas en el estudio, asignado a santiago"},
+        {"text": "Reel de tips de fotografía, media prioridad, etiquetas: educativo, tips"},
+        {"text": "Carrusel de lugares para visitar en Medellín, baja prioridad"},
+        {"text": "Reel detrás de cámaras de la sesión de fotos, asignado a maría"},
+    ],
+}
+
+
+async def run_batch(base_url: str, email: str, token: str, config: JiraClientConfig, batch: dict):
+    """Ejecuta el endpoint de batch con un cliente configurado."""
+    async with AsyncJiraClient(base_url=base_url, email=email, api_token=token, config=config) as client:
+        return await create_batch_tasks(
+            CreateBatchTasksRequest(**batch), jira_client=client, idempotency=IdempotencyContext()
+        )
+
+
+def record(args: argparse.Namespace, batch: dict) -> None:
+    if os.path.exists(args.cassette):
+        os.remove(args.cassette)
+    config = JiraClientConfig(cassette_mode="record", cassette_path=args.cassette, rate_limit_per_minute=0)
+
+    if args.base_url:
+        result = asyncio.run(run_batch(
+            args.base_url, os.environ["JIRA_EMAIL"], os.environ["JIRA_API_TOKEN"], config, batch
+        ))
+    else:
+        with JiraSimulator(SimulatorConfig(latency_ms=120, latency_jitter_ms=60, seed=7)) as simulator:
+            result = asyncio.run(run_batch(simulator.base_url, "bench@example.com", "x", config, batch))
+
+    cassette = get_cassette(args.cassette)
+    print(f"Grabadas {cassette.recorded} interacciones en {args.cassette}")
+    print(f"Workflows creados: {result.total_created}/{result.total_requested}")
+
+
+def replay(args: argparse.Namespace, batch: dict) -> None:
+    config = JiraClientConfig(
+        cassette_mode="replay",
+        cassette_path=args.cassette,
+        cassette_speed=args.speed,
+        rate_limit_per_minute=0,
+    )
+    cassette = get_cassette(args.cassette)
+    timings, outcomes = [], set()
+    for _ in range(args.rounds):
+        cassette.rewind()
+        start = time.perf_counter()
+        result = asyncio.run(run_batch("https://replay.invalid", "bench@example.com", "x", config, batch))
+        timings.append((time.perf_counter() - start) * 1000)
+        outcomes.add(json.dumps([r.main_task_key for r in result.results]))
+
+    print(f"{args.rounds} rondas, speed={args.speed}, {cassette.played} peticiones por ronda")
+    print(f"  mean={statistics.mean(timings):8.1f} ms  min={min(timings):8.1f} ms  max={max(timings):8.1f} ms")
+    print(f"  resultados idénticos en todas las rondas: {len(outcomes) == 1}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("cassette", help="Archivo JSONL del cassette")
+    parser.add_argument("--batch", help="JSON con el body de POST /api/v1/tasks/batch")
+    parser.add_argument("--base-url", help="Sitio real de Jira para grabar (default: simulador local)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Escala de los tiempos grabados")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    batch = DEFAULT_BATCH
+    if args.batch:
+        with open(args.batch, encoding="utf-8") as f:
+            batch = json.load(f)
+
+    if args.mode == "record":
+        record(args, batch)
+    else:
+        replay(args, batch)
+
+
+if __name__ == "__main__":
+    main()
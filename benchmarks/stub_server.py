@@ -0,0 +1,108 @@
+"""
+Servidor HTTP local mínimo que imita respuestas de Jira para benchmarks.
+
+Responde JSON fijo a cualquier GET/POST bajo /rest/api/3 y soporta
+conexiones keep-alive (HTTP/1.1), de modo que se pueda medir el efecto
+de reutilizar conexiones sin depender de un sitio real de Jira.
+
+Se pueden encolar respuestas puntuales con ``server.script.append(...)``
+para simular errores (ej: un 503 con Retry-After antes de un 200), y
+revisar lo enviado en ``server.received`` (método, path y body JSON).
+
+Acepta bodies con ``Content-Encoding: gzip`` y, con
+``server.gzip_responses = True``, comprime las respuestas a clientes que
+envían ``Accept-Encoding: gzip``.
+"""
+
+import gzip
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class StubServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer con los contadores y el guion de respuestas del stub."""
+
+    daemon_threads = True
+
+    def __init__(self, server_address: Tuple[str, int]):
+        super().__init__(server_address, _StubHandler)
+        self.connection_count = 0
+        self.request_count = 0
+        self.received: List[Tuple[str, str, Optional[Any]]] = []
+        self.gzip_responses = False
+        # (status, headers, body JSON) a responder antes del cuerpo fijo
+        self.script: Deque[Tuple[int, Dict[str, str], Any]] = deque()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Handler que responde con un cuerpo JSON pequeño."""
+
+    server: StubServer
+    protocol_version = "HTTP/1.1"
+    # Evita el retraso de Nagle/ACK diferido entre headers y body
+    disable_nagle_algorithm = True
+    body = json.dumps({
+        "id": "10000", "key": "STUB-1", "accountId": "stub", "displayName": "Stub User"
+    }).encode()
+
+    def setup(self) -> None:
+        super().setup()
+        # Contar conexiones TCP aceptadas (una por handshake)
+        self.server.connection_count += 1
+
+    def _reply(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding", "").lower() == "gzip":
+            raw = gzip.decompress(raw)
+        payload = json.loads(raw) if raw else None
+
+        self.server.request_count += 1
+        self.server.received.append((self.command, self.path, payload))
+        headers: Dict[str, str] = {}
+        status, body = 200, self.body
+        if self.server.script:
+            status, headers, payload = self.server.script.popleft()
+            body = json.dumps(payload).encode()
+
+        headers = dict(headers)
+        if self.server.gzip_responses and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if self.headers.get("Connection", "").lower() == "close":
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, format, *args) -> None:
+        """Silenciar el log de cada petición."""
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0) -> Tuple[StubServer, str]:
+    """
+    Arranca el servidor stub en un hilo daemon.
+
+    Args:
+        host: Interfaz de escucha
+        port: Puerto (0 = puerto libre aleatorio)
+
+    Returns:
+        Tupla (servidor, base_url)
+    """
+    server = StubServer((host, port))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
@@ -0,0 +1,98 @@
+"""
+Benchmark: throughput de creación de workflows contra el simulador de Jira.
+
+Lanza N workflows de Reel (1 tarea principal + 6 subtareas en /issue/bulk)
+con ReelWorkflowService y AsyncJiraClient, con una concurrencia fija,
+contra ``jira_simulator`` con latencia, rate limit y fallos configurables.
+Sirve para medir el efecto del rate limiter y los reintentos ante una
+tormenta de 429 sin tocar un sitio real.
+
+Uso:
+    python benchmarks/workflow_load_benchmark.py [--workflows 50] [--concurrency 10]
+        [--latency-ms 120] [--rate-limit 600] [--failure-rate 0.02]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.jira_client import JiraAPIError, JiraClientConfig
+from app.clients.retry import retry_stats
+from app.services.reel_workflow_service import ReelWorkflowService
+from benchmarks.jira_simulator import JiraSimulator, SimulatorConfig
+
+
+async def run(base_url: str, args: argparse.Namespace) -> dict:
+    """Crea los workflows y retorna latencias (ms) y conteo de fallos."""
+    config = JiraClientConfig(
+        rate_limit_per_minute=args.client_rate_limit,
+        max_retries=args.max_retries,
+    )
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies, failures = [], 0
+
+    async with AsyncJiraClient(base_url=base_url, email="bench@example.com", api_token="x", config=config) as client:
+        service = ReelWorkflowService(client)
+
+        async def one(i: int) -> None:
+            nonlocal failures
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    result = await service.create_reel_workflow(project_key="KAN", title=f"Reel de prueba {i}")
+                    if not result["success"]:
+                        failures += 1
+                except JiraAPIError:
+                    failures += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(args.workflows)))
+        elapsed = time.perf_counter() - started
+
+    return {"latencies": latencies, "failures": failures, "elapsed": elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workflows", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=120, help="Latencia del simulador")
+    parser.add_argument("--jitter-ms", type=float, default=40)
+    parser.add_argument("--rate-limit", type=int, default=600, help="Límite del simulador (peticiones/min)")
+    parser.add_argument("--burst", type=int, default=20)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--client-rate-limit", type=int, default=0, help="Rate limiter del cliente (0 = desactivado)")
+    parser.add_argument("--max-retries", type=int, default=3)
+    args = parser.parse_args()
+
+    simulator_config = SimulatorConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.jitter_ms,
+        rate_limit_per_minute=args.rate_limit,
+        rate_limit_burst=args.burst,
+        failure_rate=args.failure_rate,
+        seed=42,
+    )
+    with JiraSimulator(simulator_config) as simulator:
+        result = asyncio.run(run(simulator.base_url, args))
+        server = simulator.snapshot()
+
+    latencies = sorted(result["latencies"])
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+    print(f"{args.workflows} workflows, concurrencia {args.concurrency}, {result['elapsed']:.2f} s")
+    print(f"  throughput   {args.workflows / result['elapsed']:8.2f} workflows/s")
+    print(f"  latencia     p50={statistics.median(latencies):8.1f} ms  p95={p95:8.1f} ms")
+    print(f"  fallidos     {result['failures']}")
+    print(f"  simulador    {server}")
+    print(f"  reintentos   {retry_stats.snapshot()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,17 @@ Este archivo muestra diferentes formas de crear contenido de Instagram
 incluyendo Reels, Historias y Carruseles.
 """
 
-from app.clients.jira_client import JiraClient
+import asyncio
+
+from app.clients.async_jira_client import AsyncJiraClient
 from app.services.reel_workflow_service import ReelWorkflowService
 
 
-def ejemplo_crear_carrusel():
+async def ejemplo_crear_carrusel():
     """Ejemplo 1: Crear un carrusel básico."""
 
     # 1. Inicializar cliente de Jira
-    jira_client = JiraClient(
+    jira_client = AsyncJiraClient(
         base_url="https://tu-dominio.atlassian.net",
         email="tu-email@example.com",
         api_token="tu-api-token"
@@ -23,7 +25,7 @@ def ejemplo_crear_carrusel():
     service = ReelWorkflowService(jira_client)
 
     # 3. Crear carrusel
-    resultado = service.create_reel_workflow(
+    resultado = await service.create_reel_workflow(
         project_key="KAN",
         title="Tips de fotografía en viajes",
         content_type="Carrusel",  # 🎠
@@ -39,10 +41,10 @@ def ejemplo_crear_carrusel():
         print(f"  {subtask['emoji']} {subtask['phase']}: {subtask['key']}")
 
 
-def ejemplo_carrusel_completo():
+async def ejemplo_carrusel_completo():
     """Ejemplo 2: Crear un carrusel con todas las opciones."""
 
-    jira_client = JiraClient(
+    jira_client = AsyncJiraClient(
         base_url="https://tu-dominio.atlassian.net",
         email="tu-email@example.com",
         api_token="tu-api-token"
@@ -51,9 +53,9 @@ def ejemplo_carrusel_completo():
     service = ReelWorkflowService(jira_client)
 
     # Buscar el account ID del usuario asignado
-    assignee_id = jira_client.get_user_account_id("santiago", "KAN")
+    assignee_id = await jira_client.get_user_account_id("santiago", "KAN")
 
-    resultado = service.create_reel_workflow(
+    resultado = await service.create_reel_workflow(
         project_key="KAN",
         title="10 destinos imperdibles en Colombia",
         content_type="Carrusel",
@@ -66,10 +68,10 @@ def ejemplo_carrusel_completo():
     print(f"✅ Carrusel creado: {resultado['main_task']['key']}")
 
 
-def ejemplo_todos_los_tipos():
+async def ejemplo_todos_los_tipos():
     """Ejemplo 3: Crear diferentes tipos de contenido."""
 
-    jira_client = JiraClient(
+    jira_client = AsyncJiraClient(
         base_url="https://tu-dominio.atlassian.net",
         email="tu-email@example.com",
         api_token="tu-api-token"
@@ -78,7 +80,7 @@ def ejemplo_todos_los_tipos():
     service = ReelWorkflowService(jira_client)
 
     # Crear un Reel
-    reel = service.create_reel_workflow(
+    reel = await service.create_reel_workflow(
         project_key="KAN",
         title="Tour por Cartagena",
         content_type="Reel",  # 🎬
@@ -87,7 +89,7 @@ def ejemplo_todos_los_tipos():
     print(f"🎬 Reel creado: {reel['main_task']['key']}")
 
     # Crear una Historia
-    historia = service.create_reel_workflow(
+    historia = await service.create_reel_workflow(
         project_key="KAN",
         title="Behind the scenes del viaje",
         content_type="Historia",  # 📸
@@ -96,7 +98,7 @@ def ejemplo_todos_los_tipos():
     print(f"📸 Historia creada: {historia['main_task']['key']}")
 
     # Crear un Carrusel
-    carrusel = service.create_reel_workflow(
+    carrusel = await service.create_reel_workflow(
         project_key="KAN",
         title="Guía de restaurantes en Bogotá",
         content_type="Carrusel",  # 🎠
@@ -243,8 +245,8 @@ if __name__ == "__main__":
     print("=== Ejemplos de creación de Carruseles ===\n")
 
     # Descomenta el ejemplo que quieras ejecutar:
-    # ejemplo_crear_carrusel()
-    # ejemplo_carrusel_completo()
-    # ejemplo_todos_los_tipos()
+    # asyncio.run(ejemplo_crear_carrusel())
+    # asyncio.run(ejemplo_carrusel_completo())
+    # asyncio.run(ejemplo_todos_los_tipos())
     # ejemplo_usando_api()
     # ejemplo_batch_mixto()
@@ -0,0 +1,313 @@
+"""
+Tests unitarios para los backends de caché compartidos.
+"""
+
+import asyncio
+import re
+import time
+
+import pytest
+
+from app.clients.cache_backend import (
+    MISS,
+    CacheNamespace,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    cache_namespace,
+    cache_snapshot,
+    configure_cache,
+    create_cache_backend,
+    redis,
+)
+from app.clients.user_cache import AccountIdCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def redis_glob(pattern: str) -> str:
+    """Traduce un patrón de SCAN MATCH (* y ? comodines, \\ escapa) a regex."""
+    regex, chars = "", iter(pattern)
+    for char in chars:
+        if char == "\\":
+            regex += re.escape(next(chars, ""))
+        elif char == "*":
+            regex += ".*"
+        elif char == "?":
+            regex += "."
+        else:
+            regex += re.escape(char)
+    return regex
+
+
+class FakeRedis:
+    """Subconjunto de redis.Redis usado por el backend, en memoria."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.fail = False
+        self.calls = 0
+        self.delay = 0.0
+
+    def _check(self):
+        self.calls += 1
+        if self.delay:
+            # Bloquea el hilo como lo haría un socket lento
+            time.sleep(self.delay)
+        if self.fail:
+            raise redis.ConnectionError("Redis caído")
+
+    def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self._check()
+        self.data[key] = value
+        self.ttls[key] = px
+
+    def delete(self, *keys):
+        self._check()
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def scan_iter(self, match="*", count=None):
+        self._check()
+        return [key for key in list(self.data) if re.fullmatch(redis_glob(match), key, re.S)]
+
+    def ping(self):
+        self._check()
+        return True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def shared_backend():
+    backend = MemoryCacheBackend(key_prefix="test:")
+    configure_cache(backend, default_ttl=60)
+    yield backend
+    configure_cache(None)
+
+
+class TestMemoryCacheBackend:
+    def test_ttl_and_lru(self):
+        clock = FakeClock()
+        backend = MemoryCacheBackend(max_entries=2, clock=clock)
+        backend.set("a", b"1", ttl=10)
+        backend.set("b", b"2", ttl=0)
+        assert backend.get("a") == b"1"
+        backend.set("c", b"3", ttl=10)
+        # "b" era la menos usada
+        assert backend.get("b") is None
+
+        clock.now += 11
+        assert backend.get("a") is None
+        assert backend.get("c") is None
+        assert backend.snapshot()["size"] == 0
+
+    def test_clear_by_prefix(self):
+        backend = MemoryCacheBackend()
+        backend.set("x:1", b"1", 0)
+        backend.set("x:2", b"2", 0)
+        backend.set("y:1", b"3", 0)
+        assert backend.clear("x:") == 2
+        assert backend.get("y:1") == b"3"
+
+
+@pytest.mark.skipif(redis is None, reason="redis no está instalado")
+class TestRedisCacheBackend:
+    def test_roundtrip_with_ttl_in_milliseconds(self):
+        fake = FakeRedis()
+        backend = RedisCacheBackend(client=fake)
+        backend.set("k", b"v", ttl=1.5)
+        assert backend.get("k") == b"v"
+        assert fake.ttls["k"] == 1500
+        assert backend.snapshot()["hits"] == 1
+
+    def test_errors_are_misses_and_back_off(self):
+        clock = FakeClock()
+        fake = FakeRedis()
+        backend = RedisCacheBackend(client=fake, retry_interval=5, clock=clock)
+        fake.fail = True
+
+        assert backend.get("k") is None
+        backend.set("k", b"v", 10)
+        assert backend.get("k") is None
+        # Tras el primer error no se vuelve a consultar Redis
+        assert fake.calls == 1
+        assert backend.snapshot()["available"] is False
+
+        fake.fail = False
+        clock.now += 5
+        backend.set("k", b"v", 10)
+        assert backend.get("k") == b"v"
+        assert backend.snapshot()["errors"] == 1
+
+    def test_clear_escapes_glob_characters(self):
+        fake = FakeRedis()
+        backend = RedisCacheBackend(client=fake, key_prefix="app:")
+        backend.set("app:[a]:1", b"1", 0)
+        backend.set("app:a:1", b"2", 0)
+        assert backend.clear("app:[a]:") == 1
+        assert backend.get("app:a:1") == b"2"
+
+    def test_ping_reports_failure(self):
+        fake = FakeRedis()
+        backend = RedisCacheBackend(client=fake)
+        assert backend.ping() is True
+        fake.fail = True
+        assert backend.ping() is False
+
+
+class TestFactory:
+    def test_memory_url(self):
+        assert create_cache_backend("memory://").name == "memory"
+        assert create_cache_backend(None).name == "memory"
+
+    @pytest.mark.skipif(redis is None, reason="redis no está instalado")
+    def test_redis_url_does_not_connect(self):
+        # La conexión se abre con el primer comando
+        backend = create_cache_backend("redis://127.0.0.1:1/0", key_prefix="p:")
+        assert backend.name == "redis"
+        assert backend.key_prefix == "p:"
+
+    def test_invalid_url(self):
+        with pytest.raises(ValueError):
+            create_cache_backend("memcached://localhost")
+
+
+class TestCacheNamespace:
+    def test_values_are_json_and_none_is_cached(self):
+        backend = MemoryCacheBackend(key_prefix="app:")
+        cache = CacheNamespace(backend, "parser")
+        cache.set("a", {"summary": "Edición", "labels": ["reel"]})
+        cache.set("b", None)
+
+        assert cache.get("a") == {"summary": "Edición", "labels": ["reel"]}
+        assert cache.get("b") is None
+        assert cache.get("c") is MISS
+        assert backend.get("app:parser:a") is not None
+
+    def test_namespaces_do_not_collide(self):
+        backend = MemoryCacheBackend()
+        first, second = CacheNamespace(backend, "uno"), CacheNamespace(backend, "dos")
+        first.set("k", 1)
+        second.set("k", 2)
+        first.clear()
+        assert first.get("k") is MISS
+        assert second.get("k") == 2
+
+    def test_corrupt_value_is_a_miss(self):
+        backend = MemoryCacheBackend()
+        cache = CacheNamespace(backend, "ns")
+        backend.set("ns:k", b"{no es json", 0)
+        assert cache.get("k") is MISS
+        assert backend.get("ns:k") is None
+
+    def test_process_namespace(self, shared_backend):
+        cache = cache_namespace("auth")
+        assert cache.ttl == 60
+        assert cache.prefix == "test:auth:"
+        assert cache_snapshot()["backend"] == "memory"
+
+    def test_no_shared_cache_by_default(self):
+        assert cache_namespace("auth") is None
+        assert cache_snapshot() == {"backend": None}
+
+
+class TestAccountIdCacheSharedTier:
+    def test_workers_share_lookups(self):
+        backend = MemoryCacheBackend()
+        worker_a = AccountIdCache(shared=CacheNamespace(backend, "jira:account_id:site"))
+        worker_b = AccountIdCache(shared=CacheNamespace(backend, "jira:account_id:site"))
+
+        worker_a.put("María", "KAN", "acc-1")
+        worker_a.put("Fantasma", "KAN", None)
+
+        assert worker_b.get(" maría ", "kan") == "acc-1"
+        assert worker_b.get("Fantasma", "KAN") is None
+        assert worker_b.snapshot()["shared_hits"] == 2
+        # La segunda vez ya está en la memoria del worker
+        assert worker_b.get("María", "KAN") == "acc-1"
+        assert worker_b.snapshot()["hits"] == 1
+
+    def test_invalidate_reaches_shared_tier(self):
+        backend = MemoryCacheBackend()
+        worker_a = AccountIdCache(shared=CacheNamespace(backend, "site"))
+        worker_b = AccountIdCache(shared=CacheNamespace(backend, "site"))
+        worker_a.put("María", "KAN", "acc-1")
+        worker_a.invalidate("María", "KAN")
+        assert worker_b.get("María", "KAN") is MISS
+
+    @pytest.mark.skipif(redis is None, reason="redis no está instalado")
+    def test_redis_outage_falls_back_to_local(self):
+        fake = FakeRedis()
+        cache = AccountIdCache(shared=CacheNamespace(RedisCacheBackend(client=fake), "site"))
+        fake.fail = True
+        cache.put("María", "KAN", "acc-1")
+        assert cache.get("María", "KAN") == "acc-1"
+        assert cache.get("Pedro", "KAN") is MISS
+
+
+async def loop_ticks(work, interval=0.01):
+    """Corre work y cuenta cuántas veces avanzó el event loop mientras tanto."""
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            await asyncio.sleep(interval)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        result = await work
+    finally:
+        done.set()
+        await task
+    return result, ticks
+
+
+@pytest.mark.skipif(redis is None, reason="redis no está instalado")
+class TestSlowRedisDoesNotBlockLoop:
+    async def test_account_id_lookup(self):
+        fake = FakeRedis()
+        shared = CacheNamespace(RedisCacheBackend(client=fake), "site")
+        AccountIdCache(shared=shared).put("María", "KAN", "acc-1")
+        fake.delay = 0.2
+
+        cache = AccountIdCache(shared=shared)
+        account_id, ticks = await loop_ticks(cache.aget("María", "KAN"))
+        assert account_id == "acc-1"
+        # Con un get bloqueante el ticker no habría avanzado nada
+        assert ticks >= 5
+
+        _, ticks = await loop_ticks(cache.aput("Pedro", "KAN", "acc-2"))
+        assert ticks >= 5
+
+    async def test_parse_cache(self):
+        from app.parsers.parse_cache import ParseCache
+        from app.parsers.task_parser import TaskParser
+
+        fake = FakeRedis()
+        fake.delay = 0.2
+        parser = TaskParser(cache=ParseCache(shared=CacheNamespace(RedisCacheBackend(client=fake), "parser")))
+        task, ticks = await loop_ticks(parser.aparse("Editar el reel de Komodo"))
+        assert task.summary
+        assert ticks >= 5
+        assert fake.calls == 2
+
+    async def test_memory_backend_runs_inline(self):
+        cache = CacheNamespace(MemoryCacheBackend(), "ns")
+        await cache.aset("k", 1)
+        assert await cache.aget("k") == 1
+        await cache.adelete("k")
+        assert await cache.aget("k") is MISS
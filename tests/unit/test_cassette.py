@@ -0,0 +1,111 @@
+"""
+Tests unitarios para la grabación y reproducción de tráfico con Jira.
+"""
+
+import json
+import time
+
+import pytest
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.cassette import CassetteMiss, get_cassette
+from app.clients.jira_client import JiraClient, JiraClientConfig
+from benchmarks.jira_simulator import JiraSimulator
+
+EMAIL = "grabadora@empresa.com"
+TOKEN = "ATATT3xFfGF0-token-secreto"
+
+
+@pytest.fixture
+def simulator():
+    with JiraSimulator() as jira:
+        yield jira
+
+
+def make_client(cls, base_url: str, **config):
+    config.setdefault("rate_limit_per_minute", 0)
+    return cls(base_url=base_url, email=EMAIL, api_token=TOKEN, config=JiraClientConfig(**config))
+
+
+def read_lines(path) -> list:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestRecord:
+    def test_records_without_credentials(self, simulator, tmp_path):
+        path = tmp_path / "sync.jsonl"
+        simulator.myself["emailAddress"] = EMAIL
+
+        with make_client(JiraClient, simulator.base_url, cassette_mode="record", cassette_path=str(path)) as client:
+            client.get_current_user()
+            client.create_issue(project_key="KAN", summary="Grabado")
+
+        text = path.read_text(encoding="utf-8")
+        assert EMAIL not in text and TOKEN not in text
+        assert simulator.base_url.split("//")[1] not in text
+
+        first, second = read_lines(path)
+        assert (first["method"], first["path"]) == ("GET", "/rest/api/3/myself")
+        assert first["request"]["headers"]["Authorization"] == "<scrubbed>"
+        assert json.loads(second["request"]["body"])["fields"]["summary"] == "Grabado"
+        assert second["response"]["status"] == 201
+
+    async def test_async_client_records(self, simulator, tmp_path):
+        path = tmp_path / "async.jsonl"
+        async with make_client(
+            AsyncJiraClient, simulator.base_url, cassette_mode="record", cassette_path=str(path)
+        ) as client:
+            project = await client.get_project("KAN")
+
+        assert project["key"] == "KAN"
+        [interaction] = read_lines(path)
+        assert interaction["path"] == "/rest/api/3/project/KAN"
+        assert json.loads(interaction["response"]["body"])["key"] == "KAN"
+
+
+class TestReplay:
+    def record(self, simulator, path) -> None:
+        with make_client(JiraClient, simulator.base_url, cassette_mode="record", cassette_path=str(path)) as client:
+            for i in range(3):
+                client.create_issue(project_key="KAN", summary=f"Issue {i}")
+            client.get_issue("KAN-2")
+
+    def test_replays_in_order_without_network(self, simulator, tmp_path):
+        path = tmp_path / "replay.jsonl"
+        self.record(simulator, path)
+        simulator.stop()
+
+        config = {"cassette_mode": "replay", "cassette_path": str(path), "cassette_speed": 0}
+        with make_client(JiraClient, "https://sin-red.invalid", **config) as client:
+            keys = [client.create_issue(project_key="KAN", summary=f"Issue {i}")["key"] for i in range(3)]
+            issue = client.get_issue("KAN-2")
+            with pytest.raises(CassetteMiss):
+                client.get_issue("KAN-3")
+
+        assert keys == ["KAN-1", "KAN-2", "KAN-3"]
+        assert issue["fields"]["summary"] == "Issue 1"
+
+    async def test_async_replay_scales_timing(self, simulator, tmp_path):
+        path = tmp_path / "timing.jsonl"
+        self.record(simulator, path)
+
+        # Duraciones grabadas conocidas: 0.1s por interacción
+        lines = read_lines(path)
+        for line in lines:
+            line["duration"] = 0.1
+        path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+
+        config = {"cassette_mode": "replay", "cassette_path": str(path), "cassette_speed": 0.5}
+        async with make_client(AsyncJiraClient, "https://sin-red.invalid", **config) as client:
+            start = time.perf_counter()
+            await client.get_issue("KAN-2")
+            elapsed = time.perf_counter() - start
+
+        assert 0.05 <= elapsed < 0.1
+        assert get_cassette(str(path)).played == 1
+
+    def test_invalid_mode_rejected(self):
+        with pytest.raises(ValueError):
+            make_client(JiraClient, "https://x.invalid", cassette_mode="replay")
+        with pytest.raises(ValueError):
+            make_client(JiraClient, "https://x.invalid", cassette_mode="rewind", cassette_path="x.jsonl")
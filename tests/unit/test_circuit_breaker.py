@@ -0,0 +1,161 @@
+"""
+Tests unitarios para el circuit breaker de Jira.
+"""
+
+import time
+
+import pytest
+
+from app.clients.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    circuit_breaker_snapshot,
+    get_circuit_breaker,
+)
+from app.clients.client_registry import site_id
+from app.clients.deadline import deadline
+from app.clients.jira_client import JiraAPIError, JiraClient, JiraClientConfig
+from benchmarks.stub_server import start_stub_server
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def fail(breaker: CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        assert breaker.allow() is None
+        breaker.record(failure=True)
+
+
+class TestCircuitBreaker:
+    """Tests para CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker("site", failure_threshold=3, recovery_timeout=30, clock=clock)
+        fail(breaker, 2)
+        breaker.record(failure=False)  # un éxito reinicia la cuenta
+        fail(breaker, 3)
+
+        assert breaker.state == OPEN
+        assert breaker.allow() == pytest.approx(30)
+        assert breaker.snapshot()["rejected"] == 1
+
+    def test_half_open_limits_probes_and_closes_on_success(self, clock):
+        breaker = CircuitBreaker("site", failure_threshold=1, recovery_timeout=10, clock=clock)
+        fail(breaker, 1)
+
+        clock.now = 10
+        assert breaker.allow() is None
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow() == 0.0  # solo una prueba a la vez
+
+        breaker.record(failure=False)
+        assert breaker.state == CLOSED
+        assert breaker.snapshot()["transitions"] == {
+            "closed->open": 1, "open->half_open": 1, "half_open->closed": 1
+        }
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = CircuitBreaker("site", failure_threshold=1, recovery_timeout=10, clock=clock)
+        fail(breaker, 1)
+
+        clock.now = 10
+        fail(breaker, 1)
+        assert breaker.state == OPEN
+        assert breaker.allow() == pytest.approx(10)
+
+    def test_release_returns_unsent_probe(self, clock):
+        breaker = CircuitBreaker("site", failure_threshold=1, recovery_timeout=10, clock=clock)
+        fail(breaker, 1)
+
+        clock.now = 10
+        assert breaker.allow() is None
+        breaker.release()  # la prueba no llegó a enviarse
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow() is None
+
+
+class TestClientFastFail:
+    """El cliente deja de llamar a Jira con el circuito abierto."""
+
+    def test_fails_fast_when_open(self):
+        server, base_url = start_stub_server()
+        server.script.extend([(500, {}, {"errorMessages": ["caído"]})] * 2)
+        try:
+            client = JiraClient(
+                base_url=base_url,
+                email="test@example.com",
+                api_token="token",
+                config=JiraClientConfig(
+                    max_retries=0,
+                    rate_limit_per_minute=0,
+                    circuit_failure_threshold=2
+                )
+            )
+            for _ in range(2):
+                with pytest.raises(JiraAPIError):
+                    client.get_current_user()
+
+            with pytest.raises(JiraAPIError) as exc_info:
+                client.get_issue("KAN-1")
+            assert exc_info.value.status_code == 503
+            assert "circuito abierto" in str(exc_info.value)
+            assert server.request_count == 2
+            client.close()
+        finally:
+            server.shutdown()
+
+    def test_probe_abandoned_waiting_for_rate_limit_is_released(self, monkeypatch):
+        server, base_url = start_stub_server()
+        server.script.append((500, {}, {"errorMessages": ["caído"]}))
+        try:
+            client = JiraClient(
+                base_url=base_url,
+                email="test@example.com",
+                api_token="token",
+                config=JiraClientConfig(
+                    max_retries=0,
+                    rate_limit_per_minute=0,
+                    circuit_failure_threshold=1,
+                    circuit_recovery_timeout=0.05
+                )
+            )
+            with pytest.raises(JiraAPIError):
+                client.get_current_user()
+            time.sleep(0.06)
+
+            # La prueba de half-open se abandona esperando al rate limiter
+            monkeypatch.setattr(client, "_rate_limit_wait", lambda: 5.0)
+            with deadline(1):
+                with pytest.raises(JiraAPIError) as exc_info:
+                    client.get_current_user()
+            assert exc_info.value.status_code == 504
+
+            # El permiso se devolvió: la siguiente petición prueba el sitio
+            monkeypatch.setattr(client, "_rate_limit_wait", lambda: 0.0)
+            client.get_current_user()
+            assert client.circuit_breaker.state == CLOSED
+            client.close()
+        finally:
+            server.shutdown()
+
+
+def test_snapshot_does_not_expose_site_urls():
+    """El snapshot usa ids opacos, no la URL de cada cliente."""
+    get_circuit_breaker("https://cliente-caido.atlassian.net", 5, 30)
+    snapshot = circuit_breaker_snapshot()
+
+    assert not any("cliente-caido" in key for key in snapshot)
+    assert snapshot[site_id("https://cliente-caido.atlassian.net")]["state"] == CLOSED
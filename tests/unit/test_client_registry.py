@@ -0,0 +1,84 @@
+"""
+Tests unitarios para el registro de clientes de Jira.
+"""
+
+import pytest
+
+from app.clients.client_registry import ClientRegistry, credential_fingerprint
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeClient:
+    def __init__(self, name: str):
+        self.name = name
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def lease(registry: ClientRegistry, key, name: str = "client") -> FakeClient:
+    """Presta y devuelve un cliente en un solo paso."""
+    client = registry.acquire(key, lambda: FakeClient(name))
+    registry.release(key, client)
+    return client
+
+
+class TestClientRegistry:
+    """Tests para ClientRegistry."""
+
+    def test_reuses_client_for_same_key(self, clock):
+        registry = ClientRegistry(clock=clock)
+        first = lease(registry, (1, "a"))
+        second = lease(registry, (1, "a"))
+
+        assert first is second
+        assert registry.snapshot()["hits"] == 1
+        assert registry.snapshot()["misses"] == 1
+
+    def test_lru_eviction_closes_idle_client(self, clock):
+        registry = ClientRegistry(max_size=2, clock=clock)
+        oldest = lease(registry, (1, "a"))
+        lease(registry, (2, "a"))
+        lease(registry, (1, "a"))  # ahora (2, "a") es el menos reciente
+        lease(registry, (3, "a"))
+
+        assert not oldest.closed
+        assert registry.snapshot()["size"] == 2
+        assert lease(registry, (1, "a")) is oldest
+
+    def test_idle_ttl_expires_client(self, clock):
+        registry = ClientRegistry(idle_ttl=60, clock=clock)
+        client = lease(registry, (1, "a"))
+
+        clock.now = 61
+        assert lease(registry, (2, "a")) is not client
+        assert client.closed
+
+    def test_invalidate_defers_close_while_in_use(self, clock):
+        registry = ClientRegistry(clock=clock)
+        client = registry.acquire((1, "a"), lambda: FakeClient("a"))
+
+        assert registry.invalidate(1) == 1
+        assert not client.closed
+
+        registry.release((1, "a"), client)
+        assert client.closed
+        assert lease(registry, (1, "a")) is not client
+
+    def test_fingerprint_changes_with_credentials(self):
+        fingerprint = credential_fingerprint("https://x.atlassian.net", "a@b.c", "token-1")
+        assert fingerprint == credential_fingerprint("https://x.atlassian.net", "a@b.c", "token-1")
+        assert fingerprint != credential_fingerprint("https://x.atlassian.net", "a@b.c", "token-2")
@@ -0,0 +1,100 @@
+"""
+Tests unitarios para la compresión de bodies y las estadísticas por endpoint.
+"""
+
+import pytest
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.jira_client import JiraClient, JiraClientConfig
+from app.clients.transfer_stats import endpoint_template, transfer_stats
+from benchmarks.stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub_server():
+    server, base_url = start_stub_server()
+    yield server, base_url
+    server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    transfer_stats.reset()
+    yield
+    transfer_stats.reset()
+
+
+def credentials(base_url: str, **config) -> dict:
+    config.setdefault("rate_limit_per_minute", 0)
+    return {
+        "base_url": base_url,
+        "email": "test@example.com",
+        "api_token": "token",
+        "config": JiraClientConfig(**config),
+    }
+
+
+class TestEndpointTemplate:
+    @pytest.mark.parametrize("endpoint, expected", [
+        ("/issue/KAN-123", "/issue/{key}"),
+        ("/issue/10023/transitions", "/issue/{id}/transitions"),
+        ("/project/KAN", "/project/{key}"),
+        ("/issue/bulk", "/issue/bulk"),
+        ("/user/assignable/search?project=KAN", "/user/assignable/search"),
+    ])
+    def test_templates(self, endpoint, expected):
+        assert endpoint_template(endpoint) == expected
+
+
+class TestRequestCompression:
+    def test_large_body_is_gzipped(self, stub_server):
+        server, base_url = stub_server
+        description = "Descripción larga del workflow. " * 200
+        with JiraClient(**credentials(base_url, compress_requests=True)) as client:
+            client.create_issue(project_key="KAN", summary="Reel", description=description)
+
+        # El stub descomprime el body: llega intacto
+        body = server.received[0][2]
+        assert body["fields"]["summary"] == "Reel"
+
+        stats = transfer_stats.snapshot()["POST /issue"]
+        assert stats["compressed_calls"] == 1
+        assert stats["request_wire_bytes"] < stats["request_bytes"] / 5
+
+    def test_small_body_and_disabled_compression_sent_plain(self, stub_server):
+        _, base_url = stub_server
+        with JiraClient(**credentials(base_url, compress_requests=True)) as client:
+            client.create_issue(project_key="KAN", summary="Corto")
+        with JiraClient(**credentials(base_url)) as client:
+            client.create_issue(project_key="KAN", summary="Largo", description="Largo " * 1000)
+
+        stats = transfer_stats.snapshot()["POST /issue"]
+        assert stats["calls"] == 2
+        assert stats["compressed_calls"] == 0
+        assert stats["request_ratio"] == 1.0
+
+
+class TestResponseCompression:
+    def test_sync_client_reports_wire_bytes(self, stub_server):
+        server, base_url = stub_server
+        server.gzip_responses = True
+        server.script.append((200, {}, [{"accountId": str(i), "displayName": "Usuario"} for i in range(200)]))
+
+        with JiraClient(**credentials(base_url)) as client:
+            users = client.search_user("Usuario")
+
+        assert len(users) == 200
+        stats = transfer_stats.snapshot()["GET /user/search"]
+        assert stats["response_wire_bytes"] < stats["response_bytes"]
+
+    async def test_async_client_reports_wire_bytes(self, stub_server):
+        server, base_url = stub_server
+        server.gzip_responses = True
+        server.script.append((200, {}, [{"accountId": str(i), "displayName": "Usuario"} for i in range(200)]))
+
+        async with AsyncJiraClient(**credentials(base_url)) as client:
+            users = await client.search_user("Usuario")
+
+        assert len(users) == 200
+        stats = transfer_stats.snapshot()["GET /user/search"]
+        assert stats["response_wire_bytes"] < stats["response_bytes"]
@@ -0,0 +1,246 @@
+"""
+Tests unitarios para la validación local de payloads con createmeta.
+"""
+
+import pytest
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.client_registry import site_id
+from app.clients.create_meta import (
+    FieldMeta,
+    IssueTypeMeta,
+    apply_create_meta,
+    create_meta_cache_snapshot,
+    dropped_fields,
+    get_create_meta_cache,
+    match_issue_type,
+)
+from app.clients.jira_client import JiraAPIError, JiraClient, JiraClientConfig
+from app.services.reel_workflow_service import ReelWorkflowService
+from benchmarks.jira_simulator import JiraSimulator
+
+TYPES = [
+    IssueTypeMeta(id="1", name="Task"),
+    IssueTypeMeta(id="2", name="Bug"),
+    IssueTypeMeta(id="3", name="Sub-task", subtask=True),
+]
+
+
+class TestMatching:
+    @pytest.mark.parametrize("name, expected", [
+        ("Task", "Task"),
+        ("task", "Task"),
+        ("Subtask", "Sub-task"),
+        ("sub task", "Sub-task"),
+        ("Subtarea", "Sub-task"),
+    ])
+    def test_match_issue_type(self, name, expected):
+        assert match_issue_type(TYPES, name).name == expected
+
+    def test_unknown_issue_type(self):
+        assert match_issue_type(TYPES, "Epic") is None
+
+    def test_apply_normalizes_and_drops_off_screen_fields(self):
+        issue_type = IssueTypeMeta(id="3", name="Sub-task", subtask=True, fields={
+            "summary": FieldMeta("summary", "Summary", required=True),
+            "parent": FieldMeta("parent", "Parent", required=True),
+            "labels": FieldMeta("labels", "Labels"),
+        })
+        fields = {
+            "project": {"key": "KAN"},
+            "issuetype": {"name": "Subtask"},
+            "summary": "Edición",
+            "parent": {"key": "KAN-1"},
+            "labels": ["reel"],
+            "priority": {"name": "High"},
+        }
+        normalized, errors = apply_create_meta(fields, issue_type)
+
+        assert errors == {}
+        assert normalized["issuetype"] == {"name": "Sub-task"}
+        assert "priority" not in normalized
+        assert dropped_fields(fields, normalized, errors) == ["priority"]
+        # El payload original no cambia
+        assert fields["priority"] == {"name": "High"}
+
+    def test_apply_reports_invalid_values_and_missing_required(self):
+        issue_type = IssueTypeMeta(id="1", name="Task", fields={
+            "summary": FieldMeta("summary", "Summary", required=True),
+            "duedate": FieldMeta("duedate", "Due date", required=True),
+            "reporter": FieldMeta("reporter", "Reporter", required=True, has_default=True),
+            "priority": FieldMeta("priority", "Priority", allowed={"high": "High", "low": "Low"}),
+        })
+        normalized, errors = apply_create_meta(
+            {"issuetype": {"name": "Task"}, "summary": "X", "priority": {"name": "HIGH"}},
+            issue_type
+        )
+        assert normalized["priority"] == {"name": "High"}
+        assert set(errors) == {"duedate"}
+
+        _, errors = apply_create_meta(
+            {"issuetype": {"name": "Task"}, "summary": "X", "duedate": "2026-01-01", "priority": {"name": "Urgente"}},
+            issue_type
+        )
+        assert set(errors) == {"priority"}
+
+
+@pytest.fixture
+def simulator():
+    with JiraSimulator() as jira:
+        yield jira
+
+
+def make_client(cls, simulator, **config):
+    config.setdefault("rate_limit_per_minute", 0)
+    config.setdefault("max_retries", 0)
+    config.setdefault("create_meta_ttl", 3600)
+    client = cls(base_url=simulator.base_url, email="a@b.com", api_token="x", config=JiraClientConfig(**config))
+    if client.create_meta_cache is not None:
+        client.create_meta_cache.invalidate()
+    return client
+
+
+def requests_to(simulator, method: str, prefix: str) -> int:
+    return sum(
+        1 for sent, path, _ in simulator.received
+        if sent == method and path.split("?")[0] == f"/rest/api/3/{prefix}"
+    )
+
+
+class TestClientValidation:
+    def test_invalid_issue_type_never_reaches_jira(self, simulator):
+        with make_client(JiraClient, simulator) as client:
+            with pytest.raises(JiraAPIError) as error:
+                client.create_issue(project_key="KAN", summary="Reel", issue_type="Historia")
+
+        assert error.value.status_code == 400
+        assert "issuetype" in error.value.response["errors"]
+        assert requests_to(simulator, "POST", "issue") == 0
+        assert client.create_meta_cache.snapshot()["rejected"] == 1
+
+    def test_invalid_priority_never_reaches_jira(self, simulator):
+        with make_client(JiraClient, simulator) as client:
+            with pytest.raises(JiraAPIError) as error:
+                client.create_issue(project_key="KAN", summary="Reel", priority="Urgentísima")
+
+        assert "priority" in error.value.response["errors"]
+        assert requests_to(simulator, "POST", "issue") == 0
+
+    def test_missing_required_field(self, simulator):
+        simulator.add_project("REQ", "Con fecha", required_fields=["duedate"])
+        with make_client(JiraClient, simulator) as client:
+            with pytest.raises(JiraAPIError) as error:
+                client.create_issue(project_key="REQ", summary="Reel")
+
+        assert set(error.value.response["errors"]) == {"duedate"}
+        assert requests_to(simulator, "POST", "issue") == 0
+
+    def test_metadata_is_cached(self, simulator):
+        with make_client(JiraClient, simulator) as client:
+            client.create_issue(project_key="KAN", summary="Uno", priority="high")
+            client.create_issue(project_key="KAN", summary="Dos")
+
+        assert requests_to(simulator, "GET", "issue/createmeta/KAN/issuetypes") == 1
+        assert requests_to(simulator, "POST", "issue") == 2
+        # La prioridad se envió con el nombre exacto de Jira
+        assert simulator.issues["KAN-1"]["fields"]["priority"] == {"name": "High"}
+
+    def test_dropped_fields_are_logged_and_counted(self, simulator, caplog):
+        simulator.add_project("NOP", "Sin prioridad en subtareas", subtask_hidden_fields=["priority"])
+        with make_client(JiraClient, simulator) as client:
+            before = client.create_meta_cache.snapshot()["dropped"].get("priority", 0)
+            parent = client.create_issue(project_key="NOP", summary="Reel")
+            payload = client._build_issue_payload(
+                project_key="NOP", summary="Edición", issue_type="Subtask", priority="High"
+            )
+            payload["fields"]["parent"] = {"key": parent["key"]}
+            result = client.create_issues_bulk([payload])
+            after = client.create_meta_cache.snapshot()["dropped"].get("priority", 0)
+
+        assert "priority" not in simulator.issues[result["issues"][0]["key"]]["fields"]
+        assert after - before == 1
+        assert any(
+            record.levelname == "WARNING" and "NOP/Subtask" in record.getMessage() and "priority" in record.getMessage()
+            for record in caplog.records
+        )
+
+    def test_unavailable_metadata_sends_unvalidated(self, simulator):
+        simulator.script.append((500, {}, {"errorMessages": ["Fallo"]}))
+        with make_client(JiraClient, simulator) as client:
+            issue = client.create_issue(project_key="KAN", summary="Reel")
+        assert issue["key"] == "KAN-1"
+
+    def test_disabled_by_default_in_client_config(self, simulator):
+        with make_client(JiraClient, simulator, create_meta_ttl=0) as client:
+            assert client.create_meta_cache is None
+            client.create_issue(project_key="KAN", summary="Reel")
+        assert requests_to(simulator, "GET", "issue/createmeta/KAN/issuetypes") == 0
+
+    async def test_bulk_skips_invalid_payloads(self, simulator):
+        async with make_client(AsyncJiraClient, simulator) as client:
+            payloads = [
+                client._build_issue_payload(project_key="KAN", summary="Uno"),
+                client._build_issue_payload(project_key="KAN", summary="Dos", issue_type="Historia"),
+                client._build_issue_payload(project_key="KAN", summary="Tres", priority="Nula"),
+                client._build_issue_payload(project_key="KAN", summary="Cuatro"),
+            ]
+            result = await client.create_issues_bulk(payloads)
+
+        assert [(issue["index"], issue["key"]) for issue in result["issues"]] == [(0, "KAN-1"), (3, "KAN-2")]
+        assert [(error["index"], error["status"]) for error in result["errors"]] == [(1, 400), (2, 400)]
+        assert "issuetype" in result["errors"][0]["errors"]
+        # Solo los dos válidos viajaron a Jira
+        bodies = [body for method, path, body in simulator.received if path == "/rest/api/3/issue/bulk"]
+        assert len(bodies[0]["issueUpdates"]) == 2
+
+
+class TestWorkflowSubtasks:
+    async def test_subtask_type_name_is_normalized(self, simulator):
+        simulator.add_project("OLD", "Sitio antiguo", issue_types=("Task", "Sub-task"))
+        async with make_client(AsyncJiraClient, simulator) as client:
+            result = await ReelWorkflowService(client).create_reel_workflow(
+                project_key="OLD", title="Komodo", priority="High"
+            )
+
+        assert result["success"] is True
+        subtask = simulator.issues[result["subtasks"][0]["key"]]
+        assert subtask["fields"]["issuetype"] == {"name": "Sub-task"}
+        assert subtask["fields"]["priority"] == {"name": "High"}
+
+    async def test_priority_is_left_out_when_subtasks_lack_it(self, simulator):
+        simulator.add_project("NOP", "Sin prioridad en subtareas", subtask_hidden_fields=["priority"])
+        async with make_client(AsyncJiraClient, simulator) as client:
+            result = await ReelWorkflowService(client).create_reel_workflow(
+                project_key="NOP", title="Komodo", priority="High"
+            )
+
+        assert result["success"] is True
+        main = simulator.issues[result["main_task"]["key"]]
+        subtask = simulator.issues[result["subtasks"][0]["key"]]
+        assert main["fields"]["priority"] == {"name": "High"}
+        assert "priority" not in subtask["fields"]
+
+    async def test_project_without_subtasks_fails_before_creating(self, simulator):
+        simulator.add_project("FLAT", "Sin subtareas", issue_types=("Task",))
+        async with make_client(AsyncJiraClient, simulator) as client:
+            with pytest.raises(JiraAPIError) as error:
+                await ReelWorkflowService(client).create_reel_workflow(project_key="FLAT", title="Komodo")
+
+        assert error.value.status_code == 400
+        assert simulator.issues == {}
+
+
+def test_snapshot_does_not_expose_site_urls():
+    get_create_meta_cache("https://cliente-oculto.atlassian.net")
+    snapshot = create_meta_cache_snapshot()
+    assert not any("cliente-oculto" in key for key in snapshot)
+    assert site_id("https://cliente-oculto.atlassian.net") in snapshot
+
+
+def test_caches_are_per_credentials():
+    url = "https://compartido.atlassian.net"
+    first = get_create_meta_cache(url, "a@b.com", "token-a")
+
+    assert get_create_meta_cache(url.upper() + "/", "a@b.com", "token-a") is first
+    assert get_create_meta_cache(url, "otro@b.com", "token-b") is not first
+    assert create_meta_cache_snapshot()[site_id(url)]["credentials"] == 2
@@ -0,0 +1,149 @@
+"""
+Tests unitarios para los deadlines de petición.
+"""
+
+import pytest
+
+from app.clients.deadline import SharedDeadline, deadline, expired, remaining, shared_deadline
+from app.clients.jira_client import JiraAPIError, JiraClient, JiraClientConfig
+from benchmarks.stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub_server():
+    server, base_url = start_stub_server()
+    yield server, base_url
+    server.shutdown()
+
+
+def make_client(base_url: str, **config) -> JiraClient:
+    config.setdefault("rate_limit_per_minute", 0)
+    return JiraClient(
+        base_url=base_url,
+        email="test@example.com",
+        api_token="token",
+        config=JiraClientConfig(**config)
+    )
+
+
+class TestDeadline:
+    """Tests para el ContextVar de deadline."""
+
+    def test_no_deadline_by_default(self):
+        assert remaining() is None
+        assert not expired()
+
+    def test_nested_deadline_never_extends_outer(self):
+        with deadline(1):
+            with deadline(60):
+                assert remaining() <= 1
+            with deadline(0.5):
+                assert remaining() <= 0.5
+        assert remaining() is None
+
+
+class TestSharedDeadline:
+    """Tests para el deadline de una llamada compartida."""
+
+    def test_extends_to_furthest_caller(self):
+        shared = SharedDeadline()
+        shared.join(100.0)
+        shared.join(50.0)
+        assert shared.at() == 100.0
+        shared.join(200.0)
+        assert shared.at() == 200.0
+
+    def test_caller_without_deadline_removes_it(self):
+        shared = SharedDeadline()
+        shared.join(100.0)
+        shared.join(None)
+        shared.join(300.0)
+        assert shared.at() is None
+
+    def test_replaces_outer_deadline(self):
+        shared = SharedDeadline()
+        with deadline(60):
+            shared.join(None)
+            with shared_deadline(shared):
+                assert remaining() is None
+                with deadline(1):
+                    assert remaining() <= 1
+            assert remaining() > 1
+
+
+class TestClientDeadline:
+    """El cliente recorta timeouts y deja de trabajar sin presupuesto."""
+
+    def test_timeouts_clipped_to_deadline(self, stub_server):
+        _, base_url = stub_server
+        with make_client(base_url, timeout=30, connect_timeout=5) as client:
+            assert client._call_timeouts("url") == (5, 30)
+            with deadline(2):
+                connect, read = client._call_timeouts("url")
+        assert connect <= 2 and read <= 2
+
+    def test_expired_deadline_skips_request(self, stub_server):
+        server, base_url = stub_server
+        with make_client(base_url) as client:
+            with deadline(1e-9):
+                with pytest.raises(JiraAPIError) as exc_info:
+                    client.get_current_user()
+
+        assert exc_info.value.status_code == 504
+        assert server.request_count == 0
+
+    def test_no_retry_past_deadline(self, stub_server):
+        """Un Retry-After mayor que el presupuesto restante no se espera."""
+        server, base_url = stub_server
+        server.script.append((503, {"Retry-After": "10"}, {"errorMessages": ["ocupado"]}))
+        with make_client(base_url, max_retries=3) as client:
+            with deadline(2):
+                with pytest.raises(JiraAPIError) as exc_info:
+                    client.get_current_user()
+
+        assert exc_info.value.status_code == 503
+        assert server.request_count == 1
+
+
+class TestBatchDeadline:
+    """Tests para el presupuesto total de /tasks/batch."""
+
+    async def test_remaining_workflows_fail_fast(self, monkeypatch):
+        """Al agotarse el presupuesto del batch, los workflows pendientes no llaman a Jira."""
+        import asyncio
+
+        from app.api.dependencies import IdempotencyContext
+        from app.api.routes import batch_tasks
+
+        calls = []
+
+        class SlowWorkflowService:
+            def __init__(self, client):
+                pass
+
+            async def create_reel_workflow(self, **kwargs):
+                calls.append(remaining())
+                await asyncio.sleep(0.1)
+                return {
+                    "success": True,
+                    "main_task": {"key": "KAN-1", "url": "https://jira/KAN-1"},
+                    "subtasks": [],
+                    "failed_subtasks": [],
+                    "total_tasks": 1,
+                }
+
+        monkeypatch.setattr(batch_tasks, "ReelWorkflowService", SlowWorkflowService)
+        monkeypatch.setattr(batch_tasks.settings, "BATCH_DEADLINE_SECONDS", 0.05)
+        monkeypatch.setattr(batch_tasks.settings, "WORKFLOW_DEADLINE_SECONDS", 30)
+
+        request = batch_tasks.CreateBatchTasksRequest(
+            tasks=[{"text": f"Crear reel número {i}", "assignee": "abc"} for i in range(3)]
+        )
+        response = await batch_tasks.create_batch_tasks(request, object(), IdempotencyContext())
+
+        # El workflow hereda el presupuesto del batch, no los 30s propios
+        assert len(calls) == 1
+        assert calls[0] <= 0.05
+        assert response.total_created == 1
+        assert response.total_failed == 2
+        assert "Sin tiempo" in response.results[2].error
@@ -0,0 +1,217 @@
+"""
+Tests unitarios para los health checks en segundo plano.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.health_monitor import HealthMonitor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def probe(result=None, error=None, delay=0.0):
+    calls = []
+
+    async def run():
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return result
+
+    run.calls = calls
+    return run
+
+
+class TestHealthMonitor:
+    async def test_pending_until_first_round(self):
+        monitor = HealthMonitor()
+        monitor.register("database", probe())
+        ready, result = monitor.readiness()
+        assert ready is False
+        assert result["checks"]["database"]["status"] == "pending"
+
+        await monitor.refresh()
+        ready, result = monitor.readiness()
+        assert ready is True
+        assert result["status"] == "ready"
+        database = result["checks"]["database"]
+        assert database["latency_ms"] >= 0
+        assert database["age_seconds"] == 0
+        assert database["checked_at"] is not None
+
+    async def test_readiness_does_not_run_probes(self):
+        database = probe()
+        monitor = HealthMonitor()
+        monitor.register("database", database)
+        await monitor.refresh()
+        for _ in range(5):
+            monitor.readiness()
+            monitor.liveness()
+        assert len(database.calls) == 1
+
+    async def test_critical_failure_is_not_ready(self):
+        monitor = HealthMonitor()
+        monitor.register("database", probe(error=RuntimeError("sin conexión")))
+        await monitor.refresh()
+        await monitor.refresh()
+
+        ready, result = monitor.readiness()
+        assert ready is False
+        assert result["status"] == "not_ready"
+        assert result["checks"]["database"]["error"] == "sin conexión"
+        assert result["checks"]["database"]["consecutive_failures"] == 2
+
+    async def test_non_critical_failure_only_degrades(self):
+        monitor = HealthMonitor()
+        monitor.register("database", probe())
+        monitor.register("jira", probe(error=RuntimeError("503")), critical=False)
+        await monitor.refresh()
+
+        ready, result = monitor.readiness()
+        assert ready is True
+        assert result["status"] == "degraded"
+
+    async def test_slow_probe_times_out_without_delaying_others(self):
+        monitor = HealthMonitor(timeout=0.05)
+        monitor.register("database", probe(result="ok"))
+        monitor.register("jira", probe(delay=1), critical=False)
+        await monitor.refresh()
+
+        jira = monitor.result("jira")
+        assert jira["status"] == "error"
+        assert "0.05" in jira["error"]
+        assert monitor.result("database")["detail"] == "ok"
+
+    async def test_old_results_are_stale(self):
+        clock = FakeClock()
+        monitor = HealthMonitor(interval=10, timeout=1, stale_after=30, clock=clock)
+        monitor.register("database", probe())
+        await monitor.refresh()
+
+        clock.now += 31
+        ready, result = monitor.readiness()
+        assert ready is False
+        assert result["checks"]["database"]["stale"] is True
+        assert result["checks"]["database"]["age_seconds"] == 31
+
+    def test_default_stale_after(self):
+        assert HealthMonitor(interval=15, timeout=5).stale_after == 50
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            HealthMonitor(interval=0)
+
+    async def test_background_refresh(self):
+        database = probe()
+        monitor = HealthMonitor(interval=0.01)
+        monitor.register("database", database)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            assert monitor.running
+        finally:
+            await monitor.stop()
+
+        assert len(database.calls) >= 2
+        assert not monitor.running
+        assert monitor.liveness()["monitor_running"] is False
+
+
+class TestHealthEndpoints:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        from app import main
+
+        monitor = HealthMonitor()
+        monkeypatch.setattr(main, "health_monitor", monitor)
+        return TestClient(main.app), monitor
+
+    def test_liveness_ignores_dependencies(self, client):
+        http, monitor = client
+        monitor.register("database", probe(error=RuntimeError("caída")))
+        response = http.get("/api/v1/health/live")
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+
+    async def test_readiness_status_code(self, client):
+        http, monitor = client
+        monitor.register("database", probe())
+        assert http.get("/api/v1/health/ready").status_code == 503
+
+        await monitor.refresh()
+        response = http.get("/api/v1/health/ready")
+        assert response.status_code == 200
+        assert response.json()["checks"]["database"]["status"] == "ok"
+
+    def test_health_does_not_query_outbox_in_request(self, client, monkeypatch):
+        from app import main
+
+        http, monitor = client
+        monitor.register("database", probe())
+        monitor.register("outbox", probe(result={"entries": {"pending": 3}}), critical=False)
+
+        def blocking_snapshot():
+            raise AssertionError("el health check consultó la base de datos en el request")
+
+        monkeypatch.setattr(main.outbox_worker, "snapshot", blocking_snapshot)
+        response = http.get("/api/v1/health")
+        # Todavía no corrió ningún chequeo
+        assert response.status_code == 503
+        assert response.json()["checks"]["outbox"]["status"] == "pending"
+
+    async def test_outbox_check_runs_in_thread(self, monkeypatch):
+        import threading
+
+        from app.api import dependencies
+
+        threads = []
+        monkeypatch.setattr(
+            dependencies.outbox_worker, "snapshot",
+            lambda: threads.append(threading.current_thread()) or {"entries": {}}
+        )
+        assert await dependencies.check_outbox() == {"entries": {}}
+        assert threads[0] is not threading.main_thread()
+
+    async def test_health_reflects_database_check(self, client):
+        http, monitor = client
+        monitor.register("database", probe(error=RuntimeError("sin conexión")))
+        await monitor.refresh()
+
+        response = http.get("/api/v1/health")
+        assert response.status_code == 503
+        assert response.json()["status"] == "unhealthy"
+        assert response.json()["database"] == "error"
+        # Las métricas internas no son públicas
+        assert "jira_rate_limits" not in response.json()
+
+    def test_details_require_superuser(self, client):
+        from app import main
+        from app.api.dependencies import get_current_active_superuser
+        from app.services.principal_cache import Principal
+
+        http, monitor = client
+        monitor.register("database", probe())
+        assert http.get("/api/v1/health/details").status_code in (401, 403)
+
+        main.app.dependency_overrides[get_current_active_superuser] = lambda: Principal(
+            id=1, username="admin", email="admin@empresa.com", is_active=True, is_superuser=True,
+            jira_base_url=None, jira_email=None, jira_api_token=None, jira_fingerprint="f"
+        )
+        try:
+            response = http.get("/api/v1/health/details")
+        finally:
+            main.app.dependency_overrides.clear()
+        assert response.status_code == 200
+        assert "jira_rate_limits" in response.json()
+        assert "health_monitor" in response.json()
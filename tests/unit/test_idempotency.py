@@ -0,0 +1,293 @@
+"""
+Tests unitarios para el soporte de Idempotency-Key.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api import dependencies
+from app.api.dependencies import IdempotencyContext, get_current_user, idempotency_guard
+from app.core.database import Base
+from app.core.exceptions import IdempotencyInProgressException, IdempotencyKeyMismatchException
+from app.models.idempotency import IDEMPOTENCY_COMPLETED, IdempotencyRecord
+from app.models.user import User
+from app.services.idempotency_service import CLAIMED, REPLAY, IdempotencyStore, request_fingerprint
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # Archivo y no memoria: los duplicados concurrentes usan conexiones distintas
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'idempotency.db'}",
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = factory()
+    db.add(User(id=1, email="ana@empresa.com", username="ana", hashed_password="x"))
+    db.add(User(id=2, email="luis@empresa.com", username="luis", hashed_password="x"))
+    db.commit()
+    db.close()
+    yield factory
+    engine.dispose()
+
+
+class Clock:
+    def __init__(self):
+        self.now = datetime.now(timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+class TestFingerprint:
+    def test_json_body_is_normalized(self):
+        a = request_fingerprint("POST", "/api/v1/tasks/batch", b'{"a": 1, "b": [1, 2]}')
+        b = request_fingerprint("post", "/api/v1/tasks/batch", b'{"b":[1,2],"a":1}')
+        assert a == b
+
+    def test_differs_by_body_and_path(self):
+        base = request_fingerprint("POST", "/api/v1/tasks/create", b'{"text": "uno"}')
+        assert base != request_fingerprint("POST", "/api/v1/tasks/create", b'{"text": "dos"}')
+        assert base != request_fingerprint("POST", "/api/v1/tasks/batch", b'{"text": "uno"}')
+
+
+class TestStore:
+    async def test_claim_then_replay(self, session_factory):
+        store = IdempotencyStore(session_factory)
+        state, record = await store.begin(1, "k1", "POST /x", "f")
+        assert state == CLAIMED
+        await store.complete(record, 201, '{"key": "KAN-1"}', {"location": "/x/1"})
+
+        state, record = await store.begin(1, "k1", "POST /x", "f")
+        assert state == REPLAY
+        assert record.response_status == 201
+        assert record.response_body == '{"key": "KAN-1"}'
+        assert record.headers_data == {"location": "/x/1"}
+        assert store.snapshot()["replayed"] == 1
+
+    async def test_keys_are_scoped_per_user(self, session_factory):
+        store = IdempotencyStore(session_factory)
+        _, record = await store.begin(1, "k1", "POST /x", "f")
+        await store.complete(record, 200, "{}")
+        state, _ = await store.begin(2, "k1", "POST /x", "otro body")
+        assert state == CLAIMED
+
+    async def test_reused_key_with_other_body(self, session_factory):
+        store = IdempotencyStore(session_factory)
+        _, record = await store.begin(1, "k1", "POST /x", "f")
+        await store.complete(record, 200, "{}")
+        with pytest.raises(IdempotencyKeyMismatchException):
+            await store.begin(1, "k1", "POST /x", "g")
+        with pytest.raises(IdempotencyKeyMismatchException):
+            await store.begin(1, "k1", "POST /y", "f")
+
+    async def test_invalid_key(self, session_factory):
+        store = IdempotencyStore(session_factory)
+        with pytest.raises(ValueError):
+            await store.begin(1, "", "POST /x", "f")
+        with pytest.raises(ValueError):
+            await store.begin(1, "k" * 256, "POST /x", "f")
+
+    async def test_released_key_can_be_retried(self, session_factory):
+        store = IdempotencyStore(session_factory)
+        _, record = await store.begin(1, "k1", "POST /x", "f")
+        await store.release(record)
+        state, _ = await store.begin(1, "k1", "POST /x", "f")
+        assert state == CLAIMED
+
+    async def test_duplicate_gives_up_while_original_runs(self, session_factory):
+        store = IdempotencyStore(session_factory, wait_timeout=0.2, poll_interval=0.05)
+        await store.begin(1, "k1", "POST /x", "f")
+        with pytest.raises(IdempotencyInProgressException):
+            await store.begin(1, "k1", "POST /x", "f")
+
+    async def test_duplicate_wakes_when_original_completes(self, session_factory):
+        store = IdempotencyStore(session_factory, wait_timeout=5, poll_interval=5)
+        _, record = await store.begin(1, "k1", "POST /x", "f")
+
+        async def finish():
+            await asyncio.sleep(0.1)
+            await store.complete(record, 200, '{"ok": true}')
+
+        started = asyncio.get_running_loop().time()
+        (state, replayed), _ = await asyncio.gather(store.begin(1, "k1", "POST /x", "f"), finish())
+        assert state == REPLAY
+        assert replayed.response_body == '{"ok": true}'
+        # Despertado por el evento, no por el poll de 5 segundos
+        assert asyncio.get_running_loop().time() - started < 2
+
+    async def test_abandoned_request_is_taken_over(self, session_factory):
+        clock = Clock()
+        store = IdempotencyStore(session_factory, lock_timeout=60, wait_timeout=0, clock=clock)
+        await store.begin(1, "k1", "POST /x", "f")
+        clock.advance(61)
+        state, record = await store.begin(1, "k1", "POST /x", "f")
+        assert state == CLAIMED
+        assert record.key == "k1"
+
+    async def test_old_owner_cannot_touch_taken_over_key(self, session_factory):
+        clock = Clock()
+        store = IdempotencyStore(session_factory, lock_timeout=60, wait_timeout=0, clock=clock)
+        _, stale = await store.begin(1, "k1", "POST /x", "f")
+        clock.advance(61)
+        _, current = await store.begin(1, "k1", "POST /x", "f")
+
+        # El dueño original termina tarde: ni borra ni pisa el nuevo reclamo
+        await store.release(stale)
+        await store.complete(stale, 201, '{"key": "KAN-1"}')
+        with pytest.raises(IdempotencyInProgressException):
+            await store.begin(1, "k1", "POST /x", "f")
+
+        await store.complete(current, 201, '{"key": "KAN-2"}')
+        state, record = await store.begin(1, "k1", "POST /x", "f")
+        assert state == REPLAY
+        assert record.response_body == '{"key": "KAN-2"}'
+
+    async def test_expired_key_is_reclaimed(self, session_factory):
+        clock = Clock()
+        store = IdempotencyStore(session_factory, ttl=60, clock=clock)
+        _, record = await store.begin(1, "k1", "POST /x", "f")
+        await store.complete(record, 200, "{}")
+        clock.advance(61)
+        state, _ = await store.begin(1, "k1", "POST /x", "otro body")
+        assert state == CLAIMED
+
+    async def test_purge_expired(self, session_factory):
+        clock = Clock()
+        store = IdempotencyStore(session_factory, ttl=60, clock=clock)
+        for key in ("a", "b"):
+            _, record = await store.begin(1, key, "POST /x", "f")
+            await store.complete(record, 200, "{}")
+        clock.advance(61)
+        assert store.purge_expired() == 2
+
+    async def test_background_purge(self, session_factory, monkeypatch):
+        import threading
+
+        clock = Clock()
+        store = IdempotencyStore(session_factory, ttl=60, purge_interval=0.01, clock=clock)
+        _, record = await store.begin(1, "a", "POST /x", "f")
+        await store.complete(record, 200, "{}")
+        clock.advance(61)
+
+        threads = []
+        purge = store.purge_expired
+        monkeypatch.setattr(store, "purge_expired", lambda: threads.append(threading.current_thread()) or purge())
+        store.start()
+        try:
+            await asyncio.sleep(0.05)
+            assert store.snapshot()["purge_running"]
+        finally:
+            await store.stop()
+
+        # Corre varias veces y fuera del event loop
+        assert len(threads) >= 2
+        assert threading.main_thread() not in threads
+        assert store.snapshot()["purged"] == 1
+        assert not store.snapshot()["purge_running"]
+
+
+@pytest.fixture
+def api(session_factory, monkeypatch):
+    """App mínima con un endpoint de creación protegido por idempotency_guard."""
+    monkeypatch.setattr(
+        dependencies, "idempotency_store",
+        IdempotencyStore(session_factory, wait_timeout=5, poll_interval=0.02)
+    )
+    app = FastAPI()
+    app.dependency_overrides[get_current_user] = lambda: User(id=1, email="ana@empresa.com", username="ana")
+    created = []
+
+    @app.post("/create")
+    async def create(body: dict, idempotency: IdempotencyContext = Depends(idempotency_guard)):
+        if idempotency.replay is not None:
+            return idempotency.replay
+        await asyncio.sleep(body.get("delay", 0))
+        if body.get("fail"):
+            raise HTTPException(status_code=502, detail="Jira no responde")
+        created.append(body["summary"])
+        if body.get("async"):
+            return await idempotency.save(JSONResponse(
+                status_code=202, content={"outbox_id": 7}, headers={"Location": "/api/v1/outbox/7"}
+            ))
+        return await idempotency.save({"issue_key": f"KAN-{len(created)}"})
+
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    return client, created, session_factory
+
+
+class TestGuard:
+    async def test_retry_replays_response(self, api):
+        client, created, _ = api
+        headers = {"Idempotency-Key": "abc"}
+        first = await client.post("/create", json={"summary": "Uno"}, headers=headers)
+        second = await client.post("/create", json={"summary": "Uno"}, headers=headers)
+
+        assert first.json() == second.json() == {"issue_key": "KAN-1"}
+        assert second.headers["idempotent-replayed"] == "true"
+        assert "idempotent-replayed" not in first.headers
+        assert created == ["Uno"]
+
+    async def test_without_header_every_request_runs(self, api):
+        client, created, _ = api
+        await client.post("/create", json={"summary": "Uno"})
+        await client.post("/create", json={"summary": "Uno"})
+        assert created == ["Uno", "Uno"]
+
+    async def test_concurrent_duplicates_run_once(self, api):
+        client, created, _ = api
+        headers = {"Idempotency-Key": "doble-clic"}
+        responses = await asyncio.gather(*(
+            client.post("/create", json={"summary": "Reel", "delay": 0.2}, headers=headers)
+            for _ in range(3)
+        ))
+        assert created == ["Reel"]
+        assert {r.status_code for r in responses} == {200}
+        assert {r.json()["issue_key"] for r in responses} == {"KAN-1"}
+
+    async def test_failure_releases_key(self, api):
+        client, created, session_factory = api
+        headers = {"Idempotency-Key": "falla"}
+        failed = await client.post("/create", json={"summary": "X", "fail": True}, headers=headers)
+        assert failed.status_code == 502
+
+        db = session_factory()
+        assert db.query(IdempotencyRecord).count() == 0
+        db.close()
+
+        # El mismo key (con otro body) vuelve a ejecutarse
+        ok = await client.post("/create", json={"summary": "X"}, headers=headers)
+        assert ok.status_code == 200
+        assert created == ["X"]
+
+    async def test_mismatched_body_is_rejected(self, api):
+        client, _, _ = api
+        headers = {"Idempotency-Key": "abc"}
+        await client.post("/create", json={"summary": "Uno"}, headers=headers)
+        response = await client.post("/create", json={"summary": "Dos"}, headers=headers)
+        assert response.status_code == 422
+
+    async def test_accepted_response_is_replayed_with_location(self, api):
+        client, created, session_factory = api
+        headers = {"Idempotency-Key": "async"}
+        await client.post("/create", json={"summary": "Uno", "async": True}, headers=headers)
+        replay = await client.post("/create", json={"summary": "Uno", "async": True}, headers=headers)
+
+        assert replay.status_code == 202
+        assert replay.headers["location"] == "/api/v1/outbox/7"
+        assert replay.json() == {"outbox_id": 7}
+        assert created == ["Uno"]
+        db = session_factory()
+        assert db.query(IdempotencyRecord).one().status == IDEMPOTENCY_COMPLETED
+        db.close()
@@ -0,0 +1,172 @@
+"""
+Tests unitarios para los hooks de instrumentación de los clientes de Jira.
+"""
+
+import pytest
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.instrumentation import (
+    LatencyHistogram,
+    RequestCounter,
+    RequestEvent,
+    default_hooks,
+    operation,
+    register_hook,
+    unregister_hook,
+)
+from app.clients.jira_client import JiraAPIError, JiraClient, JiraClientConfig
+from app.clients.transfer_stats import TransferStats, transfer_stats
+from benchmarks.stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub_server():
+    server, base_url = start_stub_server()
+    yield server, base_url
+    server.shutdown()
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def observe(self, event):
+        self.events.append(event)
+
+
+def credentials(base_url: str, **config) -> dict:
+    config.setdefault("rate_limit_per_minute", 0)
+    config.setdefault("retry_base_delay", 0.01)
+    config.setdefault("retry_max_delay", 0.01)
+    return {
+        "base_url": base_url,
+        "email": "test@example.com",
+        "api_token": "token",
+        "config": JiraClientConfig(**config),
+    }
+
+
+def event(endpoint="/issue/{key}", status_code=200, duration=0.03, retries=0, operation=None):
+    return RequestEvent(
+        method="GET",
+        endpoint=endpoint,
+        status_code=status_code,
+        request_bytes=0,
+        response_bytes=100,
+        duration=duration,
+        retries=retries,
+        operation=operation,
+    )
+
+
+class TestClientHooks:
+    def test_event_per_call_includes_retries(self, stub_server):
+        server, base_url = stub_server
+        server.script.extend([(503, {}, {}), (200, {}, {"key": "KAN-7"})])
+        recorder = Recorder()
+
+        with JiraClient(**credentials(base_url)) as client:
+            client.add_hook(recorder)
+            with operation("GET /api/v1/test"):
+                client.get_issue("KAN-7")
+
+        [call] = recorder.events
+        assert call.key == "GET /issue/{key}"
+        assert call.status_code == 200
+        assert call.retries == 1
+        assert call.response_bytes > 0
+        assert call.operation == "GET /api/v1/test"
+
+    def test_failed_call_reports_error_status(self, stub_server):
+        server, base_url = stub_server
+        server.script.append((404, {}, {"errorMessages": ["No existe"]}))
+        recorder = Recorder()
+
+        with JiraClient(**credentials(base_url)) as client:
+            client.add_hook(recorder)
+            with pytest.raises(JiraAPIError):
+                client.get_issue("KAN-404")
+
+        [call] = recorder.events
+        assert call.status_code == 404
+        assert call.failed
+        assert call.error == "JiraAPIError"
+
+    def test_broken_hook_does_not_break_call(self, stub_server):
+        _, base_url = stub_server
+
+        class Broken:
+            def observe(self, event):
+                raise RuntimeError("boom")
+
+        with JiraClient(**credentials(base_url)) as client:
+            client.add_hook(Broken())
+            assert client.get_issue("KAN-1") is not None
+
+    async def test_async_client_uses_registered_hooks(self, stub_server):
+        _, base_url = stub_server
+        recorder = Recorder()
+        register_hook(recorder)
+        try:
+            async with AsyncJiraClient(**credentials(base_url)) as client:
+                await client.create_issue(project_key="KAN", summary="Reel")
+        finally:
+            unregister_hook(recorder)
+
+        [call] = recorder.events
+        assert call.key == "POST /issue"
+        assert call.request_bytes > 0
+
+    def test_hook_without_observe_rejected(self, stub_server):
+        _, base_url = stub_server
+        with JiraClient(**credentials(base_url)) as client:
+            with pytest.raises(ValueError):
+                client.add_hook(object())
+
+
+class TestCollectors:
+    def test_histogram_buckets_and_percentiles(self):
+        histogram = LatencyHistogram(buckets_ms=(10, 100, 1000))
+        for duration in (0.005, 0.05, 0.05, 0.5, 5):
+            histogram.observe(event(duration=duration))
+
+        stats = histogram.snapshot()["GET /issue/{key}"]
+        assert stats["count"] == 5
+        assert stats["buckets"] == {"le_10": 1, "le_100": 2, "le_1000": 1, "inf": 1}
+        assert stats["p50_ms"] == 100
+        assert stats["p99_ms"] is None
+
+    def test_counter_by_endpoint_and_operation(self):
+        counter = RequestCounter()
+        counter.observe(event(operation="POST /api/v1/tasks/batch", retries=2))
+        counter.observe(event(status_code=500, operation="POST /api/v1/tasks/batch"))
+        counter.observe(event(endpoint="/myself"))
+
+        snapshot = counter.snapshot()
+        issue = snapshot["endpoints"]["GET /issue/{key}"]
+        assert issue["calls"] == 2
+        assert issue["errors"] == 1
+        assert issue["status"] == {"200": 1, "500": 1}
+
+        batch = snapshot["operations"]["POST /api/v1/tasks/batch"]
+        assert batch["jira_calls"] == 2
+        assert batch["retries"] == 2
+        assert snapshot["operations"]["-"]["endpoints"] == {"GET /myself": 1}
+
+    def test_transfer_stats_is_a_default_hook(self):
+        assert transfer_stats in default_hooks()
+
+    def test_transfer_stats_from_events(self):
+        stats = TransferStats()
+        stats.observe(RequestEvent(
+            method="POST", endpoint="/issue", status_code=201, request_bytes=1000,
+            response_bytes=300, duration=0.2, retries=1, request_wire_bytes=200, response_wire_bytes=100,
+        ))
+        stats.observe(event(status_code=None))
+
+        snapshot = stats.snapshot()
+        assert list(snapshot) == ["POST /issue"]
+        issue = snapshot["POST /issue"]
+        assert issue["compressed_calls"] == 1
+        assert issue["request_ratio"] == 0.2
+        assert issue["compressed_mean_ms"] == 200.0
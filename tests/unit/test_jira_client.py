@@ -0,0 +1,123 @@
+"""
+Tests unitarios para JiraClient.
+"""
+
+import pytest
+
+from app.clients.jira_client import JiraClient, JiraClientConfig
+from app.clients.async_jira_client import AsyncJiraClient
+from benchmarks.stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub_server():
+    """Servidor stub local que imita respuestas de Jira."""
+    server, base_url = start_stub_server()
+    yield server, base_url
+    server.shutdown()
+
+
+def make_client(base_url: str, **config) -> JiraClient:
+    """Crea un cliente contra el stub con configuración opcional."""
+    return JiraClient(
+        base_url=base_url,
+        email="test@example.com",
+        api_token="token",
+        config=JiraClientConfig(**config)
+    )
+
+
+class TestConnectionPool:
+    """Tests para la sesión HTTP persistente."""
+
+    def test_session_reuses_connection(self, stub_server):
+        """Peticiones consecutivas reutilizan la misma conexión del pool."""
+        server, base_url = stub_server
+        with make_client(base_url) as client:
+            client.get_current_user()
+            client.get_current_user()
+
+        assert server.connection_count == 1
+
+    def test_pool_size_from_config(self, stub_server):
+        """El adaptador respeta el tamaño de pool configurado."""
+        _, base_url = stub_server
+        with make_client(base_url, pool_maxsize=3, pool_block=True) as client:
+            adapter = client.session.get_adapter(base_url)
+            assert adapter._pool_maxsize == 3
+            assert adapter._pool_block is True
+
+    def test_keep_alive_disabled_sends_connection_close(self, stub_server):
+        """Sin keep-alive se envía Connection: close."""
+        server, base_url = stub_server
+        with make_client(base_url, keep_alive=False) as client:
+            assert client.session.headers["Connection"] == "close"
+            client.get_current_user()
+            client.get_current_user()
+
+        assert server.connection_count == 2
+
+
+class TestAsyncJiraClient:
+    """Tests para AsyncJiraClient."""
+
+    async def test_get_current_user(self, stub_server):
+        """Las corrutinas del cliente async retornan el JSON de Jira."""
+        server, base_url = stub_server
+        async with AsyncJiraClient(
+            base_url=base_url,
+            email="test@example.com",
+            api_token="token",
+            config=JiraClientConfig()
+        ) as client:
+            first = await client.get_current_user()
+            second = await client.get_current_user()
+
+        assert first["accountId"] == second["accountId"] == "stub"
+        assert server.connection_count == 1
+
+
+class TestBulkCreate:
+    """Tests para create_issues_bulk."""
+
+    def test_chunks_and_maps_partial_failures(self, stub_server):
+        """Se envían bloques de chunk_size y los errores se mapean al índice original."""
+        server, base_url = stub_server
+        server.script.append((201, {}, {
+            "issues": [{"id": "1", "key": "KAN-1"}],
+            "errors": [{
+                "status": 400,
+                "failedElementNumber": 1,
+                "elementErrors": {"errorMessages": [], "errors": {"summary": "Requerido"}}
+            }]
+        }))
+        server.script.append((201, {}, {"issues": [{"id": "3", "key": "KAN-3"}], "errors": []}))
+
+        payloads = [{"fields": {"summary": str(i)}} for i in range(3)]
+        with make_client(base_url) as client:
+            result = client.create_issues_bulk(payloads, chunk_size=2)
+
+        assert [issue["index"] for issue in result["issues"]] == [0, 2]
+        assert result["issues"][1]["key"] == "KAN-3"
+        assert result["errors"][0]["index"] == 1
+        assert result["errors"][0]["errors"] == {"summary": "Requerido"}
+        assert [path for _, path, _ in server.received] == ["/rest/api/3/issue/bulk"] * 2
+        assert len(server.received[0][2]["issueUpdates"]) == 2
+
+    def test_chunk_error_fails_every_item(self, stub_server):
+        """Un error del bloque completo marca como fallidos todos sus issues."""
+        server, base_url = stub_server
+        server.script.append((401, {}, {"errorMessages": ["No autorizado"]}))
+
+        with make_client(base_url) as client:
+            result = client.create_issues_bulk([{"fields": {}}, {"fields": {}}])
+
+        assert result["issues"] == []
+        assert [error["index"] for error in result["errors"]] == [0, 1]
+        assert all(error["status"] == 401 for error in result["errors"])
+
+    def test_invalid_chunk_size(self, stub_server):
+        _, base_url = stub_server
+        with make_client(base_url) as client:
+            with pytest.raises(ValueError):
+                client.create_issues_bulk([], chunk_size=51)
@@ -0,0 +1,126 @@
+"""
+Tests del simulador local de Jira usado para pruebas de carga y desarrollo.
+
+Además de probar el simulador, ejercitan los clientes contra un sitio con
+estado: keys consecutivas, validación de campos, paginación y rate limiting.
+"""
+
+import pytest
+import requests
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.jira_client import JiraAPIError, JiraClient, JiraClientConfig
+from app.clients.pagination import TOKEN
+from app.services.reel_workflow_service import ReelWorkflowService
+from benchmarks.jira_simulator import JiraSimulator, SimulatorConfig
+
+
+@pytest.fixture
+def simulator():
+    with JiraSimulator(SimulatorConfig(seed=1)) as jira:
+        yield jira
+
+
+def credentials(base_url: str, **config) -> dict:
+    config.setdefault("rate_limit_per_minute", 0)
+    config.setdefault("retry_base_delay", 0.01)
+    config.setdefault("retry_max_delay", 0.05)
+    return {
+        "base_url": base_url,
+        "email": "test@example.com",
+        "api_token": "token",
+        "config": JiraClientConfig(**config),
+    }
+
+
+class TestIssues:
+    def test_create_and_get_issue(self, simulator):
+        with JiraClient(**credentials(simulator.base_url)) as client:
+            first = client.create_issue(project_key="KAN", summary="Primero", priority="High")
+            second = client.create_issue(project_key="KAN", summary="Segundo")
+            issue = client.get_issue(second["key"])
+
+        assert (first["key"], second["key"]) == ("KAN-1", "KAN-2")
+        assert issue["fields"]["summary"] == "Segundo"
+        assert issue["fields"]["project"]["key"] == "KAN"
+
+    def test_validation_errors_like_jira(self, simulator):
+        simulator.add_project("OLD", "Sitio antiguo", hidden_fields=["priority"])
+        with JiraClient(**credentials(simulator.base_url)) as client:
+            with pytest.raises(JiraAPIError) as exc_info:
+                client.create_issue(project_key="OLD", summary="Con prioridad")
+            with pytest.raises(JiraAPIError) as missing:
+                client.get_issue("KAN-999")
+
+        assert exc_info.value.status_code == 400
+        assert "priority" in exc_info.value.response["errors"]
+        assert missing.value.status_code == 404
+
+    def test_bulk_reports_failed_elements(self, simulator):
+        payloads = [
+            {"fields": {"project": {"key": "KAN"}, "summary": "Ok", "issuetype": {"name": "Task"}}},
+            {"fields": {"project": {"key": "KAN"}, "summary": "Sin padre", "issuetype": {"name": "Subtask"}}},
+        ]
+        with JiraClient(**credentials(simulator.base_url)) as client:
+            result = client.create_issues_bulk(payloads)
+
+        assert [issue["index"] for issue in result["issues"]] == [0]
+        assert result["errors"][0]["index"] == 1
+        assert "parent" in result["errors"][0]["errors"]
+
+    async def test_reel_workflow_end_to_end(self, simulator):
+        async with AsyncJiraClient(**credentials(simulator.base_url)) as client:
+            result = await ReelWorkflowService(client).create_reel_workflow(project_key="KAN", title="Cartagena")
+
+        assert result["success"]
+        assert len(simulator.issues) == 7
+        subtask = simulator.issues[result["subtasks"][0]["key"]]
+        assert subtask["fields"]["parent"]["key"] == result["main_task"]["key"]
+
+
+class TestListings:
+    def test_assignable_users_paginate(self, simulator):
+        for i in range(7):
+            simulator.add_user(f"Editor {i}", f"editor{i}@example.com", projects=["KAN"])
+
+        with JiraClient(**credentials(simulator.base_url)) as client:
+            users = list(client.paginate("/user/assignable/search", params={"project": "KAN"}, page_size=4))
+            found = client.search_user("maría")
+
+        assert len(users) == 10
+        assert [u["displayName"] for u in found] == ["María José Gómez"]
+
+    def test_search_jql_token_pagination(self, simulator):
+        with JiraClient(**credentials(simulator.base_url)) as client:
+            for i in range(5):
+                client.create_issue(project_key="KAN", summary=f"Issue {i}")
+            issues = list(client.paginate(
+                "/search/jql", params={"jql": "project = KAN"}, style=TOKEN, page_size=2, items_key="issues"
+            ))
+
+        assert [issue["key"] for issue in issues] == [f"KAN-{i}" for i in range(1, 6)]
+
+
+class TestInjection:
+    def test_rate_limit_returns_429_and_client_recovers(self):
+        config = SimulatorConfig(rate_limit_per_minute=6000, rate_limit_burst=1)
+        with JiraSimulator(config) as simulator:
+            with JiraClient(**credentials(simulator.base_url, max_retries=5)) as client:
+                for _ in range(2):
+                    client.get_current_user()
+
+            assert simulator.throttled > 0
+
+    def test_injected_failures_surface_as_errors(self):
+        config = SimulatorConfig(failure_rate=1.0, failure_statuses=(500,), seed=3)
+        with JiraSimulator(config) as simulator:
+            with JiraClient(**credentials(simulator.base_url)) as client:
+                with pytest.raises(JiraAPIError) as exc_info:
+                    client.create_issue(project_key="KAN", summary="Falla")
+
+            assert exc_info.value.status_code == 500
+            assert simulator.injected_failures == 1
+
+    def test_requires_authorization(self, simulator):
+        response = requests.get(f"{simulator.base_url}/rest/api/3/myself")
+        assert response.status_code == 401
@@ -0,0 +1,73 @@
+"""
+Tests unitarios para el codec JSON de los clientes de Jira.
+"""
+
+import pytest
+
+from app.clients.json_codec import StdlibJsonCodec, get_codec, is_empty_body, orjson
+from app.clients.jira_client import JiraAPIError, JiraClient, JiraClientConfig
+from benchmarks.stub_server import start_stub_server
+
+
+class TestJsonCodec:
+    """Tests para los codecs y su selección."""
+
+    def test_auto_prefers_orjson(self):
+        expected = "orjson" if orjson is not None else "json"
+        assert get_codec("auto").name == expected
+
+    def test_invalid_codec(self):
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    @pytest.mark.parametrize("name", ["json"] + (["orjson"] if orjson is not None else []))
+    def test_roundtrip_unicode(self, name):
+        codec = get_codec(name)
+        payload = {"summary": "🎬 Reel IG | Cartagena", "labels": ["edición"]}
+        assert codec.loads(codec.dumps(payload)) == payload
+
+    def test_stdlib_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            StdlibJsonCodec().loads(b"<html>")
+
+    def test_empty_body(self):
+        assert is_empty_body(b"")
+        assert is_empty_body(b" \n")
+        assert not is_empty_body(b"{}")
+
+
+class TestClientBodies:
+    """El cliente envía y parsea bodies con el codec configurado."""
+
+    @pytest.fixture
+    def stub_server(self):
+        server, base_url = start_stub_server()
+        yield server, base_url
+        server.shutdown()
+
+    def make_client(self, base_url: str) -> JiraClient:
+        return JiraClient(
+            base_url=base_url,
+            email="test@example.com",
+            api_token="token",
+            config=JiraClientConfig(rate_limit_per_minute=0, max_retries=0, json_codec="json")
+        )
+
+    def test_sends_encoded_body(self, stub_server):
+        server, base_url = stub_server
+        with self.make_client(base_url) as client:
+            client.create_issue(project_key="KAN", summary="Edición", labels=["reel"])
+
+        _, path, body = server.received[0]
+        assert path == "/rest/api/3/issue"
+        assert body["fields"]["summary"] == "Edición"
+
+    def test_error_message_from_json_body(self, stub_server):
+        server, base_url = stub_server
+        server.script.append((400, {}, {"errorMessages": ["Proyecto inválido"]}))
+        with self.make_client(base_url) as client:
+            with pytest.raises(JiraAPIError) as exc_info:
+                client.get_project("XX")
+
+        assert "Proyecto inválido" in str(exc_info.value)
+        assert exc_info.value.response == {"errorMessages": ["Proyecto inválido"]}
@@ -0,0 +1,319 @@
+"""
+Tests unitarios para el outbox de escrituras a Jira.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.requests import Request
+
+from app.api.dependencies import prefers_async
+from app.api.routes.outbox import accepted_response
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.jira_client import JiraAPIError, JiraClientConfig
+from app.core.config import settings
+from app.core.database import Base
+from app.models.outbox import (
+    OUTBOX_DONE,
+    OUTBOX_FAILED,
+    OUTBOX_ISSUE,
+    OUTBOX_PENDING,
+    OUTBOX_PROCESSING,
+    OUTBOX_WORKFLOW,
+    OutboxEntry,
+)
+from app.models.user import User
+from app.services.outbox_service import OutboxWorker, enqueue_jira_write, get_outbox_entry, is_retry_safe
+from benchmarks.jira_simulator import JiraSimulator
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = factory()
+    db.add(User(id=1, email="ana@empresa.com", username="ana", hashed_password="x"))
+    db.add(User(id=2, email="luis@empresa.com", username="luis", hashed_password="x"))
+    db.commit()
+    db.close()
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def simulator():
+    with JiraSimulator() as jira:
+        yield jira
+
+
+class Clock:
+    def __init__(self):
+        self.now = datetime.now(timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+def make_worker(session_factory, simulator, clock=None, **kwargs) -> OutboxWorker:
+    @asynccontextmanager
+    async def provider(user):
+        config = JiraClientConfig(rate_limit_per_minute=0, max_retries=0)
+        async with AsyncJiraClient(
+            base_url=simulator.base_url, email=user.email, api_token="x", config=config
+        ) as client:
+            yield client
+
+    kwargs.setdefault("retry_base_delay", 10)
+    return OutboxWorker(session_factory, provider, clock=clock or Clock(), **kwargs)
+
+
+def enqueue(session_factory, kind=OUTBOX_ISSUE, user_id=1, **payload) -> int:
+    db = session_factory()
+    try:
+        return enqueue_jira_write(db, user_id, kind, payload).id
+    finally:
+        db.close()
+
+
+def load(session_factory, entry_id: int) -> OutboxEntry:
+    db = session_factory()
+    try:
+        return db.query(OutboxEntry).filter(OutboxEntry.id == entry_id).one()
+    finally:
+        db.close()
+
+
+def bulk_calls(simulator) -> list:
+    return [body for method, path, body in simulator.received if path.endswith("/issue/bulk")]
+
+
+class TestEnqueue:
+    def test_rejects_unknown_kind(self, session_factory):
+        db = session_factory()
+        with pytest.raises(ValueError):
+            enqueue_jira_write(db, 1, "comment", {})
+        db.close()
+
+    def test_entries_are_private_to_owner(self, session_factory):
+        entry_id = enqueue(session_factory, project_key="KAN", summary="Privada")
+        db = session_factory()
+        assert get_outbox_entry(db, entry_id, 1).payload_data["summary"] == "Privada"
+        assert get_outbox_entry(db, entry_id, 2) is None
+        db.close()
+
+
+class TestDrain:
+    async def test_issues_sent_in_one_bulk_call(self, session_factory, simulator):
+        ids = [
+            enqueue(session_factory, project_key="KAN", summary=f"Tarea {i}", assignee_name="santiago")
+            for i in range(3)
+        ]
+        worker = make_worker(session_factory, simulator)
+
+        assert await worker.drain_once() == 3
+
+        [bulk] = bulk_calls(simulator)
+        assert len(bulk["issueUpdates"]) == 3
+        assert all(u["fields"]["assignee"]["id"] for u in bulk["issueUpdates"])
+        # Una sola búsqueda del assignee para todo el lote
+        searches = [p for _, p, _ in simulator.received if "/user/" in p]
+        assert len(searches) == 1
+
+        keys = []
+        for entry_id in ids:
+            entry = load(session_factory, entry_id)
+            assert entry.status == OUTBOX_DONE
+            assert entry.attempts == 1
+            keys.append(entry.result_data["issue_key"])
+        assert len(set(keys)) == 3
+        assert await worker.drain_once() == 0
+
+    async def test_workflow_entry(self, session_factory, simulator):
+        entry_id = enqueue(session_factory, OUTBOX_WORKFLOW, project_key="KAN", title="Reel de Cartagena")
+        worker = make_worker(session_factory, simulator)
+
+        await worker.drain_once()
+
+        entry = load(session_factory, entry_id)
+        assert entry.status == OUTBOX_DONE
+        result = entry.result_data
+        assert result["success"] is True
+        assert result["main_task_key"].startswith("KAN-")
+        assert len(result["subtasks"]) == result["total_tasks"] - 1 > 0
+
+    async def test_entries_grouped_by_user(self, session_factory, simulator):
+        enqueue(session_factory, project_key="KAN", summary="De Ana", user_id=1)
+        enqueue(session_factory, project_key="KAN", summary="De Luis", user_id=2)
+        worker = make_worker(session_factory, simulator)
+
+        await worker.drain_once()
+
+        assert len(bulk_calls(simulator)) == 2
+        assert worker.delivered == 2
+
+
+class TestFailures:
+    async def test_rejected_request_is_rescheduled(self, session_factory, simulator):
+        entry_id = enqueue(session_factory, project_key="KAN", summary="Reintentar")
+        clock = Clock()
+        worker = make_worker(session_factory, simulator, clock=clock)
+        simulator.script.append((429, {}, {"errorMessages": ["Demasiadas peticiones"]}))
+
+        await worker.drain_once()
+
+        entry = load(session_factory, entry_id)
+        assert entry.status == OUTBOX_PENDING
+        assert "Demasiadas peticiones" in entry.last_error
+
+        # Aún no vence el backoff
+        assert await worker.drain_once() == 0
+
+        clock.advance(10)
+        await worker.drain_once()
+        entry = load(session_factory, entry_id)
+        assert entry.status == OUTBOX_DONE
+        assert entry.attempts == 2
+
+    async def test_gives_up_after_max_attempts(self, session_factory, simulator):
+        entry_id = enqueue(session_factory, project_key="KAN", summary="Sin suerte")
+        clock = Clock()
+        worker = make_worker(session_factory, simulator, clock=clock, max_attempts=2)
+
+        for _ in range(2):
+            simulator.script.append((429, {}, {"errorMessages": ["Demasiadas peticiones"]}))
+            await worker.drain_once()
+            clock.advance(60)
+
+        entry = load(session_factory, entry_id)
+        assert entry.status == OUTBOX_FAILED
+        assert "2 intentos" in entry.last_error
+
+    async def test_server_error_after_send_is_not_resent(self, session_factory, simulator):
+        issue = enqueue(session_factory, project_key="KAN", summary="Quizás creado")
+        workflow = enqueue(session_factory, kind=OUTBOX_WORKFLOW, project_key="KAN", title="Reel")
+        worker = make_worker(session_factory, simulator)
+        simulator.script.append((503, {}, {"errorMessages": ["Mantenimiento"]}))
+        simulator.script.append((502, {}, {"errorMessages": ["Bad gateway"]}))
+
+        await worker.drain_once()
+
+        # Jira pudo haberlos creado: reenviar podría duplicarlos
+        for entry_id in (issue, workflow):
+            entry = load(session_factory, entry_id)
+            assert entry.status == OUTBOX_FAILED
+            assert "Resultado incierto" in entry.last_error
+        assert worker.rescheduled == 0
+
+    def test_only_unapplied_errors_are_retry_safe(self):
+        assert is_retry_safe(JiraAPIError("ocupado", status_code=429))
+        assert is_retry_safe(JiraAPIError("circuito abierto", status_code=503, request_sent=False))
+        assert is_retry_safe(JiraAPIError("sin conexión", request_sent=False))
+        assert not is_retry_safe(JiraAPIError("timeout de lectura"))
+        assert not is_retry_safe(JiraAPIError("caído", status_code=503))
+
+    async def test_validation_error_fails_without_retry(self, session_factory, simulator):
+        good = enqueue(session_factory, project_key="KAN", summary="Válida")
+        bad = enqueue(session_factory, project_key="KAN", summary="Inválida", priority="Urgentísima")
+        # Sin summary: se rechaza antes de llamar a Jira
+        empty = enqueue(session_factory, project_key="KAN", summary="")
+        worker = make_worker(session_factory, simulator)
+
+        await worker.drain_once()
+
+        assert len(bulk_calls(simulator)[0]["issueUpdates"]) == 2
+        assert load(session_factory, good).status == OUTBOX_DONE
+        entry = load(session_factory, bad)
+        assert entry.status == OUTBOX_FAILED
+        assert entry.attempts == 1
+        entry = load(session_factory, empty)
+        assert entry.status == OUTBOX_FAILED
+        assert "summary" in entry.last_error
+
+    async def test_missing_user_client_fails_entries(self, session_factory, simulator):
+        entry_id = enqueue(session_factory, project_key="KAN", summary="Sin credenciales")
+
+        @asynccontextmanager
+        async def provider(user):
+            raise ValueError("Usuario sin credenciales de Jira")
+            yield
+
+        worker = OutboxWorker(session_factory, provider)
+        await worker.drain_once()
+
+        entry = load(session_factory, entry_id)
+        assert entry.status == OUTBOX_FAILED
+        assert "credenciales" in entry.last_error
+
+    async def test_abandoned_entry_is_reclaimed(self, session_factory, simulator):
+        clock = Clock()
+        entry_id = enqueue(session_factory, project_key="KAN", summary="Huérfana")
+        db = session_factory()
+        db.query(OutboxEntry).filter(OutboxEntry.id == entry_id).update(
+            {OutboxEntry.status: OUTBOX_PROCESSING, OutboxEntry.locked_at: clock(), OutboxEntry.attempts: 1}
+        )
+        db.commit()
+        db.close()
+        worker = make_worker(session_factory, simulator, clock=clock, lease_seconds=60)
+
+        assert await worker.drain_once() == 0
+        clock.advance(61)
+        assert await worker.drain_once() == 1
+        assert load(session_factory, entry_id).status == OUTBOX_DONE
+
+
+class TestWorkerLoop:
+    async def test_wake_drains_without_waiting_for_poll(self, session_factory, simulator):
+        worker = make_worker(session_factory, simulator, poll_interval=30)
+        worker._clock = lambda: datetime.now(timezone.utc)
+        worker.start()
+        try:
+            await asyncio.sleep(0.05)
+            entry_id = enqueue(session_factory, project_key="KAN", summary="Despertar")
+            worker.wake()
+            for _ in range(100):
+                if load(session_factory, entry_id).status == OUTBOX_DONE:
+                    break
+                await asyncio.sleep(0.02)
+            assert load(session_factory, entry_id).status == OUTBOX_DONE
+            assert worker.snapshot()["running"] is True
+        finally:
+            await worker.stop()
+        assert worker.snapshot()["entries"] == {OUTBOX_DONE: 1}
+
+
+class TestRespondAsync:
+    def make_request(self, *prefer: str) -> Request:
+        headers = [(b"prefer", value.encode()) for value in prefer]
+        return Request({"type": "http", "method": "POST", "path": "/", "headers": headers})
+
+    def test_prefer_header(self, monkeypatch):
+        monkeypatch.setattr(settings, "OUTBOX_ENABLED", True)
+        assert prefers_async(self.make_request("respond-async"))
+        assert prefers_async(self.make_request("return=minimal, respond-async; wait=5"))
+        assert prefers_async(self.make_request("handling=lenient", "Respond-Async"))
+        assert not prefers_async(self.make_request("return=minimal"))
+        assert not prefers_async(self.make_request())
+
+    def test_ignored_when_outbox_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "OUTBOX_ENABLED", False)
+        assert not prefers_async(self.make_request("respond-async"))
+
+    def test_accepted_response(self, session_factory):
+        entry = load(session_factory, enqueue(session_factory, project_key="KAN", summary="202"))
+        response = accepted_response(entry)
+        assert response.status_code == 202
+        assert response.headers["location"] == f"/api/v1/outbox/{entry.id}"
+        assert response.headers["preference-applied"] == "respond-async"
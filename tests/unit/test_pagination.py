@@ -0,0 +1,108 @@
+"""
+Tests unitarios para la paginación de endpoints de Jira.
+"""
+
+import pytest
+
+from app.clients.pagination import TOKEN, Pager
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.jira_client import JiraClient, JiraClientConfig
+from benchmarks.stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub_server():
+    server, base_url = start_stub_server()
+    yield server, base_url
+    server.shutdown()
+
+
+def credentials(base_url: str) -> dict:
+    return {
+        "base_url": base_url,
+        "email": "test@example.com",
+        "api_token": "token",
+        "config": JiraClientConfig(rate_limit_per_minute=0),
+    }
+
+
+class TestPager:
+    """Tests para Pager."""
+
+    def test_offset_uses_is_last(self):
+        pager = Pager(page_size=2)
+        params = pager.first_params()
+        assert params == {"startAt": 0, "maxResults": 2}
+
+        params = pager.next_params(params, {"values": [1, 2], "isLast": False})
+        assert params["startAt"] == 2
+        assert pager.next_params(params, {"values": [3], "isLast": True}) is None
+
+    def test_offset_uses_total(self):
+        pager = Pager(page_size=2)
+        params = pager.first_params()
+        assert pager.next_params(params, {"values": [1, 2], "total": 2}) is None
+
+    def test_bare_list_stops_on_short_page(self):
+        """Una página corta sin metadatos es la última."""
+        pager = Pager({"project": "KAN"}, page_size=3)
+        params = pager.next_params(pager.first_params(), [1, 2, 3])
+        assert params == {"project": "KAN", "startAt": 3, "maxResults": 3}
+        assert pager.next_params(params, [4]) is None
+        assert pager.next_params(params, []) is None
+
+    def test_token_style(self):
+        pager = Pager(style=TOKEN, items_key="issues")
+        params = pager.first_params()
+        assert "startAt" not in params
+
+        params = pager.next_params(params, {"issues": [1], "nextPageToken": "abc"})
+        assert params["nextPageToken"] == "abc"
+        assert pager.next_params(params, {"issues": [2], "isLast": True}) is None
+
+    def test_token_style_with_list_response(self):
+        pager = Pager(style=TOKEN, items_key="issues")
+        params = pager.first_params()
+        assert pager.items([1, 2]) == [1, 2]
+        assert pager.next_params(params, [1, 2]) is None
+
+    def test_invalid_style(self):
+        with pytest.raises(ValueError):
+            Pager(style="cursor")
+
+
+class TestPaginate:
+    """Tests para JiraClient.paginate y AsyncJiraClient.paginate."""
+
+    def test_streams_all_pages(self, stub_server):
+        server, base_url = stub_server
+        server.script.extend([
+            (200, {}, [{"accountId": "a"}, {"accountId": "b"}]),
+            (200, {}, [{"accountId": "c"}]),
+        ])
+
+        with JiraClient(**credentials(base_url)) as client:
+            users = client.paginate("/user/assignable/search", {"project": "KAN"}, page_size=2)
+            ids = [user["accountId"] for user in users]
+
+        assert ids == ["a", "b", "c"]
+        # La página corta es la última: no se pide una vacía
+        paths = [path for _, path, _ in server.received]
+        assert len(paths) == 2
+        assert "startAt=2" in paths[1]
+
+    async def test_async_token_pages(self, stub_server):
+        server, base_url = stub_server
+        server.script.extend([
+            (200, {}, {"issues": [{"key": "KAN-1"}], "nextPageToken": "t2"}),
+            (200, {}, {"issues": [{"key": "KAN-2"}], "isLast": True}),
+        ])
+
+        async with AsyncJiraClient(**credentials(base_url)) as client:
+            keys = [
+                issue["key"]
+                async for issue in client.paginate("/search/jql", style=TOKEN, items_key="issues")
+            ]
+
+        assert keys == ["KAN-1", "KAN-2"]
+        assert "nextPageToken=t2" in server.received[1][1]
@@ -0,0 +1,127 @@
+"""
+Tests unitarios para la caché de resultados del parser.
+"""
+
+import pytest
+
+from app.clients.cache_backend import CacheNamespace, MemoryCacheBackend
+from app.parsers import parse_cache as parse_cache_module
+from app.parsers.parse_cache import ParseCache, configure_parse_cache, get_parse_cache, parse_key
+from app.parsers.task_parser import TaskParser, create_parser
+
+TEXT = "Crea una tarea para editar el reel de Komodo, prioridad alta, asignada a Juan"
+
+
+class CountingParser(TaskParser):
+    """TaskParser que cuenta cuántas veces corre las reglas."""
+
+    def __init__(self, cache=None):
+        super().__init__(cache)
+        self.runs = 0
+
+    def _parse(self, text):
+        self.runs += 1
+        return super()._parse(text)
+
+
+@pytest.fixture
+def process_cache():
+    previous = get_parse_cache()
+    yield configure_parse_cache(1024 * 1024)
+    parse_cache_module._parse_cache = previous
+
+
+class TestParseCache:
+    def test_second_parse_is_a_hit(self):
+        parser = CountingParser(ParseCache())
+        first = parser.parse(TEXT)
+        second = parser.parse(TEXT)
+
+        assert parser.runs == 1
+        assert first == second
+        assert first == TaskParser().parse(TEXT)
+        assert parser.cache.snapshot()["hit_ratio"] == 0.5
+
+    def test_callers_get_independent_copies(self):
+        parser = CountingParser(ParseCache())
+        first = parser.parse(TEXT)
+        first.labels.append("modificada")
+        first.summary = "Otro"
+
+        second = parser.parse(TEXT)
+        assert "modificada" not in second.labels
+        assert second.summary != "Otro"
+
+    def test_surrounding_whitespace_shares_entry_but_case_does_not(self):
+        parser = CountingParser(ParseCache())
+        parser.parse(TEXT)
+        parser.parse(f"  {TEXT}\n")
+        assert parser.runs == 1
+
+        # El assignee depende de las mayúsculas
+        parser.parse(TEXT.lower())
+        assert parser.runs == 2
+
+    def test_key_includes_parser_version(self):
+        assert parse_key(TEXT, "1") != parse_key(TEXT, "2")
+        assert parse_key(TEXT) == parse_key(f" {TEXT} ")
+
+    def test_empty_text_is_not_cached(self):
+        parser = CountingParser(ParseCache())
+        with pytest.raises(ValueError):
+            parser.parse("   ")
+        assert len(parser.cache) == 0
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        cache = ParseCache(max_bytes=3000)
+        parser = CountingParser(cache)
+        texts = [f"Editar el reel número {i} de Komodo" for i in range(10)]
+        for text in texts:
+            parser.parse(text)
+
+        snapshot = cache.snapshot()
+        assert snapshot["bytes"] <= 3000
+        assert snapshot["evictions"] > 0
+        assert 0 < snapshot["size"] < len(texts)
+
+        # El último sigue en caché; el primero fue desalojado
+        runs = parser.runs
+        parser.parse(texts[-1])
+        assert parser.runs == runs
+        parser.parse(texts[0])
+        assert parser.runs == runs + 1
+
+    def test_entry_larger_than_budget_is_skipped(self):
+        cache = ParseCache(max_bytes=600)
+        parser = CountingParser(cache)
+        parser.parse("Documentar " + "la API REST " * 100)
+        assert len(cache) == 0
+
+    def test_shared_tier_between_workers(self):
+        backend = MemoryCacheBackend()
+        worker_a = CountingParser(ParseCache(shared=CacheNamespace(backend, "parser")))
+        worker_b = CountingParser(ParseCache(shared=CacheNamespace(backend, "parser")))
+
+        expected = worker_a.parse(TEXT)
+        assert worker_b.parse(TEXT) == expected
+        assert worker_b.runs == 0
+        assert worker_b.cache.snapshot()["shared_hits"] == 1
+
+    def test_invalid_budget(self):
+        with pytest.raises(ValueError):
+            ParseCache(max_bytes=0)
+
+
+class TestProcessCache:
+    def test_create_parser_instances_share_cache(self, process_cache):
+        create_parser().parse(TEXT)
+        create_parser().parse(TEXT)
+        snapshot = process_cache.snapshot()
+        assert (snapshot["hits"], snapshot["misses"]) == (1, 1)
+
+    def test_task_parser_is_uncached_by_default(self):
+        assert TaskParser().cache is None
+
+    def test_disabled_cache(self, process_cache):
+        assert configure_parse_cache(0) is None
+        assert create_parser().cache is None
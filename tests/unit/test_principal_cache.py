@@ -0,0 +1,186 @@
+"""
+Tests unitarios para la caché de usuarios autenticados.
+"""
+
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.api import dependencies
+from app.api.dependencies import get_current_db_user, get_current_user
+from app.core.database import Base
+from app.core.security import create_access_token
+from app.models.user import User
+from app.services.principal_cache import Principal, PrincipalCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self)
+
+    def __call__(self, *args):
+        self.count += 1
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    session.add(User(
+        id=1, email="ana@empresa.com", username="ana", hashed_password="x",
+        jira_base_url="https://empresa.atlassian.net", jira_email="ana@empresa.com", jira_api_token="cifrado"
+    ))
+    session.commit()
+    session.queries = QueryCounter(engine)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    dependencies.principal_cache.clear()
+    yield
+    dependencies.principal_cache.clear()
+
+
+def bearer(user_id: int = 1, minutes: int = 60) -> HTTPAuthorizationCredentials:
+    token = create_access_token({"sub": str(user_id)}, expires_delta=timedelta(minutes=minutes))
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def principal(**overrides) -> Principal:
+    values = dict(
+        id=1, username="ana", email="ana@empresa.com", is_active=True, is_superuser=False,
+        jira_base_url=None, jira_email=None, jira_api_token=None, jira_fingerprint="f"
+    )
+    values.update(overrides)
+    return Principal(**values)
+
+
+class TestPrincipalCache:
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = PrincipalCache(ttl=30, clock=clock)
+        cache.put("token", principal())
+        assert cache.get("token").id == 1
+        clock.now += 31
+        assert cache.get("token") is None
+
+    def test_entry_never_outlives_token(self):
+        cache = PrincipalCache(ttl=30, clock=FakeClock(), wall_clock=lambda: 5000.0)
+        cache.put("token", principal(), expires_at=5000.0)
+        assert cache.get("token") is None
+
+    def test_inactive_users_are_not_cached(self):
+        cache = PrincipalCache()
+        cache.put("token", principal(is_active=False))
+        assert len(cache) == 0
+
+    def test_invalidate_user_drops_every_token(self):
+        cache = PrincipalCache()
+        cache.put("a", principal())
+        cache.put("b", principal())
+        cache.put("c", principal(id=2))
+        assert cache.invalidate_user(1) == 2
+        assert cache.get("c") is not None
+
+    def test_principal_is_immutable(self):
+        with pytest.raises(AttributeError):
+            principal().is_active = False
+
+
+class TestGetCurrentUser:
+    async def test_repeated_token_skips_database(self, db):
+        credentials = bearer()
+        first = await get_current_user(credentials, db)
+        queries = db.queries.count
+        second = await get_current_user(credentials, db)
+
+        assert isinstance(first, Principal)
+        assert first == second
+        assert db.queries.count == queries
+        assert first.jira_fingerprint
+        assert dependencies.principal_cache.snapshot()["hits"] == 1
+
+    async def test_credential_update_invalidates(self, db):
+        credentials = bearer()
+        await get_current_user(credentials, db)
+
+        user = db.query(User).get(1)
+        user.jira_email = "otra@empresa.com"
+        db.commit()
+
+        refreshed = await get_current_user(credentials, db)
+        assert refreshed.jira_email == "otra@empresa.com"
+
+    async def test_deactivation_invalidates(self, db):
+        credentials = bearer()
+        await get_current_user(credentials, db)
+
+        db.query(User).get(1).is_active = False
+        db.commit()
+
+        with pytest.raises(HTTPException) as error:
+            await get_current_user(credentials, db)
+        assert error.value.status_code == 403
+
+    async def test_last_login_does_not_invalidate(self, db):
+        from datetime import datetime
+
+        credentials = bearer()
+        await get_current_user(credentials, db)
+        db.query(User).get(1).last_login = datetime.utcnow()
+        db.commit()
+
+        assert len(dependencies.principal_cache) == 1
+
+    async def test_logout_drops_token(self, db):
+        from app.api.routes.auth import logout
+
+        credentials = bearer()
+        current = await get_current_user(credentials, db)
+        await logout(credentials, current)
+        assert len(dependencies.principal_cache) == 0
+
+    async def test_invalid_token_is_rejected(self, db):
+        with pytest.raises(HTTPException) as error:
+            await get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials="basura"), db)
+        assert error.value.status_code == 401
+
+    async def test_db_user_for_endpoints_that_modify_it(self, db):
+        current = await get_current_user(bearer(), db)
+        user = get_current_db_user(current, db)
+        assert isinstance(user, User)
+        assert user.id == 1
+
+    async def test_client_key_uses_snapshot_fingerprint(self, db):
+        current = await get_current_user(bearer(), db)
+        orm_key = dependencies._user_client_key(db.query(User).get(1))
+        assert dependencies._user_client_key(current) == orm_key
+
+    async def test_project_cache_key_includes_token(self, db):
+        current = await get_current_user(bearer(), db)
+        other = principal(
+            id=2, jira_base_url=current.jira_base_url, jira_email=current.jira_email,
+            jira_api_token="otro", jira_fingerprint=dependencies.credential_fingerprint(
+                current.jira_base_url, current.jira_email, "otro"
+            )
+        )
+        # Mismo sitio y email con otro token: no comparte la lista cacheada
+        assert dependencies.jira_tenant_key(current) != dependencies.jira_tenant_key(other)
+        assert dependencies.jira_tenant_key(current) == dependencies._user_client_key(current)
@@ -0,0 +1,150 @@
+"""
+Tests unitarios para la caché stale-while-revalidate de proyectos.
+"""
+
+import asyncio
+
+import pytest
+
+from app.clients.deadline import deadline, remaining
+from app.services.project_cache import HIT, MISS, REFRESH, STALE, ProjectListCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Loader:
+    """Loader que cuenta llamadas y puede demorarse o fallar."""
+
+    def __init__(self, delay: float = 0):
+        self.calls = 0
+        self.delay = delay
+        self.fail = False
+        self.deadlines = []
+
+    async def __call__(self):
+        self.calls += 1
+        self.deadlines.append(remaining())
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Jira caído")
+        return [f"PROJ-{self.calls}"]
+
+
+async def settle():
+    """Deja correr los refrescos en segundo plano."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestProjectListCache:
+    async def test_fresh_entry_is_served_without_loading(self):
+        cache = ProjectListCache(soft_ttl=60, hard_ttl=600, clock=FakeClock())
+        loader = Loader()
+        assert await cache.get("t", loader) == (["PROJ-1"], MISS)
+        assert await cache.get("t", loader) == (["PROJ-1"], HIT)
+        assert loader.calls == 1
+
+    async def test_stale_entry_is_served_and_refreshed_in_background(self):
+        clock = FakeClock()
+        cache = ProjectListCache(soft_ttl=60, hard_ttl=600, clock=clock)
+        loader = Loader()
+        await cache.get("t", loader)
+
+        clock.now += 61
+        assert await cache.get("t", loader) == (["PROJ-1"], STALE)
+        await settle()
+        assert loader.calls == 2
+        assert await cache.get("t", loader) == (["PROJ-2"], HIT)
+
+    async def test_stale_response_does_not_wait_for_jira(self):
+        clock = FakeClock()
+        cache = ProjectListCache(soft_ttl=60, hard_ttl=600, clock=clock)
+        loader = Loader()
+        await cache.get("t", loader)
+
+        clock.now += 61
+        loader.delay = 5
+        value, state = await asyncio.wait_for(cache.get("t", loader), timeout=0.5)
+        assert (value, state) == (["PROJ-1"], STALE)
+        await cache.close()
+
+    async def test_expired_entry_is_reloaded(self):
+        clock = FakeClock()
+        cache = ProjectListCache(soft_ttl=60, hard_ttl=600, clock=clock)
+        loader = Loader()
+        await cache.get("t", loader)
+        clock.now += 601
+        assert await cache.get("t", loader) == (["PROJ-2"], MISS)
+
+    async def test_refresh_bypasses_cache(self):
+        cache = ProjectListCache(soft_ttl=60, hard_ttl=600, clock=FakeClock())
+        loader = Loader()
+        await cache.get("t", loader)
+        assert await cache.get("t", loader, refresh=True) == (["PROJ-2"], REFRESH)
+        assert await cache.get("t", loader) == (["PROJ-2"], HIT)
+
+    async def test_tenants_are_separate(self):
+        cache = ProjectListCache(clock=FakeClock())
+        loader = Loader()
+        await cache.get(("https://a.atlassian.net", "ana@a.com"), loader)
+        _, state = await cache.get(("https://b.atlassian.net", "ana@a.com"), loader)
+        assert state == MISS
+
+    async def test_concurrent_misses_share_one_load(self):
+        cache = ProjectListCache(clock=FakeClock())
+        loader = Loader(delay=0.05)
+        results = await asyncio.gather(*(cache.get("t", loader) for _ in range(5)))
+        assert loader.calls == 1
+        assert {tuple(value) for value, _ in results} == {("PROJ-1",)}
+
+    async def test_failed_background_refresh_keeps_entry(self):
+        clock = FakeClock()
+        cache = ProjectListCache(soft_ttl=60, hard_ttl=600, clock=clock)
+        loader = Loader()
+        await cache.get("t", loader)
+
+        clock.now += 61
+        loader.fail = True
+        assert await cache.get("t", loader) == (["PROJ-1"], STALE)
+        await settle()
+        assert cache.snapshot()["refresh_errors"] == 1
+        assert (await cache.get("t", loader))[0] == ["PROJ-1"]
+        await cache.close()
+
+    async def test_foreground_errors_propagate(self):
+        cache = ProjectListCache(clock=FakeClock())
+        loader = Loader()
+        loader.fail = True
+        with pytest.raises(RuntimeError):
+            await cache.get("t", loader)
+        assert cache.snapshot()["size"] == 0
+
+    async def test_background_refresh_has_its_own_deadline(self):
+        clock = FakeClock()
+        cache = ProjectListCache(soft_ttl=60, hard_ttl=600, refresh_timeout=30, clock=clock)
+        loader = Loader()
+        await cache.get("t", loader)
+
+        clock.now += 61
+        with deadline(0.5):
+            await cache.get("t", loader)
+        await settle()
+        # No hereda los 0.5 s de la petición que lo disparó
+        assert loader.deadlines[-1] > 1
+
+    async def test_disabled_with_zero_hard_ttl(self):
+        cache = ProjectListCache(soft_ttl=0, hard_ttl=0, clock=FakeClock())
+        loader = Loader()
+        await cache.get("t", loader)
+        await cache.get("t", loader)
+        assert loader.calls == 2
+
+    def test_invalid_ttls(self):
+        with pytest.raises(ValueError):
+            ProjectListCache(soft_ttl=600, hard_ttl=60)
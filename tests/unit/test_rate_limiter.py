@@ -0,0 +1,91 @@
+"""
+Tests unitarios para el rate limiter por sitio de Jira.
+"""
+
+import pytest
+
+from app.clients.client_registry import site_id
+from app.clients.rate_limiter import TokenBucket, get_rate_limiter, rate_limiter_snapshot
+
+
+class FakeClock:
+    """Reloj manual para controlar el paso del tiempo."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestTokenBucket:
+    """Tests para TokenBucket."""
+
+    def test_burst_then_queue(self, clock):
+        """Tras agotar la ráfaga, las peticiones se encolan a la tasa sostenida."""
+        bucket = TokenBucket(rate_per_minute=60, burst=2, clock=clock)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(1.0)
+        assert bucket.reserve() == pytest.approx(2.0)
+
+    def test_refill_over_time(self, clock):
+        """Los tokens se recuperan con el tiempo."""
+        bucket = TokenBucket(rate_per_minute=60, burst=1, clock=clock)
+        bucket.reserve()
+        clock.now += 1.0
+        assert bucket.reserve() == 0
+
+    def test_retry_after_pauses_and_halves_rate(self, clock):
+        """Un 429 con Retry-After pausa el bucket y reduce la tasa a la mitad."""
+        bucket = TokenBucket(rate_per_minute=120, burst=5, clock=clock)
+        bucket.observe(429, {"Retry-After": "10"})
+
+        assert bucket.snapshot()["rate_per_minute"] == 60
+        assert bucket.reserve() >= 10
+
+    def test_remaining_header_caps_tokens(self, clock):
+        """X-RateLimit-Remaining limita los tokens disponibles."""
+        bucket = TokenBucket(rate_per_minute=60, burst=10, clock=clock)
+        bucket.observe(200, {"X-RateLimit-Remaining": "0"})
+        assert bucket.reserve() > 0
+
+    def test_rate_recovers_after_success(self, clock):
+        """La tasa vuelve gradualmente al valor inicial con respuestas sanas."""
+        bucket = TokenBucket(rate_per_minute=60, burst=5, clock=clock)
+        bucket.observe(429, {})
+        assert bucket.snapshot()["rate_per_minute"] == 30
+
+        for _ in range(20):
+            bucket.observe(200, {})
+        assert bucket.snapshot()["rate_per_minute"] == 60
+
+    def test_invalid_rate(self):
+        """La tasa debe ser positiva."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_minute=0)
+
+
+def test_bucket_shared_per_site():
+    """Clientes del mismo sitio comparten bucket."""
+    first = get_rate_limiter("https://team.atlassian.net/", 60)
+    second = get_rate_limiter("https://TEAM.atlassian.net", 120)
+    other = get_rate_limiter("https://other.atlassian.net", 60)
+
+    assert first is second
+    assert first is not other
+
+
+def test_snapshot_does_not_expose_site_urls():
+    """El snapshot usa ids opacos, no la URL de cada cliente."""
+    get_rate_limiter("https://cliente-secreto.atlassian.net", 60)
+    snapshot = rate_limiter_snapshot()
+
+    assert not any("cliente-secreto" in key for key in snapshot)
+    assert site_id("https://Cliente-Secreto.atlassian.net/") in snapshot
@@ -0,0 +1,135 @@
+"""
+Tests unitarios para la política de reintentos de Jira.
+"""
+
+import random
+
+import pytest
+
+from app.clients.jira_client import JiraClient, JiraClientConfig, JiraAPIError
+from app.clients.retry import RetryPolicy, RetryStats, parse_retry_after
+from benchmarks.stub_server import start_stub_server
+
+
+@pytest.fixture
+def policy():
+    """Política determinista para los tests."""
+    return RetryPolicy(max_retries=3, backoff_factor=3, base_delay=0.5, rng=random.Random(42))
+
+
+class TestRetryPolicy:
+    """Tests para RetryPolicy."""
+
+    def test_get_is_retried_on_503(self, policy):
+        """Un GET con 503 se reintenta."""
+        assert policy.retry_delay("GET", 0, status_code=503) is not None
+
+    def test_non_transient_status_not_retried(self, policy):
+        """Errores del cliente (400, 404) no se reintentan."""
+        assert policy.retry_delay("GET", 0, status_code=400) is None
+        assert policy.retry_delay("GET", 0, status_code=404) is None
+
+    def test_post_only_retried_when_rejected(self, policy):
+        """Un POST solo se reintenta si Jira lo rechazó sin procesarlo."""
+        assert policy.retry_delay("POST", 0, status_code=429) is not None
+        # Un 503 puede venir de un proxy después de que Jira creó el issue
+        assert policy.retry_delay("POST", 0, status_code=503) is None
+        assert policy.retry_delay("POST", 0, status_code=504) is None
+        # Timeout de lectura: el issue pudo crearse
+        assert policy.retry_delay("POST", 0) is None
+        # La conexión nunca se estableció
+        assert policy.retry_delay("POST", 0, request_sent=False) is not None
+
+    def test_idempotent_override(self, policy):
+        """idempotent=True permite reintentar un POST de búsqueda."""
+        assert policy.retry_delay("POST", 0, status_code=504, idempotent=True) is not None
+
+    def test_max_retries(self, policy):
+        """No se reintenta más allá de max_retries."""
+        assert policy.retry_delay("GET", 3, status_code=503) is None
+
+    def test_decorrelated_jitter_bounds(self, policy):
+        """La espera está entre la base y previous * backoff_factor."""
+        previous = None
+        for attempt in range(3):
+            delay = policy.retry_delay("GET", attempt, previous_delay=previous, status_code=503)
+            upper = max(policy.base_delay, (previous or policy.base_delay) * policy.backoff_factor)
+            assert policy.base_delay <= delay <= upper
+            previous = delay
+
+    def test_retry_after_is_honoured(self, policy):
+        """Retry-After marca la espera mínima."""
+        delay = policy.retry_delay("POST", 0, status_code=429, headers={"Retry-After": "7"})
+        assert 7 <= delay <= 7 + policy.base_delay
+
+    def test_retry_after_too_long_fails_fast(self, policy):
+        """Si Jira pide esperar más de max_retry_after no se reintenta."""
+        headers = {"Retry-After": "3600"}
+        assert policy.retry_delay("GET", 0, status_code=429, headers=headers) is None
+
+    def test_parse_retry_after_http_date(self):
+        """Retry-After también puede ser una fecha HTTP."""
+        assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+        assert parse_retry_after({"Retry-After": "invalid"}) is None
+        assert parse_retry_after({}) is None
+
+
+class TestClientRetries:
+    """Tests de reintentos de extremo a extremo contra el stub."""
+
+    @pytest.fixture
+    def stub_server(self):
+        server, base_url = start_stub_server()
+        yield server, base_url
+        server.shutdown()
+
+    def make_client(self, base_url, max_retries=2):
+        client = JiraClient(
+            base_url=base_url,
+            email="test@example.com",
+            api_token="token",
+            config=JiraClientConfig(max_retries=max_retries, retry_base_delay=0.01, retry_max_delay=0.05)
+        )
+        client.retry_stats = RetryStats()
+        return client
+
+    def test_create_issue_survives_429(self, stub_server):
+        """Un 429 con Retry-After en un POST se reintenta y se reporta."""
+        server, base_url = stub_server
+        server.script.append((429, {"Retry-After": "0"}, {"errorMessages": ["Rate limit"]}))
+
+        with self.make_client(base_url) as client:
+            issue = client.create_issue(project_key="KAN", summary="Reel")
+
+            assert issue["key"] == "STUB-1"
+            assert server.request_count == 2
+            stats = client.retry_stats.snapshot()
+            assert stats["retries"] == 1
+            assert stats["retries_by_reason"] == {"429": 1}
+
+    def test_create_issue_not_retried_on_503(self, stub_server):
+        """Un 503 en un POST no se reintenta: el issue pudo haberse creado."""
+        server, base_url = stub_server
+        server.script.append((503, {}, {"errorMessages": ["Unavailable"]}))
+
+        with self.make_client(base_url) as client:
+            with pytest.raises(JiraAPIError) as exc_info:
+                client.create_issue(project_key="KAN", summary="Reel")
+
+            assert exc_info.value.status_code == 503
+            assert server.request_count == 1
+            assert client.retry_stats.snapshot()["retries"] == 0
+
+    def test_retries_exhausted_raise(self, stub_server):
+        """Al agotar los reintentos se lanza el último error."""
+        server, base_url = stub_server
+        for _ in range(3):
+            server.script.append((503, {}, {"message": "Unavailable"}))
+
+        with self.make_client(base_url) as client:
+            with pytest.raises(JiraAPIError) as exc_info:
+                client.get_current_user()
+
+            assert exc_info.value.status_code == 503
+            assert server.request_count == 3
+            assert client.retry_stats.snapshot()["exhausted"] == 1
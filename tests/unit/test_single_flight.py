@@ -0,0 +1,236 @@
+"""
+Tests unitarios para la coalescencia de GETs idénticos.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.clients.deadline import deadline, remaining
+from app.clients.single_flight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    SingleFlightStats,
+    request_key,
+)
+
+
+class TestRequestKey:
+    def test_param_order_does_not_matter(self):
+        assert request_key("t", "get", "/project", {"a": 1, "b": 2}) == \
+            request_key("t", "GET", "/project", {"b": 2, "a": 1})
+
+    def test_tenant_is_part_of_key(self):
+        assert request_key("t1", "GET", "/project") != request_key("t2", "GET", "/project")
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_upstream_call(self):
+        stats = SingleFlightStats()
+        flight = SingleFlight(stats)
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"values": [1]}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", fetch)))
+        leader.start()
+        while not flight._calls:
+            pass
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("k", fetch)))
+            for _ in range(3)
+        ]
+        for thread in followers:
+            thread.start()
+        while flight._calls["k"].joined < 4:
+            pass
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert len(calls) == 1
+        assert stats.snapshot()["coalesced"] == 3
+        # Cada llamador recibe su propia copia
+        assert len({id(result) for result in results}) == 4
+
+    def test_error_is_shared_and_not_cached(self):
+        flight = SingleFlight(SingleFlightStats())
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flight.do("k", fail)
+        assert flight.do("k", lambda: 42) == 42
+
+    def test_leader_deadline_does_not_fail_followers(self):
+        flight = SingleFlight(SingleFlightStats())
+        seen_deadlines = []
+        results = {}
+
+        def fetch():
+            time.sleep(0.05)
+            seen_deadlines.append(remaining())
+            time.sleep(0.05)
+            return {"key": "KAN"}
+
+        def leader():
+            with deadline(0.02):
+                try:
+                    flight.do("k", fetch, timeout_error=lambda: TimeoutError("sin presupuesto"))
+                except TimeoutError as e:
+                    results["leader"] = e
+
+        def follower():
+            with deadline(5):
+                results["follower"] = flight.do("k", fetch)
+
+        threads = [threading.Thread(target=leader)]
+        threads[0].start()
+        while not flight._calls:
+            pass
+        threads.append(threading.Thread(target=follower))
+        threads[1].start()
+        for thread in threads:
+            thread.join()
+
+        assert str(results["leader"]) == "sin presupuesto"
+        assert results["follower"] == {"key": "KAN"}
+        # La llamada compartida se extendió al deadline del seguidor
+        assert seen_deadlines[0] > 1
+
+    def test_follower_wait_is_bounded_by_its_deadline(self):
+        flight = SingleFlight(SingleFlightStats())
+        release = threading.Event()
+
+        def fetch():
+            release.wait(5)
+            return 1
+
+        leader = threading.Thread(target=lambda: flight.do("k", fetch))
+        leader.start()
+        while not flight._calls:
+            pass
+
+        started = time.monotonic()
+        with deadline(0.05):
+            with pytest.raises(TimeoutError):
+                flight.do("k", fetch)
+        assert time.monotonic() - started < 1
+
+        release.set()
+        leader.join()
+
+
+class TestAsyncSingleFlight:
+    async def test_concurrent_coroutines_share_one_call(self):
+        stats = SingleFlightStats()
+        flight = AsyncSingleFlight(stats)
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"key": "KAN"}
+
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(result == {"key": "KAN"} for result in results)
+        assert len({id(result) for result in results}) == 5
+        assert stats.snapshot()["upstream"] == 1
+        assert stats.snapshot()["coalesced"] == 4
+
+    async def test_error_propagates_to_followers(self):
+        flight = AsyncSingleFlight(SingleFlightStats())
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("k", fail) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_leader_cancellation_does_not_fail_followers(self):
+        flight = AsyncSingleFlight(SingleFlightStats())
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return {"key": "KAN"}
+
+        leader = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+
+        # El cliente del líder se desconecta
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == {"key": "KAN"}
+        assert leader.cancelled()
+
+    async def test_leader_deadline_does_not_fail_followers(self):
+        flight = AsyncSingleFlight(SingleFlightStats())
+        seen_deadlines = []
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            seen_deadlines.append(remaining())
+            await asyncio.sleep(0.05)
+            return {"key": "KAN"}
+
+        async def leader():
+            with deadline(0.02):
+                return await flight.do("k", fetch, timeout_error=lambda: TimeoutError("sin presupuesto"))
+
+        async def follower():
+            await asyncio.sleep(0.005)
+            with deadline(5):
+                return await flight.do("k", fetch)
+
+        results = await asyncio.gather(leader(), follower(), return_exceptions=True)
+
+        assert isinstance(results[0], TimeoutError)
+        assert str(results[0]) == "sin presupuesto"
+        assert results[1] == {"key": "KAN"}
+        # La llamada compartida se extendió al deadline del seguidor
+        assert seen_deadlines[0] > 1
+
+    async def test_shared_call_cancelled_when_every_caller_leaves(self):
+        flight = AsyncSingleFlight(SingleFlightStats())
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.create_task(flight.do("k", fetch)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        callers[0].cancel()
+        await asyncio.sleep(0.01)
+        assert not cancelled.is_set()
+
+        callers[1].cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.gather(*callers, return_exceptions=True)
+
+        # Una llamada nueva no reutiliza la cancelada
+        async def fresh():
+            return 1
+
+        assert await flight.do("k", fresh) == 1
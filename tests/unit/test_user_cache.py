@@ -0,0 +1,160 @@
+"""
+Tests unitarios para la caché de nombre → accountId.
+"""
+
+import pytest
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.jira_client import JiraClient, JiraClientConfig
+from app.clients.client_registry import site_id
+from app.clients.user_cache import (
+    MISS,
+    AccountIdCache,
+    account_id_cache_snapshot,
+    get_account_id_cache,
+    normalize_name,
+)
+from benchmarks.jira_simulator import JiraSimulator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAccountIdCache:
+    def test_normalize_name(self):
+        assert normalize_name("  María   José ") == "maría josé"
+        assert normalize_name("MARÍA") == normalize_name("maría")
+
+    def test_hit_and_miss(self):
+        cache = AccountIdCache()
+        assert cache.get("María", "KAN") is MISS
+        cache.put("María", "kan", "acc-1")
+        assert cache.get(" maría ", "KAN") == "acc-1"
+        # El proyecto es parte de la clave
+        assert cache.get("María", "OTRO") is MISS
+        snapshot = cache.snapshot()
+        assert (snapshot["hits"], snapshot["misses"]) == (1, 2)
+
+    def test_negative_entries_use_shorter_ttl(self):
+        clock = FakeClock()
+        cache = AccountIdCache(ttl=3600, negative_ttl=60, clock=clock)
+        cache.put("Fantasma", "KAN", None)
+        cache.put("María", "KAN", "acc-1")
+
+        assert cache.get("Fantasma", "KAN") is None
+        assert cache.snapshot()["negative_hits"] == 1
+
+        clock.now += 61
+        assert cache.get("Fantasma", "KAN") is MISS
+        assert cache.get("María", "KAN") == "acc-1"
+
+        clock.now += 3600
+        assert cache.get("María", "KAN") is MISS
+        assert cache.snapshot()["expirations"] == 2
+
+    def test_negative_caching_can_be_disabled(self):
+        cache = AccountIdCache(negative_ttl=0)
+        cache.put("Fantasma", "KAN", None)
+        assert cache.get("Fantasma", "KAN") is MISS
+
+    def test_lru_eviction(self):
+        cache = AccountIdCache(max_size=2)
+        cache.put("a", None, "1")
+        cache.put("b", None, "2")
+        cache.get("a", None)
+        cache.put("c", None, "3")
+
+        assert cache.get("b", None) is MISS
+        assert cache.get("a", None) == "1"
+        assert len(cache) == 2
+        assert cache.snapshot()["evictions"] == 1
+
+    def test_invalidate(self):
+        cache = AccountIdCache()
+        cache.put("a", "KAN", "1")
+        cache.put("b", "KAN", "2")
+        cache.invalidate("A", "KAN")
+        assert cache.get("a", "KAN") is MISS
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_shared_per_site(self):
+        first = get_account_id_cache("https://equipo.atlassian.net/")
+        assert get_account_id_cache("https://EQUIPO.atlassian.net") is first
+        assert get_account_id_cache("https://otro.atlassian.net") is not first
+
+    def test_snapshot_does_not_expose_site_urls(self):
+        get_account_id_cache("https://cliente-privado.atlassian.net")
+        snapshot = account_id_cache_snapshot()
+        assert not any("cliente-privado" in key for key in snapshot)
+        assert site_id("https://cliente-privado.atlassian.net") in snapshot
+
+
+@pytest.fixture
+def simulator():
+    with JiraSimulator() as jira:
+        yield jira
+
+
+def make_client(cls, simulator, **config):
+    config.setdefault("rate_limit_per_minute", 0)
+    config.setdefault("max_retries", 0)
+    client = cls(base_url=simulator.base_url, email="a@b.com", api_token="x", config=JiraClientConfig(**config))
+    if client.account_id_cache is not None:
+        client.account_id_cache.invalidate()
+    return client
+
+
+def user_searches(simulator) -> int:
+    return sum(1 for _, path, _ in simulator.received if path.startswith("/rest/api/3/user/search"))
+
+
+class TestClientLookup:
+    def test_repeated_names_hit_jira_once(self, simulator):
+        with make_client(JiraClient, simulator) as client:
+            first = client.get_user_account_id("Santiago", "KAN")
+            assert first is not None
+            for name in ("santiago", " SANTIAGO "):
+                assert client.get_user_account_id(name, "KAN") == first
+
+        assert user_searches(simulator) == 1
+
+    def test_not_found_is_cached(self, simulator):
+        with make_client(JiraClient, simulator) as client:
+            assert client.get_user_account_id("Nadie", "KAN") is None
+            assert client.get_user_account_id("nadie", "KAN") is None
+
+        assert user_searches(simulator) == 1
+        assert client.account_id_cache.snapshot()["negative_hits"] == 1
+
+    def test_errors_are_not_cached(self, simulator):
+        simulator.script.append((500, {}, {"errorMessages": ["Fallo"]}))
+        with make_client(JiraClient, simulator) as client:
+            assert client.get_user_account_id("Santiago", "KAN") is None
+            assert client.get_user_account_id("Santiago", "KAN") is not None
+
+        assert user_searches(simulator) == 2
+
+    def test_cache_can_be_disabled(self, simulator):
+        with make_client(JiraClient, simulator, user_cache_ttl=0) as client:
+            assert client.account_id_cache is None
+            client.get_user_account_id("Santiago", "KAN")
+            client.get_user_account_id("Santiago", "KAN")
+
+        assert user_searches(simulator) == 2
+
+    async def test_async_client_shares_site_cache(self, simulator):
+        with make_client(JiraClient, simulator) as client:
+            expected = client.get_user_account_id("María", "KAN")
+
+        async with make_client(AsyncJiraClient, simulator) as client:
+            # make_client limpió la caché: la primera búsqueda va a Jira
+            assert await client.get_user_account_id("María", "KAN") == expected
+            assert await client.get_user_account_id("maría", "KAN") == expected
+
+        assert user_searches(simulator) == 2
@@ -0,0 +1,219 @@
+"""
+Tests unitarios para el directorio local de usuarios asignables.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.clients.async_jira_client import AsyncJiraClient
+from app.clients.jira_client import JiraClientConfig
+from app.services.user_directory import (
+    AMBIGUOUS,
+    EMAIL,
+    EXACT,
+    FUZZY,
+    PREFIX,
+    WORD,
+    ProjectUsers,
+    UserDirectory,
+    edit_distance,
+    fold,
+    resolve_assignee,
+)
+from benchmarks.jira_simulator import JiraSimulator
+
+USERS = [
+    {"accountId": "santiago", "displayName": "Santiago Pérez", "emailAddress": "santiago@example.com"},
+    {"accountId": "maria", "displayName": "María José Gómez", "emailAddress": "mj.gomez@example.com"},
+    {"accountId": "andres", "displayName": "Andrés Rodríguez", "emailAddress": "andres.rodriguez@example.com"},
+    {"accountId": "ana-r", "displayName": "Ana Ruiz", "emailAddress": "ana.ruiz@example.com"},
+    {"accountId": "ana-l", "displayName": "Ana López", "emailAddress": "alopez@example.com"},
+    {"accountId": "baja", "displayName": "Usuario Inactivo", "active": False},
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMatching:
+    def test_fold(self):
+        assert fold("  María   JOSÉ ") == "maria jose"
+        assert fold("Andrés") == fold("andres")
+
+    def test_edit_distance(self):
+        assert edit_distance("santiago", "santiago", 2) == 0
+        assert edit_distance("santigo", "santiago", 2) == 1
+        assert edit_distance("snatiago", "santiago", 2) == 1  # transposición
+        assert edit_distance("pedro", "santiago", 2) == 3
+
+    @pytest.mark.parametrize("name, account_id, kind", [
+        ("Santiago Pérez", "santiago", EXACT),
+        ("santiago perez", "santiago", EXACT),
+        ("andres.rodriguez", "andres", EMAIL),
+        ("Andres Rodriguez", "andres", EXACT),
+        ("santiago", "santiago", EMAIL),
+        ("Pérez", "santiago", WORD),
+        ("ANDRES", "andres", WORD),
+        ("Gómez", "maria", WORD),
+        ("maria jose", "maria", PREFIX),
+        ("santigo", "santiago", FUZZY),
+        ("Andrez", "andres", FUZZY),
+        ("santiago peres", "santiago", FUZZY),
+    ])
+    def test_resolves(self, name, account_id, kind):
+        assert ProjectUsers(USERS).resolve(name) == (account_id, kind)
+
+    def test_ambiguous_names_are_not_guessed(self):
+        users = ProjectUsers(USERS)
+        assert users.resolve("Ana") == (None, AMBIGUOUS)
+        assert users.resolve("ana ruiz")[0] == "ana-r"
+
+    def test_short_names_are_not_fuzzy(self):
+        # Con tres letras no se toleran errores de tipeo
+        assert ProjectUsers(USERS).resolve("Luz")[0] is None
+
+    def test_inactive_users_are_skipped(self):
+        users = ProjectUsers(USERS)
+        assert users.count == 5
+        assert users.resolve("Usuario Inactivo")[0] is None
+
+    def test_fuzzy_can_be_disabled(self):
+        assert ProjectUsers(USERS, max_distance=0).resolve("santigo")[0] is None
+
+
+@pytest.fixture
+def simulator():
+    with JiraSimulator() as jira:
+        yield jira
+
+
+def make_client(simulator) -> AsyncJiraClient:
+    config = JiraClientConfig(rate_limit_per_minute=0, max_retries=0, user_cache_ttl=0)
+    return AsyncJiraClient(base_url=simulator.base_url, email="a@b.com", api_token="x", config=config)
+
+
+def requests_to(simulator, prefix: str) -> int:
+    return sum(1 for _, path, _ in simulator.received if path.startswith(f"/rest/api/3/{prefix}"))
+
+
+class TestDirectory:
+    async def test_syncs_once_and_resolves_locally(self, simulator):
+        directory = UserDirectory()
+        async with make_client(simulator) as client:
+            first = await directory.resolve(client, "santiago", "KAN")
+            assert first is not None
+            assert await directory.resolve(client, "SANTIAGO", "kan") == first
+            assert await directory.resolve(client, "maria", "KAN") is not None
+            assert await directory.resolve(client, "andrés", "KAN") is not None
+
+        # Una sola sincronización y ninguna búsqueda por nombre
+        assert requests_to(simulator, "user/search") == 0
+        snapshot = directory.snapshot()
+        assert (snapshot["projects"], snapshot["users"], snapshot["syncs"]) == (1, 3, 1)
+
+    async def test_resyncs_after_refresh_interval(self, simulator):
+        clock = FakeClock()
+        directory = UserDirectory(refresh_interval=60, clock=clock)
+        async with make_client(simulator) as client:
+            await directory.resolve(client, "santiago", "KAN")
+            assert await directory.resolve(client, "Lucía", "KAN") is None
+
+            simulator.add_user("Lucía Fernández", "lucia@example.com", projects=["KAN"])
+            clock.now += 61
+            assert await directory.resolve(client, "lucia", "KAN") is not None
+
+        assert directory.snapshot()["syncs"] == 2
+
+    async def test_expired_directory_is_served_while_it_refreshes(self, simulator):
+        clock = FakeClock()
+        directory = UserDirectory(refresh_interval=60, clock=clock)
+        leases = []
+
+        @asynccontextmanager
+        async def lease():
+            leases.append(1)
+            async with make_client(simulator) as own:
+                yield own
+
+        async with make_client(simulator) as client:
+            await directory.resolve(client, "santiago", "KAN")
+            simulator.add_user("Lucía Fernández", "lucia@example.com", projects=["KAN"])
+            clock.now += 61
+
+            # La petición no espera la sincronización: usa el directorio vencido
+            assert await directory.resolve(client, "lucia", "KAN", lease) is None
+            assert await directory.resolve(client, "santiago", "KAN", lease) is not None
+            assert directory.snapshot()["refreshing"] == 1
+            await asyncio.gather(*directory._refreshing.values())
+
+            assert await directory.resolve(client, "lucia", "KAN", lease) is not None
+        assert leases == [1]
+        assert directory.snapshot()["syncs"] == 2
+
+    async def test_first_sync_with_lease_runs_in_background(self, simulator):
+        directory = UserDirectory()
+
+        @asynccontextmanager
+        async def lease():
+            async with make_client(simulator) as own:
+                yield own
+
+        async with make_client(simulator) as client:
+            # Sin directorio todavía: resolve_assignee cae a /user/search
+            assert await resolve_assignee(client, "santiago", "KAN", directory, lease) is not None
+            assert requests_to(simulator, "user/search") == 1
+            await asyncio.gather(*directory._refreshing.values())
+
+            # Cargado en segundo plano: el siguiente nombre se resuelve local
+            assert await resolve_assignee(client, "maria", "KAN", directory, lease) is not None
+        assert requests_to(simulator, "user/search") == 1
+        assert directory.snapshot()["syncs"] == 1
+
+    async def test_projects_are_evicted_lru(self, simulator):
+        directory = UserDirectory(max_projects=2)
+        directory.load(simulator.base_url, "A", USERS)
+        directory.load(simulator.base_url, "B", USERS)
+        assert directory.get(simulator.base_url, "A") is not None  # A pasa a ser el más reciente
+        directory.load(simulator.base_url, "C", USERS)
+
+        assert directory.get(simulator.base_url, "B") is None
+        assert directory.get(simulator.base_url, "A") is not None
+        assert directory.snapshot()["projects"] == 2
+
+    async def test_sync_error_returns_none(self, simulator):
+        directory = UserDirectory()
+        async with make_client(simulator) as client:
+            assert await directory.resolve(client, "santiago", "NOPE") is None
+        assert directory.snapshot()["sync_errors"] == 1
+
+    async def test_load_replaces_project(self, simulator):
+        directory = UserDirectory()
+        directory.load(simulator.base_url, "KAN", USERS)
+        async with make_client(simulator) as client:
+            assert await directory.resolve(client, "ana ruiz", "KAN") == "ana-r"
+        assert requests_to(simulator, "user/assignable/search") == 0
+
+        directory.invalidate(simulator.base_url, "KAN")
+        assert directory.get(simulator.base_url, "KAN") is None
+
+
+class TestResolveAssignee:
+    async def test_falls_back_to_user_search(self, simulator):
+        directory = UserDirectory()
+        directory.load(simulator.base_url, "KAN", [])
+        async with make_client(simulator) as client:
+            assert await resolve_assignee(client, "Santiago", "KAN", directory) is not None
+        assert requests_to(simulator, "user/search") == 1
+
+    async def test_without_directory_uses_user_search(self, simulator):
+        async with make_client(simulator) as client:
+            assert await resolve_assignee(client, "Santiago", "KAN") is not None
+        assert requests_to(simulator, "user/assignable/search") == 0
+        assert requests_to(simulator, "user/search") == 1